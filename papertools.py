@@ -8,6 +8,7 @@ import os
 import sys
 import subprocess
 import argparse
+import importlib.util
 
 from src.utils.config import (
     CRAWL_CATEGORIES,
@@ -27,7 +28,12 @@ def check_python_version():
 
 
 def check_and_install_dependencies(install_missing: bool = False) -> bool:
-    """Check required imports and optionally install missing runtime packages."""
+    """Check required packages and optionally install missing runtime packages.
+
+    Packages are located with ``find_spec`` instead of being imported: the
+    stages run in their own processes, so importing openai & co. here would
+    only slow down every ``papertools run``.
+    """
     required_packages = {
         "requests": "requests>=2.28.0",
         "bs4": "beautifulsoup4>=4.11.0",
@@ -38,9 +44,7 @@ def check_and_install_dependencies(install_missing: bool = False) -> bool:
 
     missing_packages = []
     for package, pip_name in required_packages.items():
-        try:
-            __import__(package)
-        except ImportError:
+        if importlib.util.find_spec(package) is None:
             missing_packages.append(pip_name)
 
     if missing_packages:
@@ -217,6 +221,8 @@ def run_pipeline(args) -> int:
         cmd.extend(["--skip-filter"])
     if args.skip_cluster:
         cmd.extend(["--skip-cluster"])
+    if args.skip_extract:
+        cmd.extend(["--skip-extract"])
     if args.skip_summary:
         cmd.extend(["--skip-summary"])
     if args.skip_unified:
@@ -225,12 +231,112 @@ def run_pipeline(args) -> int:
         cmd.extend(["--skip-serve"])
     if args.status_file:
         cmd.extend(["--status-file", args.status_file])
+    if args.profile:
+        cmd.extend(["--profile"])
 
     print("🚀 启动论文处理流水线...")
     result = subprocess.run(cmd)
     return result.returncode
 
 
+def run_backlog(args) -> int:
+    """按流水线方式处理多个日期"""
+    if args.date or args.start_date or args.end_date:
+        print("❌ --dates 不能与 --date/--start-date/--end-date 同时使用")
+        return 2
+    # 各日期固定拆成准备段和发布段，与阶段选择冲突的参数直接拒绝，不能静默忽略
+    conflicting = [
+        flag
+        for flag, value in (
+            ("--start-from", args.start_from),
+            ("--skip-summary", args.skip_summary),
+            ("--skip-unified", args.skip_unified),
+        )
+        if value
+    ]
+    if conflicting:
+        print(f"❌ --dates 不能与 {'/'.join(conflicting)} 同时使用")
+        return 2
+
+    cmd = [sys.executable, "src/core/backlog_pipeline.py", "--dates"] + args.dates
+    if args.lookahead:
+        cmd.extend(["--lookahead", str(args.lookahead)])
+    if args.status_file:
+        cmd.extend(["--status-file", args.status_file])
+
+    # 以下参数原样传给每个日期的 pipeline.py
+    if args.mode == "quick":
+        cmd.extend(["--max-papers-total", str(MAX_PAPERS_TOTAL_QUICK)])
+    elif args.mode == "full":
+        cmd.extend(["--max-papers-total", str(MAX_PAPERS_TOTAL_FULL)])
+    if args.categories:
+        cmd.extend(["--categories"] + args.categories)
+    if args.max_papers_total:
+        cmd.extend(["--max-papers-total", str(args.max_papers_total)])
+    if args.max_papers_per_category:
+        cmd.extend(["--max-papers-per-category", str(args.max_papers_per_category)])
+    if args.max_workers:
+        cmd.extend(["--max-workers", str(args.max_workers)])
+    # 只影响准备段的跳过选项；发布段从总结开始，不受影响
+    if args.skip_crawl:
+        cmd.extend(["--skip-crawl"])
+    if args.skip_filter:
+        cmd.extend(["--skip-filter"])
+    if args.skip_cluster:
+        cmd.extend(["--skip-cluster"])
+    if args.skip_extract:
+        cmd.extend(["--skip-extract"])
+    if args.profile:
+        cmd.extend(["--profile"])
+
+    print("🚀 启动多日期流水线...")
+    result = subprocess.run(cmd)
+    return result.returncode
+
+
+def run_extract(args) -> int:
+    """预提取论文全文到文档缓存"""
+    cmd = [sys.executable, "src/core/extract_documents.py"]
+    if args.input_file:
+        cmd.extend(["--input-file", args.input_file])
+    if args.date:
+        cmd.extend(["--date", args.date])
+    if args.max_workers:
+        cmd.extend(["--max-workers", str(args.max_workers)])
+
+    print("📄 启动全文预提取...")
+    result = subprocess.run(cmd)
+    return result.returncode
+
+
+def report_profiles(args) -> int:
+    """汇总各阶段的性能剖析热点"""
+    from src.utils.profiling import find_profiles, profile_dir, summarize_profiles
+
+    directory = args.dir or profile_dir()
+    grouped = find_profiles(directory, date=args.date, stage=args.stage)
+    if not grouped:
+        print(f"❌ 未找到性能剖析文件: {directory}")
+        print(
+            "💡 先运行: python papertools.py run --profile 或设置 PAPERTOOLS_PROFILE=1"
+        )
+        return 1
+
+    for stage, paths in grouped.items():
+        summary = summarize_profiles(paths, sort=args.sort, top=args.top)
+        print(
+            f"\n🔬 {stage}: {summary['runs']} 次运行, "
+            f"总计 {summary['total_seconds']:.1f}s (按 {args.sort} 排序)"
+        )
+        print(f"  {'cumtime':>9} {'tottime':>9} {'ncalls':>9}  function")
+        for row in summary["hot_spots"]:
+            print(
+                f"  {row['cumtime']:>9.3f} {row['tottime']:>9.3f} "
+                f"{row['ncalls']:>9}  {row['function']}"
+            )
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="🎓 PaperTools - 学术论文处理工具",
@@ -238,10 +344,14 @@ def main():
 使用示例:
   python papertools.py run                     # 全量模式：处理1000篇论文
   python papertools.py run --mode quick        # 快速模式：处理10篇论文
+  python papertools.py extract --date 2025-09-24  # 预提取指定日期论文全文
   python papertools.py serve                   # 启动网页服务器
   python papertools.py clean                   # 清理缓存文件
   python papertools.py run --date 2025-09-24   # 处理指定日期论文
   python papertools.py run --start-date 2025-09-22 --end-date 2025-09-24
+  python papertools.py run --dates 2025-09-22 2025-09-23 2025-09-24  # 多日期补跑
+  python papertools.py run --date 2025-09-24 --profile  # 剖析各阶段耗时
+  python papertools.py profile report --date 2025-09-24  # 查看剖析热点
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -259,6 +369,14 @@ def main():
     run_parser.add_argument("--date", help="处理指定日期的论文 (YYYY-MM-DD)")
     run_parser.add_argument("--start-date", help="处理日期范围起始日期 (YYYY-MM-DD)")
     run_parser.add_argument("--end-date", help="处理日期范围结束日期 (YYYY-MM-DD)")
+    run_parser.add_argument(
+        "--dates",
+        nargs="+",
+        help="按流水线方式逐日处理多个日期：后续日期的爬取/筛选/预提取与前一日期的总结并行",
+    )
+    run_parser.add_argument(
+        "--lookahead", type=int, help="--dates 模式下准备阶段最多领先的日期数"
+    )
     run_parser.add_argument(
         "--categories", nargs="+", default=CRAWL_CATEGORIES, help="论文类别"
     )
@@ -269,12 +387,23 @@ def main():
     run_parser.add_argument("--max-workers", type=int, help="最大线程数")
     run_parser.add_argument(
         "--start-from",
-        choices=["crawl", "filter", "cluster", "summary", "unified", "serve"],
+        choices=[
+            "crawl",
+            "filter",
+            "cluster",
+            "extract",
+            "summary",
+            "unified",
+            "serve",
+        ],
         help="从指定阶段开始执行",
     )
     run_parser.add_argument("--skip-crawl", action="store_true", help="跳过爬取步骤")
     run_parser.add_argument("--skip-filter", action="store_true", help="跳过筛选步骤")
     run_parser.add_argument("--skip-cluster", action="store_true", help="跳过聚类步骤")
+    run_parser.add_argument(
+        "--skip-extract", action="store_true", help="跳过全文预提取步骤"
+    )
     run_parser.add_argument("--skip-summary", action="store_true", help="跳过总结步骤")
     run_parser.add_argument(
         "--skip-unified", action="store_true", help="跳过统一页面生成步骤"
@@ -283,6 +412,33 @@ def main():
         "--skip-serve", action="store_true", help="跳过启动服务器步骤"
     )
     run_parser.add_argument("--status-file", help="写入结构化流水线状态 JSON")
+    run_parser.add_argument(
+        "--profile", action="store_true", help="用 cProfile 剖析每个阶段"
+    )
+
+    # extract 子命令
+    extract_parser = subparsers.add_parser("extract", help="预提取论文全文到文档缓存")
+    extract_input = extract_parser.add_mutually_exclusive_group(required=True)
+    extract_input.add_argument("--input-file", help="筛选或聚类后的论文 JSON 文件")
+    extract_input.add_argument("--date", help="处理指定日期的论文 (YYYY-MM-DD)")
+    extract_parser.add_argument("--max-workers", type=int, help="提取进程数")
+
+    # profile 子命令
+    profile_parser = subparsers.add_parser("profile", help="查看阶段性能剖析结果")
+    profile_commands = profile_parser.add_subparsers(dest="profile_command")
+    report_parser = profile_commands.add_parser("report", help="汇总各阶段热点函数")
+    report_parser.add_argument("--dir", help="剖析文件目录 (默认: logs/profiles)")
+    report_parser.add_argument("--date", help="只看指定日期 (YYYY-MM-DD)")
+    report_parser.add_argument("--stage", help="只看指定阶段，如 paper_filter")
+    report_parser.add_argument(
+        "--top", type=int, default=15, help="每个阶段显示的函数数"
+    )
+    report_parser.add_argument(
+        "--sort",
+        choices=["cumulative", "tottime", "ncalls"],
+        default="cumulative",
+        help="排序方式 (默认: cumulative)",
+    )
 
     # serve 子命令
     subparsers.add_parser("serve", help="启动网页服务器")
@@ -323,11 +479,20 @@ def main():
             return 1
     elif args.command == "serve":
         return serve_webpages()
+    elif args.command == "profile":
+        if args.profile_command != "report":
+            profile_parser.print_help()
+            return 1
+        return report_profiles(args)
+    elif args.command == "extract":
+        return run_extract(args)
     elif args.command == "run":
         if not check_and_install_dependencies():
             return 1
         if not check_config():
             return 1
+        if args.dates:
+            return run_backlog(args)
         return run_pipeline(args)
 
     return 0
@@ -5,10 +5,18 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import hashlib
 import json
+import multiprocessing
+import os
 import re
 import sys
+import time
 from collections import Counter
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +24,21 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from src.utils.build_manifest import (  # noqa: E402
+    file_fingerprint,
+    load_build_manifest,
+    save_build_manifest,
+)
+from src.utils.date_bundles import (  # noqa: E402
+    BUNDLE_RE,
+    bundle_filename,
+    plan_date_bundles,
+)
+from src.utils.precompress import (  # noqa: E402
+    ENCODING_SUFFIXES,
+    brotli_available,
+    decompress_bytes,
+)
 from src.utils.publish_quality import (  # noqa: E402
     has_canonical_text,
     has_non_empty_text,
@@ -24,8 +47,21 @@ from src.utils.publish_quality import (  # noqa: E402
     link_matches_arxiv_id,
     validate_date_data_payload,
 )
-from src.utils.published_data_version import build_published_data_version  # noqa: E402
-from src.utils.published_webpage_data import project_embedded_clusters  # noqa: E402
+from src.utils.published_data_version import (  # noqa: E402
+    build_published_data_version,
+    build_published_data_version_from_digests,
+    published_payload_digest,
+)
+from src.utils.published_webpage_data import (  # noqa: E402
+    extract_page_data,
+    project_embedded_clusters,
+)
+from src.utils.search_index import (  # noqa: E402
+    SEARCH_INDEX_FILENAME,
+    SEARCH_SHARD_RE,
+    bloom_might_contain,
+    search_shard_filename,
+)
 
 DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 PRESTIGE_EXCLUDED_FILENAME = "prestige_excluded_papers.json"
@@ -35,6 +71,212 @@ LOADED_DATES_RE = re.compile(
 )
 LOAD_MORE_DAYS_RE = re.compile(r"\bconst\s+LOAD_MORE_DAYS\s*=\s*(\d+)\s*;")
 DATA_VERSION_RE = re.compile(r'\bconst\s+DATA_VERSION\s*=\s*"([^"]+)"\s*;')
+FIRST_SCREEN_DATA_URL_RE = re.compile(
+    r'\bconst\s+FIRST_SCREEN_DATA_URL\s*=\s*"([^"]*)"\s*;'
+)
+STATIC_ASSET_REF_RE = re.compile(r'\b(?:src|href)="(assets/[^"]+)"')
+STATIC_ASSET_URL_RE = re.compile(r"assets/[A-Za-z0-9._-]+")
+COMPRESSED_SUFFIXES = {suffix: encoding for encoding, suffix in ENCODING_SUFFIXES}
+
+VALIDATION_LEDGER_NAME = ".validation-ledger.json"
+VALIDATION_LEDGER_VERSION = 1
+# Modules whose rules decide what "valid" means; editing any of them drops the ledger.
+VALIDATION_RULE_MODULES = (
+    "src.utils.date_bundles",
+    "src.utils.precompress",
+    "src.utils.publish_quality",
+    "src.utils.published_data_version",
+    "src.utils.published_webpage_data",
+    "src.utils.search_index",
+)
+# A file's recorded stat is only trusted when it was last modified this long
+# before the ledger was written; newer files may have changed within the same
+# mtime tick, so they are hashed again.
+LEDGER_RACY_WINDOW_NS = 2_000_000_000
+# Below this many date files the process pool costs more than it saves.
+PARALLEL_MIN_DATE_FILES = 8
+MAX_VALIDATION_JOBS = 8
+
+
+def default_validation_jobs() -> int:
+    return max(1, min(MAX_VALIDATION_JOBS, os.cpu_count() or 1))
+
+
+def validation_pool_context() -> multiprocessing.context.BaseContext:
+    """Start method for validation workers.
+
+    The validator also runs inside the multi-threaded in-process pipeline,
+    where forking could copy a lock held by another thread into the worker.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+def validation_rules_digest() -> str:
+    """Fingerprint of the validator and the rule modules it imports."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    for name in VALIDATION_RULE_MODULES:
+        module_file = getattr(sys.modules.get(name), "__file__", None)
+        if module_file:
+            digest.update(Path(module_file).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class ValidationLedger:
+    """Checks that passed the last successful validation, keyed by input digests.
+
+    A check (one date payload, compressed sibling, search shard or bundle) is
+    skipped when the digests of every file it reads match the ledger.  The
+    ledger is only written after a validation without errors, and is dropped
+    whenever the validation rules change.
+    """
+
+    def __init__(self, webpages_dir: Path, *, enabled: bool = True):
+        self.webpages_dir = webpages_dir
+        self.path = webpages_dir / VALIDATION_LEDGER_NAME
+        self.enabled = enabled
+        self.rules = validation_rules_digest() if enabled else ""
+        previous = (
+            load_build_manifest(str(self.path), VALIDATION_LEDGER_VERSION)
+            if enabled
+            else {}
+        )
+        if previous.get("rules") != self.rules:
+            previous = {}
+        self._previous_files: dict[str, Any] = previous.get("files") or {}
+        self._previous_checks: dict[str, Any] = previous.get("checks") or {}
+        self._previous_saved_ns = previous.get("saved_ns") or 0
+        self.files: dict[str, Any] = {}
+        self.checks: dict[str, Any] = {}
+        self.skipped = 0
+
+    def relative_key(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.webpages_dir).as_posix()
+        except ValueError:
+            return str(path)
+
+    def file_digest(self, path: Path) -> str | None:
+        """SHA-256 of an ordinary file, reusing the recorded one when safe."""
+        if path.is_symlink() or not path.is_file():
+            return None
+        key = self.relative_key(path)
+        previous = self._previous_files.get(key)
+        if not (
+            previous
+            and previous.get("mtime_ns", 0) + LEDGER_RACY_WINDOW_NS
+            < self._previous_saved_ns
+        ):
+            previous = None
+        fingerprint = file_fingerprint(str(path), previous)
+        if fingerprint is None:
+            return None
+        self.files[key] = fingerprint
+        return fingerprint["digest"]
+
+    def inputs_digest(self, paths: list[Path], extra: str = "") -> str | None:
+        """Combined digest of a check's input files, or None if one is unreadable."""
+        digest = hashlib.sha256(extra.encode())
+        for path in paths:
+            file_digest = self.file_digest(path)
+            if file_digest is None:
+                return None
+            digest.update(f"{self.relative_key(path)}:{file_digest};".encode())
+        return digest.hexdigest()
+
+    def verified(self, key: str, inputs: str | None) -> dict[str, Any] | None:
+        """The recorded result of ``key`` if it passed with identical inputs."""
+        record = self._previous_checks.get(key)
+        if (
+            self.enabled
+            and inputs is not None
+            and isinstance(record, dict)
+            and record.get("inputs") == inputs
+        ):
+            return record
+        return None
+
+    def record(self, key: str, inputs: str | None, **extra: Any) -> None:
+        if self.enabled and inputs is not None:
+            self.checks[key] = {"inputs": inputs, **extra}
+
+    def check(
+        self,
+        key: str,
+        paths: list[Path],
+        run: Callable[[], list[str]],
+        extra: str = "",
+    ) -> list[str]:
+        """Run ``run`` unless the same inputs already passed; record a pass."""
+        if not self.enabled:
+            return run()
+        inputs = self.inputs_digest(paths, extra)
+        if self.verified(key, inputs) is not None:
+            self.skipped += 1
+            self.record(key, inputs)
+            return []
+        errors = run()
+        if not errors:
+            self.record(key, inputs)
+        return errors
+
+    def save(self) -> None:
+        if not self.enabled:
+            return
+        save_build_manifest(
+            str(self.path),
+            {
+                "version": VALIDATION_LEDGER_VERSION,
+                "rules": self.rules,
+                "saved_ns": time.time_ns(),
+                "files": self.files,
+                "checks": self.checks,
+            },
+        )
+
+
+class DatePayloads(Mapping[str, Any]):
+    """Published date payloads, parsed on first use.
+
+    Cross-checks (search shards, bundles, first-screen data) only read the
+    dates they need, so dates skipped through the ledger are never parsed.
+    Unreadable or non-object files behave as absent; their errors are
+    reported by the per-file validation.
+    """
+
+    def __init__(self, data_dir: Path, dates: list[str]):
+        self._data_dir = data_dir
+        self._dates = dates
+        self._date_set = set(dates)
+        self._cache: dict[str, Any] = {}
+
+    def _load(self, date: str) -> Any:
+        if date not in self._cache:
+            value = None
+            if date in self._date_set:
+                data, error = read_json(self._data_dir / f"{date}.json")
+                if error is None and isinstance(data, dict):
+                    value = data
+            self._cache[date] = value
+        return self._cache[date]
+
+    def remember(self, date: str, payload: dict[str, Any]) -> None:
+        """Keep a payload that was already parsed while validating its file."""
+        self._cache[date] = payload
+
+    def __getitem__(self, date: str) -> Any:
+        value = self._load(date)
+        if value is None:
+            raise KeyError(date)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (date for date in self._dates if self._load(date) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
 
 
 def read_json(path: Path) -> tuple[Any | None, str | None]:
@@ -65,6 +307,68 @@ def read_html(path: Path) -> tuple[str | None, str | None]:
         return None, f"{path}: failed to read site entrypoint: {exc}"
 
 
+def _references(html: str, path: Path, reference: str) -> bool:
+    """Whether the page, or a split-mode script it loads, mentions ``reference``."""
+    if reference in html:
+        return True
+    for url in STATIC_ASSET_REF_RE.findall(html):
+        asset_path = path.parent / url
+        if (
+            url.endswith(".js")
+            and STATIC_ASSET_URL_RE.fullmatch(url)
+            and not asset_path.is_symlink()
+            and asset_path.is_file()
+            and reference in asset_path.read_text(encoding="utf-8", errors="replace")
+        ):
+            return True
+    return False
+
+
+def validate_precompressed_variant(variant: Path) -> list[str]:
+    """Ensure a ``.gz``/``.br`` sibling decodes to exactly its original file."""
+    encoding = COMPRESSED_SUFFIXES[variant.suffix]
+    original = variant.with_suffix("")
+    if variant.is_symlink() or not variant.is_file():
+        return [f"{variant}: compressed variant must be an ordinary file"]
+    if original.is_symlink() or not original.is_file():
+        return [f"{variant}: compressed variant without original file"]
+    if encoding == "br" and not brotli_available():
+        return []
+    try:
+        decoded = decompress_bytes(variant.read_bytes(), encoding)
+    except Exception as exc:
+        return [f"{variant}: failed to decompress: {exc}"]
+    if decoded != original.read_bytes():
+        return [f"{variant}: compressed variant does not match {original.name}"]
+    return []
+
+
+def check_precompressed_variant(
+    variant: Path, ledger: ValidationLedger | None = None
+) -> list[str]:
+    """:func:`validate_precompressed_variant`, skipped when the ledger vouches for it."""
+    if ledger is None:
+        return validate_precompressed_variant(variant)
+    return ledger.check(
+        f"variant:{ledger.relative_key(variant)}",
+        [variant, variant.with_suffix("")],
+        lambda: validate_precompressed_variant(variant),
+        extra=str(brotli_available()),
+    )
+
+
+def validate_precompressed_siblings(
+    path: Path, ledger: ValidationLedger | None = None
+) -> list[str]:
+    """Validate every compressed sibling published next to ``path``."""
+    errors: list[str] = []
+    for suffix in COMPRESSED_SUFFIXES:
+        variant = Path(f"{path}{suffix}")
+        if exists_or_symlink(variant):
+            errors.extend(check_precompressed_variant(variant, ledger))
+    return errors
+
+
 def validate_html_page(path: Path, *, required_reference: str = "") -> list[str]:
     """Validate a user-facing HTML page and optional asset/data reference."""
     errors: list[str] = []
@@ -81,7 +385,7 @@ def validate_html_page(path: Path, *, required_reference: str = "") -> list[str]
     lowered = html.lower()
     if "<html" not in lowered or "</html>" not in lowered:
         errors.append(f"{path}: site entrypoint must be an HTML page")
-    if required_reference and required_reference not in html:
+    if required_reference and not _references(html, path, required_reference):
         errors.append(
             f"{path}: site entrypoint does not reference {required_reference}"
         )
@@ -185,39 +489,159 @@ def _extract_js_data_block(
         return None, [f"{path}: {label} embedded data is not valid JSON: {exc}"]
 
 
-def validate_initial_embedded_data(
-    html: str,
-    path: Path,
-    *,
-    loaded_dates: list[str],
-    date_payloads_by_date: dict[str, Any],
-) -> list[str]:
-    """Validate first-screen embedded data against the JSON users can lazy-load."""
-    errors: list[str] = []
-    all_papers, parse_errors = _extract_js_data_block(
+def _checked_string_list(
+    value: Any, path: Path, label: str
+) -> tuple[list[str] | None, list[str]]:
+    if value is None:
+        return None, [f"{path}: missing {label} manifest"]
+    if not isinstance(value, list) or any(not isinstance(item, str) for item in value):
+        return None, [f"{path}: {label} manifest must be a list of strings"]
+    return value, []
+
+
+def _read_page_manifest(html: str, path: Path) -> tuple[dict[str, Any], list[str]]:
+    """Read the entrypoint's data manifest.
+
+    Current pages carry every embedded value in one marked JSON span, which is
+    sliced out and parsed once.  Older pages declare each value as its own
+    ``const``; those are still read with the per-value patterns.  Missing
+    values are absent from the result and reported as errors.
+    """
+    page_data, page_data_error = extract_page_data(html)
+    if page_data_error:
+        return {}, [f"{path}: {page_data_error}"]
+    if page_data is not None:
+        manifest = {"page_data": page_data}
+        errors: list[str] = []
+        for label, key in (
+            ("availableDates", "availableDates"),
+            ("loadedDates", "loadedDates"),
+        ):
+            value, value_errors = _checked_string_list(page_data.get(key), path, label)
+            errors.extend(value_errors)
+            manifest[key] = value
+        load_more_days = page_data.get("loadMoreDays")
+        if isinstance(load_more_days, int) and not isinstance(load_more_days, bool):
+            manifest["loadMoreDays"] = load_more_days
+        data_version = page_data.get("dataVersion")
+        if isinstance(data_version, str) and data_version:
+            manifest["dataVersion"] = data_version
+        first_screen_url = page_data.get("firstScreenDataUrl")
+        manifest["firstScreenDataUrl"] = (
+            first_screen_url if isinstance(first_screen_url, str) else ""
+        )
+        return manifest, errors
+
+    manifest = {}
+    errors = []
+    manifest["availableDates"], parse_errors = _extract_js_string_array(
         html,
         path,
-        "allPapers",
-        "const allPapers =",
-        "\n\nconst allPaperTags =",
+        "availableDates",
+        AVAILABLE_DATES_RE,
     )
     errors.extend(parse_errors)
-    all_tags, parse_errors = _extract_js_data_block(
+    manifest["loadedDates"], parse_errors = _extract_js_string_array(
         html,
         path,
-        "allPaperTags",
-        "const allPaperTags =",
-        "\n\nconst availableDates =",
+        "loadedDates",
+        LOADED_DATES_RE,
     )
     errors.extend(parse_errors)
-    overviews, parse_errors = _extract_js_data_block(
-        html,
-        path,
-        "dailyOverviewsRaw",
-        "const dailyOverviewsRaw =",
-        "\nconst dailyOverviews =",
+    load_more_match = LOAD_MORE_DAYS_RE.search(html)
+    if load_more_match:
+        manifest["loadMoreDays"] = int(load_more_match.group(1))
+    version_match = DATA_VERSION_RE.search(html)
+    if version_match:
+        manifest["dataVersion"] = version_match.group(1)
+    first_screen_match = FIRST_SCREEN_DATA_URL_RE.search(html)
+    manifest["firstScreenDataUrl"] = (
+        first_screen_match.group(1) if first_screen_match else ""
     )
-    errors.extend(parse_errors)
+    return manifest, errors
+
+
+def _load_first_screen_chunk(
+    url: str, path: Path
+) -> tuple[dict[str, Any] | None, list[str]]:
+    """Return the split-asset first-screen chunk, or None for inline entrypoints."""
+    if not url:
+        return None, []
+    if not STATIC_ASSET_URL_RE.fullmatch(url) or not url.endswith(".json"):
+        return None, [
+            f"{path}: FIRST_SCREEN_DATA_URL must name a JSON file under assets/"
+        ]
+    chunk, read_error = read_json(path.parent / url)
+    if read_error:
+        return None, [read_error]
+    if not isinstance(chunk, dict):
+        return None, [f"{path}: first-screen data chunk must be an object"]
+    return chunk, []
+
+
+def validate_static_asset_references(html: str, path: Path) -> list[str]:
+    """Ensure every split-mode asset the entrypoint loads is published."""
+    errors: list[str] = []
+    for url in STATIC_ASSET_REF_RE.findall(html):
+        asset_path = path.parent / url
+        if not STATIC_ASSET_URL_RE.fullmatch(url):
+            errors.append(f"{path}: invalid static asset reference {url}")
+        elif asset_path.is_symlink() or not asset_path.is_file():
+            errors.append(f"{path}: missing static asset {url}")
+    return errors
+
+
+def validate_initial_embedded_data(
+    html: str,
+    path: Path,
+    *,
+    loaded_dates: list[str],
+    date_payloads_by_date: Mapping[str, Any],
+    manifest: dict[str, Any] | None = None,
+) -> list[str]:
+    """Validate first-screen embedded data against the JSON users can lazy-load.
+
+    Split-asset entrypoints keep this data in a separate JSON chunk named by
+    ``FIRST_SCREEN_DATA_URL``; that chunk is validated instead.
+    """
+    if manifest is None:
+        manifest, _ = _read_page_manifest(html, path)
+    errors: list[str] = []
+    chunk, chunk_errors = _load_first_screen_chunk(
+        manifest.get("firstScreenDataUrl", ""), path
+    )
+    if chunk_errors:
+        return chunk_errors
+    if chunk is not None or "page_data" in manifest:
+        source = chunk if chunk is not None else manifest["page_data"]
+        all_papers = source.get("allPapers")
+        all_tags = source.get("allPaperTags")
+        overviews = source.get("dailyOverviewsRaw")
+    else:
+        all_papers, parse_errors = _extract_js_data_block(
+            html,
+            path,
+            "allPapers",
+            "const allPapers =",
+            "\n\nconst allPaperTags =",
+        )
+        errors.extend(parse_errors)
+        all_tags, parse_errors = _extract_js_data_block(
+            html,
+            path,
+            "allPaperTags",
+            "const allPaperTags =",
+            "\n\nconst availableDates =",
+        )
+        errors.extend(parse_errors)
+        overviews, parse_errors = _extract_js_data_block(
+            html,
+            path,
+            "dailyOverviewsRaw",
+            "const dailyOverviewsRaw =",
+            "\nconst dailyOverviews =",
+        )
+        errors.extend(parse_errors)
 
     if not isinstance(all_papers, dict):
         errors.append(f"{path}: allPapers embedded data must be an object")
@@ -260,9 +684,14 @@ def validate_site_data_manifest(
     *,
     index_data: dict[str, Any],
     normalized_dates: list[str],
-    date_payloads_by_date: dict[str, Any] | None = None,
+    date_payloads_by_date: Mapping[str, Any] | None = None,
+    payload_digests: dict[str, str] | None = None,
 ) -> list[str]:
-    """Validate that the entrypoint's embedded data manifest matches index.json."""
+    """Validate that the entrypoint's embedded data manifest matches index.json.
+
+    ``payload_digests`` (date -> published payload digest) lets DATA_VERSION
+    be checked without parsing the date payloads again.
+    """
     if not exists_or_symlink(path) or path.is_symlink() or not path.is_file():
         return []
 
@@ -273,23 +702,15 @@ def validate_site_data_manifest(
     if html is None:
         return [f"{path}: failed to read site entrypoint"]
 
-    available_dates, parse_errors = _extract_js_string_array(
-        html,
-        path,
-        "availableDates",
-        AVAILABLE_DATES_RE,
-    )
-    errors.extend(parse_errors)
+    errors.extend(validate_static_asset_references(html, path))
+
+    manifest, manifest_errors = _read_page_manifest(html, path)
+    errors.extend(manifest_errors)
+    available_dates = manifest.get("availableDates")
     if available_dates is not None and available_dates != normalized_dates:
         errors.append(f"{path}: availableDates manifest must match data/index.json")
 
-    loaded_dates, parse_errors = _extract_js_string_array(
-        html,
-        path,
-        "loadedDates",
-        LOADED_DATES_RE,
-    )
-    errors.extend(parse_errors)
+    loaded_dates = manifest.get("loadedDates")
     initial_days = index_data.get("initial_days")
     if (
         loaded_dates is not None
@@ -303,8 +724,8 @@ def validate_site_data_manifest(
                 f"{path}: loadedDates manifest must match the first {initial_days} indexed dates"
             )
 
-    load_more_match = LOAD_MORE_DAYS_RE.search(html)
-    if not load_more_match:
+    html_load_more_days = manifest.get("loadMoreDays")
+    if html_load_more_days is None:
         errors.append(f"{path}: missing LOAD_MORE_DAYS manifest")
     else:
         load_more_days = index_data.get("load_more_days")
@@ -312,20 +733,26 @@ def validate_site_data_manifest(
             isinstance(load_more_days, int)
             and not isinstance(load_more_days, bool)
             and load_more_days > 0
+            and html_load_more_days != load_more_days
         ):
-            html_load_more_days = int(load_more_match.group(1))
-            if html_load_more_days != load_more_days:
-                errors.append(
-                    f"{path}: LOAD_MORE_DAYS mismatch: expected {load_more_days}, got {html_load_more_days}"
-                )
+            errors.append(
+                f"{path}: LOAD_MORE_DAYS mismatch: expected {load_more_days}, got {html_load_more_days}"
+            )
 
-    version_match = DATA_VERSION_RE.search(html)
-    if not version_match:
+    html_data_version = manifest.get("dataVersion")
+    if html_data_version is None:
         errors.append(f"{path}: missing DATA_VERSION cache-busting token")
+    elif not re.fullmatch(r"[0-9a-f]{12}", html_data_version):
+        errors.append(f"{path}: DATA_VERSION must be a 12-character hex string")
     else:
-        html_data_version = version_match.group(1)
-        if not re.fullmatch(r"[0-9a-f]{12}", html_data_version):
-            errors.append(f"{path}: DATA_VERSION must be a 12-character hex string")
+        expected_data_version = None
+        if payload_digests is not None and all(
+            date in payload_digests for date in normalized_dates
+        ):
+            expected_data_version = build_published_data_version_from_digests(
+                index_data,
+                {date: payload_digests[date] for date in normalized_dates},
+            )
         elif date_payloads_by_date is not None and all(
             date in date_payloads_by_date for date in normalized_dates
         ):
@@ -333,10 +760,13 @@ def validate_site_data_manifest(
                 index_data,
                 {date: date_payloads_by_date[date] for date in normalized_dates},
             )
-            if html_data_version != expected_data_version:
-                errors.append(
-                    f"{path}: DATA_VERSION mismatch: expected {expected_data_version}, got {html_data_version}"
-                )
+        if (
+            expected_data_version is not None
+            and html_data_version != expected_data_version
+        ):
+            errors.append(
+                f"{path}: DATA_VERSION mismatch: expected {expected_data_version}, got {html_data_version}"
+            )
 
     if (
         isinstance(loaded_dates, list)
@@ -349,6 +779,7 @@ def validate_site_data_manifest(
                 path,
                 loaded_dates=loaded_dates,
                 date_payloads_by_date=date_payloads_by_date,
+                manifest=manifest,
             )
         )
 
@@ -571,13 +1002,331 @@ def validate_prestige_excluded_payload(
     return errors
 
 
+def _published_paper_keys(date: str, date_data: Any) -> set[tuple[str, str]]:
+    keys = set()
+    for cluster in date_data.get("clusters", []) or []:
+        for paper in cluster.get("papers", []) or []:
+            arxiv_id = str(paper.get("arxiv_id") or "")
+            if arxiv_id:
+                keys.add((arxiv_id, date))
+    return keys
+
+
+def validate_search_shard(
+    shard_file: Path,
+    entry: dict[str, Any],
+    date_payloads_by_date: Mapping[str, Any],
+) -> list[str]:
+    """Check one month shard against its dictionary entry and the date payloads."""
+    shard, shard_error = read_json(shard_file)
+    if shard_error:
+        return [shard_error]
+    if not isinstance(shard, dict):
+        return [f"{shard_file}: search shard must be an object"]
+    if published_payload_digest(shard)[:12] != entry.get("digest"):
+        return [f"{shard_file}: search shard digest does not match search index"]
+
+    docs = shard.get("docs")
+    postings = shard.get("postings")
+    if not isinstance(docs, list) or not isinstance(postings, dict):
+        return [f"{shard_file}: search shard must contain docs and postings"]
+    errors: list[str] = []
+    doc_keys = {
+        (doc[0], doc[1])
+        for doc in docs
+        if isinstance(doc, list)
+        and len(doc) == 2
+        and all(isinstance(value, str) for value in doc)
+    }
+    if len(doc_keys) != len(docs):
+        errors.append(f"{shard_file}: search docs must be unique [arxiv_id, date]")
+    expected_keys: set[tuple[str, str]] = set()
+    for date in entry.get("dates") or []:
+        if isinstance(date_payloads_by_date.get(date), dict):
+            expected_keys |= _published_paper_keys(date, date_payloads_by_date[date])
+    if doc_keys != expected_keys:
+        errors.append(f"{shard_file}: search docs do not match published payloads")
+    for term, doc_ids in postings.items():
+        if not isinstance(doc_ids, list) or any(
+            isinstance(doc_id, bool)
+            or not isinstance(doc_id, int)
+            or not 0 <= doc_id < len(docs)
+            for doc_id in doc_ids
+        ):
+            errors.append(f"{shard_file}: postings of {term!r} reference unknown docs")
+            break
+        if not bloom_might_contain(entry, term):
+            errors.append(f"{shard_file}: term {term!r} missing from search index")
+            break
+    return errors
+
+
+def validate_search_index(
+    data_dir: Path,
+    normalized_dates: list[str],
+    date_payloads_by_date: Mapping[str, Any],
+    ledger: ValidationLedger | None = None,
+) -> list[str]:
+    """Validate the search dictionary and its month shards when published.
+
+    With a ``ledger``, a shard whose file, dictionary entry and member date
+    files all match the last successful validation is not re-read.
+    """
+    index_file = data_dir / SEARCH_INDEX_FILENAME
+    shard_names = {
+        path.name
+        for path in data_dir.glob("search-*.json")
+        if SEARCH_SHARD_RE.fullmatch(path.name)
+    }
+    if not exists_or_symlink(index_file):
+        return [
+            f"{data_dir / name}: search shard without {SEARCH_INDEX_FILENAME}"
+            for name in sorted(shard_names)
+        ]
+    search_index, index_error = read_json(index_file)
+    if index_error:
+        return [index_error]
+    if not isinstance(search_index, dict) or not isinstance(
+        search_index.get("months"), list
+    ):
+        return [f"{index_file}: search index must contain a months list"]
+
+    errors: list[str] = []
+    dates_by_month: dict[str, list[str]] = {}
+    for date in normalized_dates:
+        dates_by_month.setdefault(date[:7], []).append(date)
+    listed_months: list[str] = []
+    for position, entry in enumerate(search_index["months"], 1):
+        if not isinstance(entry, dict) or not isinstance(entry.get("month"), str):
+            errors.append(f"{index_file}: months[{position}] must name a month")
+            continue
+        month = entry["month"]
+        listed_months.append(month)
+        if entry.get("file") != search_shard_filename(month):
+            errors.append(f"{index_file}: months[{position}] has an invalid file")
+            continue
+        if entry.get("dates") != dates_by_month.get(month):
+            errors.append(f"{index_file}: {month} dates do not match index.json")
+        bits = entry.get("bits")
+        if (
+            isinstance(bits, bool)
+            or not isinstance(bits, int)
+            or bits < 8
+            or bits % 8
+            or not isinstance(entry.get("bloom"), str)
+        ):
+            errors.append(f"{index_file}: {month} has an invalid term filter")
+            continue
+        shard_file = data_dir / entry["file"]
+        if not exists_or_symlink(shard_file):
+            errors.append(f"{shard_file}: listed in search index but missing")
+            continue
+        if ledger is None:
+            errors.extend(
+                validate_search_shard(shard_file, entry, date_payloads_by_date)
+            )
+            continue
+        member_files = [
+            data_dir / f"{date}.json"
+            for date in entry.get("dates") or []
+            if isinstance(date, str)
+        ]
+        errors.extend(
+            ledger.check(
+                f"search:{entry['file']}",
+                [shard_file, *member_files],
+                partial(
+                    validate_search_shard, shard_file, entry, date_payloads_by_date
+                ),
+                extra=json.dumps(entry, sort_keys=True),
+            )
+        )
+    if sorted(listed_months) != sorted(dates_by_month):
+        errors.append(f"{index_file}: months must cover exactly the published months")
+    listed_files = {search_shard_filename(month) for month in listed_months}
+    for name in sorted(shard_names - listed_files):
+        errors.append(f"{data_dir / name}: stale search shard not in search index")
+    return errors
+
+
+def validate_date_bundle(
+    bundle_file: Path,
+    dates: Any,
+    date_payloads_by_date: Mapping[str, Any],
+) -> list[str]:
+    """Check one weekly bundle against the date files it concatenates."""
+    bundle, bundle_error = read_json(bundle_file)
+    if bundle_error:
+        return [bundle_error]
+    members = bundle.get("dates") if isinstance(bundle, dict) else None
+    if not isinstance(members, dict) or sorted(members) != sorted(dates or []):
+        return [f"{bundle_file}: bundle dates do not match index.json"]
+    return [
+        f"{bundle_file}: {date} differs from its date file"
+        for date, payload in members.items()
+        if payload != date_payloads_by_date.get(date)
+    ]
+
+
+def validate_date_bundles(
+    data_dir: Path,
+    index_data: dict[str, Any],
+    normalized_dates: list[str],
+    date_payloads_by_date: Mapping[str, Any],
+    ledger: ValidationLedger | None = None,
+) -> list[str]:
+    """Validate weekly range bundles against index.json and the date files."""
+    index_file = data_dir / "index.json"
+    bundle_names = {
+        path.name
+        for path in data_dir.glob("bundle-*.json")
+        if BUNDLE_RE.fullmatch(path.name)
+    }
+    plan = index_data.get("bundles")
+    if plan is None:
+        return [
+            f"{data_dir / name}: bundle file without bundles in index.json"
+            for name in sorted(bundle_names)
+        ]
+    if not isinstance(plan, dict):
+        return [f"{index_file}: bundles must be an object"]
+
+    errors: list[str] = []
+    if plan != plan_date_bundles(normalized_dates):
+        errors.append(f"{index_file}: bundles do not match the indexed dates")
+    for week, dates in plan.items():
+        bundle_file = data_dir / bundle_filename(str(week))
+        if not exists_or_symlink(bundle_file):
+            errors.append(f"{bundle_file}: listed in index.json but missing")
+            continue
+        if ledger is None:
+            errors.extend(
+                validate_date_bundle(bundle_file, dates, date_payloads_by_date)
+            )
+            continue
+        member_files = [
+            data_dir / f"{date}.json" for date in dates or [] if isinstance(date, str)
+        ]
+        errors.extend(
+            ledger.check(
+                f"bundle:{bundle_file.name}",
+                [bundle_file, *member_files],
+                partial(
+                    validate_date_bundle, bundle_file, dates, date_payloads_by_date
+                ),
+                extra=json.dumps(dates),
+            )
+        )
+    listed_files = {bundle_filename(str(week)) for week in plan}
+    for name in sorted(bundle_names - listed_files):
+        errors.append(f"{data_dir / name}: stale bundle not in index.json")
+    return errors
+
+
+def _read_date_file(
+    date_file: Path, date: str
+) -> tuple[list[str], str | None, dict[str, Any] | None]:
+    date_data, date_error = read_json(date_file)
+    if date_error:
+        return [date_error], None, None
+    if not isinstance(date_data, dict):
+        return [f"{date_file}: date payload must be an object"], None, None
+    ok, payload_errors = validate_date_data_payload(date_data, expected_date=date)
+    errors = [] if ok else [f"{date_file}: {error}" for error in payload_errors]
+    return errors, published_payload_digest(date_data), date_data
+
+
+def _validate_date_file(date_file: str, date: str) -> tuple[list[str], str | None]:
+    """Process-pool worker: errors and payload digest of one date file."""
+    errors, digest, _ = _read_date_file(Path(date_file), date)
+    return errors, digest
+
+
+def validate_date_files(
+    data_dir: Path,
+    normalized_dates: list[str],
+    payloads: DatePayloads,
+    ledger: ValidationLedger,
+    jobs: int = 1,
+) -> tuple[list[str], dict[str, str]]:
+    """Validate every published date file.
+
+    Returns the errors in index order and the payload digest of every date
+    whose file holds an object.  Files the ledger vouches for are not read;
+    the rest are spread over ``jobs`` worker processes when there are enough
+    of them to pay for the pool.
+    """
+    digests: dict[str, str] = {}
+    pending: list[tuple[str, Path, str | None]] = []
+    for date in normalized_dates:
+        date_file = data_dir / f"{date}.json"
+        if not exists_or_symlink(date_file):
+            continue
+        key = f"date:{date}"
+        inputs = ledger.inputs_digest([date_file]) if ledger.enabled else None
+        record = ledger.verified(key, inputs)
+        if record is not None and isinstance(record.get("payload_digest"), str):
+            ledger.skipped += 1
+            ledger.record(key, inputs, payload_digest=record["payload_digest"])
+            digests[date] = record["payload_digest"]
+            continue
+        pending.append((date, date_file, inputs))
+
+    results: list[tuple[list[str], str | None]] | None = None
+    if jobs > 1 and len(pending) >= PARALLEL_MIN_DATE_FILES:
+        workers = min(jobs, len(pending))
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=validation_pool_context()
+            ) as executor:
+                results = list(
+                    executor.map(
+                        _validate_date_file,
+                        [str(date_file) for _, date_file, _ in pending],
+                        [date for date, _, _ in pending],
+                        chunksize=max(1, len(pending) // (workers * 4)),
+                    )
+                )
+        except (OSError, BrokenProcessPool) as exc:
+            print(
+                f"Parallel validation unavailable, validating serially: {exc}",
+                file=sys.stderr,
+            )
+    if results is None:
+        results = []
+        for date, date_file, _ in pending:
+            date_errors, digest, date_data = _read_date_file(date_file, date)
+            if date_data is not None:
+                payloads.remember(date, date_data)
+            results.append((date_errors, digest))
+
+    errors: list[str] = []
+    for (date, _, inputs), (date_errors, digest) in zip(pending, results):
+        errors.extend(date_errors)
+        if digest is None:
+            continue
+        digests[date] = digest
+        if not date_errors:
+            ledger.record(f"date:{date}", inputs, payload_digest=digest)
+    return errors, digests
+
+
 def validate_webpages_data(
     webpages_dir: Path,
     *,
     today: dt.date | None = None,
+    jobs: int | None = None,
+    use_ledger: bool = True,
 ) -> list[str]:
-    """Return publication-blocking errors for a webpages/ directory."""
+    """Return publication-blocking errors for a webpages/ directory.
+
+    ``jobs`` worker processes validate the date files (default: one per CPU,
+    at most ``MAX_VALIDATION_JOBS``).  With ``use_ledger`` the checks that
+    passed last time on byte-identical inputs are skipped; the ledger is only
+    updated when the whole directory validates.
+    """
     today = today or dt.date.today()
+    jobs = default_validation_jobs() if jobs is None else max(1, jobs)
     errors: list[str] = []
     data_dir = webpages_dir / "data"
     index_file = data_dir / "index.json"
@@ -587,7 +1336,14 @@ def validate_webpages_data(
         if not exists_or_symlink(webpages_dir):
             return [f"{webpages_dir}: webpages directory does not exist"]
         return [f"{webpages_dir}: webpages directory must be an ordinary directory"]
+    ledger = ValidationLedger(webpages_dir, enabled=use_ledger)
     errors.extend(validate_html_page(site_index_file, required_reference="data/"))
+    errors.extend(validate_precompressed_siblings(site_index_file, ledger))
+    asset_dir = webpages_dir / "assets"
+    if asset_dir.is_dir() and not asset_dir.is_symlink():
+        for entry in sorted(asset_dir.iterdir()):
+            if entry.suffix in COMPRESSED_SUFFIXES:
+                errors.extend(check_precompressed_variant(entry, ledger))
 
     if data_dir.is_symlink() or not data_dir.is_dir():
         if not exists_or_symlink(data_dir):
@@ -645,7 +1401,11 @@ def validate_webpages_data(
         if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
             errors.append(f"{index_file}: {field} must be a positive integer")
 
-    allowed_json_names = {"index.json", PRESTIGE_EXCLUDED_FILENAME}
+    allowed_json_names = {
+        "index.json",
+        PRESTIGE_EXCLUDED_FILENAME,
+        SEARCH_INDEX_FILENAME,
+    }
     for entry in sorted(data_dir.iterdir()):
         if entry.is_symlink():
             errors.append(
@@ -660,10 +1420,20 @@ def validate_webpages_data(
                 f"{entry}: unexpected filesystem entry in published data directory"
             )
             continue
-        if entry.suffix != ".json":
+        json_entry = entry
+        if entry.suffix in COMPRESSED_SUFFIXES:
+            json_entry = entry.with_suffix("")
+        if json_entry.suffix != ".json":
             errors.append(f"{entry}: unexpected file in published data directory")
             continue
-        if entry.name in allowed_json_names or DATE_RE.fullmatch(entry.stem):
+        if (
+            json_entry.name in allowed_json_names
+            or DATE_RE.fullmatch(json_entry.stem)
+            or SEARCH_SHARD_RE.fullmatch(json_entry.name)
+            or BUNDLE_RE.fullmatch(json_entry.name)
+        ):
+            if json_entry is not entry:
+                errors.extend(check_precompressed_variant(entry, ledger))
             continue
         errors.append(f"{entry}: unexpected JSON file in published data directory")
 
@@ -688,23 +1458,20 @@ def validate_webpages_data(
     for stale in sorted(file_dates - index_dates):
         errors.append(f"{data_dir / (stale + '.json')}: stale date file not in index")
 
-    date_payloads_by_date: dict[str, Any] = {}
-    for date in normalized_dates:
-        date_file = data_dir / f"{date}.json"
-        if not exists_or_symlink(date_file):
-            continue
-        date_data, date_error = read_json(date_file)
-        if date_error:
-            errors.append(date_error)
-            continue
-        if not isinstance(date_data, dict):
-            errors.append(f"{date_file}: date payload must be an object")
-            continue
-        date_payloads_by_date[date] = date_data
-        ok, payload_errors = validate_date_data_payload(date_data, expected_date=date)
-        if not ok:
-            for error in payload_errors:
-                errors.append(f"{date_file}: {error}")
+    date_payloads_by_date = DatePayloads(data_dir, normalized_dates)
+    date_errors, payload_digests = validate_date_files(
+        data_dir, normalized_dates, date_payloads_by_date, ledger, jobs
+    )
+    errors.extend(date_errors)
+
+    errors.extend(
+        validate_search_index(data_dir, normalized_dates, date_payloads_by_date, ledger)
+    )
+    errors.extend(
+        validate_date_bundles(
+            data_dir, index_data, normalized_dates, date_payloads_by_date, ledger
+        )
+    )
 
     errors.extend(
         validate_site_data_manifest(
@@ -712,6 +1479,7 @@ def validate_webpages_data(
             index_data=index_data,
             normalized_dates=normalized_dates,
             date_payloads_by_date=date_payloads_by_date,
+            payload_digests=payload_digests,
         )
     )
 
@@ -743,6 +1511,8 @@ def validate_webpages_data(
                 )
             )
 
+    if not errors:
+        ledger.save()
     return errors
 
 
@@ -756,9 +1526,22 @@ def main(argv: list[str] | None = None) -> int:
         type=Path,
         help="Path to the webpages directory.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for date files (default: one per CPU, at most 8).",
+    )
+    parser.add_argument(
+        "--no-ledger",
+        action="store_true",
+        help="Re-validate everything instead of skipping unchanged, already validated files.",
+    )
     args = parser.parse_args(argv)
 
-    errors = validate_webpages_data(args.webpages_dir)
+    errors = validate_webpages_data(
+        args.webpages_dir, jobs=args.jobs, use_ledger=not args.no_ledger
+    )
     if errors:
         print("Published payload validation failed:")
         for error in errors:
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+多日期流水线编排
+Pipelined multi-date backlog processing.
+
+Every date runs as two ``pipeline.py`` children:
+
+1. prepare: crawl -> filter -> cluster -> extract (``--stop-after extract``);
+2. publish: summary -> unified page (``--start-from summary``).
+
+A prepare lane works through the dates in order while a publish lane
+summarizes and publishes them, also in order.  Crawling, filtering and
+full-text extraction of later dates therefore overlap the rate-limited summary
+stage of earlier ones, and the prepare lane stays at most ``--lookahead``
+dates ahead.  Only the publish lane writes ``webpages/``, one date at a time,
+and the whole run holds the same publish lock as the daily wrappers.
+
+Options this script does not know (``--categories``, ``--max-papers-total``,
+...) are passed to every ``pipeline.py`` child unchanged.
+"""
+
+import argparse
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None
+
+# 添加项目根目录到Python路径
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.utils.exceptions import ValidationError
+from src.utils.io import load_json, save_json
+from src.utils.validation import validate_date_string, validate_positive_int
+
+DEFAULT_LOOKAHEAD = 2
+PREPARE_ARGS = ["--stop-after", "extract"]
+PUBLISH_ARGS = ["--start-from", "summary"]
+SKIPPED_STATUSES = ("skipped_no_source_papers", "skipped_no_selected_papers")
+
+PhaseRunner = Callable[[str, str, List[str]], Tuple[int, Dict[str, Any]]]
+
+
+def publish_lock_path() -> str:
+    """The publish lock file shared with the daily and batch wrappers."""
+    return (
+        os.getenv("PAPERTOOLS_PUBLISH_LOCK_FILE")
+        or os.getenv("PAPERTOOLS_DAILY_LOCK_FILE")
+        or os.path.join("logs", "papertools_publish.lock")
+    )
+
+
+def acquire_publish_lock(path: str) -> Optional[IO[str]]:
+    """Take the publish lock without waiting; None if another run holds it."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    handle = open(path, "a", encoding="utf-8")
+    if fcntl is None:
+        return handle
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+
+def make_phase_runner(run_dir: str, pipeline_args: List[str]) -> PhaseRunner:
+    """Return a runner that executes one pipeline phase for one date.
+
+    Each phase writes its own status file and log under ``run_dir``; the
+    runner returns the child's exit code and parsed status.
+    """
+
+    def run_phase(
+        date: str, phase: str, phase_args: List[str]
+    ) -> Tuple[int, Dict[str, Any]]:
+        status_file = os.path.join(run_dir, f"{phase}_status_{date}.json")
+        log_file = os.path.join(run_dir, f"{phase}_{date}.log")
+        cmd = [
+            sys.executable,
+            "src/core/pipeline.py",
+            "--date",
+            date,
+            "--skip-serve",
+            "--status-file",
+            status_file,
+            *phase_args,
+            *pipeline_args,
+        ]
+        with open(log_file, "w", encoding="utf-8") as log:
+            returncode = subprocess.run(
+                cmd, stdout=log, stderr=subprocess.STDOUT, text=True
+            ).returncode
+        status = load_json(status_file, default={})
+        return returncode, status if isinstance(status, dict) else {}
+
+    return run_phase
+
+
+def phase_result(phase: str, returncode: int, status: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize a finished phase for the backlog status file."""
+    status_value = status.get("status") or "missing"
+    if returncode != 0 and status_value in ("ok", "missing"):
+        status_value = "failed"
+    return {
+        "status": status_value,
+        "phase": phase,
+        "exit_code": returncode,
+        "reason": status.get("reason"),
+    }
+
+
+def run_backlog(
+    dates: List[str],
+    run_phase: PhaseRunner,
+    lookahead: int = DEFAULT_LOOKAHEAD,
+) -> Dict[str, Dict[str, Any]]:
+    """Prepare and publish every date; returns per-date results in date order."""
+    prepared: "queue.Queue[Optional[Tuple[str, int, Dict[str, Any]]]]" = queue.Queue(
+        maxsize=lookahead
+    )
+
+    def prepare_lane() -> None:
+        try:
+            for date in dates:
+                print(f"🔧 {date} 开始爬取/筛选/聚类/预提取")
+                try:
+                    returncode, status = run_phase(date, "prepare", PREPARE_ARGS)
+                except Exception as exc:
+                    returncode, status = 1, {"status": "failed", "reason": str(exc)}
+                prepared.put((date, returncode, status))
+        finally:
+            prepared.put(None)
+
+    preparer = threading.Thread(target=prepare_lane, name="backlog-prepare")
+    preparer.daemon = True
+    preparer.start()
+
+    results: Dict[str, Dict[str, Any]] = {}
+    while True:
+        item = prepared.get()
+        if item is None:
+            break
+        date, returncode, status = item
+        result = phase_result("prepare", returncode, status)
+        if result["status"] != "ok":
+            icon = "⏭️" if result["status"] in SKIPPED_STATUSES else "❌"
+            print(f"{icon} {date} 准备阶段结束: {result['status']}")
+            results[date] = result
+            continue
+
+        print(f"📝 {date} 开始总结与发布")
+        try:
+            returncode, status = run_phase(date, "publish", PUBLISH_ARGS)
+        except Exception as exc:
+            returncode, status = 1, {"status": "failed", "reason": str(exc)}
+        result = phase_result("publish", returncode, status)
+        icon = {"ok": "✅", "partial": "⏳"}.get(result["status"], "❌")
+        print(f"{icon} {date} 发布阶段结束: {result['status']}")
+        results[date] = result
+    preparer.join()
+
+    for date in dates:
+        results.setdefault(
+            date,
+            {"status": "failed", "phase": "prepare", "exit_code": 1, "reason": None},
+        )
+    return {date: results[date] for date in dates}
+
+
+def main() -> int:
+    """主函数"""
+    parser = argparse.ArgumentParser(
+        description="按流水线方式处理多个日期：后续日期的准备阶段与前一日期的总结阶段并行"
+    )
+    parser.add_argument(
+        "--dates", nargs="+", required=True, help="要处理的日期 (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        "--lookahead",
+        type=int,
+        default=DEFAULT_LOOKAHEAD,
+        help=f"准备阶段最多领先发布阶段的日期数 (默认: {DEFAULT_LOOKAHEAD})",
+    )
+    parser.add_argument("--status-file", default=None, help="写入各日期结果 JSON")
+    args, pipeline_args = parser.parse_known_args()
+
+    try:
+        validate_positive_int(args.lookahead, "--lookahead")
+        dates = sorted({validate_date_string(date, "--dates") for date in args.dates})
+    except ValidationError as exc:
+        print(f"❌ 参数校验失败: {exc}")
+        return 2
+
+    lock_file = publish_lock_path()
+    lock = acquire_publish_lock(lock_file)
+    if lock is None:
+        print(f"⏭️ 已有 PaperTools 发布或回填任务在运行，跳过本次处理: {lock_file}")
+        return 0
+
+    try:
+        run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        run_dir = os.path.join("logs", f"backlog_{run_id}")
+        os.makedirs(run_dir, exist_ok=True)
+        print(f"🚀 多日期流水线: {', '.join(dates)}")
+        print(f"📂 各阶段日志: {run_dir}")
+
+        started_at = time.time()
+        results = run_backlog(
+            dates,
+            make_phase_runner(run_dir, pipeline_args),
+            lookahead=args.lookahead,
+        )
+        failed = [
+            date
+            for date, result in results.items()
+            if result["status"] not in ("ok", "partial", *SKIPPED_STATUSES)
+        ]
+        if args.status_file:
+            save_json(
+                args.status_file,
+                {
+                    "status": "failed" if failed else "ok",
+                    "dates": results,
+                    "duration_seconds": round(time.time() - started_at, 1),
+                    "created_at": datetime.now().isoformat(timespec="seconds"),
+                },
+            )
+
+        published = [d for d, r in results.items() if r["status"] == "ok"]
+        print(f"\n📊 已发布: {', '.join(published) or '无'}")
+        if failed:
+            print(f"❌ 失败日期: {', '.join(failed)}")
+            return 1
+        return 0
+    finally:
+        lock.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
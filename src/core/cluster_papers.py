@@ -5,12 +5,14 @@ Groups filtered papers into research topic clusters using an LLM.
 Runs after filter stage, before summarize stage.
 """
 
+import hashlib
 import json
 import os
 import re
 import sys
 import argparse
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 # Add project root to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -22,19 +24,34 @@ from openai import OpenAI
 from src.utils.config import (
     CLUSTER_API_KEY,
     CLUSTER_BASE_URL,
+    CLUSTER_ENGINE,
+    CLUSTER_MAX_WORKERS,
     CLUSTER_MODEL,
+    CLUSTER_TAXONOMY_ENABLED,
+    CLUSTER_TAXONOMY_FILE,
+    CLUSTER_TAXONOMY_MIN_SIMILARITY,
     TEMPERATURE,
     DOMAIN_PAPER_DIR,
+    ENABLE_CACHE,
+    CLUSTER_CACHE_INCREMENTAL_MAX_RATIO,
 )
-from src.utils.io import save_json
+from src.utils.cache_manager import CacheManager
+from src.utils.io import load_stage_input, remember_stage_output, save_json
 from src.utils.openai_client import create_openai_client
+from src.utils.profiling import profiled
 from src.utils.retry import retry_with_backoff
+from src.utils.stage_manifest import write_stage_manifest
+from src.utils.text_clustering import local_clustering_available
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
 BATCH_SIZE = 60  # Maximum papers per clustering request
+CLUSTER_ENGINES = ("auto", "local", "llm")
+# Bump whenever prompts or engine behaviour change so cached assignments expire.
+CLUSTER_PROMPT_VERSION = "2"
+NAMING_SAMPLE_SIZE = 5  # Representative titles shown per group when naming
 CLUSTER_MODEL_CHAIN_ENV = (
     os.getenv("PAPERTOOLS_CLUSTER_MODEL_CHAIN")
     or os.getenv("CLUSTER_MODEL_CHAIN")
@@ -47,7 +64,7 @@ CLUSTER_PROMPT = """You are an expert researcher helping to organise a set of ac
 Below is a list of papers (index, title, and a short abstract excerpt). Your task is to:
 1. Identify 3 to 8 natural research clusters that best describe the topics covered.
 2. Assign every paper to exactly one cluster.
-3. Choose short, descriptive cluster names (e.g. "Multi-Agent Collaboration", "Tool Use & Planning", "Self-Evolving Agents").
+3. Choose short, descriptive cluster names (e.g. "Multi-Agent Collaboration", "Tool Use & Planning", "Self-Evolving Agents").{known_names_text}
 
 Return ONLY a valid JSON object in this exact format (no markdown fences, no extra text):
 {{
@@ -78,6 +95,23 @@ Cluster names to merge:
 {names_text}
 """
 
+NAMING_PROMPT = """You are an expert researcher. A set of academic papers has already been grouped by topic. For each group below you see its most distinctive keywords and a few representative paper titles.
+
+Give every group a short, descriptive research-topic name (e.g. "Multi-Agent Collaboration", "Tool Use & Planning", "Self-Evolving Agents"). Different groups should get different names.{known_names_text}
+
+Return ONLY a valid JSON object mapping each group id to its name (no markdown fences, no extra text):
+{{
+  "names": {{
+    "0": "Cluster Name",
+    "1": "Cluster Name",
+    ...
+  }}
+}}
+
+Groups:
+{groups_text}
+"""
+
 
 # ---------------------------------------------------------------------------
 # LLM helpers
@@ -334,12 +368,29 @@ def _validate_cluster_assignments(
         print(f"⚠️ {len(missing)} papers missing cluster assignments, assigned to '{default_cluster}'")
 
 
+def known_names_prompt_text(known_names: Optional[List[str]]) -> str:
+    """Prompt suffix asking the LLM to reuse cross-day taxonomy names."""
+    if not known_names:
+        return ""
+    return (
+        "\n\nThese cluster names are already used on earlier days. If a group "
+        "clearly fits one of them, reuse that name exactly:\n"
+        + "\n".join(f"- {name}" for name in known_names)
+    )
+
+
 def cluster_batch(
-    client: OpenAI, model: Any, papers: list, temperature: float
+    client: OpenAI,
+    model: Any,
+    papers: list,
+    temperature: float,
+    known_names: Optional[List[str]] = None,
 ) -> Dict[str, List[int]]:
     """Cluster one batch of papers. Returns a dict mapping cluster name -> list of indices."""
     papers_text = _build_papers_text(papers)
-    prompt = CLUSTER_PROMPT.format(papers_text=papers_text)
+    prompt = CLUSTER_PROMPT.format(
+        papers_text=papers_text, known_names_text=known_names_prompt_text(known_names)
+    )
 
     try:
         raw = call_llm_for_clustering_with_fallback(client, model, prompt, temperature)
@@ -392,16 +443,466 @@ def merge_cluster_names(
         raise RuntimeError(f"cluster merge failed: {exc}") from exc
 
 
+def run_cluster_batches(
+    client: OpenAI,
+    model: Any,
+    batches: List[list],
+    temperature: float,
+    max_workers: Optional[int] = None,
+    known_names: Optional[List[str]] = None,
+) -> List[Dict[str, List[int]]]:
+    """Cluster batches in a bounded thread pool.
+
+    Each batch keeps its own retry and model fallback inside ``cluster_batch``.
+    Results are returned in batch order regardless of completion order; the
+    first failing batch (by offset) is re-raised so the stage still fails closed.
+    """
+    workers = min(max_workers or CLUSTER_MAX_WORKERS, len(batches))
+    if workers <= 1:
+        return [
+            cluster_batch(client, model, batch, temperature, known_names)
+            for batch in batches
+        ]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                cluster_batch, client, model, batch, temperature, known_names
+            )
+            for batch in batches
+        ]
+        return [future.result() for future in futures]
+
+
+def cluster_papers_with_llm(
+    papers: list,
+    client: OpenAI,
+    model: Any,
+    temperature: float,
+    max_workers: Optional[int] = None,
+    name_mapping: Optional[Dict[str, str]] = None,
+    known_names: Optional[List[str]] = None,
+) -> Dict[str, List[int]]:
+    """Partition papers with LLM batch calls; returns cluster name -> indices.
+
+    If ``name_mapping`` is given, raw batch names found in it are mapped to
+    their canonical names first, and the mapping is updated in place with
+    this run's merge result.  ``known_names`` are offered to every batch for
+    reuse, like in :func:`name_clusters_with_llm`.
+    """
+    if name_mapping is None:
+        name_mapping = {}
+    # Split into batches of BATCH_SIZE
+    batches = [papers[i : i + BATCH_SIZE] for i in range(0, len(papers), BATCH_SIZE)]
+
+    # Batches are independent LLM calls; run them concurrently but assemble the
+    # results by batch offset so the output matches a serial run.
+    batch_results = run_cluster_batches(
+        client, model, batches, temperature, max_workers, known_names
+    )
+
+    # cluster_name -> list of global indices
+    global_clusters: Dict[str, List[int]] = {}
+    offset = 0
+
+    for batch, batch_result in zip(batches, batch_results):
+        for name, local_indices in batch_result.items():
+            name = name_mapping.get(name, name)
+            global_indices = [offset + idx for idx in local_indices if idx < len(batch)]
+            if name not in global_clusters:
+                global_clusters[name] = []
+            global_clusters[name].extend(global_indices)
+        offset += len(batch)
+
+    # Merge cluster names if there are too many unique ones (from multiple batches)
+    if len(batches) > 1:
+        all_names = list(global_clusters.keys())
+        merge_mapping = merge_cluster_names(client, model, all_names, temperature)
+        merged: Dict[str, List[int]] = {}
+        for old_name, indices in global_clusters.items():
+            canonical = merge_mapping.get(old_name, old_name)
+            merged.setdefault(canonical, [])
+            merged[canonical].extend(indices)
+        global_clusters = merged
+        for raw_name, old_name in list(name_mapping.items()):
+            name_mapping[raw_name] = merge_mapping.get(old_name, old_name)
+        for old_name, canonical in merge_mapping.items():
+            name_mapping.setdefault(old_name, canonical)
+
+    return global_clusters
+
+
+def resolve_cluster_engine(engine: Optional[str] = None) -> str:
+    """Resolve ``auto`` to ``local`` when NumPy is available, else ``llm``.
+
+    The default is ``llm``; ``local`` and ``auto`` must be chosen explicitly.
+    """
+    engine = (engine or CLUSTER_ENGINE or "llm").strip().lower()
+    if engine not in CLUSTER_ENGINES:
+        raise ValueError(
+            f"unknown cluster engine {engine!r}; expected one of {', '.join(CLUSTER_ENGINES)}"
+        )
+    if engine == "auto":
+        return "local" if local_clustering_available() else "llm"
+    if engine == "local" and not local_clustering_available():
+        raise RuntimeError(
+            "local cluster engine requires numpy: pip install -e '.[cluster-local]'"
+        )
+    return engine
+
+
+def name_clusters_with_llm(
+    client: OpenAI,
+    model: Any,
+    groups: List[Dict[str, Any]],
+    temperature: float,
+    known_names: Optional[List[str]] = None,
+) -> Dict[int, str]:
+    """Ask the LLM for one name per group from its keywords and sample titles.
+
+    ``known_names`` (from the cross-day taxonomy) are offered for reuse so the
+    same topic keeps the same tag across dates.
+    """
+    blocks = []
+    for group_id, group in enumerate(groups):
+        titles = "\n".join(f"  - {title}" for title in group["titles"])
+        keywords = ", ".join(group["keywords"]) or "(none)"
+        blocks.append(f"[{group_id}] keywords: {keywords}\n{titles}")
+    prompt = NAMING_PROMPT.format(
+        groups_text="\n\n".join(blocks),
+        known_names_text=known_names_prompt_text(known_names),
+    )
+
+    raw = call_llm_for_clustering_with_fallback(client, model, prompt, temperature)
+    names = parse_json_response(raw).get("names")
+    if not isinstance(names, dict):
+        raise ValueError("naming output must contain a names object")
+
+    result: Dict[int, str] = {}
+    for group_id in range(len(groups)):
+        name = names.get(str(group_id))
+        if isinstance(name, str) and name.strip():
+            result[group_id] = name.strip()
+    return result
+
+
+def cluster_papers_locally(
+    papers: list,
+    client: Optional[OpenAI],
+    model: Any,
+    temperature: float,
+    known_names: Optional[List[str]] = None,
+) -> Dict[str, List[int]]:
+    """Group papers with local TF-IDF k-means and let the LLM only name groups.
+
+    Grouping is deterministic and needs no network.  Naming is a single small
+    prompt; without a client, or if the call fails, groups fall back to names
+    built from their keywords.
+    """
+    from src.utils import text_clustering
+
+    term_lists = [text_clustering.paper_terms(paper) for paper in papers]
+    df = text_clustering.document_frequencies(term_lists)
+    vectors = text_clustering.vectorize(term_lists, df, len(papers))
+    labels, centroids = text_clustering.spherical_kmeans(
+        vectors, text_clustering.choose_cluster_count(len(papers))
+    )
+
+    members: Dict[int, List[int]] = {}
+    for index, label in enumerate(labels):
+        members.setdefault(label, []).append(index)
+
+    groups = []
+    for label in sorted(members):
+        indices = members[label]
+        representatives = text_clustering.representative_indices(
+            vectors, indices, centroids[label], NAMING_SAMPLE_SIZE
+        )
+        groups.append(
+            {
+                "indices": indices,
+                "keywords": text_clustering.group_keywords(
+                    term_lists, indices, df, len(papers)
+                ),
+                "titles": [
+                    str(papers[i].get("title", "")).strip() for i in representatives
+                ],
+            }
+        )
+
+    llm_names: Dict[int, str] = {}
+    if client is not None:
+        try:
+            llm_names = name_clusters_with_llm(
+                client, model, groups, temperature, known_names
+            )
+        except Exception as exc:
+            print(f"⚠️ 聚类命名失败，使用关键词命名: {str(exc)[:240]}")
+
+    clusters: Dict[str, List[int]] = {}
+    for group_id, group in enumerate(groups):
+        name = llm_names.get(group_id) or text_clustering.keyword_cluster_name(
+            group["keywords"]
+        )
+        clusters.setdefault(name, []).extend(group["indices"])
+    return clusters
+
+
+def load_cluster_taxonomy(path: str = CLUSTER_TAXONOMY_FILE):
+    """Load the cross-day taxonomy, or None when disabled or NumPy is missing."""
+    if not CLUSTER_TAXONOMY_ENABLED or not local_clustering_available():
+        return None
+    from src.utils.cluster_taxonomy import ClusterTaxonomy
+
+    return ClusterTaxonomy.load(path)
+
+
+def cluster_papers_with_taxonomy(
+    papers: list,
+    client: Optional[OpenAI],
+    model: Any,
+    temperature: float,
+    engine: str,
+    taxonomy,
+    max_workers: Optional[int] = None,
+    min_similarity: float = CLUSTER_TAXONOMY_MIN_SIMILARITY,
+    name_mapping: Optional[Dict[str, str]] = None,
+) -> Dict[str, List[int]]:
+    """Assign papers to known clusters by similarity; cluster only leftovers.
+
+    The taxonomy centroids are updated in memory with this run's members; the
+    caller decides when to persist it.
+    """
+    from src.utils.text_clustering import paper_vectors
+
+    vectors = paper_vectors(papers)
+    known = taxonomy.assign(vectors, min_similarity)
+
+    clusters: Dict[str, List[int]] = {}
+    leftovers: List[int] = []
+    for index, name in enumerate(known):
+        if name is None:
+            leftovers.append(index)
+        else:
+            clusters.setdefault(name, []).append(index)
+    print(
+        f"Taxonomy: {len(papers) - len(leftovers)} papers matched "
+        f"{len(clusters)} known clusters, {len(leftovers)} left for {engine}"
+    )
+
+    if leftovers:
+        subset = [papers[index] for index in leftovers]
+        if engine == "local":
+            new_clusters = cluster_papers_locally(
+                subset, client, model, temperature, known_names=taxonomy.names()
+            )
+        else:
+            new_clusters = cluster_papers_with_llm(
+                subset,
+                client,
+                model,
+                temperature,
+                max_workers,
+                name_mapping,
+                known_names=taxonomy.names(),
+            )
+        for name, local_indices in new_clusters.items():
+            clusters.setdefault(name, []).extend(
+                leftovers[i] for i in local_indices if 0 <= i < len(leftovers)
+            )
+
+    for name, indices in clusters.items():
+        if name != "Other":
+            taxonomy.update(name, vectors[sorted(indices)])
+    return clusters
+
+
+def run_cluster_engine(
+    papers: list,
+    client: Optional[OpenAI],
+    model: Any,
+    temperature: float,
+    engine: str,
+    max_workers: Optional[int] = None,
+    taxonomy=None,
+    name_mapping: Optional[Dict[str, str]] = None,
+) -> Dict[str, List[int]]:
+    """Cluster all papers with the resolved engine, via the taxonomy if given."""
+    if taxonomy is not None:
+        return cluster_papers_with_taxonomy(
+            papers,
+            client,
+            model,
+            temperature,
+            engine,
+            taxonomy,
+            max_workers,
+            name_mapping=name_mapping,
+        )
+    if engine == "local":
+        return cluster_papers_locally(papers, client, model, temperature)
+    return cluster_papers_with_llm(
+        papers, client, model, temperature, max_workers, name_mapping
+    )
+
+
+def paper_cluster_id(paper: Dict[str, Any]) -> str:
+    """Stable per-paper id for the cluster cache (arxiv_id, else link/title)."""
+    return str(
+        paper.get("arxiv_id") or paper.get("link") or paper.get("title") or ""
+    ).strip()
+
+
+def cluster_cache_config(engine: str, model: Any) -> Dict[str, Any]:
+    """Settings that must match for a cached assignment to be reusable."""
+    return {
+        "engine": engine,
+        "models": coerce_cluster_model_chain(model),
+        "prompt_version": CLUSTER_PROMPT_VERSION,
+    }
+
+
+def cluster_cache_fingerprint(paper_ids: List[str], config: Dict[str, Any]) -> str:
+    """Digest of the ordered paper ids plus model and prompt version."""
+    payload = json.dumps(
+        {"config": config, "arxiv_ids": paper_ids}, sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def find_incremental_cluster_cache(
+    cache_manager: CacheManager,
+    config: Dict[str, Any],
+    paper_ids: List[str],
+    max_new_ratio: float = CLUSTER_CACHE_INCREMENTAL_MAX_RATIO,
+) -> Optional[Dict[str, Any]]:
+    """Pick the cached run covering most of ``paper_ids`` with few papers added."""
+    current = set(paper_ids)
+    best: Optional[Dict[str, Any]] = None
+    best_known = 0
+    for entry in cache_manager.find_cluster_caches(config):
+        known = len(current & set(entry["arxiv_ids"]))
+        if not known or len(current) - known > max_new_ratio * len(current):
+            continue
+        if known > best_known:
+            best, best_known = entry, known
+    return best
+
+
+def assign_new_papers(
+    papers: list,
+    clusters: Dict[str, List[int]],
+    new_indices: List[int],
+    client: Optional[OpenAI],
+    model: Any,
+    temperature: float,
+    max_workers: Optional[int] = None,
+    name_mapping: Optional[Dict[str, str]] = None,
+) -> Dict[str, List[int]]:
+    """Add ``new_indices`` to existing ``clusters`` without re-clustering the rest.
+
+    With NumPy each new paper joins the cluster with the closest centroid (no
+    LLM call); otherwise only the new papers are clustered by the LLM and the
+    resulting names are merged with the existing ones.
+    """
+    if not new_indices:
+        return clusters
+    if local_clustering_available():
+        from src.utils.text_clustering import nearest_groups, paper_vectors
+
+        names = list(clusters)
+        vectors = paper_vectors(papers)
+        nearest = nearest_groups(vectors, [clusters[n] for n in names], new_indices)
+        for index, group in zip(new_indices, nearest):
+            clusters[names[group]].append(index)
+        return clusters
+
+    subset = [papers[index] for index in new_indices]
+    new_clusters = cluster_papers_with_llm(
+        subset, client, model, temperature, max_workers, name_mapping
+    )
+    for name, local_indices in new_clusters.items():
+        clusters.setdefault(name, []).extend(
+            new_indices[i] for i in local_indices if 0 <= i < len(new_indices)
+        )
+    merge_mapping = merge_cluster_names(client, model, list(clusters), temperature)
+    merged: Dict[str, List[int]] = {}
+    for name, indices in clusters.items():
+        merged.setdefault(merge_mapping.get(name, name), []).extend(indices)
+    if name_mapping is not None:
+        for raw_name, old_name in list(name_mapping.items()):
+            name_mapping[raw_name] = merge_mapping.get(old_name, old_name)
+    return merged
+
+
+def cluster_papers_from_cache(
+    papers: list,
+    cache_manager: CacheManager,
+    config: Dict[str, Any],
+    fingerprint: str,
+    paper_ids: List[str],
+    client: Optional[OpenAI],
+    model: Any,
+    temperature: float,
+    max_workers: Optional[int],
+    name_mapping: Dict[str, str],
+) -> Optional[Dict[str, List[int]]]:
+    """Reuse a cached assignment, fully or incrementally; None on a miss."""
+    cached = cache_manager.get_cluster_cache(fingerprint)
+    if cached is None:
+        cached = find_incremental_cluster_cache(cache_manager, config, paper_ids)
+        if cached is None:
+            return None
+
+    assignments = cached["assignments"]
+    name_mapping.update(cached.get("name_mapping") or {})
+    clusters: Dict[str, List[int]] = {}
+    new_indices: List[int] = []
+    for index, paper_id in enumerate(paper_ids):
+        if paper_id in assignments:
+            clusters.setdefault(assignments[paper_id], []).append(index)
+        else:
+            new_indices.append(index)
+
+    if new_indices:
+        print(
+            f"Cluster cache: reusing {len(papers) - len(new_indices)} assignments, "
+            f"assigning {len(new_indices)} new papers"
+        )
+    else:
+        print(f"Cluster cache hit: reusing assignments for {len(papers)} papers")
+    return assign_new_papers(
+        papers,
+        clusters,
+        new_indices,
+        client,
+        model,
+        temperature,
+        max_workers,
+        name_mapping,
+    )
+
+
 def cluster_papers(
     papers: list,
     client: OpenAI,
     model: Any,
     temperature: float,
+    max_workers: Optional[int] = None,
+    engine: Optional[str] = None,
+    taxonomy=None,
+    cache_manager: Optional[CacheManager] = None,
 ) -> list:
     """Main clustering function.
 
     Adds ``cluster`` and ``tags`` fields to each paper dict (in-place copy).
-    Returns the enriched list.
+    Returns the enriched list.  ``engine`` selects local grouping with LLM
+    naming (``local``) or LLM partitioning in concurrent batches (``llm``, the
+    default ``CLUSTER_ENGINE``); ``auto`` prefers ``local`` when NumPy exists.
+    With a ``taxonomy`` (see ``load_cluster_taxonomy``), papers close to a known
+    cluster keep its name and only the rest go through the engine.  With a
+    ``cache_manager``, a re-run over the same paper set reuses the cached
+    assignment, and a run that only adds a few papers assigns just those.
     """
     enriched = [dict(p) for p in papers]  # shallow copy each paper
 
@@ -427,34 +928,38 @@ def cluster_papers(
     if not enriched:
         return enriched
 
-    # Split into batches of BATCH_SIZE
-    batches = [
-        enriched[i : i + BATCH_SIZE] for i in range(0, len(enriched), BATCH_SIZE)
-    ]
-
-    # cluster_name -> list of global indices
-    global_clusters: Dict[str, List[int]] = {}
-    offset = 0
-
-    for batch in batches:
-        batch_result = cluster_batch(client, model, batch, temperature)
-        for name, local_indices in batch_result.items():
-            global_indices = [offset + idx for idx in local_indices if idx < len(batch)]
-            if name not in global_clusters:
-                global_clusters[name] = []
-            global_clusters[name].extend(global_indices)
-        offset += len(batch)
-
-    # Merge cluster names if there are too many unique ones (from multiple batches)
-    if len(batches) > 1:
-        all_names = list(global_clusters.keys())
-        name_mapping = merge_cluster_names(client, model, all_names, temperature)
-        merged: Dict[str, List[int]] = {}
-        for old_name, indices in global_clusters.items():
-            canonical = name_mapping.get(old_name, old_name)
-            merged.setdefault(canonical, [])
-            merged[canonical].extend(indices)
-        global_clusters = merged
+    engine = resolve_cluster_engine(engine)
+    paper_ids = [paper_cluster_id(paper) for paper in enriched]
+    use_cache = cache_manager is not None and all(paper_ids)
+    cache_config = cluster_cache_config(engine, model)
+    fingerprint = cluster_cache_fingerprint(paper_ids, cache_config)
+    name_mapping: Dict[str, str] = {}
+
+    global_clusters = None
+    if use_cache:
+        global_clusters = cluster_papers_from_cache(
+            enriched,
+            cache_manager,
+            cache_config,
+            fingerprint,
+            paper_ids,
+            client,
+            model,
+            temperature,
+            max_workers,
+            name_mapping,
+        )
+    if global_clusters is None:
+        global_clusters = run_cluster_engine(
+            enriched,
+            client,
+            model,
+            temperature,
+            engine,
+            max_workers,
+            taxonomy,
+            name_mapping,
+        )
 
     # Assign cluster field to each paper
     for cluster_name, indices in global_clusters.items():
@@ -462,6 +967,17 @@ def cluster_papers(
             if 0 <= idx < len(enriched):
                 enriched[idx]["cluster"] = cluster_name
 
+    if use_cache:
+        cache_manager.set_cluster_cache(
+            fingerprint,
+            cache_config,
+            paper_ids,
+            {
+                paper_id: paper["cluster"]
+                for paper_id, paper in zip(paper_ids, enriched)
+            },
+            name_mapping,
+        )
     return enriched
 
 
@@ -469,6 +985,8 @@ def save_clustered_papers_output(output_filepath: str, clustered: List[dict]) ->
     """Atomically save clustered papers or raise so the stage fails closed."""
     if not save_json(output_filepath, clustered, indent=4, ensure_ascii=False):
         raise IOError(f"failed to save clustered papers: {output_filepath}")
+    write_stage_manifest(output_filepath, clustered)
+    remember_stage_output(output_filepath, clustered)
 
 
 # ---------------------------------------------------------------------------
@@ -476,6 +994,7 @@ def save_clustered_papers_output(output_filepath: str, clustered: List[dict]) ->
 # ---------------------------------------------------------------------------
 
 
+@profiled("cluster_papers")
 def main():
     parser = argparse.ArgumentParser(
         description="Cluster filtered papers into research topic groups using an LLM."
@@ -494,8 +1013,40 @@ def main():
     parser.add_argument(
         "--temperature", type=float, default=TEMPERATURE, help="Sampling temperature"
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=CLUSTER_MAX_WORKERS,
+        help=f"Concurrent clustering batches (default: {CLUSTER_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=CLUSTER_ENGINES,
+        default=None,
+        help=f"Clustering engine (default: CLUSTER_ENGINE={CLUSTER_ENGINE})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached cluster assignments and re-cluster from scratch",
+    )
+    parser.add_argument(
+        "--no-taxonomy",
+        action="store_true",
+        help="Ignore the cross-day cluster taxonomy for this run",
+    )
     args = parser.parse_args()
 
+    if args.max_workers < 1:
+        print("Error: --max-workers must be >= 1")
+        sys.exit(1)
+    requested_engine = (args.engine or CLUSTER_ENGINE or "llm").strip().lower()
+    try:
+        engine = resolve_cluster_engine(args.engine)
+    except (ValueError, RuntimeError) as exc:
+        print(f"Error: {exc}")
+        sys.exit(1)
+
     # Validate input file
     if not os.path.exists(args.input_file):
         print(f"Error: input file not found: {args.input_file}")
@@ -516,8 +1067,7 @@ def main():
 
     # Load papers
     try:
-        with open(args.input_file, "r", encoding="utf-8") as f:
-            papers = json.load(f)
+        papers = load_stage_input(args.input_file)
         print(f"Loaded {len(papers)} papers from {args.input_file}")
     except Exception as exc:
         print(f"Error reading input file: {exc}")
@@ -527,12 +1077,19 @@ def main():
         print("No papers to cluster.")
         sys.exit(0)
 
-    # Initialise OpenAI client
-    client = create_openai_client(
-        api_key=args.api_key,
-        base_url=args.base_url,
-        timeout=180.0,
-    )
+    # Initialise OpenAI client. The local engine only needs it for naming and
+    # falls back to keyword names when no client can be built (offline runs).
+    try:
+        client = create_openai_client(
+            api_key=args.api_key,
+            base_url=args.base_url,
+            timeout=180.0,
+        )
+    except Exception as exc:
+        if engine != "local":
+            raise
+        print(f"⚠️ 无法创建聚类 LLM 客户端，使用关键词命名: {exc}")
+        client = None
 
     model_chain = build_cluster_model_chain(args.model, args.base_url)
     if not model_chain:
@@ -542,11 +1099,31 @@ def main():
     print(
         f"Clustering {len(papers)} papers using model chain: {', '.join(model_chain)}"
     )
-    print(
-        f"Batch size: {BATCH_SIZE}, batches: {(len(papers) + BATCH_SIZE - 1) // BATCH_SIZE}"
-    )
+    # auto 会按是否安装 NumPy 选择引擎，把实际选中的引擎打出来
+    engine_source = " (auto)" if requested_engine == "auto" else ""
+    if engine == "local":
+        print(f"Engine: local{engine_source} TF-IDF k-means, LLM names groups only")
+    else:
+        print(
+            f"Engine: llm{engine_source}, batch size: {BATCH_SIZE}, "
+            f"batches: {(len(papers) + BATCH_SIZE - 1) // BATCH_SIZE}, "
+            f"workers: {args.max_workers}"
+        )
 
-    clustered = cluster_papers(papers, client, model_chain, args.temperature)
+    taxonomy = None if args.no_taxonomy else load_cluster_taxonomy()
+    if taxonomy is not None:
+        print(f"Taxonomy: {len(taxonomy.clusters)} known clusters ({taxonomy.path})")
+
+    clustered = cluster_papers(
+        papers,
+        client,
+        model_chain,
+        args.temperature,
+        max_workers=args.max_workers,
+        engine=engine,
+        taxonomy=taxonomy,
+        cache_manager=None if args.no_cache or not ENABLE_CACHE else CacheManager(),
+    )
 
     # Show cluster summary
     from collections import Counter
@@ -564,6 +1141,10 @@ def main():
         print(f"Error saving output file: {exc}")
         sys.exit(1)
 
+    # The taxonomy is only persisted after the clustered output is safely written.
+    if taxonomy is not None and not taxonomy.save():
+        print(f"⚠️ 聚类主题库保存失败: {taxonomy.path}")
+
 
 if __name__ == "__main__":
     main()
@@ -73,8 +73,11 @@ try:
     )
     from src.utils.cache_manager import CacheManager
     from src.utils.exceptions import CrawlError, ValidationError
-    from src.utils.io import save_json
+    from src.utils.io import remember_stage_output, save_json
+    from src.utils.profiling import profiled
     from src.utils.retry import retry_with_backoff
+    from src.utils.source_index import update_source_index
+    from src.utils.stage_manifest import write_stage_manifest
     from src.utils.validation import (
         validate_date_inputs,
         validate_positive_float,
@@ -96,6 +99,18 @@ except ImportError:
             filepath, data, indent=indent, ensure_ascii=ensure_ascii
         )
 
+    def remember_stage_output(filepath, data):  # type: ignore[no-redef]
+        return None
+
+    def profiled(stage):  # type: ignore[no-redef]
+        return lambda func: func
+
+    def update_source_index(directory, json_file, papers):  # type: ignore[no-redef]
+        return False
+
+    def write_stage_manifest(filepath, data):  # type: ignore[no-redef]
+        return False
+
     def validate_date_inputs(**kwargs):  # type: ignore[no-redef]
         return kwargs.get("date"), kwargs.get("start_date"), kwargs.get("end_date")
 
@@ -430,15 +445,19 @@ def save_papers(
         f"{'_'.join(sorted(selected_categories))}_paper_{date_suffix}.json"
     )
     combined_filepath = os.path.join(output_dir, combined_filename)
-    if not save_json(
-        combined_filepath, list(all_papers.values()), indent=4, ensure_ascii=False
-    ):
+    papers = list(all_papers.values())
+    if not save_json(combined_filepath, papers, indent=4, ensure_ascii=False):
         raise IOError(f"保存论文文件失败: {combined_filepath}")
     print(f"📚 已保存 {len(all_papers)} 篇去重论文到 {combined_filepath}")
+    # 同步 arxiv_id -> 元数据索引，供下游回填按需查询
+    update_source_index(output_dir, combined_filepath, papers)
+    write_stage_manifest(combined_filepath, papers)
+    remember_stage_output(combined_filepath, papers)
 
     return combined_filepath
 
 
+@profiled("crawl_arxiv")
 def main() -> int:
     """主函数"""
     parser = argparse.ArgumentParser(description="增强版arXiv论文爬取工具")
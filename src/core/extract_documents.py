@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+论文全文预提取阶段
+Document pre-extraction stage.
+
+Populates the shared document cache for every paper in a filtered/clustered
+file before (or while) the summary stage runs, using a CPU-bound process pool
+that is independent from the summary LLM workers.  Progress is written to a
+small JSON file so a concurrently running summary stage can pick up each paper
+as soon as its content lands in the cache.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# 添加项目根目录到Python路径
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.document_extraction import (
+    ExtractionManager,
+    ensure_valid_extraction_content,
+)
+from src.utils.cache_manager import CacheManager
+from src.utils.config import (
+    DOMAIN_PAPER_DIR,
+    ENABLE_CACHE,
+    EXTRACT_MAX_WORKERS,
+    SUMMARY_EXTRACTION_MAX_ATTEMPTS,
+)
+from src.utils.exceptions import ValidationError
+from src.utils.io import save_json
+from src.utils.profiling import profiled
+from src.utils.validation import validate_positive_int
+
+EXTRACTION_PROGRESS_TERMINAL_STATUSES = ("ok", "failed")
+# 预提取进程运行期间定期刷新进度文件的心跳；心跳超过 STALE 秒未更新视为进程已退出
+EXTRACTION_HEARTBEAT_SECONDS = 10.0
+EXTRACTION_HEARTBEAT_STALE_SECONDS = 90.0
+
+_WORKER_EXTRACTOR: Optional[ExtractionManager] = None
+
+
+def resolve_extract_input_file(
+    input_file: Optional[str], date: Optional[str], directory: str = DOMAIN_PAPER_DIR
+) -> Optional[str]:
+    """Return the explicit input file, or the clustered/filtered file for a date."""
+    if input_file:
+        return input_file
+    if not date:
+        return None
+    for name in (f"clustered_papers_{date}.json", f"filtered_papers_{date}.json"):
+        candidate = os.path.join(directory, name)
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def collect_paper_links(papers: List[Dict[str, Any]]) -> List[str]:
+    """Return unique non-empty paper links in input order."""
+    links = []
+    seen = set()
+    for paper in papers:
+        if not isinstance(paper, dict):
+            continue
+        link = str(paper.get("link") or "").strip()
+        if not link or link in seen:
+            continue
+        seen.add(link)
+        links.append(link)
+    return links
+
+
+def write_extraction_progress(
+    progress_file: Optional[str], payload: Dict[str, Any]
+) -> bool:
+    """Atomically persist extraction progress for the summary stage."""
+    if not progress_file:
+        return True
+    payload["updated_at"] = datetime.now().isoformat(timespec="seconds")
+    payload["heartbeat_at"] = time.time()
+    if not save_json(progress_file, payload, indent=2, ensure_ascii=False):
+        print(f"⚠️ 写入预提取进度失败: {progress_file}")
+        return False
+    return True
+
+
+def read_extraction_progress(progress_file: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Read extraction progress; return None while it is missing or unreadable."""
+    if not progress_file or not os.path.exists(progress_file):
+        return None
+    try:
+        with open(progress_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # 进程存在但无权发信号，或平台不支持探测
+        return True
+    return True
+
+
+def extraction_progress_is_stale(
+    progress: Dict[str, Any],
+    stale_after: float = EXTRACTION_HEARTBEAT_STALE_SECONDS,
+) -> bool:
+    """True when a ``running`` extract stage has died without finishing.
+
+    The extract process is gone if its pid no longer exists or its heartbeat
+    has not been refreshed for ``stale_after`` seconds (which also covers a
+    crashed child that has not been reaped yet).  Progress files without these
+    fields are never considered stale.
+    """
+    if progress.get("status") in EXTRACTION_PROGRESS_TERMINAL_STATUSES:
+        return False
+    pid = progress.get("pid")
+    if isinstance(pid, int) and pid > 0 and not _pid_alive(pid):
+        return True
+    heartbeat_at = progress.get("heartbeat_at")
+    if isinstance(heartbeat_at, (int, float)):
+        return time.time() - heartbeat_at > stale_after
+    return False
+
+
+def _init_extraction_worker() -> None:
+    """Build one ExtractionManager per worker process."""
+    global _WORKER_EXTRACTOR
+    cache_manager = CacheManager() if ENABLE_CACHE else None
+    _WORKER_EXTRACTOR = ExtractionManager(cache_manager=cache_manager)
+
+
+def extract_paper_document(link: str) -> Tuple[str, str, str]:
+    """Extract one paper into the document cache.
+
+    Returns ``(link, status, detail)`` where status is ``cached``, ``extracted``
+    or ``failed``.  Runs inside a worker process, so failures are reported
+    instead of raised.
+    """
+    if _WORKER_EXTRACTOR is None:
+        _init_extraction_worker()
+    extractor = _WORKER_EXTRACTOR
+
+    try:
+        if extractor.get_cached_result(link):
+            return link, "cached", ""
+    except Exception:
+        pass
+
+    last_error: Optional[Exception] = None
+    for attempt in range(1, SUMMARY_EXTRACTION_MAX_ATTEMPTS + 1):
+        try:
+            result = extractor.extract(link)
+            ensure_valid_extraction_content(result.content, link)
+            return link, "extracted", result.provider
+        except Exception as exc:
+            last_error = exc
+            if attempt < SUMMARY_EXTRACTION_MAX_ATTEMPTS:
+                time.sleep(min(30, 2 ** (attempt - 1)))
+    return link, "failed", str(last_error)
+
+
+def prefetch_documents(
+    links: List[str],
+    max_workers: int,
+    progress_file: Optional[str] = None,
+    input_file: str = "",
+) -> Dict[str, Any]:
+    """Extract all links into the document cache and return the final progress."""
+    progress: Dict[str, Any] = {
+        "status": "running",
+        "input_file": input_file,
+        "total": len(links),
+        "completed": [],
+        "failed": {},
+        "cached": 0,
+        "extracted": 0,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "pid": os.getpid(),
+    }
+    write_extraction_progress(progress_file, progress)
+    # 单篇提取可能耗时数分钟，后台线程定期刷新心跳，等待方据此判断本进程是否还活着
+    progress_lock = threading.Lock()
+    stop_heartbeat = threading.Event()
+
+    def heartbeat() -> None:
+        while not stop_heartbeat.wait(EXTRACTION_HEARTBEAT_SECONDS):
+            with progress_lock:
+                write_extraction_progress(progress_file, progress)
+
+    def record(link: str, status: str, detail: str) -> None:
+        with progress_lock:
+            if status == "failed":
+                progress["failed"][link] = detail
+                print(f"⚠️ 预提取失败 {link}: {detail}")
+            else:
+                progress["completed"].append(link)
+                progress[status] += 1
+            write_extraction_progress(progress_file, progress)
+
+    heartbeat_thread = None
+    if progress_file:
+        heartbeat_thread = threading.Thread(
+            target=heartbeat, name="extract-heartbeat", daemon=True
+        )
+        heartbeat_thread.start()
+    try:
+        if max_workers <= 1 or len(links) <= 1:
+            for link in links:
+                record(*extract_paper_document(link))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_extraction_worker
+            ) as executor:
+                futures = {
+                    executor.submit(extract_paper_document, link): link
+                    for link in links
+                }
+                for future in as_completed(futures):
+                    link = futures[future]
+                    try:
+                        record(*future.result())
+                    except Exception as exc:
+                        record(link, "failed", f"worker error: {exc}")
+    finally:
+        stop_heartbeat.set()
+        if heartbeat_thread is not None:
+            heartbeat_thread.join()
+
+    progress["status"] = "failed" if progress["failed"] else "ok"
+    progress["finished_at"] = datetime.now().isoformat(timespec="seconds")
+    write_extraction_progress(progress_file, progress)
+    return progress
+
+
+@profiled("extract_documents")
+def main() -> int:
+    parser = argparse.ArgumentParser(description="预提取论文全文并写入文档缓存")
+    parser.add_argument("--input-file", help="筛选或聚类后的论文 JSON 文件")
+    parser.add_argument(
+        "--date", help="按日期在 domain_paper 中查找聚类/筛选文件 (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=EXTRACT_MAX_WORKERS,
+        help=f"提取进程数 (默认: {EXTRACT_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--progress-file", default=None, help="写入逐篇预提取进度 JSON，供总结阶段消费"
+    )
+    args = parser.parse_args()
+
+    try:
+        validate_positive_int(args.max_workers, "--max-workers")
+    except ValidationError as exc:
+        print(f"❌ 参数校验失败: {exc}")
+        return 2
+
+    if not ENABLE_CACHE:
+        print("❌ 缓存已禁用，预提取结果无法被总结阶段复用")
+        return 2
+
+    input_file = resolve_extract_input_file(args.input_file, args.date)
+    if not input_file or not os.path.exists(input_file):
+        print(f"❌ 输入文件未找到: {input_file or args.date}")
+        return 1
+
+    try:
+        with open(input_file, "r", encoding="utf-8") as f:
+            papers = json.load(f)
+    except Exception as e:
+        print(f"❌ 读取文件时出错: {e}")
+        return 1
+    if not isinstance(papers, list):
+        print(f"❌ 输入文件不是论文列表: {input_file}")
+        return 1
+
+    links = collect_paper_links(papers)
+    print(f"📄 预提取论文全文: {len(links)} 篇 ({args.max_workers} 个进程)")
+    start_time = time.time()
+    progress = prefetch_documents(
+        links, args.max_workers, args.progress_file, input_file
+    )
+    duration = time.time() - start_time
+
+    print("\n📊 预提取完成！")
+    print(f"📋 已在缓存: {progress['cached']} 篇")
+    print(f"✅ 新提取: {progress['extracted']} 篇")
+    print(f"❌ 失败: {len(progress['failed'])} 篇")
+    print(f"⏱️ 耗时: {duration:.1f}秒")
+    return 1 if progress["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
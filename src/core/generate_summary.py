@@ -64,10 +64,16 @@ from src.utils.config import (  # noqa: E402
     SUMMARY_MAX_WORKERS,
     ENABLE_CACHE,
     SUMMARY_EXTRACTION_MAX_ATTEMPTS,
+    SUMMARY_PREFETCH_WAIT_SECONDS,
     REVIEWGROUNDER_ENABLED,
     REVIEWGROUNDER_MODEL,
     REVIEWGROUNDER_REASONING_EFFORT,
 )
+from src.core.extract_documents import (  # noqa: E402
+    EXTRACTION_PROGRESS_TERMINAL_STATUSES,
+    extraction_progress_is_stale,
+    read_extraction_progress,
+)
 from src.core.reviewgrounder_adapter import (  # noqa: E402
     build_reviewgrounder_cache_payload,
     generate_reviewgrounder_review,
@@ -82,10 +88,17 @@ from src.document_extraction import (  # noqa: E402
 )
 from src.utils.cache_manager import CacheManager  # noqa: E402
 from src.utils.exceptions import ValidationError  # noqa: E402
-from src.utils.io import save_json, save_text  # noqa: E402
+from src.utils.io import (  # noqa: E402
+    load_stage_input,
+    remember_stage_output,
+    save_json,
+    save_text,
+)
 from src.utils.notify import notify_failures  # noqa: E402
 from src.utils.openai_client import create_openai_client  # noqa: E402
+from src.utils.profiling import profiled  # noqa: E402
 from src.utils.publish_quality import missing_publish_fields  # noqa: E402
+from src.utils.stage_manifest import write_stage_manifest  # noqa: E402
 from src.utils.validation import validate_non_negative_int, validate_positive_int  # noqa: E402
 
 
@@ -1861,6 +1874,48 @@ def group_papers_by_source_date(
     return grouped
 
 
+def wait_for_prefetched_content(
+    document_extractor: ExtractionManager,
+    paper_link: str,
+    progress_file: Optional[str],
+    timeout_seconds: float = SUMMARY_PREFETCH_WAIT_SECONDS,
+    poll_interval: float = 2.0,
+) -> Optional[str]:
+    """Wait for a concurrently running extract stage to cache this paper.
+
+    Returns the cached content, or None once the extract stage has finished,
+    given up on the paper or died (dead pid or stale heartbeat), or the wait
+    times out, so the caller can fall back to extracting it in-process.
+    """
+    if not progress_file or not paper_link:
+        return None
+
+    deadline = time.monotonic() + max(0.0, float(timeout_seconds))
+    while True:
+        cached_result = document_extractor.get_cached_result(paper_link)
+        if cached_result and cached_result.content:
+            if not get_paper_content_issue(cached_result.content):
+                return cached_result.content
+
+        progress = read_extraction_progress(progress_file)
+        if progress is not None:
+            failed = progress.get("failed") or {}
+            if paper_link in failed:
+                return None
+            if progress.get("status") in EXTRACTION_PROGRESS_TERMINAL_STATUSES:
+                return None
+            # 预提取进程崩溃时状态停在 running，按 pid/心跳判定为已结束
+            if extraction_progress_is_stale(progress):
+                return None
+
+        if summary_budget_exceeded():
+            raise SummaryBudgetExceeded()
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(poll_interval)
+
+
+@profiled("generate_summary")
 def main() -> int:
     """主函数"""
     parser = argparse.ArgumentParser(description="论文总结生成工具")
@@ -1931,6 +1986,11 @@ def main() -> int:
         default=0.0,
         help="本阶段墙钟预算秒数，0=不限；超出后保存已完成部分并以码 3 退出以便续跑",
     )
+    parser.add_argument(
+        "--extraction-progress-file",
+        default=None,
+        help="并行预提取阶段的进度文件；设置后先等待全文进入缓存再自行提取",
+    )
 
     args = parser.parse_args()
 
@@ -1986,8 +2046,7 @@ def main() -> int:
 
     # 加载论文数据
     try:
-        with open(args.input_file, "r", encoding="utf-8") as f:
-            papers = json.load(f)
+        papers = load_stage_input(args.input_file)
         print(f"📚 成功加载 {len(papers)} 篇论文")
     except Exception as e:
         print(f"❌ 读取文件时出错: {e}")
@@ -2062,7 +2121,8 @@ def main() -> int:
                             f"methodology_v3_{paper_title}", cached_paper_content
                         )
                         cached_additional_insights = cache_manager.get_summary_cache(
-                            f"additional_insights_v2_{paper_title}", cached_paper_content
+                            f"additional_insights_v2_{paper_title}",
+                            cached_paper_content,
                         )
                         if not has_valid_generated_text(cached_intro_logic):
                             cached_intro_logic = None
@@ -2184,6 +2244,12 @@ def main() -> int:
                     else:
                         print(f"⚠️ 忽略无效缓存正文 {paper_title[:30]}: {cached_issue}")
 
+            # 预提取阶段与总结并行时，先等待该篇全文进入共享缓存。
+            if not paper_content and cache_manager and ENABLE_CACHE:
+                paper_content = wait_for_prefetched_content(
+                    document_extractor, paper_link, args.extraction_progress_file
+                )
+
             # 如果缓存中没有内容，才通过统一提取层获取。每日发布不允许
             # 用标题+摘要伪装成全文提取成功；提取失败必须重试后硬失败。
             if not paper_content:
@@ -2580,6 +2646,8 @@ def main() -> int:
         if not save_json(output_path, updated_papers, indent=2, ensure_ascii=False):
             print(f"❌ 保存总结结果失败: {output_path}")
             return 1
+        write_stage_manifest(output_path, updated_papers)
+        remember_stage_output(output_path, updated_papers)
 
         print(f"\n💾 已保存更新后的JSON文件: {output_path}")
 
@@ -5,6 +5,7 @@
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
@@ -66,6 +67,9 @@ try:
     from src.utils.config import (
         SUMMARY_DIR,
         WEBPAGES_DIR,
+        WEBPAGE_ASSET_MODE,
+        WEBPAGE_DATE_BUNDLES,
+        WEBPAGE_PRECOMPRESS,
         DOMAIN_PAPER_DIR,
         ARXIV_PAPER_DIR,
         PRESTIGE_COMPANY_WHITELIST,
@@ -74,15 +78,21 @@ try:
 except ImportError:
     SUMMARY_DIR = "summary"
     WEBPAGES_DIR = "webpages"
+    WEBPAGE_ASSET_MODE = "inline"
+    WEBPAGE_DATE_BUNDLES = False
+    WEBPAGE_PRECOMPRESS = True
     DOMAIN_PAPER_DIR = "domain_paper"
     ARXIV_PAPER_DIR = "arxiv_paper"
     PRESTIGE_COMPANY_WHITELIST = {}
     PRESTIGE_INSTITUTION_WHITELIST = {}
 
 try:
-    from src.utils.io import save_json, save_text
+    from src.utils.io import save_bytes, save_json, save_text
 except ImportError:
 
+    def save_bytes(filepath, content):  # type: ignore[no-redef]
+        return _atomic_save_text(filepath, content.decode("utf-8"))
+
     def save_json(filepath, data, indent=2, ensure_ascii=False):  # type: ignore[no-redef]
         return _atomic_save_json(
             filepath, data, indent=indent, ensure_ascii=ensure_ascii
@@ -92,8 +102,43 @@ except ImportError:
         return _atomic_save_text(filepath, content)
 
 
-from src.utils.published_data_version import build_published_data_version
-from src.utils.published_webpage_data import project_embedded_clusters
+from src.utils.build_manifest import (
+    file_digest,
+    file_fingerprint,
+    file_stat_matches,
+    load_build_manifest,
+    remove_build_manifest,
+    save_build_manifest,
+)
+from src.utils.date_bundles import (
+    BUNDLE_RE,
+    bundle_filename,
+    encode_date_bundle,
+    plan_date_bundles,
+)
+from src.utils.published_data_version import (
+    EncodedPayload,
+    build_published_data_version_from_digests,
+    published_payload_digest,
+)
+from src.utils.precompress import (
+    ENCODING_SUFFIXES,
+    ensure_precompressed,
+    remove_precompressed,
+    write_precompressed,
+)
+from src.utils.published_webpage_data import (
+    PAGE_DATA_BEGIN,
+    PAGE_DATA_END,
+    project_embedded_clusters,
+)
+from src.utils.search_index import (
+    SEARCH_INDEX_FILENAME,
+    SEARCH_SHARD_RE,
+    build_search_files,
+)
+from src.utils.profiling import profiled
+from src.utils.source_index import open_source_index
 
 
 try:
@@ -116,6 +161,27 @@ except ImportError as exc:
         ]
 
 
+# 增量构建清单：记录输入文件指纹与每个已发布日期的载荷摘要
+BUILD_MANIFEST_NAME = ".build-manifest.json"
+BUILD_MANIFEST_VERSION = 1
+# 除本模块外参与派生日期载荷的模块；它们与本模块的代码摘要记入清单，
+# 升级后摘要不一致时清单作废、全量构建，避免未变化输入的日期保留旧载荷
+PAYLOAD_GENERATOR_MODULES = (
+    "src.utils.publish_quality",
+    "src.utils.published_data_version",
+    "src.utils.source_index",
+)
+# 数据目录按代生成：新一代在 webpages/ 下的隐藏目录中组装后整体换入，
+# 上一代保留到发布校验通过为止，用于回滚
+DATA_GENERATION_PREFIX = ".data-generation-"
+PREVIOUS_DATA_GENERATION = ".data.previous"
+
+# 拆分资源模式下的静态资源目录与文件名（name.<sha256 前 12 位>.ext）
+STATIC_ASSET_DIR = "assets"
+STATIC_ASSET_RE = re.compile(
+    r"((?:app|first-screen)\.[0-9a-f]{12}\.(?:css|js|json))(?:\.br|\.gz)?"
+)
+
 # 分页配置
 INITIAL_DAYS = 3  # 初始加载的天数（其余通过"加载更多"按需加载）
 LOAD_MORE_DAYS = 7  # 每次"加载更多"加载的天数
@@ -404,7 +470,10 @@ def publishable_papers_or_none(
 
 
 def build_arxiv_source_index() -> Dict[str, Dict[str, Any]]:
-    """Load crawl-stage metadata for backfilling partial downstream files."""
+    """Load all crawl-stage metadata into memory.
+
+    Fallback for when the persistent source index cannot be opened.
+    """
     source_by_id: Dict[str, Dict[str, Any]] = {}
     arxiv_dir = Path(ARXIV_PAPER_DIR)
     if not arxiv_dir.exists():
@@ -595,20 +664,78 @@ def group_papers_by_source_date(
     return grouped
 
 
+def collect_candidate_files() -> List[Path]:
+    """List summary/cluster/filter outputs that can feed published dates."""
+    candidate_files = list(Path(SUMMARY_DIR).glob("*_with_summary2.json"))
+    candidate_files.extend(Path(DOMAIN_PAPER_DIR).glob("clustered_papers_*.json"))
+    candidate_files.extend(Path(DOMAIN_PAPER_DIR).glob("filtered_papers_*.json"))
+    return candidate_files
+
+
+def collect_overview_files() -> List[Path]:
+    """List daily overview Markdown files."""
+    return list(Path(SUMMARY_DIR).glob("daily_overview_*.md"))
+
+
+def candidate_file_dates(json_file: Path) -> List[str]:
+    """Return the dates a candidate file can contribute to.
+
+    Single-date files are named after their date; range files are grouped by
+    each paper's upstream date, so they have to be read.
+    """
+    filename = json_file.stem
+    range_match = re.search(r"(\d{4}-\d{2}-\d{2})_to_(\d{4}-\d{2}-\d{2})", filename)
+    date_match = re.search(r"(\d{4}-\d{2}-\d{2})", filename)
+    if not date_match:
+        return []
+    if not range_match:
+        return [date_match.group(1)]
+
+    try:
+        with open(json_file, "r", encoding="utf-8") as f:
+            papers = json.load(f)
+    except Exception as e:
+        print(f"加载文件 {json_file} 时出错: {e}")
+        return []
+    if not isinstance(papers, list):
+        return []
+    papers = [paper for paper in papers if isinstance(paper, dict)]
+    return sorted(group_papers_by_source_date(papers, range_match.group(1)))
+
+
 def load_paper_data(
     replace_dates: Optional[Set[str]] = None,
+    only_dates: Optional[Set[str]] = None,
+    candidate_files: Optional[List[Path]] = None,
 ) -> Dict[str, List[Dict[str, Any]]]:
-    """加载论文数据"""
+    """加载论文数据
+
+    ``only_dates`` restricts loading to those dates (incremental builds);
+    ``candidate_files`` overrides the globbed summary/cluster/filter files.
+    """
     replace_dates = replace_dates or set()
     papers_by_date = {}
-    summary_dir = Path(SUMMARY_DIR)
-    domain_paper_dir = Path(DOMAIN_PAPER_DIR)
     candidates_by_date: Dict[str, List[tuple]] = {}
-    source_by_id = build_arxiv_source_index()
 
-    candidate_files = list(summary_dir.glob("*_with_summary2.json"))
-    candidate_files.extend(domain_paper_dir.glob("clustered_papers_*.json"))
-    candidate_files.extend(domain_paper_dir.glob("filtered_papers_*.json"))
+    if candidate_files is None:
+        candidate_files = collect_candidate_files()
+    # 回填只按需查询持久化索引中用到的 arxiv_id，索引不可用时才全量读取源文件
+    source_index = open_source_index(ARXIV_PAPER_DIR) if candidate_files else None
+    fallback_source_by_id: Dict[str, Dict[str, Any]] = {}
+    if candidate_files and source_index is None:
+        fallback_source_by_id = build_arxiv_source_index()
+
+    def wanted(date: str) -> bool:
+        return only_dates is None or date in only_dates
+
+    def source_metadata(papers: List[Any]) -> Dict[str, Dict[str, Any]]:
+        if source_index is None:
+            return fallback_source_by_id
+        return source_index.lookup(
+            str(paper.get("arxiv_id") or "")
+            for paper in papers
+            if isinstance(paper, dict)
+        )
 
     for json_file in candidate_files:
         try:
@@ -624,7 +751,11 @@ def load_paper_data(
             )
             date_match = re.search(r"(\d{4}-\d{2}-\d{2})", filename)
             if date_match:
-                backfilled_papers = backfill_paper_metadata(papers, source_by_id)
+                if not range_match and not wanted(date_match.group(1)):
+                    continue
+                backfilled_papers = backfill_paper_metadata(
+                    papers, source_metadata(papers)
+                )
                 normalized_papers = publishable_papers_or_none(
                     backfilled_papers,
                     f"{json_file.parent.name}/{json_file.name}",
@@ -637,6 +768,8 @@ def load_paper_data(
                         range_match.group(1),
                     )
                     for date, date_papers in grouped_papers.items():
+                        if not wanted(date):
+                            continue
                         publishable_date_papers = publishable_papers_or_none(
                             date_papers,
                             f"{json_file.parent.name}/{json_file.name}:{date}",
@@ -662,6 +795,9 @@ def load_paper_data(
         except Exception as e:
             print(f"加载文件 {json_file} 时出错: {e}")
 
+    if source_index is not None:
+        source_index.close()
+
     for date, candidates in candidates_by_date.items():
         _, chosen_file, chosen_papers = merge_candidate_papers(candidates)
         papers_by_date[date] = chosen_papers
@@ -676,6 +812,8 @@ def load_paper_data(
                 continue
 
             date = date_file.stem
+            if not wanted(date):
+                continue
             try:
                 with open(date_file, "r", encoding="utf-8") as f:
                     date_data = json.load(f)
@@ -724,24 +862,26 @@ def load_paper_data(
     return papers_by_date
 
 
-def load_daily_overviews() -> Dict[str, str]:
+def load_daily_overviews(only_dates: Optional[Set[str]] = None) -> Dict[str, str]:
     """加载每日AI论文速览"""
     overviews = {}
-    summary_dir = Path(SUMMARY_DIR)
 
     # 查找所有的每日速览Markdown文件
-    for md_file in summary_dir.glob("daily_overview_*.md"):
+    for md_file in collect_overview_files():
         try:
-            with open(md_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
             # 从文件名提取日期
             filename = md_file.stem
             date_match = re.search(r"(\d{4}-\d{2}-\d{2})", filename)
-            if date_match:
-                date = date_match.group(1)
-                overviews[date] = content
-                print(f"加载了每日速览，日期: {date}")
+            if not date_match:
+                continue
+            date = date_match.group(1)
+            if only_dates is not None and date not in only_dates:
+                continue
+
+            with open(md_file, "r", encoding="utf-8") as f:
+                content = f.read()
+            overviews[date] = content
+            print(f"加载了每日速览，日期: {date}")
         except Exception as e:
             print(f"加载每日速览文件 {md_file} 时出错: {e}")
 
@@ -750,6 +890,8 @@ def load_daily_overviews() -> Dict[str, str]:
         for date_file in data_dir.glob("*.json"):
             if date_file.name == "index.json" or date_file.stem in overviews:
                 continue
+            if only_dates is not None and date_file.stem not in only_dates:
+                continue
 
             try:
                 with open(date_file, "r", encoding="utf-8") as f:
@@ -764,26 +906,23 @@ def load_daily_overviews() -> Dict[str, str]:
     return overviews
 
 
-def build_data_version(
-    papers_by_date: Dict[str, List[Dict[str, Any]]], daily_overviews: Dict[str, str]
-) -> str:
-    """Return a deterministic cache-busting version for published JSON data."""
-    all_dates = sorted(papers_by_date.keys(), reverse=True)
-    index_data = {
+def build_date_index(all_dates: List[str]) -> Dict[str, Any]:
+    """Return the published ``data/index.json`` payload."""
+    index_data: Dict[str, Any] = {
         "dates": all_dates,
         "initial_days": INITIAL_DAYS,
         "load_more_days": LOAD_MORE_DAYS,
     }
-    date_payloads = {
-        date: {
-            "date": date,
-            "clusters": organize_papers_by_cluster(papers_by_date.get(date, [])),
-            "tags": collect_all_tags(papers_by_date.get(date, [])),
-            "overview": daily_overviews.get(date, ""),
-        }
-        for date in all_dates
-    }
-    return build_published_data_version(index_data, date_payloads)
+    if WEBPAGE_DATE_BUNDLES:
+        index_data["bundles"] = plan_date_bundles(all_dates)
+    return index_data
+
+
+def build_data_version(all_dates: List[str], digests_by_date: Dict[str, str]) -> str:
+    """Return a deterministic cache-busting version for published JSON data."""
+    return build_published_data_version_from_digests(
+        build_date_index(all_dates), digests_by_date
+    )
 
 
 def escape_script_json_chars(text: str) -> str:
@@ -859,58 +998,186 @@ def collect_all_tags(papers: List[Dict]) -> List[Dict]:
     return result
 
 
-def prune_stale_date_files(data_dir: Path, valid_dates: List[str]) -> None:
-    """Remove date JSON files that are empty, partial, or no longer publishable."""
-    valid_date_set = set(valid_dates)
-    if not data_dir.exists():
-        return
-
-    for date_file in data_dir.glob("*.json"):
-        if date_file.name == "index.json":
-            continue
-        if not re.fullmatch(r"\d{4}-\d{2}-\d{2}", date_file.stem):
-            continue
-        if date_file.stem not in valid_date_set:
-            date_file.unlink()
-            print(f"删除未发布日期数据文件: {date_file}")
+def link_or_copy(source: Path, target: Path) -> None:
+    """Hardlink an unchanged published file into a new generation."""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
 
 
-def stage_date_data_files(
+def build_data_generation(
     data_dir: Path,
-    date_payloads: Dict[str, Dict[str, Any]],
+    date_payloads: Dict[str, EncodedPayload],
     index_data: Dict[str, Any],
+    search_files: Optional[Dict[str, Any]] = None,
+    bundle_files: Optional[Dict[str, bytes]] = None,
 ) -> Path:
-    """Write candidate published JSON into a staging directory before commit."""
-    data_dir.mkdir(parents=True, exist_ok=True)
-    stage_dir = Path(tempfile.mkdtemp(prefix=".publish-stage-", dir=str(data_dir)))
+    """Assemble the next published data directory next to the current one.
+
+    New payloads, search files, bundles and the index are written (and
+    compressed); every other file of the current generation, compressed
+    siblings included, is hardlinked, so the cost scales with what changed.
+    Date files no longer listed in the index, search shards no longer listed
+    in the search dictionary and bundles of weeks no longer bundled are left
+    out, which prunes them.
+    """
+    valid_date_set = set(index_data["dates"])
+    data_dir.parent.mkdir(parents=True, exist_ok=True)
+    generation_dir = Path(
+        tempfile.mkdtemp(prefix=DATA_GENERATION_PREFIX, dir=str(data_dir.parent))
+    )
     try:
-        for date, date_data in date_payloads.items():
-            staged_date_file = stage_dir / f"{date}.json"
+        for date, payload in date_payloads.items():
+            staged_date_file = generation_dir / f"{date}.json"
+            if not save_bytes(str(staged_date_file), payload.content):
+                raise IOError(f"暂存数据文件失败: {staged_date_file}")
+            if WEBPAGE_PRECOMPRESS:
+                write_precompressed(staged_date_file, payload.content)
+
+        for filename, search_data in (search_files or {}).items():
+            staged_search_file = generation_dir / filename
             if not save_json(
-                str(staged_date_file), date_data, indent=None, ensure_ascii=False
+                str(staged_search_file), search_data, indent=None, ensure_ascii=False
             ):
-                raise IOError(f"暂存数据文件失败: {staged_date_file}")
+                raise IOError(f"暂存搜索索引失败: {staged_search_file}")
+            if WEBPAGE_PRECOMPRESS:
+                write_precompressed(staged_search_file)
+        for filename, content in (bundle_files or {}).items():
+            staged_bundle_file = generation_dir / filename
+            if not save_bytes(str(staged_bundle_file), content):
+                raise IOError(f"暂存日期合并文件失败: {staged_bundle_file}")
+            if WEBPAGE_PRECOMPRESS:
+                write_precompressed(staged_bundle_file, content)
+        published_bundles = {
+            bundle_filename(week) for week in index_data.get("bundles", {})
+        }
+
+        search_dictionary = (search_files or {}).get(SEARCH_INDEX_FILENAME)
+        published_shards = {
+            entry["file"] for entry in (search_dictionary or {}).get("months", [])
+        }
 
-        staged_index_file = stage_dir / "index.json"
+        staged_index_file = generation_dir / "index.json"
         if not save_json(
             str(staged_index_file), index_data, indent=2, ensure_ascii=False
         ):
             raise IOError(f"暂存索引文件失败: {staged_index_file}")
+        if WEBPAGE_PRECOMPRESS:
+            write_precompressed(staged_index_file)
+
+        rewritten = {path.name for path in generation_dir.iterdir()}
+        compressed_suffixes = tuple(suffix for _, suffix in ENCODING_SUFFIXES)
+        if data_dir.is_dir():
+            for entry in sorted(data_dir.iterdir()):
+                target = generation_dir / entry.name
+                if (
+                    entry.name.startswith(".")
+                    or entry.is_symlink()
+                    or not entry.is_file()
+                    or target.exists()
+                ):
+                    continue
+                original_name = entry.name
+                if entry.name.endswith(compressed_suffixes):
+                    # 原文件已重写时，旧压缩副本描述的是旧内容
+                    original_name = entry.name.rsplit(".", 1)[0]
+                    if not WEBPAGE_PRECOMPRESS or original_name in rewritten:
+                        continue
+                if (
+                    search_dictionary is not None
+                    and SEARCH_SHARD_RE.fullmatch(original_name)
+                    and original_name not in published_shards
+                ):
+                    continue
+                if (
+                    BUNDLE_RE.fullmatch(original_name)
+                    and original_name not in published_bundles
+                ):
+                    continue
+                stem = original_name.split(".", 1)[0]
+                if (
+                    re.fullmatch(r"\d{4}-\d{2}-\d{2}", stem)
+                    and stem not in valid_date_set
+                ):
+                    if original_name == entry.name:
+                        print(f"删除未发布日期数据文件: {entry}")
+                    continue
+                link_or_copy(entry, target)
+
+        if WEBPAGE_PRECOMPRESS:
+            # 升级后首次构建或新装 brotli 时，为未变化的文件补齐压缩副本
+            for date in index_data["dates"]:
+                date_file = generation_dir / f"{date}.json"
+                if date_file.name not in rewritten and date_file.exists():
+                    ensure_precompressed(date_file)
+
+        missing = [
+            date
+            for date in index_data["dates"]
+            if not (generation_dir / f"{date}.json").exists()
+        ]
+        if missing:
+            raise IOError(f"新数据目录缺少日期文件: {', '.join(missing[:5])}")
+        return generation_dir
+    except Exception:
+        shutil.rmtree(generation_dir, ignore_errors=True)
+        raise
+
 
-        return stage_dir
+def swap_data_generation(generation_dir: Path, data_dir: Path) -> None:
+    """Make ``generation_dir`` the live data directory.
+
+    The current generation is renamed aside to ``PREVIOUS_DATA_GENERATION``
+    first so a failed publish can swap it back without copying any bytes.
+    A symlinked data directory is rejected by the release validator, so the
+    flip is two renames within the same directory rather than a link swap.
+    """
+    previous_dir = data_dir.parent / PREVIOUS_DATA_GENERATION
+    if previous_dir.exists():
+        shutil.rmtree(previous_dir)
+    had_data_dir = data_dir.exists()
+    if had_data_dir:
+        os.rename(data_dir, previous_dir)
+    try:
+        os.rename(generation_dir, data_dir)
     except Exception:
-        shutil.rmtree(stage_dir, ignore_errors=True)
+        if had_data_dir:
+            os.rename(previous_dir, data_dir)
         raise
 
 
-def save_date_data_files(papers_by_date: Dict, daily_overviews: Dict) -> List[str]:
-    """将每个日期的数据保存为独立的 JSON 文件"""
-    all_dates = sorted(papers_by_date.keys(), reverse=True)
-    if not all_dates:
-        raise ValueError("没有可发布日期，拒绝写入空网页数据索引")
+def rollback_data_generation(data_dir: Path) -> bool:
+    """Swap the previous generation back in; return False if there is none."""
+    previous_dir = data_dir.parent / PREVIOUS_DATA_GENERATION
+    if not previous_dir.is_dir():
+        return False
+    discarded_dir = data_dir.parent / f"{DATA_GENERATION_PREFIX}rolled-back"
+    if discarded_dir.exists():
+        shutil.rmtree(discarded_dir)
+    if data_dir.exists():
+        os.rename(data_dir, discarded_dir)
+    os.rename(previous_dir, data_dir)
+    shutil.rmtree(discarded_dir, ignore_errors=True)
+    return True
 
-    date_payloads: Dict[str, Dict[str, Any]] = {}
-    for date in all_dates:
+
+def discard_previous_data_generation(webpages_dir: Path) -> None:
+    """Drop the generation kept for rollback once a publish is final."""
+    shutil.rmtree(webpages_dir / PREVIOUS_DATA_GENERATION, ignore_errors=True)
+
+
+def build_date_payloads(
+    papers_by_date: Dict, daily_overviews: Dict
+) -> Dict[str, EncodedPayload]:
+    """Build, quality-check and serialize the published payload of every date.
+
+    This is the only pass over the papers: the data files, their compressed
+    siblings, the build manifest and ``DATA_VERSION`` all reuse the returned
+    bytes and digests.
+    """
+    date_payloads: Dict[str, EncodedPayload] = {}
+    for date in sorted(papers_by_date.keys(), reverse=True):
         papers = papers_by_date[date]
         organized = organize_papers_by_cluster(papers)
         tags = collect_all_tags(papers)
@@ -925,38 +1192,345 @@ def save_date_data_files(papers_by_date: Dict, daily_overviews: Dict) -> List[st
         ok, errors = validate_date_data_payload(date_data, expected_date=date)
         if not ok:
             raise ValueError(f"{date} 未通过发布质量检查: {'; '.join(errors[:5])}")
-        date_payloads[date] = date_data
+        date_payloads[date] = EncodedPayload.from_data(date_data)
+    return date_payloads
+
+
+def encode_date_payloads(
+    date_payloads: Dict[str, Any],
+) -> Dict[str, EncodedPayload]:
+    """Serialize payloads that were not produced by :func:`build_date_payloads`."""
+    return {
+        date: payload
+        if isinstance(payload, EncodedPayload)
+        else EncodedPayload.from_data(payload)
+        for date, payload in date_payloads.items()
+    }
+
+
+def build_date_search_files(
+    data_dir: Path, date_payloads: Dict[str, EncodedPayload], all_dates: List[str]
+) -> Dict[str, Any]:
+    """Rebuild the search shards of months touched by ``date_payloads``."""
 
+    def load_payload(date: str) -> Dict[str, Any]:
+        with open(data_dir / f"{date}.json", "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    previous_index = None
+    try:
+        with open(data_dir / SEARCH_INDEX_FILENAME, "r", encoding="utf-8") as f:
+            previous_index = json.load(f)
+    except (OSError, ValueError):
+        pass
+    return build_search_files(
+        all_dates,
+        {date: payload.data for date, payload in date_payloads.items()},
+        previous_index,
+        load_payload,
+        shard_exists=lambda name: (data_dir / name).is_file(),
+    )
+
+
+def build_date_bundle_files(
+    data_dir: Path,
+    date_payloads: Dict[str, EncodedPayload],
+    bundle_plan: Dict[str, List[str]],
+) -> Dict[str, bytes]:
+    """Rebuild the weekly bundles whose dates changed or were added/removed.
+
+    Unchanged dates are taken from the current data files as raw bytes, so
+    building a bundle never re-serializes a payload.
+    """
+    previous_plan: Dict[str, Any] = {}
+    try:
+        with open(data_dir / "index.json", "r", encoding="utf-8") as f:
+            previous_plan = json.load(f).get("bundles") or {}
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    bundle_files: Dict[str, bytes] = {}
+    for week, dates in bundle_plan.items():
+        filename = bundle_filename(week)
+        if (
+            previous_plan.get(week) == dates
+            and not any(date in date_payloads for date in dates)
+            and (data_dir / filename).is_file()
+        ):
+            continue
+        bundle_files[filename] = encode_date_bundle(
+            {
+                date: date_payloads[date].content
+                if date in date_payloads
+                else (data_dir / f"{date}.json").read_bytes()
+                for date in dates
+            }
+        )
+    return bundle_files
+
+
+def write_date_data_files(date_payloads: Dict[str, Any], all_dates: List[str]) -> None:
+    """Publish date payloads plus the index as a new data generation.
+
+    Dates in ``all_dates`` without a payload keep their existing file (hardlinked);
+    date files not in ``all_dates`` are pruned.
+    """
+    if not all_dates:
+        raise ValueError("没有可发布日期，拒绝写入空网页数据索引")
+
+    date_payloads = encode_date_payloads(date_payloads)
     # 生成日期索引文件
-    index_data = {
-        "dates": all_dates,
-        "initial_days": INITIAL_DAYS,
-        "load_more_days": LOAD_MORE_DAYS,
-    }
+    index_data = build_date_index(all_dates)
     data_dir = Path(WEBPAGES_DIR) / "data"
-    data_snapshot = snapshot_directory(data_dir)
-    stage_dir = stage_date_data_files(data_dir, date_payloads, index_data)
+    search_files = build_date_search_files(data_dir, date_payloads, all_dates)
+    bundle_files = build_date_bundle_files(
+        data_dir, date_payloads, index_data.get("bundles", {})
+    )
+    generation_dir = build_data_generation(
+        data_dir, date_payloads, index_data, search_files, bundle_files
+    )
     try:
-        try:
-            for date in all_dates:
-                date_file = data_dir / f"{date}.json"
-                os.replace(stage_dir / f"{date}.json", date_file)
-                print(f"保存数据文件: {date_file}")
+        swap_data_generation(generation_dir, data_dir)
+    except Exception:
+        shutil.rmtree(generation_dir, ignore_errors=True)
+        raise
 
-            index_file = data_dir / "index.json"
-            os.replace(stage_dir / "index.json", index_file)
-            print(f"保存索引文件: {index_file}")
+    for date in all_dates:
+        if date in date_payloads:
+            print(f"保存数据文件: {data_dir / f'{date}.json'}")
+    print(f"保存索引文件: {data_dir / 'index.json'}")
 
-            prune_stale_date_files(data_dir, all_dates)
-        except Exception:
-            restore_directory_snapshot(data_dir, data_snapshot)
-            raise
-    finally:
-        shutil.rmtree(stage_dir, ignore_errors=True)
 
+def save_date_data_files(papers_by_date: Dict, daily_overviews: Dict) -> List[str]:
+    """将每个日期的数据保存为独立的 JSON 文件"""
+    all_dates = sorted(papers_by_date.keys(), reverse=True)
+    if not all_dates:
+        raise ValueError("没有可发布日期，拒绝写入空网页数据索引")
+
+    date_payloads = build_date_payloads(papers_by_date, daily_overviews)
+    write_date_data_files(date_payloads, all_dates)
     return all_dates
 
 
+def write_static_asset(name: str, suffix: str, content: str) -> str:
+    """Write a content-hashed asset under ``webpages/assets`` and return its URL.
+
+    Asset names change whenever their content does, so they can be cached
+    indefinitely; an existing file with the same name is reused as-is.
+    """
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    filename = f"{name}.{digest}{suffix}"
+    asset_path = Path(WEBPAGES_DIR) / STATIC_ASSET_DIR / filename
+    if not asset_path.exists():
+        if not save_text(str(asset_path), content):
+            raise IOError(f"写入静态资源失败: {asset_path}")
+        if WEBPAGE_PRECOMPRESS:
+            write_precompressed(asset_path)
+    elif WEBPAGE_PRECOMPRESS:
+        ensure_precompressed(asset_path)
+    return f"{STATIC_ASSET_DIR}/{filename}"
+
+
+def prune_static_assets(webpages_dir: Path, html_content: str) -> None:
+    """Remove generated assets that the published HTML no longer references."""
+    asset_dir = webpages_dir / STATIC_ASSET_DIR
+    if not asset_dir.is_dir():
+        return
+    for asset_path in asset_dir.iterdir():
+        match = STATIC_ASSET_RE.fullmatch(asset_path.name)
+        if not match:
+            continue
+        if f"{STATIC_ASSET_DIR}/{match.group(1)}" not in html_content:
+            asset_path.unlink()
+
+
+def publish_precompressed(path: Path) -> None:
+    """Bring the compressed siblings of a published page in line with it."""
+    if WEBPAGE_PRECOMPRESS and path.exists():
+        write_precompressed(path)
+    else:
+        remove_precompressed(path)
+
+
+def build_manifest_path() -> Path:
+    return Path(WEBPAGES_DIR) / BUILD_MANIFEST_NAME
+
+
+def payload_generator_digest() -> str:
+    """Fingerprint of this module and the modules that derive date payloads."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    for name in PAYLOAD_GENERATOR_MODULES:
+        module_file = getattr(sys.modules.get(name), "__file__", None)
+        if module_file:
+            digest.update(Path(module_file).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def payload_arxiv_ids(date_data: Dict[str, Any]) -> List[str]:
+    """Return the arXiv ids published in a date payload, in display order."""
+    arxiv_ids = []
+    for cluster in date_data.get("clusters", []) or []:
+        for paper in cluster.get("papers", []) or []:
+            aid = str(paper.get("arxiv_id") or "")
+            if aid:
+                arxiv_ids.append(aid)
+    return arxiv_ids
+
+
+def load_source_arxiv_ids(json_file: Path) -> Optional[Set[str]]:
+    """Return the arXiv ids in a crawl file, or None when it cannot be read."""
+    try:
+        with open(json_file, "r", encoding="utf-8") as f:
+            papers = json.load(f)
+    except Exception as e:
+        print(f"加载源文件 {json_file} 时出错: {e}")
+        return None
+    if not isinstance(papers, list):
+        return None
+    return {
+        (paper.get("arxiv_id") or "").strip()
+        for paper in papers
+        if isinstance(paper, dict) and (paper.get("arxiv_id") or "").strip()
+    }
+
+
+def fingerprint_build_inputs(previous_inputs: Dict[str, Dict[str, Any]]) -> tuple:
+    """Fingerprint every build input against the previous manifest.
+
+    Returns ``(inputs, touched_dates, source_ids)``: the new manifest
+    ``inputs`` section, every date an added, changed or removed candidate or
+    overview file can contribute to, and the arXiv ids whose crawl metadata
+    changed (``None`` when a crawl file disappeared or could not be read).
+    """
+    current = [(path, "candidate") for path in collect_candidate_files()]
+    current.extend((path, "overview") for path in collect_overview_files())
+    arxiv_dir = Path(ARXIV_PAPER_DIR)
+    if arxiv_dir.exists():
+        current.extend((path, "source") for path in sorted(arxiv_dir.glob("*.json")))
+
+    inputs: Dict[str, Dict[str, Any]] = {}
+    touched_dates: Set[str] = set()
+    source_ids: Optional[Set[str]] = set()
+    for path, kind in current:
+        key = str(path)
+        previous = previous_inputs.get(key)
+        fingerprint = file_fingerprint(key, previous)
+        if fingerprint is None:
+            continue
+        fingerprint["kind"] = kind
+        if (
+            previous
+            and previous.get("kind") == kind
+            and previous.get("digest") == fingerprint["digest"]
+        ):
+            fingerprint["dates"] = previous.get("dates", [])
+            inputs[key] = fingerprint
+            continue
+
+        if kind == "candidate":
+            fingerprint["dates"] = candidate_file_dates(path)
+        elif kind == "overview":
+            date_match = re.search(r"(\d{4}-\d{2}-\d{2})", path.stem)
+            fingerprint["dates"] = [date_match.group(1)] if date_match else []
+        else:
+            fingerprint["dates"] = []
+            changed_ids = load_source_arxiv_ids(path)
+            if changed_ids is None or source_ids is None:
+                source_ids = None
+            else:
+                source_ids |= changed_ids
+        touched_dates.update(fingerprint["dates"])
+        if previous:
+            touched_dates.update(previous.get("dates", []))
+        inputs[key] = fingerprint
+
+    for key, previous in previous_inputs.items():
+        if key in inputs:
+            continue
+        touched_dates.update(previous.get("dates", []))
+        if previous.get("kind") == "source":
+            source_ids = None
+
+    return inputs, touched_dates, source_ids
+
+
+def published_file_matches(date_file: Path, entry: Dict[str, Any]) -> bool:
+    """Whether a published date file still holds the payload recorded in ``entry``."""
+    if file_stat_matches(str(date_file), entry):
+        return True
+    if not date_file.exists():
+        return False
+    try:
+        # 数据文件即规范序列化，直接比对字节摘要；旧格式文件再按解析后的内容比对
+        if file_digest(str(date_file)) != entry.get("digest"):
+            with open(date_file, "r", encoding="utf-8") as f:
+                date_data = json.load(f)
+            if published_payload_digest(date_data) != entry.get("digest"):
+                return False
+    except Exception:
+        return False
+    stat = date_file.stat()
+    entry["size"] = stat.st_size
+    entry["mtime_ns"] = stat.st_mtime_ns
+    return True
+
+
+def plan_incremental_build(
+    manifest: Dict[str, Any], replace_dates: Optional[Set[str]] = None
+) -> Dict[str, Any]:
+    """Decide which dates must be re-derived from the previous build manifest.
+
+    ``dirty_dates`` is None when there is no usable manifest (full build).
+    ``verified_dates`` are previously published dates whose file is intact.
+    """
+    inputs, touched_dates, source_ids = fingerprint_build_inputs(
+        manifest.get("inputs", {}) if manifest else {}
+    )
+    if not manifest:
+        return {"inputs": inputs, "dirty_dates": None, "verified_dates": set()}
+
+    previous_dates = manifest.get("dates", {})
+    dirty_dates = set(touched_dates) | set(replace_dates or ())
+
+    # 源数据元信息变化会影响回填：重建包含这些论文的日期，以及尚未发布的候选日期
+    candidate_dates = {
+        date
+        for entry in inputs.values()
+        if entry.get("kind") == "candidate"
+        for date in entry.get("dates", [])
+    }
+    if source_ids is None:
+        dirty_dates |= candidate_dates
+    elif source_ids:
+        dirty_dates |= candidate_dates - set(previous_dates)
+        dirty_dates |= {
+            date
+            for date, entry in previous_dates.items()
+            if source_ids.intersection(entry.get("arxiv_ids", []))
+        }
+
+    data_dir = Path(WEBPAGES_DIR) / "data"
+    verified_dates: Set[str] = set()
+    for date, entry in previous_dates.items():
+        if published_file_matches(data_dir / f"{date}.json", entry):
+            verified_dates.add(date)
+        else:
+            dirty_dates.add(date)
+    if data_dir.exists():
+        for date_file in data_dir.glob("*.json"):
+            if (
+                re.fullmatch(r"\d{4}-\d{2}-\d{2}", date_file.stem)
+                and date_file.stem not in previous_dates
+            ):
+                dirty_dates.add(date_file.stem)
+
+    return {
+        "inputs": inputs,
+        "dirty_dates": dirty_dates,
+        "verified_dates": verified_dates,
+    }
+
+
 def compute_window_dates(all_dates: List[str]) -> List[str]:
     """返回展示窗口内的日期（约最近 WINDOW_DAYS 天，以最新日期为锚点）。
 
@@ -982,17 +1556,91 @@ def compute_window_dates(all_dates: List[str]) -> List[str]:
 
 
 def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
-    """生成完整的HTML页面"""
-    papers_by_date = load_paper_data(replace_dates=replace_dates)
-    daily_overviews = load_daily_overviews()
+    """生成完整的HTML页面
+
+    With a build manifest from a previous run of the same payload generator
+    code only dates whose inputs or published files changed are re-derived
+    and rewritten; other ``data/<date>.json`` files are left untouched.
+    """
+    manifest_path = build_manifest_path()
+    manifest = load_build_manifest(str(manifest_path), BUILD_MANIFEST_VERSION)
+    generator = payload_generator_digest()
+    if manifest and manifest.get("generator") != generator:
+        print("载荷生成代码已变化，忽略增量构建清单并全量构建")
+        manifest = {}
+    plan = plan_incremental_build(manifest, replace_dates)
+    dirty_dates = plan["dirty_dates"]
+    previous_dates: Dict[str, Dict[str, Any]] = manifest.get("dates", {})
+
+    if dirty_dates is None:
+        papers_by_date = load_paper_data(replace_dates=replace_dates)
+        daily_overviews = load_daily_overviews()
+        clean_dates: Set[str] = set()
+    else:
+        clean_dates = set(previous_dates) - dirty_dates
+        print(
+            f"增量构建: {len(dirty_dates)} 个日期需要重建，"
+            f"{len(clean_dates)} 个日期保持不变"
+        )
+        papers_by_date, daily_overviews = {}, {}
+        if dirty_dates:
+            candidate_files = [
+                Path(key)
+                for key, entry in plan["inputs"].items()
+                if entry.get("kind") == "candidate"
+                and dirty_dates.intersection(entry.get("dates", []))
+            ]
+            papers_by_date = load_paper_data(
+                replace_dates=replace_dates,
+                only_dates=dirty_dates,
+                candidate_files=candidate_files,
+            )
+            daily_overviews = load_daily_overviews(only_dates=dirty_dates)
 
     for date in list(papers_by_date.keys()):
         if not has_valid_generated_text(daily_overviews.get(date, "")):
             print(f"跳过缺少每日速览的日期 {date}")
             del papers_by_date[date]
 
-    # 保存所有日期的数据到独立文件
-    all_dates = save_date_data_files(papers_by_date, daily_overviews)
+    # 保存所有日期的数据到独立文件；未变化日期的文件保持原样
+    all_dates = sorted(set(papers_by_date) | clean_dates, reverse=True)
+    if not all_dates:
+        raise ValueError("没有可发布日期，拒绝写入空网页数据索引")
+    date_payloads = build_date_payloads(papers_by_date, daily_overviews)
+    digests_by_date = {date: payload.digest for date, payload in date_payloads.items()}
+    changed_payloads = {
+        date: payload
+        for date, payload in date_payloads.items()
+        if date not in plan["verified_dates"]
+        or previous_dates[date].get("digest") != payload.digest
+    }
+    write_date_data_files(changed_payloads, all_dates)
+
+    data_dir = Path(WEBPAGES_DIR) / "data"
+    date_entries: Dict[str, Dict[str, Any]] = {}
+    for date in all_dates:
+        if date in changed_payloads:
+            stat = (data_dir / f"{date}.json").stat()
+            date_entries[date] = {
+                "digest": digests_by_date[date],
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "arxiv_ids": payload_arxiv_ids(date_payloads[date].data),
+            }
+        else:
+            date_entries[date] = previous_dates[date]
+            digests_by_date[date] = previous_dates[date]["digest"]
+    if not save_build_manifest(
+        str(manifest_path),
+        {
+            "version": BUILD_MANIFEST_VERSION,
+            "generator": generator,
+            "inputs": plan["inputs"],
+            "dates": date_entries,
+        },
+    ):
+        print(f"⚠️ 写入增量构建清单失败，下次将全量构建: {manifest_path}")
+        remove_build_manifest(str(manifest_path))
 
     # 展示窗口：默认信息流只覆盖最近约两周的日期；窗口外日期数据文件仍保留，
     # 但只有被收藏的论文才内联显示。窗口是纯客户端的展示过滤——index.json 与
@@ -1000,167 +1648,195 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
     window_dates = compute_window_dates(all_dates)
     # 嵌入 HTML 的初始数据仍是最新 INITIAL_DAYS 天（必然落在窗口内）
     initial_dates = all_dates[:INITIAL_DAYS]
-    data_version = build_data_version(papers_by_date, daily_overviews)
+    data_version = build_data_version(all_dates, digests_by_date)
 
     # 全量 arxiv_id -> 日期索引：供前端把窗口外被收藏的论文按需加载并内联显示。
     # 仅包含被展示的（已筛选）论文，体积很小。倒序遍历，重复 id 取最新日期。
     paper_date_index: Dict[str, str] = {}
     for date in all_dates:
-        for paper in papers_by_date.get(date, []):
-            aid = str(paper.get("arxiv_id") or "")
-            if aid:
-                paper_date_index.setdefault(aid, date)
+        for aid in date_entries[date].get("arxiv_ids", []):
+            paper_date_index.setdefault(aid, date)
 
-    # 生成JavaScript数据 - 只包含初始数据
-    initial_papers = {}
+    # 首屏日期一律取规范序列化后的内容，新建与复用的日期嵌入结果逐字节一致
+    initial_payloads = {}
     for date in initial_dates:
-        papers = papers_by_date.get(date, [])
-        organized = organize_papers_by_cluster(papers)
-        date_payload = {"clusters": organized}
-        initial_papers[date] = project_embedded_clusters(date_payload)
-
-    js_data = f"const allPapers = {dumps_js(initial_papers)};\n\n"
+        if date in date_payloads:
+            initial_payloads[date] = json.loads(date_payloads[date].content)
+        else:
+            with open(data_dir / f"{date}.json", "r", encoding="utf-8") as f:
+                initial_payloads[date] = json.load(f)
 
-    # 生成 allPaperTags 数据
+    # 生成JavaScript数据 - 只包含初始数据
+    initial_papers = {
+        date: project_embedded_clusters(initial_payloads[date])
+        for date in initial_dates
+    }
     initial_tags = {
-        date: collect_all_tags(papers_by_date.get(date, [])) for date in initial_dates
+        date: initial_payloads[date].get("tags", []) for date in initial_dates
     }
-    js_data += f"const allPaperTags = {dumps_js(initial_tags)};\n\n"
-
-    # 添加所有可用日期列表（用于按需加载）。注意 availableDates 仍是全量日期
-    # （发布校验器要求它与 index.json 一致）；两周窗口由下面的 windowDateSet
-    # 在客户端做展示过滤。
-    js_data += f"const availableDates = {dumps_js(all_dates)};\n"
-    js_data += f"const loadedDates = new Set({dumps_js(initial_dates)});\n"
-    js_data += f"const LOAD_MORE_DAYS = {LOAD_MORE_DAYS};\n"
-    js_data += f"const WINDOW_DAYS = {WINDOW_DAYS};\n"
-    # 两周展示窗口内的日期集合：窗口内正常展示；窗口外只展示被收藏的论文。
-    js_data += f"const windowDateSet = new Set({dumps_js(window_dates)});\n"
-    # arxiv_id -> 日期：用于把窗口外被收藏的论文按需加载进来内联显示。
-    js_data += f"const paperDateIndex = {dumps_js(paper_date_index)};\n\n"
-    js_data += f"const DATA_VERSION = {dumps_js(data_version)};\n\n"
-
-    # 添加每日速览数据 - 只包含初始数据
     initial_overviews = {
-        date: daily_overviews.get(date, "")
+        date: initial_payloads[date].get("overview", "")
         for date in initial_dates
-        if daily_overviews.get(date, "")
+        if initial_payloads[date].get("overview", "")
+    }
+    embedded_date_index = paper_date_index
+    first_screen_url = ""
+    if WEBPAGE_ASSET_MODE == "split":
+        # 拆分模式：首屏数据写成单独可缓存的 JSON，HTML 外壳只保留日期清单
+        first_screen_url = write_static_asset(
+            "first-screen",
+            ".json",
+            json.dumps(
+                {
+                    "allPapers": initial_papers,
+                    "allPaperTags": initial_tags,
+                    "paperDateIndex": paper_date_index,
+                    "dailyOverviewsRaw": initial_overviews,
+                },
+                ensure_ascii=False,
+            ),
+        )
+        initial_papers, initial_tags, initial_overviews = {}, {}, {}
+        embedded_date_index = {}
+
+    # 所有嵌入数据写成一个带标记的 JSON 对象：发布校验器按标记截取后整体解析，
+    # 页面脚本再从中取出各个常量。
+    # 注意 availableDates 仍是全量日期（发布校验器要求它与 index.json 一致）；
+    # 两周窗口由 windowDates 在客户端做展示过滤：窗口内正常展示，窗口外只展示
+    # 被收藏的论文。paperDateIndex（arxiv_id -> 日期）用于把窗口外被收藏的论文
+    # 按需加载进来内联显示。
+    page_data = {
+        "allPapers": initial_papers,
+        "allPaperTags": initial_tags,
+        "availableDates": all_dates,
+        "loadedDates": initial_dates,
+        "loadMoreDays": LOAD_MORE_DAYS,
+        "windowDays": WINDOW_DAYS,
+        "windowDates": window_dates,
+        "paperDateIndex": embedded_date_index,
+        "dataVersion": data_version,
+        "firstScreenDataUrl": first_screen_url,
+        "dateBundles": build_date_index(all_dates).get("bundles", {}),
+        "dailyOverviewsRaw": initial_overviews,
     }
-    js_data += f"const dailyOverviewsRaw = {dumps_js(initial_overviews)};\n"
-    # 在客户端，我们再将解析后的字符串赋值给 dailyOverviews
-    js_data += "const dailyOverviews = {};\n"
-    js_data += "for (const date in dailyOverviewsRaw) {\n"
-    js_data += "    dailyOverviews[date] = dailyOverviewsRaw[date];\n"
-    js_data += "}\n"
+    js_data = (
+        f"const PAGE_DATA = {PAGE_DATA_BEGIN}{dumps_js(page_data)}{PAGE_DATA_END};\n"
+    )
+    js_data += """const allPapers = PAGE_DATA.allPapers;
+const allPaperTags = PAGE_DATA.allPaperTags;
+const availableDates = PAGE_DATA.availableDates;
+const loadedDates = new Set(PAGE_DATA.loadedDates);
+const LOAD_MORE_DAYS = PAGE_DATA.loadMoreDays;
+const WINDOW_DAYS = PAGE_DATA.windowDays;
+const windowDateSet = new Set(PAGE_DATA.windowDates);
+const paperDateIndex = PAGE_DATA.paperDateIndex;
+const DATA_VERSION = PAGE_DATA.dataVersion;
+const FIRST_SCREEN_DATA_URL = PAGE_DATA.firstScreenDataUrl;
+const DATE_BUNDLES = PAGE_DATA.dateBundles;
+const dailyOverviewsRaw = PAGE_DATA.dailyOverviewsRaw;
+const dailyOverviews = {};
+for (const date in dailyOverviewsRaw) {
+    dailyOverviews[date] = dailyOverviewsRaw[date];
+}
+"""
 
-    # 完整的HTML模板
-    html_template = f"""<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PaperTools - 学术论文集合</title>
-    <!-- 引入 Tailwind CSS -->
-    <script src="https://cdn.tailwindcss.com"></script>
-    <!-- 引入 Marked.js 用于 Markdown 渲染 -->
-    <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
-    <style>
-        /* 微软雅黑字体 */
-        body {{
+    # 页面样式与应用脚本：内联模式直接嵌入 HTML；拆分模式写成内容哈希命名的静态资源
+    page_css = """        /* 微软雅黑字体 */
+        body {
             font-family: "Microsoft YaHei", "微软雅黑", sans-serif;
             -ms-overflow-style: none;  /* IE and Edge */
             scrollbar-width: none;  /* Firefox */
-        }}
-        body::-webkit-scrollbar {{
+        }
+        body::-webkit-scrollbar {
             display: none;
-        }}
+        }
 
         /* 移动端优化 */
-        @media (max-width: 640px) {{
-            body {{
+        @media (max-width: 640px) {
+            body {
                 font-size: 14px;
-            }}
+            }
 
             /* 改善可点击区域 */
-            button, a {{
+            button, a {
                 min-height: 44px;
                 min-width: 44px;
-            }}
+            }
 
             /* 优化间距 */
-            .container {{
+            .container {
                 padding-left: 12px !important;
                 padding-right: 12px !important;
-            }}
-        }}
+            }
+        }
 
         /* 星标样式 */
-        .star-button {{
+        .star-button {
             transition: color 0.2s ease-in-out;
-        }}
-        .star-button.starred {{
+        }
+        .star-button.starred {
             color: #fbbf24;
-        }}
-        .star-button:not(.starred) {{
+        }
+        .star-button:not(.starred) {
             color: #9ca3af;
-        }}
-        .star-button:hover {{
+        }
+        .star-button:hover {
             color: #fbbf24;
-        }}
+        }
         /* 删除按钮样式 */
-        .delete-button {{
+        .delete-button {
             transition: all 0.2s ease-in-out;
-        }}
-        .delete-button:hover {{
+        }
+        .delete-button:hover {
             color: #ef4444;
             transform: scale(1.1);
-        }}
+        }
         /* 论文项目样式 */
-        .paper-item {{
+        .paper-item {
             transition: all 0.3s ease-in-out;
-        }}
-        .paper-item.hidden-paper {{
+        }
+        .paper-item.hidden-paper {
             opacity: 0.3;
             transform: scale(0.98);
-        }}
+        }
         /* 平滑过渡 */
-        .rotate-90-transition {{
+        .rotate-90-transition {
             transition: transform 0.2s ease-in-out;
-        }}
+        }
 
         /* 论文卡片展开/收起 */
-        .paper-expand-hint {{
+        .paper-expand-hint {
             padding: 4px 0;
             font-size: 0.75rem;
             cursor: pointer;
             transition: color 0.2s;
-        }}
-        .paper-expand-hint:hover {{
+        }
+        .paper-expand-hint:hover {
             color: #2563eb;
-        }}
-        .dark .paper-expand-hint:hover {{
+        }
+        .dark .paper-expand-hint:hover {
             color: #60a5fa;
-        }}
-        .paper-expand-hint .expand-arrow {{
+        }
+        .paper-expand-hint .expand-arrow {
             display: inline-block;
             transition: transform 0.2s;
             font-size: 0.65rem;
             margin-right: 4px;
-        }}
-        .paper-detail {{
+        }
+        .paper-detail {
             border-top: 1px solid #e2e8f0;
             margin-top: 8px;
             padding-top: 8px;
-        }}
-        .dark .paper-detail {{
+        }
+        .dark .paper-detail {
             border-top-color: #334155;
-        }}
-        .paper-detail.hidden {{
+        }
+        .paper-detail.hidden {
             display: none;
-        }}
+        }
 
         /* 可折叠部分样式 */
-        .collapsible-header {{
+        .collapsible-header {
             cursor: pointer;
             display: flex;
             align-items: center;
@@ -1169,136 +1845,136 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             user-select: none;
             color: #1e40af;
             transition: all 0.2s ease-in-out;
-        }}
-        .dark .collapsible-header {{
+        }
+        .dark .collapsible-header {
             color: #60a5fa;
-        }}
-        .collapsible-header:hover {{
+        }
+        .collapsible-header:hover {
             opacity: 0.8;
-        }}
-        .collapsible-header::before {{
+        }
+        .collapsible-header::before {
             content: "▶";
             margin-right: 8px;
             transition: transform 0.3s ease;
             font-size: 0.8em;
-        }}
-        .collapsible-header.open::before {{
+        }
+        .collapsible-header.open::before {
             transform: rotate(90deg);
-        }}
-        .collapsible-content {{
+        }
+        .collapsible-content {
             display: none;
-        }}
-        .collapsible-content.open {{
+        }
+        .collapsible-content.open {
             display: block;
-        }}
-        .collapsible-content .inner {{
+        }
+        .collapsible-content .inner {
             padding-top: 8px;
-        }}
+        }
 
         /* Markdown 内容样式 */
-        .markdown-content {{
+        .markdown-content {
             line-height: 1.6;
-        }}
-        .markdown-content h1 {{
+        }
+        .markdown-content h1 {
             font-size: 1.5em;
             font-weight: bold;
             margin-top: 1em;
             margin-bottom: 0.5em;
             color: #1e40af;
-        }}
-        .dark .markdown-content h1 {{
+        }
+        .dark .markdown-content h1 {
             color: #60a5fa;
-        }}
-        .markdown-content h2 {{
+        }
+        .markdown-content h2 {
             font-size: 1.3em;
             font-weight: bold;
             margin-top: 0.8em;
             margin-bottom: 0.4em;
             color: #1e40af;
-        }}
-        .dark .markdown-content h2 {{
+        }
+        .dark .markdown-content h2 {
             color: #60a5fa;
-        }}
-        .markdown-content h3 {{
+        }
+        .markdown-content h3 {
             font-size: 1.1em;
             font-weight: bold;
             margin-top: 0.6em;
             margin-bottom: 0.3em;
             color: #1e40af;
-        }}
-        .dark .markdown-content h3 {{
+        }
+        .dark .markdown-content h3 {
             color: #60a5fa;
-        }}
-        .markdown-content h4 {{
+        }
+        .markdown-content h4 {
             font-size: 1em;
             font-weight: bold;
             margin-top: 0.5em;
             margin-bottom: 0.25em;
             color: #2563eb;
-        }}
-        .dark .markdown-content h4 {{
+        }
+        .dark .markdown-content h4 {
             color: #93c5fd;
-        }}
-        .markdown-content p {{
+        }
+        .markdown-content p {
             margin-bottom: 0.8em;
-        }}
-        .markdown-content ul, .markdown-content ol {{
+        }
+        .markdown-content ul, .markdown-content ol {
             margin-left: 1.5em;
             margin-bottom: 0.8em;
-        }}
-        .markdown-content ul {{
+        }
+        .markdown-content ul {
             list-style-type: disc;
-        }}
-        .markdown-content ol {{
+        }
+        .markdown-content ol {
             list-style-type: decimal;
-        }}
-        .markdown-content li {{
+        }
+        .markdown-content li {
             margin-bottom: 0.3em;
-        }}
-        .markdown-content code {{
+        }
+        .markdown-content code {
             background-color: #f1f5f9;
             padding: 0.2em 0.4em;
             border-radius: 3px;
             font-family: monospace;
             font-size: 0.9em;
-        }}
-        .dark .markdown-content code {{
+        }
+        .dark .markdown-content code {
             background-color: #334155;
-        }}
-        .markdown-content pre {{
+        }
+        .markdown-content pre {
             background-color: #f1f5f9;
             padding: 1em;
             border-radius: 5px;
             overflow-x: auto;
             margin-bottom: 0.8em;
-        }}
-        .dark .markdown-content pre {{
+        }
+        .dark .markdown-content pre {
             background-color: #334155;
-        }}
-        .markdown-content pre code {{
+        }
+        .markdown-content pre code {
             background-color: transparent;
             padding: 0;
-        }}
-        .markdown-content blockquote {{
+        }
+        .markdown-content blockquote {
             border-left: 3px solid #cbd5e1;
             padding-left: 1em;
             margin-left: 0;
             margin-bottom: 0.8em;
             color: #64748b;
-        }}
-        .dark .markdown-content blockquote {{
+        }
+        .dark .markdown-content blockquote {
             border-left-color: #475569;
             color: #94a3b8;
-        }}
-        .markdown-content strong {{
+        }
+        .markdown-content strong {
             font-weight: 600;
-        }}
-        .markdown-content em {{
+        }
+        .markdown-content em {
             font-style: italic;
-        }}
+        }
 
         /* Tag filter button styles */
-        .tag-btn {{
+        .tag-btn {
             padding: 4px 14px;
             font-size: 0.875rem;
             border-radius: 9999px;
@@ -1308,15 +1984,15 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             cursor: pointer;
             transition: all 0.15s;
             white-space: nowrap;
-        }}
-        .tag-btn:hover {{ border-color: #3b82f6; color: #3b82f6; }}
-        .tag-btn.active {{ background: #3b82f6; color: white; border-color: #3b82f6; }}
-        .dark .tag-btn {{ border-color: #475569; color: #94a3b8; }}
-        .dark .tag-btn:hover {{ border-color: #60a5fa; color: #60a5fa; }}
-        .dark .tag-btn.active {{ background: #2563eb; color: white; border-color: #2563eb; }}
+        }
+        .tag-btn:hover { border-color: #3b82f6; color: #3b82f6; }
+        .tag-btn.active { background: #3b82f6; color: white; border-color: #3b82f6; }
+        .dark .tag-btn { border-color: #475569; color: #94a3b8; }
+        .dark .tag-btn:hover { border-color: #60a5fa; color: #60a5fa; }
+        .dark .tag-btn.active { background: #2563eb; color: white; border-color: #2563eb; }
 
         /* Tag badge styles */
-        .tag-badge {{
+        .tag-badge {
             display: inline-block;
             padding: 1px 6px;
             font-size: 0.7rem;
@@ -1324,27 +2000,27 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             background: #dbeafe;
             color: #1e40af;
             margin-right: 4px;
-        }}
-        .tag-badge.tag-arxiv {{
+        }
+        .tag-badge.tag-arxiv {
             background: #e0f2fe;
             color: #0369a1;
-        }}
-        .dark .tag-badge {{ background: #1e3a5f; color: #7dd3fc; }}
-        .dark .tag-badge.tag-arxiv {{ background: #164e63; color: #67e8f9; }}
+        }
+        .dark .tag-badge { background: #1e3a5f; color: #7dd3fc; }
+        .dark .tag-badge.tag-arxiv { background: #164e63; color: #67e8f9; }
 
         /* 作者机构上标样式 */
-        .author-aff {{
+        .author-aff {
             vertical-align: super;
             font-size: 0.65em;
             color: #3b82f6;
             margin-left: 1px;
-        }}
-        .dark .author-aff {{
+        }
+        .dark .author-aff {
             color: #60a5fa;
-        }}
+        }
 
         /* TOC 侧边栏样式 - 固定在左侧 */
-        #toc-sidebar {{
+        #toc-sidebar {
             position: fixed;
             left: 0;
             top: 0;
@@ -1355,31 +2031,31 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             border-right: 1px solid #e2e8f0;
             transition: transform 0.3s ease;
             overflow: hidden;
-        }}
-        .dark #toc-sidebar {{
+        }
+        .dark #toc-sidebar {
             background: #1e293b;
             border-right-color: #334155;
-        }}
-        #toc-sidebar.collapsed {{
+        }
+        #toc-sidebar.collapsed {
             transform: translateX(-100%);
-        }}
-        #toc-inner {{
+        }
+        #toc-inner {
             padding: 1rem 0.5rem;
             height: 100%;
             overflow-y: auto;
             scrollbar-width: thin;
-        }}
-        #toc-inner::-webkit-scrollbar {{
+        }
+        #toc-inner::-webkit-scrollbar {
             width: 4px;
-        }}
-        #toc-inner::-webkit-scrollbar-thumb {{
+        }
+        #toc-inner::-webkit-scrollbar-thumb {
             background: #cbd5e1;
             border-radius: 2px;
-        }}
-        .dark #toc-inner::-webkit-scrollbar-thumb {{
+        }
+        .dark #toc-inner::-webkit-scrollbar-thumb {
             background: #475569;
-        }}
-        .toc-date {{
+        }
+        .toc-date {
             cursor: pointer;
             padding: 6px 10px;
             border-radius: 4px;
@@ -1389,36 +2065,36 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             display: flex;
             align-items: center;
             gap: 6px;
-        }}
-        .toc-date:hover {{
+        }
+        .toc-date:hover {
             background: #e2e8f0;
-        }}
-        .dark .toc-date:hover {{
+        }
+        .dark .toc-date:hover {
             background: #334155;
-        }}
-        .toc-date.active {{
+        }
+        .toc-date.active {
             background: #dbeafe;
             color: #1e40af;
-        }}
-        .dark .toc-date.active {{
+        }
+        .dark .toc-date.active {
             background: #1e3a5f;
             color: #93c5fd;
-        }}
-        .toc-date-arrow {{
+        }
+        .toc-date-arrow {
             transition: transform 0.2s;
             font-size: 0.65rem;
-        }}
-        .toc-date-arrow.open {{
+        }
+        .toc-date-arrow.open {
             transform: rotate(90deg);
-        }}
-        .toc-papers {{
+        }
+        .toc-papers {
             display: none;
             padding-left: 1.2rem;
-        }}
-        .toc-papers.open {{
+        }
+        .toc-papers.open {
             display: block;
-        }}
-        .toc-paper {{
+        }
+        .toc-paper {
             cursor: pointer;
             padding: 3px 8px;
             border-radius: 3px;
@@ -1431,29 +2107,29 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             text-overflow: ellipsis;
             white-space: nowrap;
             max-width: 100%;
-        }}
-        .toc-paper:hover {{
+        }
+        .toc-paper:hover {
             background: #f1f5f9;
             color: #1e40af;
-        }}
-        .dark .toc-paper {{
+        }
+        .dark .toc-paper {
             color: #94a3b8;
-        }}
-        .dark .toc-paper:hover {{
+        }
+        .dark .toc-paper:hover {
             background: #1e293b;
             color: #93c5fd;
-        }}
-        .toc-paper.active {{
+        }
+        .toc-paper.active {
             background: #eff6ff;
             color: #1d4ed8;
             font-weight: 500;
-        }}
-        .dark .toc-paper.active {{
+        }
+        .dark .toc-paper.active {
             background: #1e3a5f;
             color: #93c5fd;
-        }}
+        }
         /* TOC 切换按钮 - 左侧 */
-        #toc-toggle {{
+        #toc-toggle {
             position: fixed;
             left: 220px;
             top: 50%;
@@ -1471,140 +2147,41 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             justify-content: center;
             box-shadow: 2px 0 8px rgba(0,0,0,0.15);
             transition: left 0.3s ease, background 0.2s;
-        }}
-        #toc-toggle:hover {{
+        }
+        #toc-toggle:hover {
             background: #2563eb;
-        }}
-        #toc-toggle svg {{
+        }
+        #toc-toggle svg {
             transition: transform 0.3s;
-        }}
-        #toc-toggle:not(.sidebar-open) {{
+        }
+        #toc-toggle:not(.sidebar-open) {
             left: 0;
-        }}
-        @media (max-width: 1023px) {{
-            #toc-sidebar {{
+        }
+        @media (max-width: 1023px) {
+            #toc-sidebar {
                 width: 240px;
-            }}
-            #toc-toggle {{
+            }
+            #toc-toggle {
                 left: 240px;
-            }}
-            #toc-toggle:not(.sidebar-open) {{
+            }
+            #toc-toggle:not(.sidebar-open) {
                 left: 0;
-            }}
-        }}
-        @media (max-width: 767px) {{
-            #toc-sidebar {{
+            }
+        }
+        @media (max-width: 767px) {
+            #toc-sidebar {
                 width: 260px;
                 box-shadow: 4px 0 16px rgba(0,0,0,0.1);
-            }}
-            #toc-toggle {{
+            }
+            #toc-toggle {
                 left: 260px;
-            }}
-            #toc-toggle:not(.sidebar-open) {{
+            }
+            #toc-toggle:not(.sidebar-open) {
                 left: 0;
-            }}
-        }}
-    </style>
-    <script>
-        // Tailwind CSS 暗色模式配置
-        if (localStorage.theme === 'dark' || (!('theme' in localStorage) && window.matchMedia('(prefers-color-scheme: dark)').matches)) {{
-            document.documentElement.classList.add('dark')
-        }} else {{
-            document.documentElement.classList.remove('dark')
-        }}
-    </script>
-</head>
-<body class="bg-slate-50 dark:bg-slate-900 font-sans text-slate-800 dark:text-slate-200">
-
-    <!-- 撤销删除的Toast -->
-    <div id="undo-toast" class="fixed top-4 right-4 bg-red-500 text-white px-3 sm:px-4 py-2 rounded-lg shadow-lg z-50 hidden max-w-xs sm:max-w-sm">
-        <div class="flex items-center space-x-2">
-            <span id="toast-message" class="text-sm sm:text-base">已删除</span>
-            <span id="countdown" class="text-xs sm:text-sm opacity-75"></span>
-            <button id="undo-btn" class="ml-2 px-2 py-1 bg-white text-red-500 rounded text-xs sm:text-sm hover:bg-gray-100">撤销</button>
-        </div>
-    </div>
-
-    <!-- TOC 切换按钮 -->
-    <button id="toc-toggle" class="hidden lg:flex sidebar-open" onclick="toggleTocSidebar()" title="切换目录">
-        <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-            <polyline points="15 18 9 12 15 6"></polyline>
-        </svg>
-    </button>
-
-    <div class="flex mx-auto max-w-none">
-    <!-- 主内容区域 -->
-    <div class="w-full lg:w-3/5 mx-auto p-3 sm:p-4 lg:p-6">
-        <!-- 头部导航栏 -->
-        <header class="mb-4 sm:mb-6">
-            <div class="flex flex-col sm:flex-row justify-between items-start sm:items-center gap-3 sm:gap-4">
-                <h1 class="text-2xl sm:text-3xl font-bold text-slate-900 dark:text-white">PaperTools</h1>
-                <div class="flex flex-wrap items-center gap-2 sm:gap-3 w-full sm:w-auto">
-                    <!-- 统计信息 -->
-                    <div class="text-xs sm:text-sm text-slate-600 dark:text-slate-400">
-                        总计 <span id="total-papers">0</span> 篇论文
-                    </div>
-                    <!-- 筛选按钮 -->
-                    <button id="filter-starred" class="px-2.5 py-1.5 sm:px-3 sm:py-2 text-xs sm:text-sm font-medium text-slate-600 dark:text-slate-300 bg-slate-100 dark:bg-slate-700 rounded-md hover:bg-slate-200 dark:hover:bg-slate-600 focus:outline-none transition-colors whitespace-nowrap">
-                        只看收藏
-                    </button>
-                    <button id="filter-all" class="px-2.5 py-1.5 sm:px-3 sm:py-2 text-xs sm:text-sm font-medium text-white bg-blue-600 rounded-md hover:bg-blue-700 focus:outline-none transition-colors whitespace-nowrap">
-                        显示全部
-                    </button>
-                    <!-- 中英文摘要切换按钮 -->
-                    <button id="summary-toggle" class="px-2.5 py-1.5 sm:px-3 sm:py-2 text-xs sm:text-sm font-medium text-slate-600 dark:text-slate-300 bg-slate-100 dark:bg-slate-700 rounded-md hover:bg-slate-200 dark:hover:bg-slate-600 focus:outline-none transition-colors whitespace-nowrap">
-                        中文摘要
-                    </button>
-                    <button id="theme-toggle" class="p-1.5 sm:p-2 rounded-full hover:bg-slate-200 dark:hover:bg-slate-700 focus:outline-none flex-shrink-0">
-                        <!-- 太阳图标 (浅色模式) -->
-                        <svg id="theme-icon-light" class="h-5 w-5 sm:h-6 sm:w-6 text-slate-600 dark:text-slate-300" fill="none" viewBox="0 0 24 24" stroke="currentColor">
-                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 3v1m0 16v1m9-9h-1M4 12H3m15.364 6.364l-.707-.707M6.343 6.343l-.707-.707m12.728 0l-.707.707M6.343 17.657l-.707.707M16 12a4 4 0 11-8 0 4 4 0 018 0z" />
-                        </svg>
-                        <!-- 月亮图标 (深色模式) -->
-                        <svg id="theme-icon-dark" class="h-5 w-5 sm:h-6 sm:w-6 text-slate-600 dark:text-slate-300 hidden" fill="none" viewBox="0 0 24 24" stroke="currentColor">
-                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M20.354 15.354A9 9 0 018.646 3.646 9.003 9.003 0 0012 21a9.003 9.003 0 008.354-5.646z" />
-                        </svg>
-                    </button>
-                    <!-- GitHub 图标按钮 -->
-                    <a href="https://github.com/tsrigo/PaperTools" target="https://github.com/tsrigo/PaperTools" title="GitHub 项目主页"
-                       class="p-1.5 sm:p-2 rounded-full hover:bg-slate-200 dark:hover:bg-slate-700 focus:outline-none flex-shrink-0">
-                        <svg class="h-5 w-5 sm:h-6 sm:w-6 text-slate-700 dark:text-slate-200" fill="currentColor" viewBox="0 0 24 24" aria-hidden="true">
-                            <path fill-rule="evenodd" d="M12 2C6.477 2 2 6.484 2 12.021c0 4.428 2.865 8.184 6.839 9.504.5.092.682-.217.682-.483 0-.237-.009-.868-.014-1.703-2.782.605-3.369-1.342-3.369-1.342-.454-1.155-1.11-1.463-1.11-1.463-.908-.62.069-.608.069-.608 1.004.07 1.532 1.032 1.532 1.032.892 1.53 2.341 1.088 2.91.832.092-.647.35-1.088.636-1.339-2.221-.253-4.555-1.113-4.555-4.951 0-1.093.39-1.988 1.029-2.688-.103-.254-.446-1.272.098-2.65 0 0 .84-.27 2.75 1.025A9.564 9.564 0 0112 6.844c.85.004 1.705.115 2.504.337 1.909-1.295 2.748-1.025 2.748-1.025.546 1.378.202 2.396.1 2.65.64.7 1.028 1.595 1.028 2.688 0 3.847-2.337 4.695-4.566 4.944.359.309.678.919.678 1.852 0 1.336-.012 2.417-.012 2.747 0 .268.18.579.688.481C19.138 20.2 22 16.447 22 12.021 22 6.484 17.523 2 12 2z" clip-rule="evenodd"/>
-                        </svg>
-                    </a>
-                </div>
-            </div>
-        </header>
-
-        <!-- 主要内容区域 -->
-        <main class="space-y-6 sm:space-y-8" id="main-content">
-            <!-- 加载提示 -->
-            <div id="loading" class="text-center py-8">
-                <div class="inline-flex items-center px-4 py-2 font-semibold leading-6 text-sm shadow rounded-md text-slate-500 bg-white dark:bg-slate-800 transition ease-in-out duration-150">
-                    <svg class="animate-spin -ml-1 mr-3 h-5 w-5 text-slate-500" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24">
-                        <circle class="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" stroke-width="4"></circle>
-                        <path class="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path>
-                    </svg>
-                    加载中...
-                </div>
-            </div>
-        </main>
-    </div>
-    </div>
-
-    <!-- 左侧 TOC 侧边栏（固定定位） -->
-    <aside id="toc-sidebar" class="hidden lg:block">
-        <div id="toc-inner">
-            <div class="flex items-center justify-between mb-2 px-2">
-                <span class="text-sm font-bold text-slate-500 dark:text-slate-400 uppercase tracking-wider">目录</span>
-            </div>
-            <nav id="toc-list"></nav>
-        </div>
-    </aside>
-
-    <script>
-        {js_data}
-
+            }
+        }
+"""
+    app_js = """
         // 全局状态管理
         let starredPapers = new Set();
         let readPapers = new Set();
@@ -1613,143 +2190,371 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
         let showChineseSummary = true; // 默认显示中文摘要
         let showOnlyStarred = false; // 筛选状态：是否只显示收藏的论文
         let isLoadingMore = false; // 是否正在加载更多
-        let activeTagFilters = {{}}; // {{date: Set of active tag names}}
+        let activeTagFilters = {}; // {date: Set of active tag names}
 
         // 获取未加载的日期（只在两周展示窗口内分页；窗口外日期不进入"加载更多"，
         // 仅在被收藏时由 loadArchivedStarredDates 按需加载）
-        function getUnloadedDates() {{
+        function getUnloadedDates() {
             return availableDates.filter(date => !loadedDates.has(date) && windowDateSet.has(date));
-        }}
+        }
 
         // Tag filter toggle
-        function toggleTagFilter(date, tagName) {{
+        function toggleTagFilter(date, tagName) {
             if (!activeTagFilters[date]) activeTagFilters[date] = new Set();
             const filters = activeTagFilters[date];
-            if (tagName === 'All') {{
+            if (tagName === 'All') {
                 filters.clear();
-            }} else if (filters.has(tagName)) {{
+            } else if (filters.has(tagName)) {
                 filters.delete(tagName);
-            }} else {{
+            } else {
                 filters.add(tagName);
-            }}
+            }
             renderPapers();
-        }}
+        }
 
-        // Check if paper matches active tag filters for its date
-        function paperMatchesFilters(paper, date) {{
+        // Check if paper matches the active search and tag filters for its date
+        function paperMatchesFilters(paper, date) {
+            if (searchMatches !== null && !searchMatches.has(paper.arxiv_id)) return false;
             const filters = activeTagFilters[date];
             if (!filters || filters.size === 0) return true;
             if (filters.has(paper.cluster)) return true;
             return (paper.tags || []).some(tag => filters.has(tag));
-        }}
+        }
+
+        // ========== 日期数据加载：有限并发、到达即渲染、空闲预取 ==========
+        const DATE_FETCH_CONCURRENCY = 4;
+        const dateDataRequests = {}; // date -> Promise<dateData>，预取与正式加载共用
+        const bundleRequests = {}; // week -> Promise<{date: dateData}>
+        const dateBundleWeek = {};
+        Object.keys(DATE_BUNDLES).forEach(week => {
+            DATE_BUNDLES[week].forEach(date => { dateBundleWeek[date] = week; });
+        });
+
+        function fetchJson(url) {
+            return fetch(url).then(response => {
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                return response.json();
+            });
+        }
+
+        function requestBundle(week) {
+            if (!bundleRequests[week]) {
+                bundleRequests[week] = fetchJson(`data/bundle-${week}.json?v=${DATA_VERSION}`)
+                    .then(bundle => bundle.dates || {})
+                    .catch(e => {
+                        console.error(`加载 ${week} 合并数据失败:`, e);
+                        return {};
+                    });
+            }
+            return bundleRequests[week];
+        }
+
+        // 取回某天的数据（不写入页面状态）；合并文件缺失该日期时退回单日文件
+        function requestDateData(date, viaBundle) {
+            if (!dateDataRequests[date]) {
+                const week = viaBundle ? dateBundleWeek[date] : null;
+                const fromBundle = week ? requestBundle(week).then(dates => dates[date] || null) : Promise.resolve(null);
+                dateDataRequests[date] = fromBundle
+                    .then(dateData => dateData || fetchJson(`data/${date}.json?v=${DATA_VERSION}`))
+                    .catch(e => {
+                        delete dateDataRequests[date];
+                        throw e;
+                    });
+            }
+            return dateDataRequests[date];
+        }
+
+        // 同一周需要两天以上时才走合并文件，否则单日文件更小
+        function bundleWeeksFor(dates) {
+            const counts = {};
+            dates.forEach(date => {
+                const week = dateBundleWeek[date];
+                if (week) counts[week] = (counts[week] || 0) + 1;
+            });
+            return new Set(Object.keys(counts).filter(week => counts[week] >= 2));
+        }
+
+        function applyDateData(date, dateData) {
+            allPapers[date] = dateData.clusters || [];
+            allPaperTags[date] = dateData.tags || [];
+            if (dateData.overview) {
+                dailyOverviews[date] = dateData.overview;
+            }
+            loadedDates.add(date);
+        }
+
+        async function runWithConcurrency(items, limit, task) {
+            const queue = items.slice();
+            const worker = async () => {
+                while (queue.length > 0) {
+                    await task(queue.shift());
+                }
+            };
+            await Promise.all(Array.from({ length: Math.min(limit, queue.length) }, worker));
+        }
+
+        // 并发加载一组日期，每个日期到达即调用 onLoaded；返回成功加载的天数
+        async function loadDates(dates, onLoaded) {
+            const bundleWeeks = bundleWeeksFor(dates);
+            const loaded = [];
+            await runWithConcurrency(dates, DATE_FETCH_CONCURRENCY, async date => {
+                try {
+                    const dateData = await requestDateData(date, bundleWeeks.has(dateBundleWeek[date]));
+                    applyDateData(date, dateData);
+                    loaded.push(date);
+                    if (onLoaded) onLoaded(date);
+                } catch (e) {
+                    console.error(`加载 ${date} 数据失败:`, e);
+                }
+            });
+            // 新加载日期的服务器状态一次取回
+            syncServerStateAndRender(loaded);
+            return loaded.length;
+        }
+
+        // 合并同一帧内的多次渲染请求
+        let renderScheduled = false;
+        function scheduleRender() {
+            if (renderScheduled) return;
+            renderScheduled = true;
+            requestAnimationFrame(() => {
+                renderScheduled = false;
+                renderPapers();
+            });
+        }
+
+        // 浏览器空闲时预取下一批"加载更多"的日期，只下载不渲染
+        function schedulePrefetch() {
+            if (navigator.connection && navigator.connection.saveData) return;
+            const whenIdle = window.requestIdleCallback || (callback => setTimeout(callback, 1500));
+            whenIdle(() => {
+                const nextDates = getUnloadedDates().slice(0, LOAD_MORE_DAYS);
+                const bundleWeeks = bundleWeeksFor(nextDates);
+                runWithConcurrency(nextDates, DATE_FETCH_CONCURRENCY, date =>
+                    requestDateData(date, bundleWeeks.has(dateBundleWeek[date])).catch(() => null));
+            });
+        }
 
         // 加载更多日期的数据
-        async function loadMoreDates() {{
+        async function loadMoreDates() {
             if (isLoadingMore) return;
 
             const unloadedDates = getUnloadedDates();
-            if (unloadedDates.length === 0) {{
+            if (unloadedDates.length === 0) {
                 showSimpleToast('已加载全部数据');
                 return;
-            }}
+            }
 
             isLoadingMore = true;
             const loadBtn = document.getElementById('load-more-btn');
-            if (loadBtn) {{
+            if (loadBtn) {
                 loadBtn.disabled = true;
                 loadBtn.innerHTML = '<span class="animate-spin inline-block mr-2">⏳</span>加载中...';
-            }}
+            }
 
             const datesToLoad = unloadedDates.slice(0, LOAD_MORE_DAYS);
-            let loadedCount = 0;
-
-            for (const date of datesToLoad) {{
-                try {{
-                    const response = await fetch(`data/${{date}}.json?v=${{DATA_VERSION}}`);
-                    if (!response.ok) continue;
-
-                    const dateData = await response.json();
-
-                    // 将数据添加到 allPapers
-                    allPapers[date] = dateData.clusters;
-                    allPaperTags[date] = dateData.tags;
-
-                    // 添加每日速览
-                    if (dateData.overview) {{
-                        dailyOverviews[date] = dateData.overview;
-                    }}
-
-                    loadedDates.add(date);
-                    loadedCount++;
-                }} catch (e) {{
-                    console.error(`加载 ${{date}} 数据失败:`, e);
-                }}
-            }}
+            const loadedCount = await loadDates(datesToLoad, scheduleRender);
 
             isLoadingMore = false;
 
-            if (loadedCount > 0) {{
+            if (loadedCount > 0) {
                 renderPapers();
-                showSimpleToast(`已加载 ${{loadedCount}} 天的数据`);
-            }}
+                showSimpleToast(`已加载 ${loadedCount} 天的数据`);
+            }
 
             updateLoadMoreButton();
-        }}
+            schedulePrefetch();
+        }
 
         // 更新"加载更多"按钮状态
-        function updateLoadMoreButton() {{
+        function updateLoadMoreButton() {
             const loadBtn = document.getElementById('load-more-btn');
             const unloadedCount = getUnloadedDates().length;
 
-            if (loadBtn) {{
-                if (unloadedCount === 0) {{
+            if (loadBtn) {
+                if (unloadedCount === 0) {
                     loadBtn.style.display = 'none';
-                }} else {{
+                } else {
                     loadBtn.style.display = 'inline-flex';
                     loadBtn.disabled = false;
-                    loadBtn.innerHTML = `📥 加载更多 (还有 ${{unloadedCount}} 天)`;
-                }}
-            }}
-        }}
+                    loadBtn.innerHTML = `📥 加载更多 (还有 ${unloadedCount} 天)`;
+                }
+            }
+        }
 
         // 加载窗口外（两周前）被收藏论文所在日期的数据，使其能在信息流中内联显示。
         // 这些日期的数据文件一直保留在 data/ 下，这里按需 fetch 进来；渲染时
         // createPaperHTML 会把窗口外日期里未收藏的论文隐藏，只留下收藏的那几篇。
-        async function loadArchivedStarredDates() {{
+        async function loadArchivedStarredDates() {
             if (!starredPapers || starredPapers.size === 0) return;
             const datesToLoad = new Set();
-            starredPapers.forEach(aid => {{
+            starredPapers.forEach(aid => {
                 const date = paperDateIndex[aid];
-                if (date && !windowDateSet.has(date) && !loadedDates.has(date)) {{
+                if (date && !windowDateSet.has(date) && !loadedDates.has(date)) {
                     datesToLoad.add(date);
-                }}
-            }});
+                }
+            });
             if (datesToLoad.size === 0) return;
 
-            let loadedCount = 0;
-            for (const date of datesToLoad) {{
-                try {{
-                    const response = await fetch(`data/${{date}}.json?v=${{DATA_VERSION}}`);
-                    if (!response.ok) continue;
-                    const dateData = await response.json();
-                    allPapers[date] = dateData.clusters;
-                    allPaperTags[date] = dateData.tags;
-                    if (dateData.overview) {{
-                        dailyOverviews[date] = dateData.overview;
-                    }}
-                    loadedDates.add(date);
-                    loadedCount++;
-                }} catch (e) {{
-                    console.error(`加载收藏日期 ${{date}} 数据失败:`, e);
-                }}
-            }}
-            if (loadedCount > 0) {{
+            const loadedCount = await loadDates([...datesToLoad], scheduleRender);
+            if (loadedCount > 0) {
                 renderPapers();
-            }}
-        }}
+            }
+        }
+
+        // ========== 全文搜索：预构建的按月分片倒排索引 ==========
+        const SEARCH_RESULT_LIMIT = 200;
+        let searchMatches = null; // 搜索生效时为命中论文的 arxiv_id 集合，否则为 null
+        let searchIndexPromise = null;
+        let searchSeq = 0;
+        const searchShardPromises = {};
+
+        function loadSearchIndex() {
+            if (!searchIndexPromise) {
+                searchIndexPromise = fetch(`data/search-index.json?v=${DATA_VERSION}`)
+                    .then(response => {
+                        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                        return response.json();
+                    })
+                    .then(index => {
+                        index.stopwordSet = new Set(index.stopwords || []);
+                        index.months.forEach(entry => {
+                            const raw = atob(entry.bloom);
+                            entry.bloomBytes = Uint8Array.from(raw, ch => ch.charCodeAt(0));
+                        });
+                        return index;
+                    })
+                    .catch(e => {
+                        searchIndexPromise = null;
+                        throw e;
+                    });
+            }
+            return searchIndexPromise;
+        }
+
+        function loadSearchShard(entry) {
+            if (!searchShardPromises[entry.file]) {
+                searchShardPromises[entry.file] = fetch(`data/${entry.file}?v=${entry.digest}`)
+                    .then(response => (response.ok ? response.json() : null))
+                    .catch(e => {
+                        console.error(`加载搜索分片 ${entry.file} 失败:`, e);
+                        delete searchShardPromises[entry.file];
+                        return null;
+                    });
+            }
+            return searchShardPromises[entry.file];
+        }
+
+        // 与 src/utils/search_index.py 的 tokenize_search_text 保持一致
+        function tokenizeSearchText(text, index) {
+            const terms = [];
+            const runs = String(text || '').toLowerCase().match(/[a-z0-9]+|[\\u3400-\\u9fff\\uf900-\\ufaff]+/g) || [];
+            runs.forEach(run => {
+                if (run[0] <= 'z') {
+                    if (run.length >= index.min_latin_length && !index.stopwordSet.has(run)) terms.push(run);
+                } else if (run.length === 1) {
+                    terms.push(run);
+                } else {
+                    for (let i = 0; i < run.length - 1; i++) terms.push(run.slice(i, i + 2));
+                }
+            });
+            return terms;
+        }
+
+        // 与 term_hashes 相同的 FNV-1a 双哈希，判断某月分片是否可能包含该词
+        function monthMayContain(entry, term, hashes) {
+            let first = 0x811c9dc5;
+            let second = 0x050c5d1f;
+            for (const byte of new TextEncoder().encode(term)) {
+                first = Math.imul(first ^ byte, 0x01000193) >>> 0;
+                second = Math.imul(second ^ byte, 0x01000193) >>> 0;
+            }
+            second = (second | 1) >>> 0;
+            for (let i = 0; i < hashes; i++) {
+                const position = ((first + Math.imul(i, second)) >>> 0) % entry.bits;
+                if (!(entry.bloomBytes[position >> 3] & (1 << (position & 7)))) return false;
+            }
+            return true;
+        }
+
+        function matchShard(shard, terms) {
+            const lists = terms.map(term => shard.postings[term] || []);
+            lists.sort((a, b) => a.length - b.length);
+            let docs = lists[0];
+            for (const list of lists.slice(1)) {
+                const members = new Set(list);
+                docs = docs.filter(doc => members.has(doc));
+            }
+            return docs.map(doc => shard.docs[doc]);
+        }
+
+        async function runSearch(query) {
+            const seq = ++searchSeq;
+            if (!query.trim()) {
+                searchMatches = null;
+                renderPapers();
+                return;
+            }
+
+            let index;
+            try {
+                index = await loadSearchIndex();
+            } catch (e) {
+                console.error('加载搜索索引失败:', e);
+                showSimpleToast('搜索索引加载失败');
+                return;
+            }
+            const terms = [...new Set(tokenizeSearchText(query, index))];
+            if (seq !== searchSeq) return;
+            if (terms.length === 0) {
+                searchMatches = null;
+                renderPapers();
+                return;
+            }
+
+            // 只下载所有查询词都可能出现的月份分片
+            const entries = index.months.filter(entry =>
+                terms.every(term => monthMayContain(entry, term, index.bloom_hashes)));
+            const shards = await Promise.all(entries.map(loadSearchShard));
+            if (seq !== searchSeq) return;
+
+            let hits = [];
+            shards.forEach(shard => {
+                if (shard) hits = hits.concat(matchShard(shard, terms));
+            });
+            hits.sort((a, b) => (a[1] < b[1] ? 1 : a[1] > b[1] ? -1 : 0));
+            if (hits.length > SEARCH_RESULT_LIMIT) {
+                showSimpleToast(`命中 ${hits.length} 篇，仅显示最近 ${SEARCH_RESULT_LIMIT} 篇`);
+                hits = hits.slice(0, SEARCH_RESULT_LIMIT);
+            }
+
+            const missingDates = [...new Set(hits.map(hit => hit[1]))].filter(date => !loadedDates.has(date));
+            await loadDates(missingDates);
+            if (seq !== searchSeq) return;
+
+            searchMatches = new Set(hits.map(hit => hit[0]));
+            renderPapers();
+        }
+
+        function setupSearch() {
+            const searchInput = document.getElementById('search-input');
+            if (!searchInput) return;
+            let debounceTimer = null;
+            searchInput.addEventListener('input', () => {
+                clearTimeout(debounceTimer);
+                debounceTimer = setTimeout(() => runSearch(searchInput.value), 250);
+            });
+            searchInput.addEventListener('keydown', event => {
+                if (event.key === 'Escape') {
+                    searchInput.value = '';
+                    clearTimeout(debounceTimer);
+                    runSearch('');
+                }
+            });
+        }
 
         // 从localStorage加载状态
-        function loadState() {{
+        function loadState() {
             const starred = localStorage.getItem('starred_papers');
             const read = localStorage.getItem('read_papers');
             const deleted = localStorage.getItem('deleted_papers');
@@ -1759,18 +2564,115 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             if (read) readPapers = new Set(JSON.parse(read));
             if (deleted) deletedPapers = new Set(JSON.parse(deleted));
             if (summaryLang !== null) showChineseSummary = summaryLang === 'chinese';
-        }}
+        }
 
         // 保存状态到localStorage
-        function saveState() {{
+        function saveState() {
             localStorage.setItem('starred_papers', JSON.stringify([...starredPapers]));
             localStorage.setItem('read_papers', JSON.stringify([...readPapers]));
             localStorage.setItem('deleted_papers', JSON.stringify([...deletedPapers]));
             localStorage.setItem('summary_language', showChineseSummary ? 'chinese' : 'english');
-        }}
+        }
+
+        // 由 serve_webpages 提供服务时，已读/删除状态同时同步到服务器（按日期保存）：
+        // 加载日期时一次请求取回这些日期的状态，修改攒批后一次提交。
+        // 静态托管没有这些接口（404/405/501），此时停用同步，只用 localStorage；
+        // 其他错误（含网络抖动）只跳过本次同步。
+        const STATE_SYNC_DELAY = 500;
+        const STATE_BATCH_MAX_OPS = 200;
+        // 与 serve_webpages.MAX_STATE_BATCH_DATES 一致：单次状态查询最多 366 个日期
+        const STATE_FETCH_MAX_DATES = 366;
+        let serverStateEnabled = location.protocol === 'http:' || location.protocol === 'https:';
+        let pendingStateOps = [];
+        let stateSyncTimer = null;
+
+        function disableServerState() {
+            serverStateEnabled = false;
+            pendingStateOps = [];
+            clearTimeout(stateSyncTimer);
+        }
+
+        function isStateApiMissing(response) {
+            return response.status === 404 || response.status === 405 || response.status === 501;
+        }
+
+        // 合并服务器上这些日期的状态（按 STATE_FETCH_MAX_DATES 分批请求）；有变化时返回 true
+        async function syncServerState(dates) {
+            if (!serverStateEnabled || dates.length === 0) return false;
+            const states = [];
+            for (let i = 0; i < dates.length && serverStateEnabled; i += STATE_FETCH_MAX_DATES) {
+                const chunk = dates.slice(i, i + STATE_FETCH_MAX_DATES);
+                try {
+                    const response = await fetch(`api/state?dates=${chunk.join(',')}`, { cache: 'no-store' });
+                    if (isStateApiMissing(response)) {
+                        disableServerState();
+                        break;
+                    }
+                    if (!response.ok) continue;
+                    states.push(...Object.values((await response.json()).states || {}));
+                } catch (e) {
+                    // 网络错误或响应异常：跳过这一批，下次加载日期时再同步
+                }
+            }
+            let changed = false;
+            states.forEach(state => {
+                (state.deleted_ids || []).forEach(id => {
+                    if (!deletedPapers.has(id)) {
+                        deletedPapers.add(id);
+                        changed = true;
+                    }
+                });
+                (state.read_ids || []).forEach(id => {
+                    if (readPapers.has(id)) return;
+                    readPapers.add(id);
+                    changed = true;
+                    const checkbox = document.querySelector(`[data-arxiv-id="${cssEscape(id)}"] input[type="checkbox"]`);
+                    if (checkbox) checkbox.checked = true;
+                });
+            });
+            if (changed) saveState();
+            return changed;
+        }
+
+        function syncServerStateAndRender(dates) {
+            syncServerState(dates).then(changed => {
+                if (changed) scheduleRender();
+            });
+        }
+
+        function queueStateOp(arxivId, action) {
+            if (!serverStateEnabled) return;
+            const entry = paperDataMap[arxivId];
+            const date = (entry && entry.date) || paperDateIndex[arxivId];
+            if (!date) return;
+            pendingStateOps.push({ date, arxiv_id: arxivId, action });
+            clearTimeout(stateSyncTimer);
+            stateSyncTimer = setTimeout(flushStateOps, STATE_SYNC_DELAY);
+        }
+
+        // 提交攒下的修改；页面隐藏时改用 sendBeacon，保证离开页面前发出
+        function flushStateOps(useBeacon) {
+            clearTimeout(stateSyncTimer);
+            while (serverStateEnabled && pendingStateOps.length > 0) {
+                const body = JSON.stringify({ ops: pendingStateOps.splice(0, STATE_BATCH_MAX_OPS) });
+                if (useBeacon === true && navigator.sendBeacon) {
+                    navigator.sendBeacon('api/state/batch', body);
+                    continue;
+                }
+                fetch('api/state/batch', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body,
+                    keepalive: true,
+                }).then(response => {
+                    if (isStateApiMissing(response)) disableServerState();
+                }).catch(() => {});
+            }
+        }
+        window.addEventListener('pagehide', () => flushStateOps(true));
 
         // 显示撤销删除的Toast
-        function showUndoToast(message, seconds, onUndo, onExpire) {{
+        function showUndoToast(message, seconds, onUndo, onExpire) {
             const toast = document.getElementById('undo-toast');
             const msgEl = document.getElementById('toast-message');
             const cdEl = document.getElementById('countdown');
@@ -1778,42 +2680,42 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
 
             msgEl.textContent = message;
             let remaining = seconds;
-            cdEl.textContent = `(${{remaining}}s)`;
+            cdEl.textContent = `(${remaining}s)`;
             toast.classList.remove('hidden');
 
-            let intervalId = setInterval(() => {{
+            let intervalId = setInterval(() => {
                 remaining -= 1;
-                cdEl.textContent = `(${{remaining}}s)`;
-                if (remaining <= 0) {{
+                cdEl.textContent = `(${remaining}s)`;
+                if (remaining <= 0) {
                     clearInterval(intervalId);
                     toast.classList.add('hidden');
-                    try {{ onExpire && onExpire(); }} catch (e) {{}}
-                }}
-            }}, 1000);
+                    try { onExpire && onExpire(); } catch (e) {}
+                }
+            }, 1000);
 
-            let expireTimer = setTimeout(() => {{
+            let expireTimer = setTimeout(() => {
                 clearInterval(intervalId);
                 toast.classList.add('hidden');
-                try {{ onExpire && onExpire(); }} catch (e) {{}}
-            }}, seconds * 1000);
+                try { onExpire && onExpire(); } catch (e) {}
+            }, seconds * 1000);
 
-            const cleanup = () => {{
+            const cleanup = () => {
                 clearInterval(intervalId);
                 clearTimeout(expireTimer);
                 toast.classList.add('hidden');
-            }};
+            };
 
-            const onUndoClick = () => {{
+            const onUndoClick = () => {
                 cleanup();
-                try {{ onUndo && onUndo(); }} catch (e) {{}}
-            }};
+                try { onUndo && onUndo(); } catch (e) {}
+            };
 
             undoBtn.removeEventListener('click', onUndoClick);
             undoBtn.addEventListener('click', onUndoClick);
-        }}
+        }
 
         // 显示简单的提示信息
-        function showSimpleToast(message) {{
+        function showSimpleToast(message) {
             // 创建一个简单的toast元素
             const toast = document.createElement('div');
             toast.className = 'fixed top-4 right-4 bg-green-500 text-white px-4 py-2 rounded-lg shadow-lg z-50 transition-all duration-300';
@@ -1822,25 +2724,25 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             document.body.appendChild(toast);
 
             // 3秒后自动消失
-            setTimeout(() => {{
+            setTimeout(() => {
                 toast.style.opacity = '0';
                 toast.style.transform = 'translateY(-10px)';
-                setTimeout(() => {{
+                setTimeout(() => {
                     document.body.removeChild(toast);
-                }}, 300);
-            }}, 3000);
-        }}
+                }, 300);
+            }, 3000);
+        }
 
         // 通过按钮删除论文（避免JavaScript字符串转义问题）
-        function deletePaperByButton(button) {{
+        function deletePaperByButton(button) {
             const arxivId = button.getAttribute('data-arxiv-id');
             const title = button.getAttribute('data-title');
             deletePaper(arxivId, title);
-        }}
+        }
 
         // 删除论文
-        function deletePaper(arxivId, title) {{
-            const paperEl = document.querySelector(`[data-arxiv-id="${{cssEscape(arxivId)}}"]`);
+        function deletePaper(arxivId, title) {
+            const paperEl = document.querySelector(`[data-arxiv-id="${cssEscape(arxivId)}"]`);
             if (!paperEl) return;
             const listItem = paperEl.closest('li');
             const sectionEl = paperEl.closest('section[data-date-section]');
@@ -1850,147 +2752,158 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             paperEl.style.transform = 'scale(0.95)';
             paperEl.style.opacity = '0.5';
 
-            setTimeout(() => {{
+            setTimeout(() => {
                 // 立即删除并保存状态
                 deletedPapers.add(arxivId);
                 saveState();
+                queueStateOp(arxivId, 'delete');
 
-                // 移除DOM元素
-                if (listItem) {{
+                // 移除DOM元素，并同步该日期 section 的可见论文列表
+                if (listItem) {
+                    if (paperObserver) paperObserver.unobserve(listItem);
                     listItem.remove();
-                }} else {{
+                } else {
                     paperEl.remove();
-                }}
+                }
+                const sectionDate = sectionEl && sectionEl.getAttribute('data-date-section');
+                const sectionState = sectionDate && dateSections.get(sectionDate);
+                if (sectionState) {
+                    sectionState.ids = sectionState.ids.filter(id => id !== arxivId);
+                    sectionState.signature = sectionSignature(sectionDate, sectionState.ids);
+                }
 
                 updateDateSection(sectionEl);
                 updateStats();
                 buildToc();
 
                 // 显示简单的删除提示
-                showSimpleToast(`已删除: ${{title}}`);
-            }}, 300);
-        }}
+                showSimpleToast(`已删除: ${title}`);
+            }, 300);
+        }
 
         // 切换星标状态
-        function toggleStar(arxivId) {{
-            if (starredPapers.has(arxivId)) {{
+        function toggleStar(arxivId) {
+            if (starredPapers.has(arxivId)) {
                 starredPapers.delete(arxivId);
-            }} else {{
+            } else {
                 starredPapers.add(arxivId);
-            }}
+            }
             saveState();
 
-            // 如果当前是只看收藏模式，或这篇属于窗口外（两周前）日期，则重新渲染：
-            // 窗口外的论文取消收藏后应立即隐藏，新收藏的则应立即出现。
+            // 如果当前是只看收藏模式，或这篇属于窗口外（两周前）日期，则重新渲染
+            // （只有该日期的 section 会重建）：窗口外的论文取消收藏后应立即隐藏，
+            // 新收藏的则应立即出现。
             const paperDate = (paperDataMap[arxivId] && paperDataMap[arxivId].date)
                 || paperDateIndex[arxivId];
-            if (showOnlyStarred || (paperDate && !windowDateSet.has(paperDate))) {{
+            if (showOnlyStarred || (paperDate && !windowDateSet.has(paperDate))) {
                 renderPapers();
-            }} else {{
+            } else {
                 // 否则只更新星标按钮状态
-                const starBtn = document.querySelector(`[data-arxiv-id="${{cssEscape(arxivId)}}"] .star-button`);
-                if (starBtn) {{
-                    if (starredPapers.has(arxivId)) {{
+                const starBtn = document.querySelector(`[data-arxiv-id="${cssEscape(arxivId)}"] .star-button`);
+                if (starBtn) {
+                    if (starredPapers.has(arxivId)) {
                         starBtn.classList.add('starred');
-                    }} else {{
+                    } else {
                         starBtn.classList.remove('starred');
-                    }}
-                }}
-            }}
-        }}
+                    }
+                }
+            }
+        }
 
         // 切换已读状态
-        function toggleRead(arxivId) {{
-            const checkbox = document.querySelector(`[data-arxiv-id="${{cssEscape(arxivId)}}"] input[type="checkbox"]`);
+        function toggleRead(arxivId) {
+            const checkbox = document.querySelector(`[data-arxiv-id="${cssEscape(arxivId)}"] input[type="checkbox"]`);
             if (!checkbox) return;
 
-            if (checkbox.checked) {{
+            if (checkbox.checked) {
                 readPapers.add(arxivId);
-            }} else {{
+            } else {
                 readPapers.delete(arxivId);
-            }}
+            }
             saveState();
-        }}
+            queueStateOp(arxivId, checkbox.checked ? 'read' : 'unread');
+        }
 
         // 切换摘要语言
-        function toggleSummaryLanguage() {{
+        function toggleSummaryLanguage() {
             showChineseSummary = !showChineseSummary;
             const toggleBtn = document.getElementById('summary-toggle');
             toggleBtn.textContent = showChineseSummary ? '中文摘要' : 'English Summary';
 
             // 更新所有摘要显示
-            document.querySelectorAll('.summary-section').forEach(section => {{
+            document.querySelectorAll('.summary-section').forEach(section => {
                 const chineseContent = section.querySelector('.chinese-summary');
                 const englishContent = section.querySelector('.english-summary');
 
-                if (showChineseSummary) {{
+                if (showChineseSummary) {
                     if (chineseContent) chineseContent.style.display = 'block';
                     if (englishContent) englishContent.style.display = 'none';
-                }} else {{
+                } else {
                     if (chineseContent) chineseContent.style.display = 'none';
                     if (englishContent) englishContent.style.display = 'block';
-                }}
-            }});
+                }
+            });
 
             saveState();
-        }}
+        }
 
         // 更新统计信息
-        function updateStats() {{
-            const visiblePapers = document.querySelectorAll('.paper-item:not(.hidden-paper)').length;
+        function updateStats() {
+            let visiblePapers = 0;
+            dateSections.forEach(state => { visiblePapers += state.ids.length; });
             document.getElementById('total-papers').textContent = visiblePapers;
-        }}
+        }
 
-        function updateDateSection(sectionEl) {{
+        function updateDateSection(sectionEl) {
             if (!sectionEl) return;
-            const totalPapers = sectionEl.querySelectorAll('.paper-item').length;
+            const totalPapers = sectionEl.querySelectorAll('li[data-slot-aid]').length;
             const header = sectionEl.querySelector('[data-date-heading]');
 
-            if (header) {{
+            if (header) {
                 const dateLabel = header.dataset.dateHeading || header.textContent.split(' ')[0];
-                header.textContent = `${{dateLabel}} (${{totalPapers}} 篇论文)`;
-            }}
+                header.textContent = `${dateLabel} (${totalPapers} 篇论文)`;
+            }
 
-            if (totalPapers === 0) {{
-                sectionEl.remove();
-            }}
-        }}
+            if (totalPapers === 0) {
+                discardDateSection(sectionEl.getAttribute('data-date-section'));
+            }
+        }
 
         // 可折叠功能
-        function toggleCollapsible(header) {{
+        function toggleCollapsible(header) {
             const content = header.nextElementSibling;
             const isOpen = header.classList.contains('open');
 
-            if (isOpen) {{
+            if (isOpen) {
                 header.classList.remove('open');
                 content.classList.remove('open');
-            }} else {{
+            } else {
                 header.classList.add('open');
                 content.classList.add('open');
                 // Lazy render: parse markdown only when first opened
                 lazyRenderMarkdown(content);
-            }}
-        }}
+            }
+        }
 
         // Map of element ID -> raw markdown content for lazy rendering
-        const mdRawContent = {{}};
+        const mdRawContent = {};
 
         // Register raw markdown content for lazy rendering
-        function registerMarkdown(id, content) {{
+        function registerMarkdown(id, content) {
             if (id && content) mdRawContent[id] = content;
-        }}
+        }
 
-        function escapeHtml(value) {{
-            return String(value ?? '').replace(/[&<>"']/g, ch => ({{
+        function escapeHtml(value) {
+            return String(value ?? '').replace(/[&<>"']/g, ch => ({
                 '&': '&amp;',
                 '<': '&lt;',
                 '>': '&gt;',
                 '"': '&quot;',
                 "'": '&#39;'
-            }}[ch]));
-        }}
+            }[ch]));
+        }
 
-        function escapeJsSingleQuotedAttr(value) {{
+        function escapeJsSingleQuotedAttr(value) {
             return escapeHtml(String(value ?? '')
                 .replace(/\\\\/g, '\\\\\\\\')
                 .replace(/'/g, "\\\\'")
@@ -1998,148 +2911,148 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
                 .replace(/\\n/g, '\\\\n')
                 .replace(/\\u2028/g, '\\\\u2028')
                 .replace(/\\u2029/g, '\\\\u2029'));
-        }}
+        }
 
-        function safePathSegment(value) {{
+        function safePathSegment(value) {
             return encodeURIComponent(String(value ?? ''));
-        }}
+        }
 
-        function cssEscape(value) {{
+        function cssEscape(value) {
             const text = String(value ?? '');
             if (window.CSS && typeof CSS.escape === 'function') return CSS.escape(text);
             return text.replace(/["\\\\]/g, '\\\\$&');
-        }}
+        }
 
-        function escapeMarkdownHtml(value) {{
-            return String(value ?? '').replace(/[&<>]/g, ch => ({{
+        function escapeMarkdownHtml(value) {
+            return String(value ?? '').replace(/[&<>]/g, ch => ({
                 '&': '&amp;',
                 '<': '&lt;',
                 '>': '&gt;'
-            }}[ch]));
-        }}
+            }[ch]));
+        }
 
-        function sanitizeRenderedMarkdown(root) {{
+        function sanitizeRenderedMarkdown(root) {
             root.querySelectorAll('script, style, iframe, object, embed').forEach(el => el.remove());
-            root.querySelectorAll('a[href]').forEach(link => {{
+            root.querySelectorAll('a[href]').forEach(link => {
                 const href = link.getAttribute('href') || '';
-                if (!/^(https?:|mailto:|#|[/])/i.test(href)) {{
+                if (!/^(https?:|mailto:|#|[/])/i.test(href)) {
                     link.removeAttribute('href');
-                }}
+                }
                 link.setAttribute('target', '_blank');
                 link.setAttribute('rel', 'noopener noreferrer');
-            }});
-        }}
+            });
+        }
 
         // Parse markdown for a single element by id
-        function renderMarkdownEl(el) {{
+        function renderMarkdownEl(el) {
             if (!el || el.getAttribute('data-rendered')) return;
             const raw = mdRawContent[el.id];
-            if (raw) {{
-                try {{
+            if (raw) {
+                try {
                     el.innerHTML = marked.parse(escapeMarkdownHtml(raw));
                     sanitizeRenderedMarkdown(el);
-                }} catch (e) {{ el.textContent = raw; }}
+                } catch (e) { el.textContent = raw; }
                 el.setAttribute('data-rendered', '1');
-            }}
-        }}
+            }
+        }
 
         // Parse markdown for all unrendered .markdown-content elements inside a container
-        function lazyRenderMarkdown(container) {{
+        function lazyRenderMarkdown(container) {
             if (typeof marked === 'undefined') return;
             container.querySelectorAll('.markdown-content:not([data-rendered])').forEach(renderMarkdownEl);
-        }}
+        }
 
-        function hasMeaningfulText(value) {{
+        function hasMeaningfulText(value) {
             return typeof value === 'string' && value.trim().length > 0;
-        }}
+        }
 
         // Render markdown only for currently visible (open) sections
-        function renderVisibleMarkdown() {{
+        function renderVisibleMarkdown() {
             if (typeof marked === 'undefined') return;
-            marked.setOptions({{ breaks: true, gfm: true, headerIds: false, mangle: false }});
+            marked.setOptions({ breaks: true, gfm: true, headerIds: false, mangle: false });
             // Render open collapsible sections
             document.querySelectorAll('.collapsible-content.open').forEach(c => lazyRenderMarkdown(c));
             // Render overview sections (top-level, not inside collapsible)
-            document.querySelectorAll('.markdown-content:not([data-rendered])').forEach(el => {{
+            document.querySelectorAll('.markdown-content:not([data-rendered])').forEach(el => {
                 if (!el.closest('.collapsible-content')) renderMarkdownEl(el);
-            }});
-        }}
+            });
+        }
 
         // 创建论文HTML
-        function formatAuthorsWithAffiliations(authorsStr, affiliationsStr) {{
+        function formatAuthorsWithAffiliations(authorsStr, affiliationsStr) {
             if (!affiliationsStr) return escapeHtml(authorsStr);
-            try {{
+            try {
                 // 解析 JSON（可能被包在 ```json ... ``` 中）
                 let jsonStr = affiliationsStr;
                 const match = jsonStr.match(/```json\\s*([\\s\\S]*?)\\s*```/);
                 if (match) jsonStr = match[1];
-                const objMatch = jsonStr.match(/\\{{[\\s\\S]*\\}}/);
+                const objMatch = jsonStr.match(/\\{[\\s\\S]*\\}/);
                 if (objMatch) jsonStr = objMatch[0];
                 const data = JSON.parse(jsonStr);
 
                 // 兼容旧格式（数组）
-                if (Array.isArray(data)) {{
+                if (Array.isArray(data)) {
                     const authors = authorsStr.split(/,\\s*/);
-                    const affMap = {{}};
-                    data.forEach(a => {{ if (a.name && a.affiliation) affMap[a.name.trim().toLowerCase()] = a.affiliation; }});
-                    return authors.map(a => {{
+                    const affMap = {};
+                    data.forEach(a => { if (a.name && a.affiliation) affMap[a.name.trim().toLowerCase()] = a.affiliation; });
+                    return authors.map(a => {
                         const aff = affMap[a.trim().toLowerCase()];
                         return aff
-                            ? `${{escapeHtml(a.trim())}}<sup class="aff-sup" title="${{escapeHtml(aff)}}">${{escapeHtml(aff)}}</sup>`
+                            ? `${escapeHtml(a.trim())}<sup class="aff-sup" title="${escapeHtml(aff)}">${escapeHtml(aff)}</sup>`
                             : escapeHtml(a.trim());
-                    }}).join(', ');
-                }}
+                    }).join(', ');
+                }
 
                 if (!data.authors || !data.institutions) return escapeHtml(authorsStr);
 
                 // 新格式：论文式数字角标
-                const instMap = {{}};
-                data.institutions.forEach(inst => {{ instMap[inst.id] = inst.name; }});
+                const instMap = {};
+                data.institutions.forEach(inst => { instMap[inst.id] = inst.name; });
 
                 // 渲染作者行
-                const authorParts = data.authors.map(a => {{
+                const authorParts = data.authors.map(a => {
                     let sups = [];
-                    if (a.affiliations && a.affiliations.length > 0) {{
+                    if (a.affiliations && a.affiliations.length > 0) {
                         sups = sups.concat(a.affiliations.map(String));
-                    }}
-                    if (a.markers && a.markers.length > 0) {{
+                    }
+                    if (a.markers && a.markers.length > 0) {
                         sups = sups.concat(a.markers);
-                    }}
+                    }
                     const supValues = sups.map(escapeHtml).join(',');
                     const supStr = sups.length > 0
-                        ? `<sup class="aff-sup">${{supValues}}</sup>`
+                        ? `<sup class="aff-sup">${supValues}</sup>`
                         : '';
-                    return `${{escapeHtml(a.name)}}${{supStr}}`;
-                }});
+                    return `${escapeHtml(a.name)}${supStr}`;
+                });
 
                 // 渲染机构列表
                 const instLine = data.institutions.map(inst =>
-                    `<sup class="aff-sup">${{escapeHtml(inst.id)}}</sup>${{escapeHtml(inst.name)}}`
+                    `<sup class="aff-sup">${escapeHtml(inst.id)}</sup>${escapeHtml(inst.name)}`
                 ).join('&ensp;');
 
                 // 渲染脚注
                 let footLine = '';
-                if (data.footnotes && data.footnotes.length > 0) {{
+                if (data.footnotes && data.footnotes.length > 0) {
                     footLine = data.footnotes.map(fn =>
-                        `<sup class="aff-sup">${{escapeHtml(fn.marker)}}</sup>${{escapeHtml(fn.text)}}`
+                        `<sup class="aff-sup">${escapeHtml(fn.marker)}</sup>${escapeHtml(fn.text)}`
                     ).join('&ensp;');
-                }}
+                }
 
                 let html = authorParts.join(', ');
-                html += `<div class="text-xs text-slate-500 dark:text-slate-400 mt-1">${{instLine}}</div>`;
-                if (footLine) {{
-                    html += `<div class="text-xs text-slate-400 dark:text-slate-500 mt-0.5 italic">${{footLine}}</div>`;
-                }}
+                html += `<div class="text-xs text-slate-500 dark:text-slate-400 mt-1">${instLine}</div>`;
+                if (footLine) {
+                    html += `<div class="text-xs text-slate-400 dark:text-slate-500 mt-0.5 italic">${footLine}</div>`;
+                }
                 return html;
-            }} catch (e) {{
+            } catch (e) {
                 return escapeHtml(authorsStr);
-            }}
-        }}
+            }
+        }
 
-        // Store paper data by arxiv_id for lazy detail building
-        const paperDataMap = {{}};
+        // Paper data by arxiv_id for lazy card and detail building; filled as dates are collected
+        const paperDataMap = {};
 
-        function createPaperHTML(paper, date) {{
+        function createPaperHTML(paper, date) {
             const aid = String(paper.arxiv_id ?? '');
             const aidHtml = escapeHtml(aid);
             const aidArg = escapeJsSingleQuotedAttr(aid);
@@ -2147,34 +3060,23 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             const titleAttr = escapeHtml(paper.title);
             const dateHtml = escapeHtml(date);
             const isStarred = starredPapers.has(aid);
-            const isRead = readPapers.has(aid);
-            const isDeleted = deletedPapers.has(aid);
 
-            if (isDeleted) return '';
-            // 展示窗口：窗口外（两周前）的日期只展示被收藏的论文，其余隐藏。
-            if (!windowDateSet.has(date) && !isStarred) return '';
-            if (showOnlyStarred && !isStarred) return '';
-            if (!paperMatchesFilters(paper, date)) return '';
-
-            // Store paper data for lazy rendering
-            paperDataMap[aid] = {{ paper, date }};
-
-            const clusterBadge = paper.cluster ? `<span class="tag-badge">${{escapeHtml(paper.cluster)}}</span>` : '';
-            const tagBadges = (paper.tags || []).map(tag => `<span class="tag-badge tag-arxiv">${{escapeHtml(tag)}}</span>`).join('');
+            const clusterBadge = paper.cluster ? `<span class="tag-badge">${escapeHtml(paper.cluster)}</span>` : '';
+            const tagBadges = (paper.tags || []).map(tag => `<span class="tag-badge tag-arxiv">${escapeHtml(tag)}</span>`).join('');
 
             return `
-                <div class="paper-item bg-white dark:bg-slate-800/50 rounded-lg shadow-sm p-4 sm:p-6" data-arxiv-id="${{aidHtml}}">
+                <div class="paper-item bg-white dark:bg-slate-800/50 rounded-lg shadow-sm p-4 sm:p-6" data-arxiv-id="${aidHtml}">
                     <!-- 论文标题和操作按钮 -->
                     <div class="flex items-start justify-between mb-1">
                         <div class="flex items-start space-x-2 sm:space-x-3 flex-1 min-w-0">
-                            <button class="star-button ${{isStarred ? 'starred' : ''}} mt-1 flex-shrink-0" onclick="toggleStar('${{aidArg}}')" title="点击收藏">
+                            <button class="star-button ${isStarred ? 'starred' : ''} mt-1 flex-shrink-0" onclick="toggleStar('${aidArg}')" title="点击收藏">
                                 <svg class="h-5 w-5 sm:h-6 sm:w-6" viewBox="0 0 20 20" fill="currentColor">
                                     <path d="M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.07 3.292a1 1 0 00.95.69h3.462c.969 0 1.371 1.24.588 1.81l-2.8 2.034a1 1 0 00-.364 1.118l1.07 3.292c.3.921-.755 1.688-1.54 1.118l-2.8-2.034a1 1 0 00-1.175 0l-2.8 2.034c-.784.57-1.838-.197-1.539-1.118l1.07-3.292a1 1 0 00-.364-1.118L2.98 8.72c-.783-.57-.38-1.81.588-1.81h3.461a1 1 0 00.951-.69l1.07-3.292z" />
                                 </svg>
                             </button>
-                            <h3 class="text-base sm:text-lg font-semibold text-black dark:text-white leading-tight break-words cursor-pointer hover:text-blue-600 dark:hover:text-blue-400 transition-colors" onclick="togglePaperDetail('${{aidArg}}')">${{titleHtml}}</h3>
+                            <h3 class="text-base sm:text-lg font-semibold text-black dark:text-white leading-tight break-words cursor-pointer hover:text-blue-600 dark:hover:text-blue-400 transition-colors" onclick="togglePaperDetail('${aidArg}')">${titleHtml}</h3>
                         </div>
-                        <button class="delete-button text-slate-400 hover:text-red-500 ml-2 sm:ml-4 flex-shrink-0" onclick="deletePaperByButton(this)" data-arxiv-id="${{aidHtml}}" data-title="${{titleAttr}}" title="删除">
+                        <button class="delete-button text-slate-400 hover:text-red-500 ml-2 sm:ml-4 flex-shrink-0" onclick="deletePaperByButton(this)" data-arxiv-id="${aidHtml}" data-title="${titleAttr}" title="删除">
                             <svg class="h-5 w-5" fill="none" viewBox="0 0 24 24" stroke="currentColor">
                                 <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M6 18L18 6M6 6l12 12" />
                             </svg>
@@ -2184,34 +3086,34 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
                     <!-- 论文元信息（始终可见） -->
                     <div class="space-y-1 mb-2">
                         <div class="flex flex-wrap items-center gap-2 sm:gap-4 text-xs sm:text-sm text-slate-600 dark:text-slate-400">
-                            <span class="break-all"><strong>ArXiv ID:</strong> ${{aidHtml}}</span>
-                            ${{clusterBadge}}
-                            ${{tagBadges}}
-                            <span class="whitespace-nowrap">${{dateHtml}}</span>
+                            <span class="break-all"><strong>ArXiv ID:</strong> ${aidHtml}</span>
+                            ${clusterBadge}
+                            ${tagBadges}
+                            <span class="whitespace-nowrap">${dateHtml}</span>
                         </div>
                         <div class="text-xs sm:text-sm text-black dark:text-white break-words">
-                            <strong>作者:</strong> ${{formatAuthorsWithAffiliations(paper.authors, paper.affiliations)}}
+                            <strong>作者:</strong> ${formatAuthorsWithAffiliations(paper.authors, paper.affiliations)}
                         </div>
                     </div>
 
                     <!-- 展开/收起指示器 -->
-                    <div class="paper-expand-hint text-xs text-slate-400 dark:text-slate-500 cursor-pointer select-none" onclick="togglePaperDetail('${{aidArg}}')" id="expand-hint-${{aidHtml}}">
+                    <div class="paper-expand-hint text-xs text-slate-400 dark:text-slate-500 cursor-pointer select-none" onclick="togglePaperDetail('${aidArg}')" id="expand-hint-${aidHtml}">
                         <span class="expand-arrow">▶</span> 点击标题展开详情
                     </div>
 
                     <!-- 懒加载的详情容器 -->
-                    <div class="paper-detail hidden" id="detail-${{aidHtml}}"></div>
+                    <div class="paper-detail hidden" id="detail-${aidHtml}"></div>
                 </div>
             `;
-        }}
+        }
 
         // Build and inject paper detail DOM on first expand
-        function buildPaperDetail(arxivId) {{
-            const container = document.getElementById(`detail-${{arxivId}}`);
+        function buildPaperDetail(arxivId) {
+            const container = document.getElementById(`detail-${arxivId}`);
             if (!container || container.getAttribute('data-built')) return;
             container.setAttribute('data-built', '1');
 
-            const {{ paper, date }} = paperDataMap[arxivId];
+            const { paper, date } = paperDataMap[arxivId];
             if (!paper) return;
 
             const aid = String(paper.arxiv_id ?? '');
@@ -2221,14 +3123,14 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             const isRead = readPapers.has(aid);
 
             // Register all markdown content
-            registerMarkdown(`filter-reason-${{aid}}`, paper.filter_reason);
-            registerMarkdown(`intro-logic-${{aid}}`, paper.intro_logic);
-            registerMarkdown(`core-insight-${{aid}}`, paper.core_insight);
-            registerMarkdown(`methodology-${{aid}}`, paper.methodology);
-            registerMarkdown(`additional-insights-${{aid}}`, paper.additional_insights);
-            registerMarkdown(`research-value-${{aid}}`, paper.research_value);
-            if (hasMeaningfulText(paper.summary)) registerMarkdown(`summary-en-${{aid}}`, paper.summary);
-            if (hasMeaningfulText(paper.summary_translation)) registerMarkdown(`summary-zh-${{aid}}`, paper.summary_translation);
+            registerMarkdown(`filter-reason-${aid}`, paper.filter_reason);
+            registerMarkdown(`intro-logic-${aid}`, paper.intro_logic);
+            registerMarkdown(`core-insight-${aid}`, paper.core_insight);
+            registerMarkdown(`methodology-${aid}`, paper.methodology);
+            registerMarkdown(`additional-insights-${aid}`, paper.additional_insights);
+            registerMarkdown(`research-value-${aid}`, paper.research_value);
+            if (hasMeaningfulText(paper.summary)) registerMarkdown(`summary-en-${aid}`, paper.summary);
+            if (hasMeaningfulText(paper.summary_translation)) registerMarkdown(`summary-zh-${aid}`, paper.summary_translation);
 
             let html = '';
             const hasSummaryEn = hasMeaningfulText(paper.summary);
@@ -2238,7 +3140,7 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             html += `
                 <div class="mb-3 sm:mb-4 mt-3">
                     <label class="inline-flex items-center">
-                        <input type="checkbox" ${{isRead ? 'checked' : ''}} onchange="toggleRead('${{aidArg}}')" class="rounded border-gray-300 text-blue-600 shadow-sm focus:border-blue-300 focus:ring focus:ring-blue-200 focus:ring-opacity-50 w-4 h-4">
+                        <input type="checkbox" ${isRead ? 'checked' : ''} onchange="toggleRead('${aidArg}')" class="rounded border-gray-300 text-blue-600 shadow-sm focus:border-blue-300 focus:ring focus:ring-blue-200 focus:ring-opacity-50 w-4 h-4">
                         <span class="ml-2 text-xs sm:text-sm text-slate-600 dark:text-slate-400">已阅读</span>
                     </label>
                 </div>
@@ -2251,16 +3153,16 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
                     <div class="collapsible-content open">
                         <div class="inner">
                             <div class="summary-section bg-green-50/70 dark:bg-green-950/20 border-l-3 border-green-300 p-3 sm:p-4 rounded-r-lg">
-                                ${{hasSummaryEn ? `
-                                <div class="english-summary text-xs sm:text-sm text-black dark:text-white leading-relaxed markdown-content break-words" id="summary-en-${{aidHtml}}" style="display: block;">
-                                </div>` : ''}}
-                                ${{hasSummaryZh ? `
-                                <div class="chinese-summary text-xs sm:text-sm text-black dark:text-white leading-relaxed markdown-content break-words" id="summary-zh-${{aidHtml}}" style="display: ${{hasSummaryEn ? 'none' : 'block'}};">
-                                </div>` : ''}}
-                                ${{!hasSummaryEn && !hasSummaryZh ? `
+                                ${hasSummaryEn ? `
+                                <div class="english-summary text-xs sm:text-sm text-black dark:text-white leading-relaxed markdown-content break-words" id="summary-en-${aidHtml}" style="display: block;">
+                                </div>` : ''}
+                                ${hasSummaryZh ? `
+                                <div class="chinese-summary text-xs sm:text-sm text-black dark:text-white leading-relaxed markdown-content break-words" id="summary-zh-${aidHtml}" style="display: ${hasSummaryEn ? 'none' : 'block'};">
+                                </div>` : ''}
+                                ${!hasSummaryEn && !hasSummaryZh ? `
                                 <div class="text-xs sm:text-sm text-slate-500 dark:text-slate-400 leading-relaxed">
                                     暂无原始摘要。上游抓取或解析可能失败。
-                                </div>` : ''}}
+                                </div>` : ''}
                             </div>
                         </div>
                     </div>
@@ -2269,35 +3171,35 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
 
             // 各分析section的配置
             const sections = [
-                {{ key: 'intro_logic', id: `intro-logic-${{aid}}`, title: 'Introduction 逻辑链', color: 'yellow' }},
-                {{ key: 'core_insight', id: `core-insight-${{aid}}`, title: '核心切入点 / Pain Point', color: 'orange' }},
-                {{ key: 'methodology', id: `methodology-${{aid}}`, title: '方法论解读', color: 'purple' }},
-                {{ key: 'additional_insights', id: `additional-insights-${{aid}}`, title: '延伸洞察', color: 'red' }},
-                {{ key: 'research_value', id: `research-value-${{aid}}`, title: paper.research_value_source === 'reviewgrounder' ? 'ReviewGrounder 审稿' : '研究价值', color: 'teal' }},
-                {{ key: 'filter_reason', id: `filter-reason-${{aid}}`, title: '筛选原因', color: 'blue' }},
+                { key: 'intro_logic', id: `intro-logic-${aid}`, title: 'Introduction 逻辑链', color: 'yellow' },
+                { key: 'core_insight', id: `core-insight-${aid}`, title: '核心切入点 / Pain Point', color: 'orange' },
+                { key: 'methodology', id: `methodology-${aid}`, title: '方法论解读', color: 'purple' },
+                { key: 'additional_insights', id: `additional-insights-${aid}`, title: '延伸洞察', color: 'red' },
+                { key: 'research_value', id: `research-value-${aid}`, title: paper.research_value_source === 'reviewgrounder' ? 'ReviewGrounder 审稿' : '研究价值', color: 'teal' },
+                { key: 'filter_reason', id: `filter-reason-${aid}`, title: '筛选原因', color: 'blue' },
             ];
 
             let renderedSections = 0;
-            sections.forEach(s => {{
-                if (hasMeaningfulText(paper[s.key])) {{
+            sections.forEach(s => {
+                if (hasMeaningfulText(paper[s.key])) {
                     renderedSections += 1;
                     html += `
                         <div class="mb-3 sm:mb-4">
-                            <div class="collapsible-header text-sm sm:text-base" onclick="toggleCollapsible(this)">${{s.title}}</div>
+                            <div class="collapsible-header text-sm sm:text-base" onclick="toggleCollapsible(this)">${s.title}</div>
                             <div class="collapsible-content">
                                 <div class="inner">
-                                    <div class="bg-${{s.color}}-50/70 dark:bg-${{s.color}}-950/20 border-l-3 border-${{s.color}}-300 p-3 sm:p-4 rounded-r-lg">
-                                        <div class="text-xs sm:text-sm text-black dark:text-white leading-relaxed markdown-content break-words" id="${{escapeHtml(s.id)}}">
+                                    <div class="bg-${s.color}-50/70 dark:bg-${s.color}-950/20 border-l-3 border-${s.color}-300 p-3 sm:p-4 rounded-r-lg">
+                                        <div class="text-xs sm:text-sm text-black dark:text-white leading-relaxed markdown-content break-words" id="${escapeHtml(s.id)}">
                                         </div>
                                     </div>
                                 </div>
                             </div>
                         </div>
                     `;
-                }}
-            }});
+                }
+            });
 
-            if (renderedSections === 0) {{
+            if (renderedSections === 0) {
                 html += `
                     <div class="mb-3 sm:mb-4">
                         <div class="bg-amber-50/80 dark:bg-amber-950/20 border-l-3 border-amber-300 p-3 sm:p-4 rounded-r-lg text-xs sm:text-sm text-slate-600 dark:text-slate-300 leading-relaxed">
@@ -2305,20 +3207,20 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
                         </div>
                     </div>
                 `;
-            }}
+            }
 
             // 论文链接
             html += `
                 <div class="flex flex-wrap gap-2">
-                    <a href="https://arxiv.org/abs/${{aidPath}}" target="_blank" rel="noopener noreferrer"
+                    <a href="https://arxiv.org/abs/${aidPath}" target="_blank" rel="noopener noreferrer"
                        class="inline-flex items-center px-2.5 py-1.5 sm:px-3 sm:py-2 text-xs sm:text-sm font-medium text-white bg-red-600 hover:bg-red-700 rounded-md transition-colors whitespace-nowrap">
                         arXiv 原文
                     </a>
-                    <a href="https://arxiv.org/pdf/${{aidPath}}.pdf" target="_blank" rel="noopener noreferrer"
+                    <a href="https://arxiv.org/pdf/${aidPath}.pdf" target="_blank" rel="noopener noreferrer"
                        class="inline-flex items-center px-2.5 py-1.5 sm:px-3 sm:py-2 text-xs sm:text-sm font-medium text-white bg-green-600 hover:bg-green-700 rounded-md transition-colors whitespace-nowrap">
                         PDF 下载
                     </a>
-                    <a href="https://papers.cool/arxiv/${{aidPath}}" target="_blank" rel="noopener noreferrer"
+                    <a href="https://papers.cool/arxiv/${aidPath}" target="_blank" rel="noopener noreferrer"
                        class="inline-flex items-center px-2.5 py-1.5 sm:px-3 sm:py-2 text-xs sm:text-sm font-medium text-white bg-blue-600 hover:bg-blue-700 rounded-md transition-colors whitespace-nowrap">
                         Cool Paper
                     </a>
@@ -2331,267 +3233,386 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             container.querySelectorAll('.collapsible-content.open').forEach(c => lazyRenderMarkdown(c));
 
             // Apply summary language setting
-            if (showChineseSummary) {{
+            if (showChineseSummary) {
                 const ch = container.querySelector('.chinese-summary');
                 const en = container.querySelector('.english-summary');
                 if (ch) ch.style.display = 'block';
                 if (en) en.style.display = 'none';
-            }} else {{
+            } else {
                 const ch = container.querySelector('.chinese-summary');
                 const en = container.querySelector('.english-summary');
                 if (ch) ch.style.display = 'none';
                 if (en) en.style.display = 'block';
-            }}
-        }}
+            }
+        }
+
+        // Toggle paper detail expansion
+        function togglePaperDetail(arxivId) {
+            const container = document.getElementById(`detail-${arxivId}`);
+            const hint = document.getElementById(`expand-hint-${arxivId}`);
+            if (!container) return;
+
+            const isHidden = container.classList.contains('hidden');
+            if (isHidden) {
+                // First expand: build the DOM
+                buildPaperDetail(arxivId);
+                container.classList.remove('hidden');
+                if (hint) {
+                    hint.querySelector('.expand-arrow').textContent = '▼';
+                    hint.childNodes[hint.childNodes.length - 1].textContent = ' 点击标题收起';
+                }
+            } else {
+                container.classList.add('hidden');
+                if (hint) {
+                    hint.querySelector('.expand-arrow').textContent = '▶';
+                    hint.childNodes[hint.childNodes.length - 1].textContent = ' 点击标题展开详情';
+                }
+            }
+        }
+
+        // ========== 虚拟化渲染：每个日期一个 section，论文卡片接近视口时才生成 DOM ==========
+        const PAPER_SLOT_MIN_HEIGHT = 140; // 未渲染卡片的占位高度估计（px）
+        const PAPER_RENDER_MARGIN = '1200px 0px';
+        const dateSections = new Map(); // date -> { el, ids, signature }
+        let paperObserver = null;
+
+        function getPaperObserver() {
+            if (typeof IntersectionObserver === 'undefined') return null;
+            if (!paperObserver) {
+                paperObserver = new IntersectionObserver(entries => {
+                    entries.forEach(entry => {
+                        if (entry.isIntersecting) {
+                            materializePaperSlot(entry.target);
+                        } else {
+                            releasePaperSlot(entry.target);
+                        }
+                    });
+                }, { rootMargin: PAPER_RENDER_MARGIN });
+            }
+            return paperObserver;
+        }
+
+        function findPaperSlot(arxivId) {
+            return document.querySelector(`li[data-slot-aid="${cssEscape(arxivId)}"]`);
+        }
+
+        // 为占位生成卡片 DOM（已生成则跳过）
+        function materializePaperSlot(slot) {
+            if (!slot || slot.dataset.rendered) return;
+            const entry = paperDataMap[slot.dataset.slotAid];
+            if (!entry) return;
+            slot.innerHTML = createPaperHTML(entry.paper, entry.date);
+            slot.dataset.rendered = '1';
+            slot.style.minHeight = '';
+        }
+
+        // 远离视口的卡片换回等高占位；展开了详情或含焦点的卡片保留
+        function releasePaperSlot(slot) {
+            if (!slot.dataset.rendered) return;
+            if (slot.querySelector('.paper-detail:not(.hidden)') || slot.contains(document.activeElement)) return;
+            slot.style.minHeight = `${slot.offsetHeight}px`;
+            slot.innerHTML = '';
+            delete slot.dataset.rendered;
+        }
+
+        function observeSectionSlots(section) {
+            const observer = getPaperObserver();
+            section.querySelectorAll('li[data-slot-aid]').forEach(slot => {
+                if (observer) {
+                    observer.observe(slot);
+                } else {
+                    materializePaperSlot(slot);
+                }
+            });
+        }
+
+        function discardDateSection(date) {
+            const state = dateSections.get(date);
+            if (!state) return;
+            if (paperObserver) {
+                state.el.querySelectorAll('li[data-slot-aid]').forEach(slot => paperObserver.unobserve(slot));
+            }
+            state.el.remove();
+            dateSections.delete(date);
+        }
 
-        // Toggle paper detail expansion
-        function togglePaperDetail(arxivId) {{
-            const container = document.getElementById(`detail-${{arxivId}}`);
-            const hint = document.getElementById(`expand-hint-${{arxivId}}`);
-            if (!container) return;
+        // 论文是否出现在信息流中（删除、展示窗口、只看收藏、搜索与标签筛选）
+        function isPaperVisible(paper, date) {
+            const aid = String(paper.arxiv_id ?? '');
+            if (deletedPapers.has(aid)) return false;
+            const isStarred = starredPapers.has(aid);
+            // 展示窗口：窗口外（两周前）的日期只展示被收藏或被搜索命中的论文，其余隐藏。
+            const isSearchHit = searchMatches !== null && searchMatches.has(aid);
+            if (!windowDateSet.has(date) && !isStarred && !isSearchHit) return false;
+            if (showOnlyStarred && !isStarred) return false;
+            return paperMatchesFilters(paper, date);
+        }
 
-            const isHidden = container.classList.contains('hidden');
-            if (isHidden) {{
-                // First expand: build the DOM
-                buildPaperDetail(arxivId);
-                container.classList.remove('hidden');
-                if (hint) {{
-                    hint.querySelector('.expand-arrow').textContent = '▼';
-                    hint.childNodes[hint.childNodes.length - 1].textContent = ' 点击标题收起';
-                }}
-            }} else {{
-                container.classList.add('hidden');
-                if (hint) {{
-                    hint.querySelector('.expand-arrow').textContent = '▶';
-                    hint.childNodes[hint.childNodes.length - 1].textContent = ' 点击标题展开详情';
-                }}
-            }}
-        }}
+        // Collect the visible papers of a date; cards themselves are built lazily
+        function collectPapersForDate(clusters, date) {
+            const papers = [];
+            clusters.forEach(cluster => {
+                (cluster.papers || []).forEach(paper => {
+                    if (isPaperVisible(paper, date)) {
+                        paperDataMap[String(paper.arxiv_id ?? '')] = { paper, date };
+                        papers.push(paper);
+                    }
+                });
+            });
+            return papers;
+        }
 
-        // 创建聚类HTML
-        // Collect all papers from all clusters for a date into a flat list
-        function collectPapersForDate(clusters, date) {{
-            let html = '';
-            let count = 0;
-            clusters.forEach(cluster => {{
-                if (cluster.papers) {{
-                    cluster.papers.forEach(paper => {{
-                        const paperHTML = createPaperHTML(paper, date);
-                        if (paperHTML) {{
-                            html += `<li>${{paperHTML}}</li>`;
-                            count++;
-                        }}
-                    }});
-                }}
-            }});
-            return {{ html, count }};
-        }}
+        // 日期 section 的内容签名：可见论文、标签筛选与速览都不变时复用已有 DOM
+        function sectionSignature(date, ids) {
+            const filters = [...(activeTagFilters[date] || [])].sort().join('\\u0001');
+            const tagCount = (allPaperTags[date] || []).length;
+            return [ids.join(','), filters, dailyOverviews[date] ? 1 : 0, tagCount].join('|');
+        }
 
         // Build tag filter bar HTML for a given date
-        function buildTagFilterBar(date) {{
+        function buildTagFilterBar(date) {
             const tags = allPaperTags[date];
             if (!tags || tags.length === 0) return '';
             const dateArg = escapeJsSingleQuotedAttr(date);
             const filters = activeTagFilters[date] || new Set();
             const allActive = filters.size === 0;
             let html = '<div class="flex flex-wrap gap-1.5 mb-3">';
-            html += `<button class="tag-btn ${{allActive ? 'active' : ''}}" onclick="toggleTagFilter('${{dateArg}}','All')">All</button>`;
-            tags.forEach(tag => {{
+            html += `<button class="tag-btn ${allActive ? 'active' : ''}" onclick="toggleTagFilter('${dateArg}','All')">All</button>`;
+            tags.forEach(tag => {
                 const isActive = filters.has(tag.name);
                 const tagArg = escapeJsSingleQuotedAttr(tag.name);
-                html += `<button class="tag-btn ${{isActive ? 'active' : ''}}" onclick="toggleTagFilter('${{dateArg}}','${{tagArg}}')">${{escapeHtml(tag.name)}} &times;${{escapeHtml(tag.count)}}</button>`;
-            }});
+                html += `<button class="tag-btn ${isActive ? 'active' : ''}" onclick="toggleTagFilter('${dateArg}','${tagArg}')">${escapeHtml(tag.name)} &times;${escapeHtml(tag.count)}</button>`;
+            });
             html += '</div>';
             return html;
-        }}
-
-        // 渲染论文列表
-        function renderPapers() {{
-            const mainContent = document.getElementById('main-content');
-            const loading = document.getElementById('loading');
-
-            if (loading) {{
-                loading.classList.add('hidden');
-            }}
-
-            // Clear paper data map (rebuilt by createPaperHTML)
-            Object.keys(paperDataMap).forEach(k => delete paperDataMap[k]);
-
-            let html = '';
-            let totalPapers = 0;
+        }
 
-            for (const date in allPapers) {{
-                const clusters = allPapers[date] || [];
-                const {{ html: papersHTML, count: dateVisibleTotal }} = collectPapersForDate(clusters, date);
-                const dateHtml = escapeHtml(date);
+        // 构建单个日期的 section；论文先以占位 <li> 出现，由 IntersectionObserver 填充
+        function buildDateSection(date, papers) {
+            const dateHtml = escapeHtml(date);
+            const section = document.createElement('section');
+            section.className = 'mb-6 sm:mb-8';
+            section.setAttribute('data-date-section', date);
 
-                totalPapers += dateVisibleTotal;
+            let html = `
+                <h2 class="text-base sm:text-lg font-medium text-slate-500 dark:text-slate-400 mb-3 sm:mb-4" data-date-heading="${dateHtml}">${dateHtml} (${escapeHtml(papers.length)} 篇论文)</h2>
+            `;
 
+            // 添加该日期的AI论文速览（如果存在）
+            if (dailyOverviews[date]) {
+                registerMarkdown(`overview-${date}`, dailyOverviews[date]);
                 html += `
-                    <section class="mb-6 sm:mb-8" data-date-section="${{dateHtml}}">
-                        <h2 class="text-base sm:text-lg font-medium text-slate-500 dark:text-slate-400 mb-3 sm:mb-4" data-date-heading="${{dateHtml}}">${{dateHtml}} (${{escapeHtml(dateVisibleTotal)}} 篇论文)</h2>
-                `;
-
-                // 添加该日期的AI论文速览（如果存在）
-                if (dailyOverviews[date]) {{
-                    html += `
-                        <div class="mb-3 sm:mb-4 bg-gradient-to-r from-blue-50 to-indigo-50 dark:from-slate-800 dark:to-slate-700 rounded-lg shadow-md p-3 sm:p-5">
-                            <div class="collapsible-header" onclick="toggleCollapsible(this)">
-                                <svg class="w-4 h-4 sm:w-5 sm:h-5 mr-2 text-blue-600 dark:text-blue-400 inline-block" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 20H5a2 2 0 01-2-2V6a2 2 0 012-2h10a2 2 0 012 2v1m2 13a2 2 0 01-2-2V7m2 13a2 2 0 002-2V9a2 2 0 00-2-2h-2m-4-3H9M7 16h6M7 8h6v4H7V8z"></path>
-                                </svg>
-                                <span class="font-semibold text-slate-900 dark:text-white text-sm sm:text-base">今日AI论文速览</span>
-                            </div>
-                            <div class="collapsible-content">
-                                <div class="inner">
-                                    <div class="markdown-content text-slate-700 dark:text-slate-200 text-xs sm:text-sm" id="overview-${{date}}">
-                                    </div>
+                    <div class="mb-3 sm:mb-4 bg-gradient-to-r from-blue-50 to-indigo-50 dark:from-slate-800 dark:to-slate-700 rounded-lg shadow-md p-3 sm:p-5">
+                        <div class="collapsible-header" onclick="toggleCollapsible(this)">
+                            <svg class="w-4 h-4 sm:w-5 sm:h-5 mr-2 text-blue-600 dark:text-blue-400 inline-block" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 20H5a2 2 0 01-2-2V6a2 2 0 012-2h10a2 2 0 012 2v1m2 13a2 2 0 01-2-2V7m2 13a2 2 0 002-2V9a2 2 0 00-2-2h-2m-4-3H9M7 16h6M7 8h6v4H7V8z"></path>
+                            </svg>
+                            <span class="font-semibold text-slate-900 dark:text-white text-sm sm:text-base">今日AI论文速览</span>
+                        </div>
+                        <div class="collapsible-content">
+                            <div class="inner">
+                                <div class="markdown-content text-slate-700 dark:text-slate-200 text-xs sm:text-sm" id="overview-${dateHtml}">
                                 </div>
                             </div>
                         </div>
-                    `;
-                }}
+                    </div>
+                `;
+            }
 
-                // Add tag filter bar
-                html += buildTagFilterBar(date);
+            // Add tag filter bar
+            html += buildTagFilterBar(date);
 
-                if (dateVisibleTotal === 0) {{
-                    html += `
-                        <div class="bg-white dark:bg-slate-800/50 rounded-lg shadow-sm p-4 sm:p-5 lg:p-6">
-                            <div class="text-sm sm:text-base text-slate-600 dark:text-slate-300 leading-relaxed">
-                                今日数据已处理，但没有符合当前筛选条件的论文。
-                            </div>
-                        </div>
-                    </section>
-                    `;
-                }} else {{
-                    html += `
-                        <div class="bg-white dark:bg-slate-800/50 rounded-lg shadow-sm p-3 sm:p-4 lg:p-6">
-                            <ul class="space-y-3 sm:space-y-4">
-                                ${{papersHTML}}
-                            </ul>
+            if (papers.length === 0) {
+                html += `
+                    <div class="bg-white dark:bg-slate-800/50 rounded-lg shadow-sm p-4 sm:p-5 lg:p-6">
+                        <div class="text-sm sm:text-base text-slate-600 dark:text-slate-300 leading-relaxed">
+                            今日数据已处理，但没有符合当前筛选条件的论文。
                         </div>
-                    </section>
-                    `;
-                }}
-            }}
-
-            // 添加"加载更多"按钮
-            const unloadedCount = getUnloadedDates().length;
-            if (unloadedCount > 0) {{
+                    </div>
+                `;
+            } else {
+                const slots = papers.map(paper =>
+                    `<li data-slot-aid="${escapeHtml(paper.arxiv_id)}" style="min-height: ${PAPER_SLOT_MIN_HEIGHT}px"></li>`
+                ).join('');
                 html += `
-                    <div class="text-center py-6">
-                        <button id="load-more-btn" onclick="loadMoreDates()"
-                            class="inline-flex items-center px-6 py-3 text-base font-medium text-white bg-blue-600 hover:bg-blue-700 rounded-lg shadow-md transition-all duration-200 hover:shadow-lg">
-                            📥 加载更多 (还有 ${{unloadedCount}} 天)
-                        </button>
+                    <div class="bg-white dark:bg-slate-800/50 rounded-lg shadow-sm p-3 sm:p-4 lg:p-6">
+                        <ul class="space-y-3 sm:space-y-4">${slots}</ul>
                     </div>
                 `;
-            }}
+            }
 
-            mainContent.innerHTML = html;
-            updateStats();
+            section.innerHTML = html;
+            return section;
+        }
+
+        function renderLoadMoreButton(mainContent) {
+            let container = document.getElementById('load-more-container');
+            const unloadedCount = getUnloadedDates().length;
+            if (unloadedCount === 0) {
+                if (container) container.remove();
+                return;
+            }
+            if (!container) {
+                container = document.createElement('div');
+                container.id = 'load-more-container';
+                container.className = 'text-center py-6';
+                container.innerHTML = `
+                    <button id="load-more-btn" onclick="loadMoreDates()"
+                        class="inline-flex items-center px-6 py-3 text-base font-medium text-white bg-blue-600 hover:bg-blue-700 rounded-lg shadow-md transition-all duration-200 hover:shadow-lg">
+                        📥 加载更多 (还有 ${unloadedCount} 天)
+                    </button>
+                `;
+            } else if (!isLoadingMore) {
+                updateLoadMoreButton();
+            }
+            if (mainContent.lastElementChild !== container) {
+                mainContent.appendChild(container);
+            }
+        }
+
+        // 渲染论文列表：逐日期比对签名，只重建内容变化的 section，其余 DOM 原样保留
+        function renderPapers() {
+            const mainContent = document.getElementById('main-content');
+            const loading = document.getElementById('loading');
 
-            // Register overview markdown and render visible content
-            for (const date in dailyOverviews) {{
-                registerMarkdown(`overview-${{date}}`, dailyOverviews[date]);
-            }}
+            if (loading) {
+                loading.remove();
+            }
+
+            const shownDates = [];
+            const rebuilt = [];
+            // 日期可能乱序到达，按日期倒序排列
+            for (const date of Object.keys(allPapers).sort().reverse()) {
+                const papers = collectPapersForDate(allPapers[date] || [], date);
+                // 搜索时只展示有命中的日期
+                if (searchMatches !== null && papers.length === 0) continue;
+
+                const ids = papers.map(paper => String(paper.arxiv_id ?? ''));
+                const signature = sectionSignature(date, ids);
+                const state = dateSections.get(date);
+                if (!state || state.signature !== signature) {
+                    discardDateSection(date);
+                    const el = buildDateSection(date, papers);
+                    dateSections.set(date, { el, ids, signature });
+                    rebuilt.push(el);
+                }
+                shownDates.push(date);
+            }
+
+            const shown = new Set(shownDates);
+            [...dateSections.keys()].forEach(date => {
+                if (!shown.has(date)) discardDateSection(date);
+            });
+
+            // 按日期顺序就位，只移动位置不对的 section
+            let cursor = mainContent.firstElementChild;
+            shownDates.forEach(date => {
+                const el = dateSections.get(date).el;
+                if (el === cursor) {
+                    cursor = cursor.nextElementSibling;
+                } else {
+                    mainContent.insertBefore(el, cursor);
+                }
+            });
+            renderLoadMoreButton(mainContent);
+
+            rebuilt.forEach(observeSectionSlots);
+            updateStats();
             renderVisibleMarkdown();
 
             // 更新 TOC
             buildToc();
-
-        }}
+        }
 
         // 主题切换功能
-        function setupThemeToggle() {{
+        function setupThemeToggle() {
             const themeToggleBtn = document.getElementById('theme-toggle');
             const lightIcon = document.getElementById('theme-icon-light');
             const darkIcon = document.getElementById('theme-icon-dark');
 
-            function updateThemeIcon() {{
-                if (document.documentElement.classList.contains('dark')) {{
+            function updateThemeIcon() {
+                if (document.documentElement.classList.contains('dark')) {
                     lightIcon.classList.add('hidden');
                     darkIcon.classList.remove('hidden');
-                }} else {{
+                } else {
                     lightIcon.classList.remove('hidden');
                     darkIcon.classList.add('hidden');
-                }}
-            }}
+                }
+            }
 
             updateThemeIcon();
 
-            themeToggleBtn.addEventListener('click', () => {{
+            themeToggleBtn.addEventListener('click', () => {
                 document.documentElement.classList.toggle('dark');
                 localStorage.theme = document.documentElement.classList.contains('dark') ? 'dark' : 'light';
                 updateThemeIcon();
-            }});
-        }}
+            });
+        }
 
         // 设置摘要语言切换功能
-        function setupSummaryToggle() {{
+        function setupSummaryToggle() {
             const summaryToggleBtn = document.getElementById('summary-toggle');
 
             // 初始化按钮文本
             summaryToggleBtn.textContent = showChineseSummary ? '中文摘要' : 'English Summary';
 
             summaryToggleBtn.addEventListener('click', toggleSummaryLanguage);
-        }}
+        }
 
         // 设置筛选功能
-        function setupFilter() {{
+        function setupFilter() {
             const filterStarredBtn = document.getElementById('filter-starred');
             const filterAllBtn = document.getElementById('filter-all');
 
-            filterStarredBtn.addEventListener('click', () => {{
+            filterStarredBtn.addEventListener('click', () => {
                 showOnlyStarred = true;
                 updateFilterButtons();
                 renderPapers();
-            }});
+            });
 
-            filterAllBtn.addEventListener('click', () => {{
+            filterAllBtn.addEventListener('click', () => {
                 showOnlyStarred = false;
                 updateFilterButtons();
                 renderPapers();
-            }});
+            });
 
             updateFilterButtons();
-        }}
+        }
 
         // 更新筛选按钮状态
-        function updateFilterButtons() {{
+        function updateFilterButtons() {
             const filterStarredBtn = document.getElementById('filter-starred');
             const filterAllBtn = document.getElementById('filter-all');
 
-            if (showOnlyStarred) {{
+            if (showOnlyStarred) {
                 filterStarredBtn.className = 'px-3 py-2 text-sm font-medium text-white bg-blue-600 rounded-md hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500 transition-colors';
                 filterAllBtn.className = 'px-3 py-2 text-sm font-medium text-slate-600 dark:text-slate-300 bg-slate-100 dark:bg-slate-700 rounded-md hover:bg-slate-200 dark:hover:bg-slate-600 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-slate-500 transition-colors';
-            }} else {{
+            } else {
                 filterStarredBtn.className = 'px-3 py-2 text-sm font-medium text-slate-600 dark:text-slate-300 bg-slate-100 dark:bg-slate-700 rounded-md hover:bg-slate-200 dark:hover:bg-slate-600 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-slate-500 transition-colors';
                 filterAllBtn.className = 'px-3 py-2 text-sm font-medium text-white bg-blue-600 rounded-md hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500 transition-colors';
-            }}
-        }}
+            }
+        }
 
         // ========== TOC 侧边栏功能 ==========
         let tocSidebarOpen = true;
 
-        function toggleTocSidebar() {{
+        function toggleTocSidebar() {
             const sidebar = document.getElementById('toc-sidebar');
             const toggle = document.getElementById('toc-toggle');
             tocSidebarOpen = !tocSidebarOpen;
-            if (tocSidebarOpen) {{
+            if (tocSidebarOpen) {
                 sidebar.classList.remove('collapsed');
                 toggle.classList.add('sidebar-open');
                 toggle.querySelector('svg').style.transform = 'rotate(180deg)';
-            }} else {{
+            } else {
                 sidebar.classList.add('collapsed');
                 toggle.classList.remove('sidebar-open');
                 toggle.querySelector('svg').style.transform = 'rotate(0deg)';
-            }}
+            }
             localStorage.setItem('tocSidebarOpen', tocSidebarOpen);
-        }}
+        }
 
-        function buildToc() {{
+        function buildToc() {
             const tocList = document.getElementById('toc-list');
             if (!tocList) return;
 
@@ -2600,173 +3621,305 @@ def generate_complete_html(replace_dates: Optional[Set[str]] = None) -> str:
             const tocDates = availableDates.filter(
                 date => windowDateSet.has(date) || loadedDates.has(date)
             );
-            for (const date of tocDates) {{
+            for (const date of tocDates) {
                 const isLoaded = loadedDates.has(date);
                 let papers = [];
 
-                if (isLoaded && allPapers[date]) {{
+                if (isLoaded && allPapers[date]) {
                     const clusters = allPapers[date];
-                    clusters.forEach(cluster => {{
-                        if (cluster.papers) {{
-                            cluster.papers.forEach(paper => {{
-                                if (!deletedPapers.has(paper.arxiv_id) && (!showOnlyStarred || starredPapers.has(paper.arxiv_id))) {{
-                                    if (paperMatchesFilters(paper, date)) {{
+                    clusters.forEach(cluster => {
+                        if (cluster.papers) {
+                            cluster.papers.forEach(paper => {
+                                if (!deletedPapers.has(paper.arxiv_id) && (!showOnlyStarred || starredPapers.has(paper.arxiv_id))) {
+                                    if (paperMatchesFilters(paper, date)) {
                                         papers.push(paper);
-                                    }}
-                                }}
-                            }});
-                        }}
-                    }});
-                }}
+                                    }
+                                }
+                            });
+                        }
+                    });
+                }
 
                 const countLabel = isLoaded ? papers.length : '...';
                 const dimClass = isLoaded ? '' : ' opacity-50';
                 const dateHtml = escapeHtml(date);
                 const dateArg = escapeJsSingleQuotedAttr(date);
 
-                html += `<div class="mb-1" data-toc-date="${{dateHtml}}">`;
-                html += `<div class="toc-date${{dimClass}}" onclick="tocToggleDate(this, '${{dateArg}}')" data-toc-date-btn="${{dateHtml}}">`;
+                html += `<div class="mb-1" data-toc-date="${dateHtml}">`;
+                html += `<div class="toc-date${dimClass}" onclick="tocToggleDate(this, '${dateArg}')" data-toc-date-btn="${dateHtml}">`;
                 html += `<span class="toc-date-arrow">▶</span>`;
-                html += `<span>${{dateHtml}}</span>`;
-                html += `<span class="text-xs text-slate-400 ml-auto">${{escapeHtml(countLabel)}}</span>`;
+                html += `<span>${dateHtml}</span>`;
+                html += `<span class="text-xs text-slate-400 ml-auto">${escapeHtml(countLabel)}</span>`;
                 html += `</div>`;
-                html += `<div class="toc-papers" data-toc-papers="${{dateHtml}}">`;
-                if (isLoaded) {{
-                    papers.forEach(paper => {{
+                html += `<div class="toc-papers" data-toc-papers="${dateHtml}">`;
+                if (isLoaded) {
+                    papers.forEach(paper => {
                         const title = paper.title.length > 50 ? paper.title.substring(0, 47) + '...' : paper.title;
                         const aidHtml = escapeHtml(paper.arxiv_id);
                         const aidArg = escapeJsSingleQuotedAttr(paper.arxiv_id);
-                        html += `<div class="toc-paper" onclick="tocScrollToPaper('${{aidArg}}')" data-toc-paper="${{aidHtml}}" title="${{escapeHtml(paper.title)}}">${{escapeHtml(title)}}</div>`;
-                    }});
-                }} else {{
-                    html += `<div class="toc-paper opacity-50" onclick="tocLoadAndScrollToDate('${{dateArg}}')">点击加载...</div>`;
-                }}
+                        html += `<div class="toc-paper" onclick="tocScrollToPaper('${aidArg}')" data-toc-paper="${aidHtml}" title="${escapeHtml(paper.title)}">${escapeHtml(title)}</div>`;
+                    });
+                } else {
+                    html += `<div class="toc-paper opacity-50" onclick="tocLoadAndScrollToDate('${dateArg}')">点击加载...</div>`;
+                }
                 html += `</div></div>`;
-            }}
+            }
             tocList.innerHTML = html;
-        }}
+        }
 
-        async function tocLoadAndScrollToDate(date) {{
+        async function tocLoadAndScrollToDate(date) {
             // 加载该日期之前的所有未加载日期
             const unloaded = getUnloadedDates();
             const idx = unloaded.indexOf(date);
             if (idx < 0) return;
             const datesToLoad = unloaded.slice(0, idx + 1);
-            for (const d of datesToLoad) {{
-                try {{
-                    const response = await fetch(`data/${{d}}.json?v=${{DATA_VERSION}}`);
-                    if (response.ok) {{
-                        const dateData = await response.json();
-                        allPapers[d] = dateData.clusters || [];
-                        allPaperTags[d] = dateData.tags || [];
-                        if (dateData.overview) dailyOverviews[d] = dateData.overview;
-                        loadedDates.add(d);
-                    }}
-                }} catch (e) {{
-                    console.error(`加载 ${{d}} 失败:`, e);
-                }}
-            }}
+            await loadDates(datesToLoad, scheduleRender);
             renderPapers();
             // 等待 DOM 更新后滚动
             setTimeout(() => tocScrollToDate(date), 100);
-        }}
+        }
 
-        function tocToggleDate(el, date) {{
+        function tocToggleDate(el, date) {
             const isLoaded = loadedDates.has(date);
-            if (!isLoaded) {{
+            if (!isLoaded) {
                 tocLoadAndScrollToDate(date);
                 return;
-            }}
+            }
             const arrow = el.querySelector('.toc-date-arrow');
-            const papers = document.querySelector(`[data-toc-papers="${{cssEscape(date)}}"]`);
-            if (papers) {{
+            const papers = document.querySelector(`[data-toc-papers="${cssEscape(date)}"]`);
+            if (papers) {
                 papers.classList.toggle('open');
                 arrow.classList.toggle('open');
-            }}
+            }
             // 同时滚动到对应日期
             tocScrollToDate(date);
-        }}
+        }
 
-        function tocScrollToPaper(arxivId) {{
-            const el = document.querySelector(`[data-arxiv-id="${{cssEscape(arxivId)}}"]`);
-            if (el) {{
-                el.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
+        function tocScrollToPaper(arxivId) {
+            // 目标卡片可能仍是占位，先生成 DOM 再滚动
+            materializePaperSlot(findPaperSlot(arxivId));
+            const el = document.querySelector(`[data-arxiv-id="${cssEscape(arxivId)}"]`);
+            if (el) {
+                el.scrollIntoView({ behavior: 'smooth', block: 'center' });
                 // 短暂高亮
                 el.style.outline = '2px solid #3b82f6';
                 el.style.outlineOffset = '2px';
-                setTimeout(() => {{
+                setTimeout(() => {
                     el.style.outline = '';
                     el.style.outlineOffset = '';
-                }}, 2000);
-            }}
-        }}
+                }, 2000);
+            }
+        }
 
-        function tocScrollToDate(date) {{
-            const section = document.querySelector(`[data-date-section="${{cssEscape(date)}}"]`);
-            if (section) {{
-                section.scrollIntoView({{ behavior: 'smooth', block: 'start' }});
-            }}
-        }}
+        function tocScrollToDate(date) {
+            const section = document.querySelector(`[data-date-section="${cssEscape(date)}"]`);
+            if (section) {
+                section.scrollIntoView({ behavior: 'smooth', block: 'start' });
+            }
+        }
 
         // 滚动时高亮当前可见的日期
         let tocScrollTimer = null;
-        function setupTocScrollSpy() {{
-            window.addEventListener('scroll', () => {{
+        function setupTocScrollSpy() {
+            window.addEventListener('scroll', () => {
                 if (tocScrollTimer) clearTimeout(tocScrollTimer);
-                tocScrollTimer = setTimeout(() => {{
+                tocScrollTimer = setTimeout(() => {
                     const sections = document.querySelectorAll('[data-date-section]');
                     let currentDate = null;
                     const scrollTop = window.scrollY + 100;
 
-                    sections.forEach(section => {{
-                        if (section.offsetTop <= scrollTop) {{
+                    sections.forEach(section => {
+                        if (section.offsetTop <= scrollTop) {
                             currentDate = section.getAttribute('data-date-section');
-                        }}
-                    }});
+                        }
+                    });
 
                     // 更新 TOC 高亮
                     document.querySelectorAll('.toc-date').forEach(el => el.classList.remove('active'));
-                    if (currentDate) {{
-                        const activeBtn = document.querySelector(`[data-toc-date-btn="${{cssEscape(currentDate)}}"]`);
-                        if (activeBtn) {{
+                    if (currentDate) {
+                        const activeBtn = document.querySelector(`[data-toc-date-btn="${cssEscape(currentDate)}"]`);
+                        if (activeBtn) {
                             activeBtn.classList.add('active');
                             // 确保活跃日期在 TOC 可视区域内
                             const tocInner = document.getElementById('toc-inner');
-                            if (tocInner) {{
+                            if (tocInner) {
                                 const btnRect = activeBtn.getBoundingClientRect();
                                 const tocRect = tocInner.getBoundingClientRect();
-                                if (btnRect.top < tocRect.top || btnRect.bottom > tocRect.bottom) {{
-                                    activeBtn.scrollIntoView({{ behavior: 'smooth', block: 'nearest' }});
-                                }}
-                            }}
-                        }}
-                    }}
-                }}, 100);
-            }});
-        }}
+                                if (btnRect.top < tocRect.top || btnRect.bottom > tocRect.bottom) {
+                                    activeBtn.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+                                }
+                            }
+                        }
+                    }
+                }, 100);
+            });
+        }
+
+        // 拆分资源模式下首屏数据是单独缓存的 JSON，初始化前先取回；内联模式下为空操作
+        async function loadFirstScreenData() {
+            if (!FIRST_SCREEN_DATA_URL) return;
+            try {
+                const response = await fetch(FIRST_SCREEN_DATA_URL);
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                const chunk = await response.json();
+                Object.assign(allPapers, chunk.allPapers || {});
+                Object.assign(allPaperTags, chunk.allPaperTags || {});
+                Object.assign(paperDateIndex, chunk.paperDateIndex || {});
+                Object.assign(dailyOverviews, chunk.dailyOverviewsRaw || {});
+            } catch (error) {
+                console.error('加载首屏数据失败:', error);
+            }
+        }
 
         // 初始化应用
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', async function() {
+            await loadFirstScreenData();
             loadState();
             setupThemeToggle();
             setupSummaryToggle();
             setupFilter();
+            setupSearch();
             renderPapers();
             buildToc();
             setupTocScrollSpy();
+            syncServerStateAndRender([...loadedDates]);
 
             // 异步加载窗口外被收藏论文所在日期，加载完成后会重新渲染并内联显示
             loadArchivedStarredDates();
+            schedulePrefetch();
 
             // 恢复 TOC 侧边栏状态
             const savedTocState = localStorage.getItem('tocSidebarOpen');
-            if (savedTocState === 'false') {{
+            if (savedTocState === 'false') {
                 tocSidebarOpen = true; // will be toggled to false
                 toggleTocSidebar();
-            }}
-        }});
+            }
+        });
+"""
+    if WEBPAGE_ASSET_MODE == "split":
+        css_href = write_static_asset("app", ".css", page_css)
+        js_src = write_static_asset("app", ".js", app_js)
+        style_block = f'    <link rel="stylesheet" href="{css_href}">\n'
+        script_block = (
+            f"    <script>\n        {js_data}\n    </script>\n"
+            f'    <script src="{js_src}"></script>\n'
+        )
+    else:
+        style_block = f"    <style>\n{page_css}    </style>\n"
+        script_block = f"    <script>\n        {js_data}\n{app_js}    </script>\n"
+
+    # 完整的HTML模板
+    html_template = f"""<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>PaperTools - 学术论文集合</title>
+    <!-- 引入 Tailwind CSS -->
+    <script src="https://cdn.tailwindcss.com"></script>
+    <!-- 引入 Marked.js 用于 Markdown 渲染 -->
+    <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
+{style_block}    <script>
+        // Tailwind CSS 暗色模式配置
+        if (localStorage.theme === 'dark' || (!('theme' in localStorage) && window.matchMedia('(prefers-color-scheme: dark)').matches)) {{
+            document.documentElement.classList.add('dark')
+        }} else {{
+            document.documentElement.classList.remove('dark')
+        }}
     </script>
-</body>
+</head>
+<body class="bg-slate-50 dark:bg-slate-900 font-sans text-slate-800 dark:text-slate-200">
+
+    <!-- 撤销删除的Toast -->
+    <div id="undo-toast" class="fixed top-4 right-4 bg-red-500 text-white px-3 sm:px-4 py-2 rounded-lg shadow-lg z-50 hidden max-w-xs sm:max-w-sm">
+        <div class="flex items-center space-x-2">
+            <span id="toast-message" class="text-sm sm:text-base">已删除</span>
+            <span id="countdown" class="text-xs sm:text-sm opacity-75"></span>
+            <button id="undo-btn" class="ml-2 px-2 py-1 bg-white text-red-500 rounded text-xs sm:text-sm hover:bg-gray-100">撤销</button>
+        </div>
+    </div>
+
+    <!-- TOC 切换按钮 -->
+    <button id="toc-toggle" class="hidden lg:flex sidebar-open" onclick="toggleTocSidebar()" title="切换目录">
+        <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
+            <polyline points="15 18 9 12 15 6"></polyline>
+        </svg>
+    </button>
+
+    <div class="flex mx-auto max-w-none">
+    <!-- 主内容区域 -->
+    <div class="w-full lg:w-3/5 mx-auto p-3 sm:p-4 lg:p-6">
+        <!-- 头部导航栏 -->
+        <header class="mb-4 sm:mb-6">
+            <div class="flex flex-col sm:flex-row justify-between items-start sm:items-center gap-3 sm:gap-4">
+                <h1 class="text-2xl sm:text-3xl font-bold text-slate-900 dark:text-white">PaperTools</h1>
+                <div class="flex flex-wrap items-center gap-2 sm:gap-3 w-full sm:w-auto">
+                    <!-- 全文搜索 -->
+                    <input id="search-input" type="search" placeholder="搜索全部论文…" autocomplete="off"
+                        class="w-full sm:w-48 px-2.5 py-1.5 sm:py-2 text-xs sm:text-sm text-slate-700 dark:text-slate-200 bg-slate-100 dark:bg-slate-700 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500">
+                    <!-- 统计信息 -->
+                    <div class="text-xs sm:text-sm text-slate-600 dark:text-slate-400">
+                        总计 <span id="total-papers">0</span> 篇论文
+                    </div>
+                    <!-- 筛选按钮 -->
+                    <button id="filter-starred" class="px-2.5 py-1.5 sm:px-3 sm:py-2 text-xs sm:text-sm font-medium text-slate-600 dark:text-slate-300 bg-slate-100 dark:bg-slate-700 rounded-md hover:bg-slate-200 dark:hover:bg-slate-600 focus:outline-none transition-colors whitespace-nowrap">
+                        只看收藏
+                    </button>
+                    <button id="filter-all" class="px-2.5 py-1.5 sm:px-3 sm:py-2 text-xs sm:text-sm font-medium text-white bg-blue-600 rounded-md hover:bg-blue-700 focus:outline-none transition-colors whitespace-nowrap">
+                        显示全部
+                    </button>
+                    <!-- 中英文摘要切换按钮 -->
+                    <button id="summary-toggle" class="px-2.5 py-1.5 sm:px-3 sm:py-2 text-xs sm:text-sm font-medium text-slate-600 dark:text-slate-300 bg-slate-100 dark:bg-slate-700 rounded-md hover:bg-slate-200 dark:hover:bg-slate-600 focus:outline-none transition-colors whitespace-nowrap">
+                        中文摘要
+                    </button>
+                    <button id="theme-toggle" class="p-1.5 sm:p-2 rounded-full hover:bg-slate-200 dark:hover:bg-slate-700 focus:outline-none flex-shrink-0">
+                        <!-- 太阳图标 (浅色模式) -->
+                        <svg id="theme-icon-light" class="h-5 w-5 sm:h-6 sm:w-6 text-slate-600 dark:text-slate-300" fill="none" viewBox="0 0 24 24" stroke="currentColor">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 3v1m0 16v1m9-9h-1M4 12H3m15.364 6.364l-.707-.707M6.343 6.343l-.707-.707m12.728 0l-.707.707M6.343 17.657l-.707.707M16 12a4 4 0 11-8 0 4 4 0 018 0z" />
+                        </svg>
+                        <!-- 月亮图标 (深色模式) -->
+                        <svg id="theme-icon-dark" class="h-5 w-5 sm:h-6 sm:w-6 text-slate-600 dark:text-slate-300 hidden" fill="none" viewBox="0 0 24 24" stroke="currentColor">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M20.354 15.354A9 9 0 018.646 3.646 9.003 9.003 0 0012 21a9.003 9.003 0 008.354-5.646z" />
+                        </svg>
+                    </button>
+                    <!-- GitHub 图标按钮 -->
+                    <a href="https://github.com/tsrigo/PaperTools" target="https://github.com/tsrigo/PaperTools" title="GitHub 项目主页"
+                       class="p-1.5 sm:p-2 rounded-full hover:bg-slate-200 dark:hover:bg-slate-700 focus:outline-none flex-shrink-0">
+                        <svg class="h-5 w-5 sm:h-6 sm:w-6 text-slate-700 dark:text-slate-200" fill="currentColor" viewBox="0 0 24 24" aria-hidden="true">
+                            <path fill-rule="evenodd" d="M12 2C6.477 2 2 6.484 2 12.021c0 4.428 2.865 8.184 6.839 9.504.5.092.682-.217.682-.483 0-.237-.009-.868-.014-1.703-2.782.605-3.369-1.342-3.369-1.342-.454-1.155-1.11-1.463-1.11-1.463-.908-.62.069-.608.069-.608 1.004.07 1.532 1.032 1.532 1.032.892 1.53 2.341 1.088 2.91.832.092-.647.35-1.088.636-1.339-2.221-.253-4.555-1.113-4.555-4.951 0-1.093.39-1.988 1.029-2.688-.103-.254-.446-1.272.098-2.65 0 0 .84-.27 2.75 1.025A9.564 9.564 0 0112 6.844c.85.004 1.705.115 2.504.337 1.909-1.295 2.748-1.025 2.748-1.025.546 1.378.202 2.396.1 2.65.64.7 1.028 1.595 1.028 2.688 0 3.847-2.337 4.695-4.566 4.944.359.309.678.919.678 1.852 0 1.336-.012 2.417-.012 2.747 0 .268.18.579.688.481C19.138 20.2 22 16.447 22 12.021 22 6.484 17.523 2 12 2z" clip-rule="evenodd"/>
+                        </svg>
+                    </a>
+                </div>
+            </div>
+        </header>
+
+        <!-- 主要内容区域 -->
+        <main class="space-y-6 sm:space-y-8" id="main-content">
+            <!-- 加载提示 -->
+            <div id="loading" class="text-center py-8">
+                <div class="inline-flex items-center px-4 py-2 font-semibold leading-6 text-sm shadow rounded-md text-slate-500 bg-white dark:bg-slate-800 transition ease-in-out duration-150">
+                    <svg class="animate-spin -ml-1 mr-3 h-5 w-5 text-slate-500" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24">
+                        <circle class="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" stroke-width="4"></circle>
+                        <path class="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path>
+                    </svg>
+                    加载中...
+                </div>
+            </div>
+        </main>
+    </div>
+    </div>
+
+    <!-- 左侧 TOC 侧边栏（固定定位） -->
+    <aside id="toc-sidebar" class="hidden lg:block">
+        <div id="toc-inner">
+            <div class="flex items-center justify-between mb-2 px-2">
+                <span class="text-sm font-bold text-slate-500 dark:text-slate-400 uppercase tracking-wider">目录</span>
+            </div>
+            <nav id="toc-list"></nav>
+        </div>
+    </aside>
+
+{script_block}</body>
 </html>"""
 
     return html_template
@@ -2836,59 +3989,7 @@ def restore_file_snapshot(path: Path, snapshot: tuple[bool, bytes]) -> None:
         raise
 
 
-def snapshot_directory(path: Path) -> tuple[bool, Dict[str, bytes]]:
-    """Capture all files below a directory before generation mutates them."""
-    if not path.exists():
-        return False, {}
-    if not path.is_dir():
-        return False, {}
-
-    files: Dict[str, bytes] = {}
-    for file_path in sorted(path.rglob("*")):
-        if file_path.is_file():
-            files[str(file_path.relative_to(path))] = file_path.read_bytes()
-    return True, files
-
-
-def _atomic_write_bytes(path: Path, content: bytes) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    fd, temp_path = tempfile.mkstemp(
-        prefix=f".{path.name}.rollback.",
-        suffix=".tmp",
-        dir=str(path.parent),
-    )
-    try:
-        with os.fdopen(fd, "wb") as handle:
-            handle.write(content)
-            handle.flush()
-            os.fsync(handle.fileno())
-        os.replace(temp_path, path)
-    except Exception:
-        try:
-            os.unlink(temp_path)
-        except OSError:
-            pass
-        raise
-
-
-def restore_directory_snapshot(
-    path: Path, snapshot: tuple[bool, Dict[str, bytes]]
-) -> None:
-    """Restore or remove a generated data directory after failed validation."""
-    existed, files = snapshot
-    if path.is_dir():
-        shutil.rmtree(path)
-    elif path.exists():
-        path.unlink()
-
-    if not existed:
-        return
-
-    path.mkdir(parents=True, exist_ok=True)
-    for relative_path, content in files.items():
-        _atomic_write_bytes(path / relative_path, content)
-
-
+@profiled("generate_unified_index")
 def main():
     """主函数"""
     parser = argparse.ArgumentParser(description="生成统一 PaperTools 网页")
@@ -2897,12 +3998,22 @@ def main():
         default="",
         help="要求指定日期必须生成完整、可发布的数据，否则返回非零退出码",
     )
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="忽略增量构建清单，重新生成所有日期的数据文件",
+    )
     args = parser.parse_args()
     webpages_dir = Path(WEBPAGES_DIR)
     output_path = webpages_dir / "index.html"
     output_snapshot = snapshot_file(output_path)
     data_dir = webpages_dir / "data"
-    data_snapshot = snapshot_directory(data_dir)
+    had_data_dir = data_dir.exists()
+    # 上次成功发布后遗留的旧一代不能用于本次回滚
+    discard_previous_data_generation(webpages_dir)
+    manifest_path = build_manifest_path()
+    if args.full_rebuild:
+        remove_build_manifest(str(manifest_path))
 
     try:
         replace_dates = {args.require_date} if args.require_date else set()
@@ -2914,19 +4025,26 @@ def main():
         # 写入输出文件到webpages目录
         if not save_text(str(output_path), html_content):
             raise IOError(f"写入统一HTML页面失败: {output_path}")
+        publish_precompressed(output_path)
 
         validate_required_date(args.require_date)
         validate_generated_webpages_for_publication()
 
+        discard_previous_data_generation(webpages_dir)
+        prune_static_assets(webpages_dir, html_content)
         print(f"成功生成统一HTML页面: {output_path}")
 
     except Exception as e:
+        # 回滚后的数据与清单不再一致，下次运行全量构建
+        remove_build_manifest(str(manifest_path))
         try:
-            restore_directory_snapshot(data_dir, data_snapshot)
+            if not rollback_data_generation(data_dir) and not had_data_dir:
+                shutil.rmtree(data_dir, ignore_errors=True)
         except Exception as restore_error:
             print(f"恢复旧网页数据时出错: {restore_error}")
         try:
             restore_file_snapshot(output_path, output_snapshot)
+            publish_precompressed(output_path)
         except Exception as restore_error:
             print(f"恢复旧HTML页面时出错: {restore_error}")
         print(f"生成HTML页面时出错: {e}")
@@ -31,6 +31,7 @@ try:
     from src.utils.cache_manager import CacheManager  # noqa: E402
     from src.utils.config import (  # noqa: E402
         API_KEY,
+        ARXIV_PAPER_DIR,
         BASE_URL,
         DOMAIN_PAPER_DIR,
         ENABLE_CACHE,
@@ -52,9 +53,17 @@ except ImportError as exc:
 
 from src.document_extraction import ExtractionManager  # noqa: E402
 from src.utils.exceptions import ValidationError  # noqa: E402
-from src.utils.io import save_json  # noqa: E402
+from src.utils.io import (  # noqa: E402
+    load_stage_input,
+    remember_stage_output,
+    save_json,
+)
 from src.utils.openai_client import create_openai_client  # noqa: E402
+from src.utils.profiling import profiled  # noqa: E402
 from src.utils.retry import retry_with_backoff  # noqa: E402
+from src.utils.source_index import open_source_index  # noqa: E402
+from src.utils.stage_manifest import write_stage_manifest  # noqa: E402
+from src.utils.stage_runner import exit_leaving_stuck_threads  # noqa: E402
 from src.utils.validation import validate_non_negative_int, validate_positive_int  # noqa: E402
 
 
@@ -966,6 +975,29 @@ def build_source_paper_index(papers: List[dict]) -> Dict[str, dict]:
     return source_by_id
 
 
+def supplement_source_paper_index(
+    source_by_id: Dict[str, dict],
+    papers: List[dict],
+    source_dir: str = ARXIV_PAPER_DIR,
+) -> int:
+    """Look up resumed papers missing from the input file in the persistent crawl index."""
+    missing_ids = {
+        (paper.get("arxiv_id") or "").strip()
+        for paper in papers
+        if isinstance(paper, dict)
+    }
+    missing_ids = {aid for aid in missing_ids if aid and aid not in source_by_id}
+    if not missing_ids:
+        return 0
+    source_index = open_source_index(source_dir)
+    if source_index is None:
+        return 0
+    with source_index:
+        found = source_index.lookup(missing_ids)
+    source_by_id.update(found)
+    return len(found)
+
+
 def repair_paper_metadata_from_source(
     paper: dict, source_paper: Optional[dict]
 ) -> Tuple[dict, bool]:
@@ -1615,6 +1647,7 @@ def is_current_excluded_schema(paper: dict) -> bool:
     return paper.get("prestige_result") is False
 
 
+@profiled("paper_filter")
 def main() -> int:
     """主函数"""
     parser = argparse.ArgumentParser(description="增强版论文筛选工具")
@@ -1720,8 +1753,7 @@ def main() -> int:
     print("=" * 50)
 
     try:
-        with open(args.input_file, "r", encoding="utf-8") as f:
-            papers = json.load(f)
+        papers = load_stage_input(args.input_file)
         print(f"📚 成功加载 {len(papers)} 篇论文")
     except Exception as e:
         print(f"❌ 读取文件时出错: {e}")
@@ -1767,6 +1799,7 @@ def main() -> int:
         try:
             with open(output_filepath, "r", encoding="utf-8") as f:
                 loaded_filtered = json.load(f)
+            supplement_source_paper_index(source_papers_by_id, loaded_filtered)
             for paper in loaded_filtered:
                 paper, repaired = repair_paper_metadata_from_source(
                     paper,
@@ -2387,6 +2420,8 @@ def main() -> int:
             output_filepath, all_filtered_papers, indent=4, ensure_ascii=False
         ):
             raise IOError(output_filepath)
+        write_stage_manifest(output_filepath, all_filtered_papers)
+        remember_stage_output(output_filepath, all_filtered_papers)
         print(f"\n💾 筛选结果已保存到: {output_filepath}")
         print(
             f"📊 总计: {len(all_filtered_papers)} 篇筛选通过的论文 (本次新增: {len(filtered_papers)} 篇)"
@@ -2471,18 +2506,14 @@ def main() -> int:
     if blocking_filter_failure:
         print(f"❌ {status_payload['failure_reason']}")
         if timed_out_count:
-            sys.stdout.flush()
-            sys.stderr.flush()
-            os._exit(1)
+            return exit_leaving_stuck_threads(1)
         return 1
 
     if status_exit_code != 0:
         return status_exit_code
     print("🎉 筛选完成！")
     if timed_out_count:
-        sys.stdout.flush()
-        sys.stderr.flush()
-        os._exit(0)
+        return exit_leaving_stuck_threads(0)
     return 0
 
 
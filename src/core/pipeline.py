@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """
 完整的学术论文处理流水线
-Complete academic paper processing pipeline: crawl -> filter -> summarize -> generate webpages -> serve
+Complete academic paper processing pipeline: crawl -> filter -> cluster -> extract -> summarize -> generate webpages -> serve
 """
 
+import glob
 import os
 import sys
 import json
@@ -39,7 +40,11 @@ try:
         SUMMARY_PRISM_RPM,
         SUMMARY_PRISM_REASONING_EFFORT,
         SUMMARY_MAX_WORKERS,
+        REVIEWGROUNDER_ENABLED,
+        REVIEWGROUNDER_API_KEY,
+        REVIEWGROUNDER_BASE_URL,
         FILTER_MAX_WORKERS,
+        EXTRACT_MAX_WORKERS,
         TEMPERATURE,
         ARXIV_PAPER_DIR,
         DOMAIN_PAPER_DIR,
@@ -55,8 +60,18 @@ except ImportError:
 
 from src.utils.notify import notify_failures, notify_pipeline_complete
 from src.utils.exceptions import ValidationError
-from src.utils.io import save_json
+from src.utils.io import load_stage_input, save_json
 from src.utils.publish_quality import validate_publishable_papers
+from src.utils.profiling import (
+    DEFAULT_PROFILE_DIR,
+    PROFILE_DATE_ENV,
+    PROFILE_ENV,
+    profile_dir,
+    profiling_enabled,
+)
+from src.utils.stage_manifest import count_records, read_stage_manifest
+from src.utils.stage_metrics import StageMetrics, append_metrics_record
+from src.utils.stage_runner import RUNNER_MODES, InProcessStageRunner
 from src.utils.validation import (
     validate_date_inputs,
     validate_non_negative_int,
@@ -76,33 +91,24 @@ SECRET_CLI_OPTIONS = {
 
 
 def count_paper_records(json_path: Optional[str]) -> Optional[int]:
-    """Count papers in either list-shaped pipeline files or generated page data."""
+    """Count papers in either list-shaped pipeline files or generated page data.
+
+    Stage outputs are counted from their sidecar manifest; only files without
+    a current manifest are parsed.
+    """
     if not json_path or not os.path.exists(json_path):
         return None
 
+    manifest = read_stage_manifest(json_path)
+    if manifest is not None and isinstance(manifest.get("count"), int):
+        return manifest["count"]
+
     try:
         with open(json_path, "r", encoding="utf-8") as f:
             data = json.load(f)
     except Exception:
         return None
-
-    if isinstance(data, list):
-        return len(data)
-
-    if isinstance(data, dict):
-        papers = data.get("papers")
-        if isinstance(papers, list):
-            return len(papers)
-
-        clusters = data.get("clusters")
-        if isinstance(clusters, list):
-            return sum(
-                len(cluster.get("papers", []))
-                for cluster in clusters
-                if isinstance(cluster, dict)
-            )
-
-    return None
+    return count_records(data)
 
 
 def directory_has_json_files(directory: str) -> bool:
@@ -115,18 +121,20 @@ def directory_has_json_files(directory: str) -> bool:
 class ProgressTracker:
     """进度跟踪器"""
 
-    def __init__(self, total_steps: int = 6):
+    def __init__(self, total_steps: int = 7):
         self.total_steps = total_steps
         self.current_step = 0
         self.step_names = [
             "爬取arXiv论文",
             "筛选相关论文",
             "论文聚类",
+            "预提取论文全文",
             "生成论文总结",
             "生成统一页面",
             "启动本地服务器",
         ]
         self.start_time = time.time()
+        self.metrics = StageMetrics()
 
     def log_with_timestamp(self, message: str, level: str = "INFO"):
         """带时间戳的日志输出"""
@@ -143,15 +151,18 @@ class ProgressTracker:
             f"🔄 步骤{self.current_step}: {step_name} {step_progress}"
         )
         print("-" * 50)
+        self.metrics.start(self.current_step, step_name)
 
     def complete_step(self, step_name: str, success: bool = True):
         """完成一个步骤"""
+        self.metrics.finish("ok" if success else "failed")
         status = "✅ 完成" if success else "❌ 失败"
         self.log_with_timestamp(f"{status}: {step_name}")
         print()
 
     def skip_step(self, step_name: str):
         """跳过一个步骤"""
+        self.metrics.finish("unfinished")
         self.current_step += 1
         self.log_with_timestamp(f"⏭️ 跳过步骤{self.current_step}: {step_name}")
         print()
@@ -197,16 +208,82 @@ def find_secret_cli_args(cmd: List[str]) -> List[str]:
     return sorted(set(found))
 
 
+# 阶段导入 src.utils.config 后对这些变量解析出的值；覆盖值与之相同时子进程本来
+# 就会得到同样的配置，不必写入环境，进程内运行器也因此仍能接管该阶段
+STAGE_CONFIG_ENV = {
+    "OPENAI_API_KEY": API_KEY,
+    "OPENAI_BASE_URL": BASE_URL,
+    "CLUSTER_OPENAI_API_KEY": CLUSTER_API_KEY,
+    "CLUSTER_OPENAI_BASE_URL": CLUSTER_BASE_URL,
+    "SUMMARY_OPENAI_API_KEY": SUMMARY_API_KEY,
+    "SUMMARY_OPENAI_BASE_URL": SUMMARY_BASE_URL,
+    "SUMMARY_SJTU_OPENAI_API_KEY": SUMMARY_SJTU_API_KEY,
+    "SUMMARY_SJTU_OPENAI_BASE_URL": SUMMARY_SJTU_BASE_URL,
+    "SUMMARY_PRISM_OPENAI_API_KEY": SUMMARY_PRISM_API_KEY,
+    "SUMMARY_PRISM_OPENAI_BASE_URL": SUMMARY_PRISM_BASE_URL,
+    "REVIEWGROUNDER_API_KEY": REVIEWGROUNDER_API_KEY,
+    "REVIEWGROUNDER_BASE_URL": REVIEWGROUNDER_BASE_URL,
+}
+
+
 def build_subprocess_env(overrides: Dict[str, object]) -> Dict[str, str]:
-    """Build a child environment with secret/config overrides outside argv."""
+    """Build a child environment with secret/config overrides outside argv.
+
+    Overrides equal to what the stage's config resolves anyway are left out,
+    so a run with default settings keeps the parent environment unchanged.
+    """
     env = os.environ.copy()
     for key, value in overrides.items():
         if value is None:
             continue
+        if key in STAGE_CONFIG_ENV and str(value) == STAGE_CONFIG_ENV[key]:
+            continue
         env[key] = str(value)
     return env
 
 
+def filter_stage_env(args: argparse.Namespace) -> Dict[str, str]:
+    """Child environment of the filter stage."""
+    return build_subprocess_env(
+        {
+            "OPENAI_API_KEY": args.api_key,
+            "OPENAI_BASE_URL": args.base_url,
+        }
+    )
+
+
+def cluster_stage_env() -> Dict[str, str]:
+    """Child environment of the cluster stage."""
+    return build_subprocess_env(
+        {
+            "CLUSTER_OPENAI_API_KEY": CLUSTER_API_KEY,
+            "CLUSTER_OPENAI_BASE_URL": CLUSTER_BASE_URL,
+        }
+    )
+
+
+def summary_stage_env(args: argparse.Namespace) -> Dict[str, str]:
+    """Child environment of the summary stage."""
+    overrides = {
+        "SUMMARY_OPENAI_API_KEY": args.summary_api_key,
+        "SUMMARY_OPENAI_BASE_URL": args.summary_base_url,
+        "SUMMARY_SJTU_OPENAI_API_KEY": args.summary_sjtu_api_key,
+        "SUMMARY_SJTU_OPENAI_BASE_URL": args.summary_sjtu_base_url,
+        "SUMMARY_PRISM_OPENAI_API_KEY": args.summary_prism_api_key,
+        "SUMMARY_PRISM_OPENAI_BASE_URL": args.summary_prism_base_url,
+    }
+    if REVIEWGROUNDER_ENABLED:
+        # 流水线中审稿模型默认走 Prism；与 Prism 值相同的覆盖会被省略，
+        # 所以显式传入，避免子进程回退到 OPENAI_*
+        overrides["REVIEWGROUNDER_API_KEY"] = (
+            os.getenv("REVIEWGROUNDER_API_KEY") or args.summary_prism_api_key or None
+        )
+        overrides["REVIEWGROUNDER_BASE_URL"] = (
+            os.getenv("REVIEWGROUNDER_BASE_URL") or args.summary_prism_base_url or None
+        )
+    return build_subprocess_env(overrides)
+
+
 def pipeline_stage_timeout_seconds() -> Optional[float]:
     """Return the subprocess timeout for pipeline stages; 0 disables it."""
     value = os.getenv("PAPERTOOLS_PIPELINE_STAGE_TIMEOUT_SECONDS", "21600")
@@ -225,6 +302,63 @@ def pipeline_stage_timeout_seconds() -> Optional[float]:
     return timeout
 
 
+def pipeline_stage_runner() -> str:
+    """Return how stage scripts run: ``subprocess`` (default) or ``inprocess``."""
+    value = (os.getenv("PAPERTOOLS_PIPELINE_RUNNER") or "subprocess").strip().lower()
+    if value not in RUNNER_MODES:
+        print(f"⚠️ PAPERTOOLS_PIPELINE_RUNNER={value!r} 无效，使用 subprocess")
+        return "subprocess"
+    return value
+
+
+# 进程内运行器在整个流水线进程中共享，阶段之间保留已导入模块、HTTP 连接池与交接数据
+STAGE_RUNNER = InProcessStageRunner()
+
+
+def runs_in_process(cmd: List[str], env: Optional[Dict[str, str]]) -> bool:
+    """Whether a stage command goes to the in-process runner instead of a child."""
+    return pipeline_stage_runner() == "inprocess" and STAGE_RUNNER.can_run(cmd, env)
+
+
+# logs/metrics.jsonl 只保留最近这么多次运行
+PIPELINE_METRICS_MAX_RECORDS = 1000
+
+
+def pipeline_metrics_file() -> Optional[str]:
+    """Return the rolling per-run metrics history; ``off`` disables it."""
+    value = os.getenv("PAPERTOOLS_PIPELINE_METRICS_FILE", "")
+    if value.strip().lower() in ("0", "false", "no", "off"):
+        return None
+    return value or os.path.join("logs", "metrics.jsonl")
+
+
+def pipeline_metrics_record(pipeline_status: Dict[str, Any]) -> Dict[str, Any]:
+    """One ``metrics.jsonl`` line: the run's identity, outcome and metrics."""
+    record = {
+        key: pipeline_status.get(key)
+        for key in (
+            "date",
+            "start_date",
+            "end_date",
+            "status",
+            "exit_code",
+            "created_at",
+            "finished_at",
+            "crawled",
+            "filtered",
+        )
+        if pipeline_status.get(key) is not None
+    }
+    record["metrics"] = pipeline_status.get("metrics") or {}
+    return record
+
+
+def extract_overlap_enabled() -> bool:
+    """Return whether the extract stage runs concurrently with the summary stage."""
+    value = os.getenv("PAPERTOOLS_EXTRACT_OVERLAP", "1")
+    return value.strip().lower() not in ("0", "false", "no", "off")
+
+
 def run_command(
     cmd: List[str],
     description: str,
@@ -270,7 +404,12 @@ def run_command(
         run_kwargs = {"text": True, "check": True, "timeout": timeout}
         if env is not None:
             run_kwargs["env"] = env
-        subprocess.run(cmd, **run_kwargs)
+        if runs_in_process(cmd, env):
+            returncode = STAGE_RUNNER.run(cmd, timeout)
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, cmd)
+        else:
+            subprocess.run(cmd, **run_kwargs)
         duration = time.time() - start_time
 
         if progress_tracker:
@@ -357,13 +496,16 @@ def run_command_rc(
         run_kwargs = {"text": True, "timeout": timeout}
         if env is not None:
             run_kwargs["env"] = env
-        completed = subprocess.run(cmd, **run_kwargs)
+        if runs_in_process(cmd, env):
+            returncode = STAGE_RUNNER.run(cmd, timeout)
+        else:
+            returncode = subprocess.run(cmd, **run_kwargs).returncode
         duration = time.time() - start_time
         if progress_tracker:
             progress_tracker.log_with_timestamp(
-                f"↩️ 结束: {description} (耗时: {duration:.1f}秒, 返回码: {completed.returncode})"
+                f"↩️ 结束: {description} (耗时: {duration:.1f}秒, 返回码: {returncode})"
             )
-        return completed.returncode
+        return returncode
     except subprocess.TimeoutExpired:
         duration = time.time() - start_time
         if progress_tracker:
@@ -382,6 +524,76 @@ def run_command_rc(
         return 1
 
 
+def start_background_command(
+    cmd: List[str],
+    description: str,
+    progress_tracker: ProgressTracker = None,
+    env: Optional[Dict[str, str]] = None,
+) -> Optional[subprocess.Popen]:
+    """Start a stage child without waiting, e.g. extraction overlapping summary."""
+    secret_args = find_secret_cli_args(cmd)
+    if secret_args:
+        message = (
+            "❌ 拒绝运行包含密钥命令行参数的子进程: "
+            + ", ".join(secret_args)
+            + "；请通过环境变量传递"
+        )
+        if progress_tracker:
+            progress_tracker.log_with_timestamp(message)
+        else:
+            print(message)
+        return None
+
+    if progress_tracker:
+        progress_tracker.log_with_timestamp(f"🔄 后台开始: {description}")
+        progress_tracker.log_with_timestamp(f"   命令: {redact_command(cmd)}")
+    else:
+        print(f"🔄 后台运行 {description}...")
+        print(f"   命令: {redact_command(cmd)}")
+
+    try:
+        popen_kwargs = {"text": True}
+        if env is not None:
+            popen_kwargs["env"] = env
+        return subprocess.Popen(cmd, **popen_kwargs)
+    except Exception as e:
+        if progress_tracker:
+            progress_tracker.log_with_timestamp(f"❌ 异常: {description} - {e}")
+        else:
+            print(f"❌ {description} 出错: {e}")
+        return None
+
+
+def wait_background_command(
+    process: subprocess.Popen,
+    description: str,
+    progress_tracker: ProgressTracker = None,
+    timeout: Optional[float] = 60.0,
+) -> int:
+    """Wait for a background stage child; terminate it if it outlives the timeout."""
+    try:
+        returncode = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        message = f"⚠️ 终止后台任务: {description} (等待超过 {timeout:.0f} 秒)"
+        if progress_tracker:
+            progress_tracker.log_with_timestamp(message)
+        else:
+            print(message)
+        return 124
+
+    if progress_tracker:
+        progress_tracker.log_with_timestamp(
+            f"↩️ 后台结束: {description} (返回码: {returncode})"
+        )
+    return returncode
+
+
 def run_interactive_command(
     cmd: List[str],
     description: str,
@@ -480,16 +692,45 @@ def finalize_pipeline_status(
 
 
 def read_json_file(filepath: Optional[str]) -> Optional[Any]:
-    """Read JSON when present; return None on failure."""
+    """Read JSON when present; return None on failure.
+
+    Stage outputs handed off by the in-process runner are read from memory
+    and left in place for the next stage; callers must not modify them.
+    """
     if not filepath or not os.path.exists(filepath):
         return None
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_stage_input(filepath, consume=False)
     except Exception:
         return None
 
 
+# 超过这个时间未更新的预提取进度文件属于已崩溃或已结束的旧运行，可以清理
+EXTRACT_PROGRESS_MAX_AGE_SECONDS = 24 * 3600
+
+
+def remove_extract_progress_files(
+    progress_file: Optional[str], logs_dir: str = "logs"
+) -> None:
+    """Delete this run's extraction progress file and stale leftovers.
+
+    Progress files of other runs are only removed once they are old enough
+    that no concurrent lane can still be reading them.
+    """
+    now = time.time()
+    for path in glob.glob(os.path.join(logs_dir, "extract_progress_*.json")):
+        try:
+            if now - os.path.getmtime(path) > EXTRACT_PROGRESS_MAX_AGE_SECONDS:
+                os.remove(path)
+        except OSError:
+            pass
+    if progress_file:
+        try:
+            os.remove(progress_file)
+        except OSError:
+            pass
+
+
 def validate_summary_file(filepath: Optional[str]) -> List[str]:
     """Return publication-blocking issues for a summary output file."""
     if not filepath or not os.path.exists(filepath):
@@ -686,13 +927,30 @@ def main() -> int:
         "--skip-unified", action="store_true", help="跳过统一页面生成步骤"
     )
     parser.add_argument("--skip-cluster", action="store_true", help="跳过聚类步骤")
+    parser.add_argument(
+        "--skip-extract", action="store_true", help="跳过全文预提取步骤"
+    )
     parser.add_argument("--skip-serve", action="store_true", help="跳过启动服务器步骤")
     parser.add_argument(
         "--start-from",
-        choices=["crawl", "filter", "cluster", "summary", "unified", "serve"],
+        choices=[
+            "crawl",
+            "filter",
+            "cluster",
+            "extract",
+            "summary",
+            "unified",
+            "serve",
+        ],
         default=None,
         help="从指定阶段开始执行，自动跳过之前的阶段",
     )
+    parser.add_argument(
+        "--stop-after",
+        choices=["crawl", "filter", "cluster", "extract", "summary", "unified"],
+        default=None,
+        help="执行完指定阶段后停止（状态为 ok 并记录 stopped_after），用于分段运行",
+    )
 
     # 参数配置
     parser.add_argument(
@@ -732,6 +990,17 @@ def main() -> int:
         help="结束日期 (格式: YYYY-MM-DD)，与--start-date一起使用指定日期范围",
     )
     parser.add_argument("--status-file", default=None, help="写入结构化流水线状态 JSON")
+    parser.add_argument(
+        "--runner",
+        choices=RUNNER_MODES,
+        default=None,
+        help="阶段运行方式：subprocess（默认，每阶段独立子进程）或 inprocess（同一进程内运行）",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"用 cProfile 剖析每个阶段，结果写入 {DEFAULT_PROFILE_DIR}/<日期>/",
+    )
 
     # 输入输出目录
     parser.add_argument("--crawl-input-file", help="爬取步骤的输入文件（如果跳过爬取）")
@@ -740,6 +1009,10 @@ def main() -> int:
     )
 
     args = parser.parse_args()
+    if args.runner:
+        os.environ["PAPERTOOLS_PIPELINE_RUNNER"] = args.runner
+    if args.profile:
+        os.environ[PROFILE_ENV] = "1"
     pipeline_status: Dict[str, Any] = {
         "status": "running",
         "date": args.date,
@@ -751,13 +1024,28 @@ def main() -> int:
     def finish_pipeline(
         exit_code: int, status: str = "ok", reason: Optional[str] = None
     ) -> int:
-        return finalize_pipeline_status(
+        STAGE_RUNNER.close()
+        pipeline_status["metrics"] = progress.metrics.report()
+        exit_code = finalize_pipeline_status(
             args.status_file,
             pipeline_status,
             exit_code,
             status,
             reason,
         )
+        metrics_file = pipeline_metrics_file()
+        if metrics_file:
+            append_metrics_record(
+                metrics_file,
+                pipeline_metrics_record(pipeline_status),
+                PIPELINE_METRICS_MAX_RECORDS,
+            )
+        return exit_code
+
+    def stop_pipeline_after(stage: str) -> int:
+        pipeline_status["stopped_after"] = stage
+        progress.log_with_timestamp(f"⏹️ 已按 --stop-after 在 {stage} 阶段后停止")
+        return finish_pipeline(0, "ok")
 
     try:
         validate_positive_int(args.max_papers_per_category, "--max-papers-per-category")
@@ -775,7 +1063,15 @@ def main() -> int:
         return finish_pipeline(2, "failed", f"参数校验失败: {exc}")
 
     # 根据 --start-from 自动设置跳过标志
-    stage_order = ["crawl", "filter", "cluster", "summary", "unified", "serve"]
+    stage_order = [
+        "crawl",
+        "filter",
+        "cluster",
+        "extract",
+        "summary",
+        "unified",
+        "serve",
+    ]
     if args.start_from:
         try:
             start_idx = stage_order.index(args.start_from)
@@ -786,11 +1082,22 @@ def main() -> int:
             if start_idx > 2:
                 args.skip_cluster = True
             if start_idx > 3:
-                args.skip_summary = True
+                args.skip_extract = True
             if start_idx > 4:
+                args.skip_summary = True
+            if start_idx > 5:
                 args.skip_unified = True
         except ValueError:
             pass
+    if (
+        args.start_from
+        and args.stop_after
+        and stage_order.index(args.stop_after) < stage_order.index(args.start_from)
+    ):
+        progress = ProgressTracker()
+        reason = f"--stop-after {args.stop_after} 早于 --start-from {args.start_from}"
+        progress.log_with_timestamp(f"❌ 参数校验失败: {reason}")
+        return finish_pipeline(2, "failed", f"参数校验失败: {reason}")
 
     # 初始化进度跟踪器
     progress = ProgressTracker()
@@ -802,12 +1109,21 @@ def main() -> int:
     progress.log_with_timestamp(f"📊 每类最大论文数: {args.max_papers_per_category}")
     progress.log_with_timestamp(f"🔢 总处理数量: {args.max_papers_total}")
     progress.log_with_timestamp(f"🧵 最大线程数: {args.max_workers}")
+    progress.log_with_timestamp(f"⚙️ 阶段运行方式: {pipeline_stage_runner()}")
 
     # 处理日期参数
     use_date_range = args.start_date and args.end_date
     date_lookup_key = (
         f"{args.start_date}_to_{args.end_date}" if use_date_range else args.date
     )
+    if profiling_enabled():
+        # 各阶段子进程据此把剖析文件写到同一日期目录
+        os.environ[PROFILE_DATE_ENV] = date_lookup_key or datetime.now().strftime(
+            "%Y-%m-%d"
+        )
+        progress.log_with_timestamp(
+            f"🔬 性能剖析已开启: {os.path.join(profile_dir(), os.environ[PROFILE_DATE_ENV])}"
+        )
 
     if use_date_range:
         progress.log_with_timestamp(
@@ -884,17 +1200,23 @@ def main() -> int:
                 return finish_pipeline(1, "failed", "未找到可用的爬取文件")
     progress.log_with_timestamp(f"📄 使用爬取文件: {crawl_output_file}")
     pipeline_status["crawl_output_file"] = crawl_output_file
-    crawl_papers_for_status = read_json_file(crawl_output_file)
-    if isinstance(crawl_papers_for_status, list):
-        pipeline_status["crawled"] = len(crawl_papers_for_status)
-        if len(crawl_papers_for_status) == 0:
+    crawled_count = count_paper_records(crawl_output_file)
+    if crawled_count is not None:
+        pipeline_status["crawled"] = crawled_count
+        if not args.skip_crawl:
+            progress.metrics.set_papers(crawled_count)
+        if crawled_count == 0:
             reason = "爬取结果为空，跳过发布空日期"
             progress.log_with_timestamp(f"⏭️ {reason}")
             return finish_pipeline(0, "skipped_no_source_papers", reason)
 
+    if args.stop_after == "crawl":
+        return stop_pipeline_after("crawl")
+
     # ============ 步骤2: 筛选论文 ============
     if not args.skip_filter:
         progress.start_step("筛选相关论文")
+        progress.metrics.set_papers(pipeline_status.get("crawled"))
         os.makedirs("logs", exist_ok=True)
         filter_status_file = os.path.join(
             "logs",
@@ -918,12 +1240,7 @@ def main() -> int:
             "--status-file",
             filter_status_file,
         ]
-        filter_env = build_subprocess_env(
-            {
-                "OPENAI_API_KEY": args.api_key,
-                "OPENAI_BASE_URL": args.base_url,
-            }
-        )
+        filter_env = filter_stage_env(args)
         progress.log_with_timestamp(f"🔍 筛选使用模型: {FILTER_MODEL}")
         progress.log_with_timestamp(
             f"🧵 筛选并发: {min(args.max_workers, FILTER_MAX_WORKERS)}"
@@ -970,17 +1287,16 @@ def main() -> int:
                 return finish_pipeline(1, "failed", "未找到可用的筛选文件")
     progress.log_with_timestamp(f"📄 使用筛选文件: {filter_output_file}")
 
-    # 检查筛选结果
-    try:
-        with open(filter_output_file, "r", encoding="utf-8") as f:
-            filtered_papers = json.load(f)
-        progress.log_with_timestamp(f"📊 筛选后论文数量: {len(filtered_papers)}")
-    except Exception as e:
-        progress.log_with_timestamp(f"❌ 读取筛选文件失败: {e}")
-        return finish_pipeline(1, "failed", f"读取筛选文件失败: {e}")
+    # 检查筛选结果；有阶段清单时只读清单，不解析整个文件
+    filtered_count = count_paper_records(filter_output_file)
+    if filtered_count is None:
+        reason = f"读取筛选文件失败: {filter_output_file}"
+        progress.log_with_timestamp(f"❌ {reason}")
+        return finish_pipeline(1, "failed", reason)
+    progress.log_with_timestamp(f"📊 筛选后论文数量: {filtered_count}")
 
     pipeline_status["filter_output_file"] = filter_output_file
-    pipeline_status["filtered"] = len(filtered_papers)
+    pipeline_status["filtered"] = filtered_count
     if isinstance(pipeline_status.get("filter_status"), dict):
         filter_status = pipeline_status["filter_status"]
         if filter_status.get("fatal_zero_result"):
@@ -988,7 +1304,7 @@ def main() -> int:
             progress.log_with_timestamp(f"❌ {reason}")
             return finish_pipeline(1, "failed", str(reason))
         if (
-            len(filtered_papers) == 0
+            filtered_count == 0
             and int(filter_status.get("error_count") or 0) > 0
             and int(filter_status.get("prefiltered_count") or 0) > 0
         ):
@@ -996,16 +1312,20 @@ def main() -> int:
             progress.log_with_timestamp(f"❌ {reason}")
             return finish_pipeline(1, "failed", reason)
 
-    if len(filtered_papers) == 0:
+    if filtered_count == 0:
         reason = "筛选后没有可发布论文，跳过发布空日期"
         progress.log_with_timestamp(f"⏭️ {reason}")
         return finish_pipeline(0, "skipped_no_selected_papers", reason)
 
+    if args.stop_after == "filter":
+        return stop_pipeline_after("filter")
+
     # ============ 步骤3: 论文聚类 ============
     cluster_output_file = filter_output_file  # default fallback
 
     if not args.skip_cluster:
         progress.start_step("论文聚类")
+        progress.metrics.set_papers(filtered_count)
         cmd = [
             sys.executable,
             "src/core/cluster_papers.py",
@@ -1018,12 +1338,7 @@ def main() -> int:
             "--temperature",
             str(args.temperature),
         ]
-        cluster_env = build_subprocess_env(
-            {
-                "CLUSTER_OPENAI_API_KEY": CLUSTER_API_KEY,
-                "CLUSTER_OPENAI_BASE_URL": CLUSTER_BASE_URL,
-            }
-        )
+        cluster_env = cluster_stage_env()
         progress.log_with_timestamp(f"🗂️ 聚类使用模型: {CLUSTER_MODEL}")
         if run_command(cmd, "论文聚类", progress, env=cluster_env):
             # Find the cluster output file
@@ -1068,11 +1383,89 @@ def main() -> int:
 
     progress.log_with_timestamp(f"📄 使用聚类文件: {cluster_output_file}")
 
-    # ============ 步骤4: 生成论文总结 ============
+    if args.stop_after == "cluster":
+        return stop_pipeline_after("cluster")
+
+    # ============ 步骤4: 预提取论文全文 ============
+    # 全文提取是 CPU 密集型工作，用独立进程池预热文档缓存；与总结阶段并行时，
+    # 总结 worker 通过进度文件逐篇消费，LLM 槽位不再等待 PDF 转换。
+    extract_process = None
+    extract_progress_file = None
+    if not args.skip_extract:
+        progress.start_step("预提取论文全文")
+        progress.metrics.set_papers(filtered_count)
+        os.makedirs("logs", exist_ok=True)
+        extract_progress_file = os.path.join(
+            "logs",
+            f"extract_progress_{date_lookup_key or datetime.now().strftime('%Y-%m-%d')}_{int(time.time())}.json",
+        )
+        cmd = [
+            sys.executable,
+            "src/core/extract_documents.py",
+            "--input-file",
+            cluster_output_file,
+            "--max-workers",
+            str(EXTRACT_MAX_WORKERS),
+            "--progress-file",
+            extract_progress_file,
+        ]
+        progress.log_with_timestamp(f"🧵 预提取进程数: {EXTRACT_MAX_WORKERS}")
+        if (
+            not args.skip_summary
+            and args.stop_after != "extract"
+            and extract_overlap_enabled()
+        ):
+            extract_process = start_background_command(cmd, "预提取论文全文", progress)
+            if extract_process is None:
+                extract_progress_file = None
+                progress.log_with_timestamp("⚠️ 预提取未启动，总结阶段将自行提取全文")
+            else:
+                progress.log_with_timestamp("🔀 预提取与总结阶段并行执行")
+                # 后台预提取的耗时计入总结阶段等待它的子步骤
+                progress.metrics.finish("background")
+        else:
+            if run_command(cmd, "预提取论文全文", progress):
+                progress.complete_step("预提取论文全文", True)
+            else:
+                # 预提取只是缓存预热；总结阶段仍会按发布质量要求重试并硬失败。
+                progress.log_with_timestamp("⚠️ 部分论文预提取失败，总结阶段将重试提取")
+                progress.complete_step("预提取论文全文", False)
+            remove_extract_progress_files(extract_progress_file)
+            extract_progress_file = None
+    else:
+        progress.skip_step("预提取论文全文")
+
+    def finish_background_extraction() -> None:
+        if extract_process is None:
+            return
+        with progress.metrics.measure("等待后台预提取"):
+            returncode = wait_background_command(
+                extract_process, "预提取论文全文", progress
+            )
+        extract_progress = read_json_file(extract_progress_file)
+        if isinstance(extract_progress, dict):
+            pipeline_status["extract_status"] = {
+                "status": extract_progress.get("status"),
+                "total": extract_progress.get("total"),
+                "cached": extract_progress.get("cached"),
+                "extracted": extract_progress.get("extracted"),
+                "failed": len(extract_progress.get("failed") or {}),
+            }
+        remove_extract_progress_files(extract_progress_file)
+        if returncode != 0:
+            progress.log_with_timestamp(
+                "⚠️ 后台预提取未完全成功，缺失全文已由总结阶段自行处理"
+            )
+
+    if args.stop_after == "extract":
+        return stop_pipeline_after("extract")
+
+    # ============ 步骤5: 生成论文总结 ============
     summary_output_file = cluster_output_file  # 默认使用聚类后的文件
 
     if not args.skip_summary:
         progress.start_step("生成论文总结")
+        progress.metrics.set_papers(filtered_count)
 
         cmd = [
             sys.executable,
@@ -1097,18 +1490,12 @@ def main() -> int:
             "--time-budget-seconds",
             str(int(os.getenv("PAPERTOOLS_SUMMARY_TIME_BUDGET_SECONDS", "0") or "0")),
         ]
-        summary_env = build_subprocess_env(
-            {
-                "SUMMARY_OPENAI_API_KEY": args.summary_api_key,
-                "SUMMARY_OPENAI_BASE_URL": args.summary_base_url,
-                "SUMMARY_SJTU_OPENAI_API_KEY": args.summary_sjtu_api_key,
-                "SUMMARY_SJTU_OPENAI_BASE_URL": args.summary_sjtu_base_url,
-                "SUMMARY_PRISM_OPENAI_API_KEY": args.summary_prism_api_key,
-                "SUMMARY_PRISM_OPENAI_BASE_URL": args.summary_prism_base_url,
-            }
-        )
+        if extract_process is not None and extract_progress_file:
+            cmd.extend(["--extraction-progress-file", extract_progress_file])
+        summary_env = summary_stage_env(args)
 
         summary_rc = run_command_rc(cmd, "生成论文总结", progress, env=summary_env)
+        finish_background_extraction()
         if summary_rc == 3:
             # 总结阶段墙钟预算用尽：已保存部分进度（缓存里保留已完成字段），
             # 本日不发布，交由调度器下次运行从缓存续跑。不算硬失败。
@@ -1133,7 +1520,8 @@ def main() -> int:
                 progress.complete_step("生成论文总结", False)
                 return finish_pipeline(1, "failed", reason)
 
-            summary_errors = validate_summary_file(summary_output_file)
+            with progress.metrics.measure("总结质量检查"):
+                summary_errors = validate_summary_file(summary_output_file)
             if summary_errors:
                 reason = f"总结文件未通过发布质量检查: {'; '.join(summary_errors[:5])}"
                 progress.log_with_timestamp(f"❌ {reason}")
@@ -1178,7 +1566,10 @@ def main() -> int:
             progress.log_with_timestamp(f"❌ {reason}")
             return finish_pipeline(1, "failed", reason)
 
-    # ============ 步骤5: 生成统一页面 ============
+    if args.stop_after == "summary":
+        return stop_pipeline_after("summary")
+
+    # ============ 步骤6: 生成统一页面 ============
     unified_generation_ok = True
     if not args.skip_unified:
         progress.start_step("生成统一页面")
@@ -1211,9 +1602,11 @@ def main() -> int:
                         progress.log_with_timestamp(
                             f"✅ 统一页面已生成: {unified_page_path}"
                         )
-                        if not validate_webpages_for_publication(
-                            WEBPAGES_DIR, progress
-                        ):
+                        with progress.metrics.measure("发布校验"):
+                            publishable = validate_webpages_for_publication(
+                                WEBPAGES_DIR, progress
+                            )
+                        if not publishable:
                             progress.complete_step("生成统一页面", False)
                             reason = "生成的网页数据未通过发布校验"
                             progress.log_with_timestamp(f"❌ {reason}")
@@ -1234,7 +1627,10 @@ def main() -> int:
     else:
         progress.skip_step("生成统一页面")
 
-    # ============ 步骤6: 启动本地服务器 ============
+    if args.stop_after == "unified":
+        return stop_pipeline_after("unified")
+
+    # ============ 步骤7: 启动本地服务器 ============
     if not args.skip_serve:
         if args.skip_unified and not validate_webpages_for_publication(
             WEBPAGES_DIR, progress
@@ -1279,21 +1675,17 @@ def main() -> int:
     progress.show_summary()
     print("📊 处理总结:")
 
-    if crawl_output_file and os.path.exists(crawl_output_file):
-        try:
-            with open(crawl_output_file, "r", encoding="utf-8") as f:
-                crawl_papers = json.load(f)
-            progress.log_with_timestamp(f"  📥 爬取论文: {len(crawl_papers)} 篇")
-        except Exception:
-            progress.log_with_timestamp(f"  📥 爬取文件: {crawl_output_file}")
+    crawled_count = count_paper_records(crawl_output_file)
+    if crawled_count is not None:
+        progress.log_with_timestamp(f"  📥 爬取论文: {crawled_count} 篇")
+    elif crawl_output_file and os.path.exists(crawl_output_file):
+        progress.log_with_timestamp(f"  📥 爬取文件: {crawl_output_file}")
 
-    if filter_output_file and os.path.exists(filter_output_file):
-        try:
-            with open(filter_output_file, "r", encoding="utf-8") as f:
-                filter_papers = json.load(f)
-            progress.log_with_timestamp(f"  🔍 筛选论文: {len(filter_papers)} 篇")
-        except Exception:
-            progress.log_with_timestamp(f"  🔍 筛选文件: {filter_output_file}")
+    filtered_count = count_paper_records(filter_output_file)
+    if filtered_count is not None:
+        progress.log_with_timestamp(f"  🔍 筛选论文: {filtered_count} 篇")
+    elif filter_output_file and os.path.exists(filter_output_file):
+        progress.log_with_timestamp(f"  🔍 筛选文件: {filter_output_file}")
 
     summary_count = None
     if summary_output_file and summary_output_file.endswith("_with_summary2.json"):
@@ -1336,8 +1728,6 @@ def main() -> int:
             stats["date"] = args.date
         elif use_date_range:
             stats["date_range"] = f"{args.start_date} to {args.end_date}"
-        crawled_count = count_paper_records(crawl_output_file)
-        filtered_count = count_paper_records(filter_output_file)
         clustered_count = count_paper_records(cluster_output_file)
         if crawled_count is not None:
             stats["crawled"] = crawled_count
@@ -1359,4 +1749,10 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    exit_code = main()
+    if STAGE_RUNNER.abandoned or STAGE_RUNNER.lingering:
+        # 超时阶段（或阶段内超时的工作线程）仍在运行，解释器退出时不能等待它们
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+    sys.exit(exit_code)
@@ -1,6 +1,7 @@
 """PaperTools adapter for the external ReviewGrounder pipeline."""
 
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import json
 import os
 import re
@@ -12,7 +13,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from src.utils.cache_manager import CacheManager
 from src.utils.openai_client import create_openai_client
 from src.utils.config import (
     REVIEWGROUNDER_API_KEY,
@@ -27,6 +30,7 @@ from src.utils.config import (
     REVIEWGROUNDER_REFINER_REVIEW_FORMAT,
     REVIEWGROUNDER_REVIEW_FORMAT,
     REVIEWGROUNDER_RPM,
+    REVIEWGROUNDER_SEARCH_CACHE_TTL_HOURS,
     REVIEWGROUNDER_TIMEOUT_SECONDS,
     REVIEWGROUNDER_MAX_LLM_CALLS,
     REVIEWGROUNDER_JSON_TOOL_RETRIES,
@@ -35,25 +39,125 @@ from src.utils.config import (
 
 
 REVIEWGROUNDER_CACHE_VERSION = "reviewgrounder_v5"
+OPENALEX_ID_PREFIX = "https://openalex.org/"
 _RATE_WINDOW_SECONDS = 60.0
 _REVIEWGROUNDER_RATE_LOCK = threading.Lock()
 _REVIEWGROUNDER_CALL_TIMESTAMPS: deque[float] = deque()
+# 各篇论文的审稿共用同一个 OpenAlex 连接池和兜底检索线程池
+_SEARCH_POOL_SIZE = 8
+_SEARCH_SESSION: Optional[requests.Session] = None
+_SEARCH_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_SEARCH_POOL_LOCK = threading.Lock()
+# 主检索超过这个时间仍未返回，才对冲发出 OpenAlex 请求
+_HEDGE_DELAY_SECONDS = 1.5
+# 预取关键词检索时每个查询取回的结果数（search_by_query 的默认值）
+_PREFETCH_LIMIT = 50
 
 
 class ReviewGrounderDependencyError(RuntimeError):
     """Raised when the external ReviewGrounder checkout is unavailable."""
 
 
+def _search_session() -> requests.Session:
+    """The process-wide pooled session for related-work search requests."""
+    global _SEARCH_SESSION
+    with _SEARCH_POOL_LOCK:
+        if _SEARCH_SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=_SEARCH_POOL_SIZE, pool_maxsize=_SEARCH_POOL_SIZE
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SEARCH_SESSION = session
+        return _SEARCH_SESSION
+
+
+def _search_executor() -> ThreadPoolExecutor:
+    global _SEARCH_EXECUTOR
+    with _SEARCH_POOL_LOCK:
+        if _SEARCH_EXECUTOR is None:
+            _SEARCH_EXECUTOR = ThreadPoolExecutor(
+                max_workers=_SEARCH_POOL_SIZE, thread_name_prefix="openalex-search"
+            )
+        return _SEARCH_EXECUTOR
+
+
+class _HedgedSearch:
+    """Run ``fn`` on the search pool only if the caller is still waiting after a delay."""
+
+    def __init__(self, fn: Any, delay: Optional[float] = None) -> None:
+        self._fn = fn
+        self._lock = threading.Lock()
+        self._future: Optional[Future] = None
+        self._cancelled = False
+        self._timer = threading.Timer(
+            _HEDGE_DELAY_SECONDS if delay is None else delay, self._start
+        )
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _start(self) -> None:
+        with self._lock:
+            if not self._cancelled:
+                self._future = _search_executor().submit(self._fn)
+
+    def cancel(self) -> None:
+        """The primary answered: drop the hedge if it has not started yet."""
+        self._timer.cancel()
+        with self._lock:
+            self._cancelled = True
+            if self._future is not None:
+                self._future.cancel()
+
+    def result(self) -> Any:
+        """The primary failed: use the in-flight hedge, or run it now."""
+        self._timer.cancel()
+        with self._lock:
+            self._cancelled = True
+            future = self._future
+        # 尚未开始执行（包括线程池排队中）的请求直接在当前线程跑，避免占满线程池时互相等待
+        if future is None or future.cancel():
+            return self._fn()
+        return future.result()
+
+
+def _search_concurrently(
+    search: Any, queries: List[str], limit: int, **kwargs: Any
+) -> List[List[Dict[str, Any]]]:
+    """Run ``search(query)`` for every query on the shared search pool.
+
+    A query that fails yields an empty list so one bad keyword does not sink
+    the whole batch.
+    """
+
+    def run(query: str) -> List[Dict[str, Any]]:
+        try:
+            return search(query, limit=limit, **kwargs) or []
+        except Exception:
+            return []
+
+    return list(_search_executor().map(run, queries))
+
+
 class OpenAlexSearchAPI:
     """No-key online paper search fallback using OpenAlex."""
 
     base_url = "https://api.openalex.org/works"
 
     def __init__(
-        self, paper_search_base_cls: Any = object, timeout: float = 20.0
+        self,
+        paper_search_base_cls: Any = object,
+        timeout: float = 20.0,
+        session: Optional[requests.Session] = None,
+        cache: Optional[CacheManager] = None,
+        cache_ttl_hours: float = REVIEWGROUNDER_SEARCH_CACHE_TTL_HOURS,
     ) -> None:
         self.timeout = timeout
         self._paper_search_base_cls = paper_search_base_cls
+        self.session = session or _search_session()
+        self.cache = cache if cache is not None else CacheManager()
+        self.cache_ttl_seconds = cache_ttl_hours * 3600
 
     def search_by_query(
         self, query: str, limit: int = 50, **kwargs: Any
@@ -80,6 +184,12 @@ class OpenAlexSearchAPI:
             self._normalize_work(work) for work in results if work.get("display_name")
         ]
 
+    def search_many(
+        self, queries: List[str], limit: int = 50, **kwargs: Any
+    ) -> List[List[Dict[str, Any]]]:
+        """Search several queries concurrently; results follow ``queries`` order."""
+        return _search_concurrently(self.search_by_query, queries, limit, **kwargs)
+
     def search_by_title(self, title: str, **kwargs: Any) -> Optional[Dict[str, Any]]:
         matches = self.search_by_query(title, limit=1, **kwargs)
         return matches[0] if matches else None
@@ -88,9 +198,7 @@ class OpenAlexSearchAPI:
         if not paper_id:
             return None
         try:
-            response = requests.get(paper_id, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(paper_id, {})
             if isinstance(data, dict) and data.get("display_name"):
                 return self._normalize_work(data)
         except Exception:
@@ -98,9 +206,19 @@ class OpenAlexSearchAPI:
         return None
 
     def _get(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        response = requests.get(self.base_url, params=params, timeout=self.timeout)
+        return self._get_json(self.base_url, params)
+
+    def _get_json(self, url: str, params: Dict[str, Any]) -> Any:
+        """GET ``url`` through the shared session, answering from the cache first."""
+        cached = self.cache.get_search_cache(url, params, self.cache_ttl_seconds)
+        if cached is not None:
+            return cached
+        response = self.session.get(url, params=params or None, timeout=self.timeout)
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+        if self.cache_ttl_seconds > 0:
+            self.cache.set_search_cache(url, params, data)
+        return data
 
     def _normalize_work(self, work: Dict[str, Any]) -> Dict[str, Any]:
         primary_location = work.get("primary_location") or {}
@@ -133,7 +251,14 @@ class OpenAlexSearchAPI:
 
 
 class FallbackPaperSearchAPI:
-    """Try ReviewGrounder's configured search API first, then the online fallback."""
+    """Try ReviewGrounder's configured search API first, then the online fallback.
+
+    Query searches hedge: if the primary has not answered within
+    ``_HEDGE_DELAY_SECONDS`` the OpenAlex request is started alongside it, so a
+    slow, failing or rate-limited primary does not add the fallback's full
+    latency on top.  A primary that answers in time cancels the hedge, so
+    OpenAlex only sees traffic the primary could not serve promptly.
+    """
 
     def __init__(self, primary_api: Any, fallback_api: OpenAlexSearchAPI) -> None:
         self.primary_api = primary_api
@@ -143,12 +268,22 @@ class FallbackPaperSearchAPI:
     def search_by_query(
         self, query: str, limit: int = 50, **kwargs: Any
     ) -> List[Dict[str, Any]]:
+        hedge = _HedgedSearch(
+            lambda: self.fallback_api.search_by_query(query, limit=limit, **kwargs)
+        )
         papers = self._try_primary("search_by_query", query, limit=limit, **kwargs)
         if papers:
+            hedge.cancel()
             self.last_source = self._primary_source_name()
             return _tag_search_source(papers, self.last_source)
         self.last_source = "openalex"
-        return self.fallback_api.search_by_query(query, limit=limit, **kwargs)
+        return hedge.result()
+
+    def search_many(
+        self, queries: List[str], limit: int = 50, **kwargs: Any
+    ) -> List[List[Dict[str, Any]]]:
+        """Search several queries concurrently; results follow ``queries`` order."""
+        return _search_concurrently(self.search_by_query, queries, limit, **kwargs)
 
     def search_by_title(self, title: str, **kwargs: Any) -> Optional[Dict[str, Any]]:
         paper = self._try_primary("search_by_title", title, **kwargs)
@@ -160,6 +295,10 @@ class FallbackPaperSearchAPI:
         return self.fallback_api.search_by_title(title, **kwargs)
 
     def get_paper(self, paper_id: str, **kwargs: Any) -> Optional[Dict[str, Any]]:
+        if str(paper_id).startswith(OPENALEX_ID_PREFIX):
+            # OpenAlex 检索结果的 ID，主检索 API 无法解析，直接走（带缓存的）OpenAlex
+            self.last_source = "openalex"
+            return self.fallback_api.get_paper(paper_id, **kwargs)
         paper = self._try_primary("get_paper", paper_id, **kwargs)
         if paper:
             self.last_source = self._primary_source_name()
@@ -183,6 +322,52 @@ class FallbackPaperSearchAPI:
         return name
 
 
+class PrefetchedPaperSearchAPI:
+    """Answer query searches from a batch fetched up front with ``search_many``.
+
+    ReviewGrounder searches its related-work keywords one after another; when
+    the keywords are known beforehand (the paper's tags) they are fetched
+    concurrently here and the sequential searches are served from memory.
+    Everything else is delegated to the wrapped search API.
+    """
+
+    def __init__(self, search_api: Any) -> None:
+        self.search_api = search_api
+        self._prefetched: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+
+    def prefetch(self, queries: List[str], limit: int = _PREFETCH_LIMIT) -> None:
+        queries = list(dict.fromkeys(query for query in queries if query))
+        if not queries:
+            return
+        search_many = getattr(self.search_api, "search_many", None)
+        if search_many is not None:
+            batches = search_many(queries, limit)
+        else:
+            batches = _search_concurrently(
+                self.search_api.search_by_query, queries, limit
+            )
+        for query, papers in zip(queries, batches):
+            # 空结果不缓存，留给正式检索时重试
+            if papers:
+                self._prefetched[query] = (limit, papers)
+
+    def search_by_query(
+        self, query: str, limit: int = 50, **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        prefetched = self._prefetched.get(query)
+        if prefetched is not None and not kwargs and limit <= prefetched[0]:
+            return prefetched[1][:limit]
+        return self.search_api.search_by_query(query, limit=limit, **kwargs)
+
+    def search_many(
+        self, queries: List[str], limit: int = 50, **kwargs: Any
+    ) -> List[List[Dict[str, Any]]]:
+        return _search_concurrently(self.search_by_query, queries, limit, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.search_api, name)
+
+
 def build_reviewgrounder_cache_payload(
     paper_title: str,
     arxiv_id: str,
@@ -225,6 +410,9 @@ def generate_reviewgrounder_review(
     rg = _import_reviewgrounder()
     llm_service = _build_openai_compatible_llm(rg["LLMService"], rg["ChatMessage"])
     search_api, search_source = _build_search_api(rg)
+    if keywords:
+        search_api = PrefetchedPaperSearchAPI(search_api)
+        search_api.prefetch(keywords)
 
     paper_retriever = rg["PaperRetriever"](
         search_api=search_api,
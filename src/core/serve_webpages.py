@@ -4,6 +4,7 @@
 Local web server for serving generated academic paper webpages
 """
 
+import atexit
 import os
 import sys
 import http.server
@@ -14,21 +15,40 @@ import json
 import urllib.parse
 import shutil
 import re
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
+from functools import partial
 
 # 导入配置
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from src.utils.config import WEBPAGES_DIR, ENABLE_TIME_BASED_STRUCTURE, DATE_FORMAT  # noqa: E402
+from src.utils.config import (  # noqa: E402
+    WEBPAGES_DIR,
+    ENABLE_TIME_BASED_STRUCTURE,
+    DATE_FORMAT,
+    SERVE_PRODUCTION,
+)
+from src.utils.build_manifest import file_digest  # noqa: E402
 from src.utils.cache_manager import get_available_dates  # noqa: E402
-from src.utils.io import save_json  # noqa: E402
+from src.utils.user_state_store import UserStateStore  # noqa: E402
+from src.utils.precompress import ENCODING_SUFFIXES, select_precompressed  # noqa: E402
 
 
 LOOPBACK_HOSTS = {"localhost", "127.0.0.1", "::1"}
 DEFAULT_BIND_HOST = "127.0.0.1"
 MAX_API_BODY_BYTES = 64 * 1024
+# 批量状态接口单次最多涉及的日期数与修改条数
+MAX_STATE_BATCH_DATES = 366
+MAX_STATE_BATCH_OPS = 1000
+STATE_ACTIONS = ("read", "unread", "delete")
+# 小于该大小的文件直接拷贝，sendfile 的系统调用开销不划算
+SENDFILE_MIN_BYTES = 64 * 1024
+# 生产模式下空闲长连接保持的秒数，超时后释放处理线程
+KEEP_ALIVE_TIMEOUT = 30
+# 带内容哈希的静态资源内容永不变化，可长期缓存
+IMMUTABLE_PATH_PREFIX = "/assets/"
 
 
 def _default_user_state() -> dict:
@@ -46,6 +66,55 @@ def _is_valid_date_segment(date_str: str) -> bool:
     return parsed.strftime(DATE_FORMAT) == date_str
 
 
+def _requested_state_dates(params: dict) -> tuple[list[str] | None, str | None]:
+    """Dates of a bulk state query: ``dates=a,b,...`` or ``from=...&to=...``."""
+    if "dates" in params:
+        dates: list[str] = []
+        for value in params["dates"]:
+            for date_str in value.split(","):
+                if not _is_valid_date_segment(date_str):
+                    return None, f"invalid date: {date_str!r}"
+                if date_str not in dates:
+                    dates.append(date_str)
+    elif "from" in params or "to" in params:
+        start = params.get("from", [""])[0]
+        end = params.get("to", [""])[0]
+        if not (_is_valid_date_segment(start) and _is_valid_date_segment(end)):
+            return None, "invalid or missing date range"
+        first = datetime.strptime(start, DATE_FORMAT)
+        days = (datetime.strptime(end, DATE_FORMAT) - first).days
+        if days < 0:
+            return None, "invalid or missing date range"
+        if days >= MAX_STATE_BATCH_DATES:
+            return None, f"at most {MAX_STATE_BATCH_DATES} dates per request"
+        dates = [
+            (first + timedelta(days=offset)).strftime(DATE_FORMAT)
+            for offset in range(days + 1)
+        ]
+    else:
+        return None, "invalid or missing date"
+    if len(dates) > MAX_STATE_BATCH_DATES:
+        return None, f"at most {MAX_STATE_BATCH_DATES} dates per request"
+    return dates, None
+
+
+def _apply_state_ops(state: dict, ops: list[tuple[str, str]]) -> None:
+    """Apply ``(action, arxiv_id)`` changes to one date's state in order."""
+    read_ids = set(state["read_ids"])
+    deleted_ids = set(state["deleted_ids"])
+    for action, arxiv_id in ops:
+        if action == "read":
+            read_ids.add(arxiv_id)
+        elif action == "unread":
+            read_ids.discard(arxiv_id)
+        elif action == "delete":
+            deleted_ids.add(arxiv_id)
+            # 删除的论文同时从已读里移除
+            read_ids.discard(arxiv_id)
+    state["read_ids"] = sorted(read_ids)
+    state["deleted_ids"] = sorted(deleted_ids)
+
+
 def _normalize_user_state(state: dict) -> dict:
     normalized = _default_user_state()
     if not isinstance(state, dict):
@@ -58,6 +127,11 @@ def _normalize_user_state(state: dict) -> dict:
     return normalized
 
 
+# 进程内共享的用户状态：读写都走内存，后台合并写盘，退出时写完剩余修改
+USER_STATE_STORE = UserStateStore(_normalize_user_state)
+atexit.register(USER_STATE_STORE.close)
+
+
 def _is_within_directory(base: str, target: str) -> bool:
     try:
         base_path = os.path.abspath(base)
@@ -69,6 +143,59 @@ def _is_within_directory(base: str, target: str) -> bool:
         return False
 
 
+class FileDigestCache:
+    """SHA-256 of served files, recomputed only when the file changes.
+
+    Published files are replaced by rename, so a new inode, size or mtime
+    marks new content.  Date files are written as their canonical bytes, so
+    their digest is the published payload digest.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, tuple[tuple[int, int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    def digest(self, path: str) -> str | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        try:
+            value = file_digest(path)
+        except OSError:
+            return None
+        with self._lock:
+            self._entries[path] = (key, value)
+        return value
+
+
+FILE_DIGESTS = FileDigestCache()
+
+
+def strong_etag(digest: str, encoding: str = "") -> str:
+    """Strong ETag of a file's bytes, distinct per content coding."""
+    suffix = f"-{encoding}" if encoding else ""
+    return f'"{digest[:32]}{suffix}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
 def _is_allowed_cors_origin(origin: str) -> bool:
     """Only allow browser API access from loopback origins."""
     if not origin:
@@ -85,6 +212,8 @@ def _is_allowed_cors_origin(origin: str) -> bool:
 class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """自定义HTTP请求处理器，添加CORS与简单API"""
 
+    use_sendfile = False
+
     def end_headers(self):
         origin = self.headers.get("Origin", "") if hasattr(self.headers, "get") else ""
         if _is_allowed_cors_origin(origin):
@@ -92,6 +221,14 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
             self.send_header("Access-Control-Allow-Headers", "Content-Type")
             self.send_header("Vary", "Origin")
+        if getattr(self, "_vary_accept_encoding", False):
+            self.send_header("Vary", "Accept-Encoding")
+            self._vary_accept_encoding = False
+        etag = getattr(self, "_response_etag", None)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", self._cache_control())
+            self._response_etag = None
         self.send_header("X-Content-Type-Options", "nosniff")
         self.send_header("X-Frame-Options", "SAMEORIGIN")
         self.send_header("Referrer-Policy", "no-referrer")
@@ -100,15 +237,91 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         )
         super().end_headers()
 
+    def _cache_control(self) -> str:
+        if urllib.parse.urlsplit(self.path).path.startswith(IMMUTABLE_PATH_PREFIX):
+            return "public, max-age=31536000, immutable"
+        # 其余文件每次都向服务器确认，内容未变时只返回 304
+        return "no-cache"
+
+    def _send_not_modified(self, etag: str) -> None:
+        self.send_response(304)
+        self._response_etag = etag
+        self.end_headers()
+
+    def send_head(self):
+        """Serve files with strong ETags, answering ``If-None-Match`` with 304.
+
+        A prebuilt ``.br``/``.gz`` sibling is served when the client accepts
+        it; each coding has its own ETag.
+        """
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            if not urllib.parse.urlsplit(self.path).path.endswith("/"):
+                return super().send_head()
+            path = os.path.join(path, "index.html")
+        if not os.path.isfile(path):
+            return super().send_head()
+
+        has_variants = any(
+            os.path.exists(path + suffix) for _, suffix in ENCODING_SUFFIXES
+        )
+        selected = select_precompressed(path, self.headers.get("Accept-Encoding", ""))
+        digest = FILE_DIGESTS.digest(path)
+        encoding = selected[1] if selected is not None else ""
+        etag = strong_etag(digest, encoding) if digest else None
+        self._vary_accept_encoding = has_variants or selected is not None
+        if etag and etag_matches(self.headers.get("If-None-Match", ""), etag):
+            self._send_not_modified(etag)
+            return None
+        self._response_etag = etag
+        if selected is None:
+            return super().send_head()
+
+        variant = selected[0]
+        try:
+            f = open(variant, "rb")
+        except OSError:
+            return super().send_head()
+        try:
+            fs = os.fstat(f.fileno())
+            self.send_response(200)
+            self.send_header("Content-Type", self.guess_type(path))
+            self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(fs.st_size))
+            self.send_header(
+                "Last-Modified", self.date_time_string(int(os.stat(path).st_mtime))
+            )
+            self.end_headers()
+            return f
+        except Exception:
+            f.close()
+            raise
+
+    def copyfile(self, source, outputfile):
+        """Send large files with ``sendfile`` (zero-copy) in production mode."""
+        if self.use_sendfile and outputfile is self.wfile:
+            try:
+                size = os.fstat(source.fileno()).st_size
+            except (AttributeError, OSError, ValueError):
+                size = 0
+            if size >= SENDFILE_MIN_BYTES:
+                self.wfile.flush()
+                self.connection.sendfile(source)
+                return
+        super().copyfile(source, outputfile)
+
     def log_message(self, format, *args):
         """自定义日志格式"""
         print(f"[{self.log_date_time_string()}] {format % args}")
 
     def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
+        # 长连接下客户端靠 Content-Length 判断响应结束
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+        self.wfile.write(body)
 
     def _read_json_payload(self) -> tuple[dict | None, int | None, str | None]:
         """Read a bounded JSON request body for local state APIs."""
@@ -116,11 +329,14 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         try:
             length = int(raw_length or 0)
         except (TypeError, ValueError):
-            return None, 400, "invalid content length"
+            length = -1
 
+        # 请求体未读取时不能复用连接，否则残留字节会被当成下一个请求
         if length < 0:
+            self.close_connection = True
             return None, 400, "invalid content length"
         if length > MAX_API_BODY_BYTES:
+            self.close_connection = True
             return None, 413, "request body too large"
 
         try:
@@ -141,22 +357,11 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         return os.path.join(".", date_str, ".user_state.json")
 
     def _load_state(self, date_str: str) -> dict:
-        try:
-            state_file = self._state_file_for_date(date_str)
-            if os.path.exists(state_file):
-                with open(state_file, "r", encoding="utf-8") as f:
-                    return _normalize_user_state(json.load(f))
-        except Exception:
-            return _default_user_state()
-        return _default_user_state()
+        return USER_STATE_STORE.get(self._state_file_for_date(date_str))
 
-    def _save_state(self, date_str: str, state: dict) -> bool:
-        try:
-            state_file = self._state_file_for_date(date_str)
-            return save_json(state_file, _normalize_user_state(state), indent=2)
-        except Exception as e:
-            print(f"❌ 保存状态失败({date_str}): {e}")
-            return False
+    def _update_state(self, date_str: str, mutate) -> dict:
+        """Change a date's state in memory; it is written to disk later."""
+        return USER_STATE_STORE.update(self._state_file_for_date(date_str), mutate)
 
     # ---- 预检请求 ----
     def do_OPTIONS(self):
@@ -167,6 +372,10 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     def _handle_get_state(self):
         parsed = urllib.parse.urlparse(self.path)
         params = urllib.parse.parse_qs(parsed.query)
+        if "date" not in params and (
+            "dates" in params or "from" in params or "to" in params
+        ):
+            return self._handle_get_states(params)
         date_str = params.get("date", [""])[0]
         if not _is_valid_date_segment(date_str):
             self._send_json(400, {"error": "invalid or missing date"})
@@ -174,6 +383,51 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         state = self._load_state(date_str)
         self._send_json(200, state)
 
+    # ---- API: 一次获取多个日期的状态 ----
+    def _handle_get_states(self, params: dict):
+        dates, error = _requested_state_dates(params)
+        if error is not None:
+            self._send_json(400, {"error": error})
+            return
+        self._send_json(
+            200, {"states": {date: self._load_state(date) for date in dates}}
+        )
+
+    # ---- API: 批量修改状态 ----
+    def _handle_state_batch(self, payload: dict):
+        ops = payload.get("ops")
+        if not isinstance(ops, list) or not ops or len(ops) > MAX_STATE_BATCH_OPS:
+            self._send_json(
+                400,
+                {"error": f"ops must be a list of 1-{MAX_STATE_BATCH_OPS} operations"},
+            )
+            return
+        # 先校验全部操作，任何一条无效都不做修改
+        ops_by_date: dict[str, list[tuple[str, str]]] = {}
+        for op in ops:
+            if not isinstance(op, dict):
+                op = {}
+            date_str = op.get("date", "")
+            arxiv_id = op.get("arxiv_id")
+            if (
+                not isinstance(date_str, str)
+                or not _is_valid_date_segment(date_str)
+                or not isinstance(arxiv_id, str)
+                or not arxiv_id
+                or op.get("action") not in STATE_ACTIONS
+            ):
+                self._send_json(400, {"error": "invalid state operation"})
+                return
+            ops_by_date.setdefault(date_str, []).append((op["action"], arxiv_id))
+
+        states = {
+            date_str: self._update_state(
+                date_str, partial(_apply_state_ops, ops=date_ops)
+            )
+            for date_str, date_ops in ops_by_date.items()
+        }
+        self._send_json(200, {"ok": True, "states": states})
+
     # ---- API: 删除论文 ----
     def _handle_delete(self, payload: dict):
         date_str = payload.get("date", "")
@@ -184,15 +438,9 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             self._send_json(400, {"error": "invalid date or missing arxiv_id"})
             return
 
-        state = self._load_state(date_str)
-        if arxiv_id not in state["deleted_ids"]:
-            state["deleted_ids"].append(arxiv_id)
-        # 同时从已读里移除它
-        if arxiv_id in state.get("read_ids", []):
-            state["read_ids"].remove(arxiv_id)
-        if not self._save_state(date_str, state):
-            self._send_json(500, {"error": "failed to persist user state"})
-            return
+        self._update_state(
+            date_str, partial(_apply_state_ops, ops=[("delete", arxiv_id)])
+        )
 
         # 删除对应目录（若提供且存在）
         deleted_dir = False
@@ -239,16 +487,10 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             self._send_json(400, {"error": "invalid date or missing arxiv_id"})
             return
 
-        state = self._load_state(date_str)
-        read_ids = set(state.get("read_ids", []))
-        if read:
-            read_ids.add(arxiv_id)
-        else:
-            read_ids.discard(arxiv_id)
-        state["read_ids"] = sorted(read_ids)
-        if not self._save_state(date_str, state):
-            self._send_json(500, {"error": "failed to persist user state"})
-            return
+        action = "read" if read else "unread"
+        self._update_state(
+            date_str, partial(_apply_state_ops, ops=[(action, arxiv_id)])
+        )
 
         self._send_json(200, {"ok": True})
 
@@ -267,11 +509,32 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             return self._handle_delete(payload)
         if self.path == "/api/toggle-read":
             return self._handle_toggle_read(payload)
+        if self.path == "/api/state/batch":
+            return self._handle_state_batch(payload)
 
-        self.send_response(404)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps({"error": "not found"}).encode("utf-8"))
+        self._send_json(404, {"error": "not found"})
+
+
+class ProductionHTTPRequestHandler(CustomHTTPRequestHandler):
+    """HTTP/1.1 keep-alive handler that sends large files with ``sendfile``."""
+
+    protocol_version = "HTTP/1.1"
+    timeout = KEEP_ALIVE_TIMEOUT
+    use_sendfile = True
+
+
+class ProductionHTTPServer(http.server.ThreadingHTTPServer):
+    """One thread per connection, so a slow client cannot stall the others."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def create_server(host: str, port: int, production: bool = False):
+    """Create the development (single-threaded) or production server."""
+    if production:
+        return ProductionHTTPServer((host, port), ProductionHTTPRequestHandler)
+    return socketserver.TCPServer((host, port), CustomHTTPRequestHandler)
 
 
 def find_available_port(start_port: int = 8080, max_attempts: int = 100) -> int:
@@ -358,6 +621,12 @@ def main():
         help=f"服务器绑定地址 (默认: {DEFAULT_BIND_HOST}; 使用 0.0.0.0 前请确认网络可信)",
     )
     parser.add_argument("--no-browser", action="store_true", help="不自动打开浏览器")
+    parser.add_argument(
+        "--production",
+        action="store_true",
+        default=SERVE_PRODUCTION,
+        help="生产模式：多线程、HTTP/1.1 长连接、sendfile 零拷贝 (默认取 SERVE_PRODUCTION)",
+    )
     parser.add_argument(
         "--list-only", action="store_true", help="仅列出目录内容，不启动服务器"
     )
@@ -418,9 +687,11 @@ def main():
             port = args.port
 
         # 创建HTTP服务器
-        httpd = socketserver.TCPServer((args.host, port), CustomHTTPRequestHandler)
+        httpd = create_server(args.host, port, args.production)
 
         print("🚀 正在启动本地服务器...")
+        if args.production:
+            print("⚙️ 生产模式: 多线程 + HTTP/1.1 长连接")
         display_host = "localhost" if args.host in {"127.0.0.1", "::1"} else args.host
         print(f"📍 服务器地址: http://{display_host}:{port}")
         print(f"📂 服务目录: {os.path.abspath('.')}")
@@ -448,9 +719,7 @@ def main():
                 print("💡 正在尝试其他端口...")
                 try:
                     port = find_available_port(port + 1)
-                    httpd = socketserver.TCPServer(
-                        (args.host, port), CustomHTTPRequestHandler
-                    )
+                    httpd = create_server(args.host, port, args.production)
                     print(f"✅ 使用端口 {port}")
                     display_host = (
                         "localhost" if args.host in {"127.0.0.1", "::1"} else args.host
@@ -466,7 +735,8 @@ def main():
     except Exception as e:
         print(f"❌ 未知错误: {e}")
     finally:
-        # 恢复原目录
+        # 退出前写完尚未落盘的用户状态
+        USER_STATE_STORE.close()
         os.chdir(original_dir)
 
 
@@ -0,0 +1,94 @@
+"""Build manifests for incremental generation.
+
+A manifest records the ``(size, mtime_ns, digest)`` of every input a build
+read, so the next build can tell which inputs changed by ``stat`` alone and
+only hashes files whose metadata moved.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+from src.utils.io import save_json
+
+DIGEST_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's bytes, streamed in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(DIGEST_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_stat_matches(path: str, entry: Optional[Dict[str, Any]]) -> bool:
+    """Whether ``path`` still has the size and mtime recorded in ``entry``."""
+    if not entry:
+        return False
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get(
+        "mtime_ns"
+    )
+
+
+def file_fingerprint(
+    path: str, previous: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """Return ``{"size", "mtime_ns", "digest"}`` for a file, or None if missing.
+
+    When size and mtime match ``previous`` its digest is reused without
+    reading the file.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    fingerprint = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if (
+        previous
+        and previous.get("digest")
+        and previous.get("size") == stat.st_size
+        and previous.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        fingerprint["digest"] = previous["digest"]
+        return fingerprint
+    try:
+        fingerprint["digest"] = file_digest(path)
+    except OSError:
+        return None
+    return fingerprint
+
+
+def load_build_manifest(path: str, version: int) -> Dict[str, Any]:
+    """Load a manifest; missing, corrupt or other-version files yield ``{}``."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != version:
+        return {}
+    return manifest
+
+
+def save_build_manifest(path: str, manifest: Dict[str, Any]) -> bool:
+    """Atomically persist a manifest."""
+    return save_json(path, manifest, indent=None, ensure_ascii=False)
+
+
+def remove_build_manifest(path: str) -> None:
+    """Drop a manifest so the next build starts from scratch."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -4,11 +4,13 @@
 Cache management module for academic paper processing
 """
 
+import functools
 import json
 import hashlib
 import os
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, List
 
 # 导入配置
 try:
@@ -20,7 +22,10 @@ except ImportError:
 
 from src.utils.io import save_json
 from src.utils.document_content import get_document_content_issue
+from src.utils.stage_metrics import record_cache
 
+# 增量聚类只在最近写入的这么多个聚类缓存里找候选，避免缓存目录变大后每次未命中都全量读取
+CLUSTER_CACHE_SCAN_LIMIT = 64
 
 FAILED_CACHE_TEXT_MARKERS = (
     "翻译失败",
@@ -83,6 +88,38 @@ def _is_valid_crawl_cache_payload(value: Any) -> bool:
     return isinstance(value, list) and all(isinstance(paper, dict) for paper in value)
 
 
+def _cluster_cache_payload_issue(value: Dict[str, Any]) -> Optional[str]:
+    arxiv_ids = value.get("arxiv_ids")
+    assignments = value.get("assignments")
+    if not isinstance(arxiv_ids, list) or not all(
+        _is_non_empty_string(item) for item in arxiv_ids
+    ):
+        return "聚类缓存 arxiv_ids 必须是非空字符串列表"
+    if not isinstance(assignments, dict):
+        return "聚类缓存 assignments 必须是对象"
+    if any(not _is_non_empty_string(assignments.get(item)) for item in arxiv_ids):
+        return "聚类缓存 assignments 未覆盖全部论文"
+    if not isinstance(value.get("name_mapping", {}), dict):
+        return "聚类缓存 name_mapping 必须是对象"
+    return None
+
+
+def _counts_lookup(kind: str) -> Callable:
+    """Count hits and misses of a ``get_*_cache`` method in the stage metrics."""
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self: "CacheManager", *args: Any, **kwargs: Any) -> Any:
+            result = method(self, *args, **kwargs)
+            if self.enabled:
+                record_cache(kind, result is not None)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 class CacheManager:
     """缓存管理器"""
 
@@ -100,6 +137,8 @@ class CacheManager:
             os.makedirs(os.path.join(self.cache_dir, "summaries"), exist_ok=True)
             os.makedirs(os.path.join(self.cache_dir, "webpages"), exist_ok=True)
             os.makedirs(os.path.join(self.cache_dir, "crawl"), exist_ok=True)
+            os.makedirs(os.path.join(self.cache_dir, "clusters"), exist_ok=True)
+            os.makedirs(os.path.join(self.cache_dir, "search"), exist_ok=True)
 
     def _generate_key(self, data: str) -> str:
         """生成缓存键"""
@@ -163,6 +202,7 @@ class CacheManager:
         except (OSError, ValueError, OverflowError):
             return False
 
+    @_counts_lookup("papers")
     def get_paper_cache(self, paper_url: str) -> Optional[Dict[str, Any]]:
         """获取论文缓存"""
         if not self.enabled:
@@ -210,6 +250,7 @@ class CacheManager:
         except OSError as e:
             print(f"⚠️ 保存论文缓存失败: {e}")
 
+    @_counts_lookup("documents")
     def get_document_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """获取统一文档提取缓存。"""
         if not self.enabled:
@@ -255,6 +296,7 @@ class CacheManager:
         except OSError as e:
             print(f"⚠️ 保存文档缓存失败: {e}")
 
+    @_counts_lookup("summaries")
     def get_summary_cache(self, paper_title: str, paper_content: str) -> Optional[str]:
         """获取总结缓存"""
         if not self.enabled:
@@ -309,6 +351,7 @@ class CacheManager:
         except OSError as e:
             print(f"⚠️ 保存总结缓存失败: {e}")
 
+    @_counts_lookup("webpages")
     def get_webpage_cache(self, paper_title: str, content_hash: str) -> Optional[str]:
         """获取网页缓存"""
         if not self.enabled:
@@ -360,6 +403,7 @@ class CacheManager:
         except OSError as e:
             print(f"⚠️ 保存网页缓存失败: {e}")
 
+    @_counts_lookup("crawl")
     def get_crawl_cache(
         self, category: str, date: str
     ) -> Optional[List[Dict[str, Any]]]:
@@ -434,6 +478,157 @@ class CacheManager:
         except OSError as e:
             print(f"⚠️ 保存爬取缓存失败: {e}")
 
+    def _search_cache_file(self, endpoint: str, params: Dict[str, Any]) -> str:
+        request = json.dumps([endpoint, params], ensure_ascii=False, sort_keys=True)
+        return self._get_cache_file("search", self._generate_key(request))
+
+    @_counts_lookup("search")
+    def get_search_cache(
+        self, endpoint: str, params: Dict[str, Any], max_age_seconds: float
+    ) -> Optional[Any]:
+        """获取外部检索 API 的响应缓存
+
+        Args:
+            endpoint: 请求地址
+            params: 查询参数
+            max_age_seconds: 响应的有效期；检索结果比论文内容变化快，单独计时
+
+        Returns:
+            缓存的响应 JSON，如果没有缓存或已过期则返回 None
+        """
+        if not self.enabled or max_age_seconds <= 0:
+            return None
+
+        cache_file = self._search_cache_file(endpoint, params)
+        try:
+            if time.time() - os.path.getmtime(cache_file) > max_age_seconds:
+                return None
+        except OSError:
+            return None
+
+        cache_data = self._load_cache_file(cache_file, "检索")
+        if not cache_data:
+            return None
+
+        if cache_data.get("endpoint") != endpoint or cache_data.get("params") != params:
+            self._discard_invalid_cache_file(cache_file, "检索缓存请求与缓存内容不匹配")
+            return None
+        return cache_data.get("data")
+
+    def set_search_cache(
+        self, endpoint: str, params: Dict[str, Any], data: Any
+    ) -> None:
+        """设置外部检索 API 的响应缓存"""
+        if not self.enabled:
+            return
+
+        cache_file = self._search_cache_file(endpoint, params)
+        try:
+            cache_data = {
+                "endpoint": endpoint,
+                "params": params,
+                "data": data,
+                "cached_at": datetime.now().isoformat(),
+            }
+            self._write_cache_file(cache_file, cache_data)
+        except OSError as e:
+            print(f"⚠️ 保存检索缓存失败: {e}")
+
+    @_counts_lookup("clusters")
+    def get_cluster_cache(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """获取聚类结果缓存
+
+        Args:
+            fingerprint: 有序 arxiv_id 列表 + 模型 + prompt 版本组成的指纹
+
+        Returns:
+            缓存条目（含 arxiv_ids、assignments、name_mapping），没有则返回 None
+        """
+        if not self.enabled:
+            return None
+
+        cache_file = self._get_cache_file("clusters", self._generate_key(fingerprint))
+        cache_data = self._load_cache_file(cache_file, "聚类")
+        if not cache_data:
+            return None
+
+        if cache_data.get("fingerprint") != fingerprint:
+            self._discard_invalid_cache_file(cache_file, "聚类缓存指纹与请求不匹配")
+            return None
+        issue = _cluster_cache_payload_issue(cache_data)
+        if issue:
+            self._discard_invalid_cache_file(cache_file, issue)
+            return None
+        return cache_data
+
+    def find_cluster_caches(self, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """列出与模型/prompt 版本配置一致的聚类缓存，用于增量聚类
+
+        只读取最近修改的 CLUSTER_CACHE_SCAN_LIMIT 个文件，结果按从新到旧排列。
+        """
+        if not self.enabled:
+            return []
+
+        cache_type_dir = os.path.join(self.cache_dir, "clusters")
+        if not os.path.isdir(cache_type_dir):
+            return []
+
+        candidates = []
+        with os.scandir(cache_type_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    candidates.append((entry.stat().st_mtime, entry.name))
+                except OSError:
+                    continue
+        candidates.sort(reverse=True)
+
+        entries = []
+        for _, name in candidates[:CLUSTER_CACHE_SCAN_LIMIT]:
+            cache_data = self._load_cache_file(
+                os.path.join(cache_type_dir, name), "聚类"
+            )
+            if (
+                cache_data
+                and cache_data.get("config") == config
+                and _cluster_cache_payload_issue(cache_data) is None
+            ):
+                entries.append(cache_data)
+        return entries
+
+    def set_cluster_cache(
+        self,
+        fingerprint: str,
+        config: Dict[str, Any],
+        arxiv_ids: List[str],
+        assignments: Dict[str, str],
+        name_mapping: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """设置聚类结果缓存"""
+        if not self.enabled:
+            return
+
+        cache_data = {
+            "fingerprint": fingerprint,
+            "config": config,
+            "arxiv_ids": arxiv_ids,
+            "assignments": assignments,
+            "name_mapping": name_mapping or {},
+            "paper_count": len(arxiv_ids),
+            "cached_at": datetime.now().isoformat(),
+        }
+        issue = _cluster_cache_payload_issue(cache_data)
+        if issue:
+            print(f"⚠️ 跳过无效聚类缓存: {issue}")
+            return
+
+        cache_file = self._get_cache_file("clusters", self._generate_key(fingerprint))
+        try:
+            self._write_cache_file(cache_file, cache_data)
+        except OSError as e:
+            print(f"⚠️ 保存聚类缓存失败: {e}")
+
     def clean_expired_cache(self) -> None:
         """清理过期缓存"""
         if not self.enabled:
@@ -442,7 +637,15 @@ class CacheManager:
         print("🧹 清理过期缓存...")
         cleaned_count = 0
 
-        for cache_type in ["papers", "documents", "summaries", "webpages", "crawl"]:
+        for cache_type in [
+            "papers",
+            "documents",
+            "summaries",
+            "webpages",
+            "crawl",
+            "clusters",
+            "search",
+        ]:
             cache_type_dir = os.path.join(self.cache_dir, cache_type)
             if not os.path.exists(cache_type_dir):
                 continue
@@ -470,13 +673,23 @@ class CacheManager:
                 "summaries": 0,
                 "webpages": 0,
                 "crawl": 0,
+                "clusters": 0,
+                "search": 0,
                 "total": 0,
             }
 
         stats = {}
         total = 0
 
-        for cache_type in ["papers", "documents", "summaries", "webpages", "crawl"]:
+        for cache_type in [
+            "papers",
+            "documents",
+            "summaries",
+            "webpages",
+            "crawl",
+            "clusters",
+            "search",
+        ]:
             cache_type_dir = os.path.join(self.cache_dir, cache_type)
             if os.path.exists(cache_type_dir):
                 count = len(
@@ -0,0 +1,140 @@
+"""Persistent cross-day cluster taxonomy.
+
+Keeps every known cluster name together with a centroid in the hashed TF-IDF
+space of :mod:`src.utils.text_clustering`.  New papers are assigned to the
+closest known cluster when the cosine similarity is high enough, so only the
+leftovers need an LLM call and cluster tags stay comparable across dates.
+
+Centroids are stored sparsely (top buckets only) to keep the JSON file small.
+Requires NumPy (``papertools[cluster-local]``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.utils.io import save_json
+from src.utils.text_clustering import HASH_DIMENSIONS
+
+TAXONOMY_VERSION = 1
+CENTROID_MAX_TERMS = 512
+
+
+class ClusterTaxonomy:
+    """Cluster names with running-mean centroids, persisted as JSON."""
+
+    def __init__(self, path: str, clusters: Optional[List[Dict[str, Any]]] = None):
+        self.path = path
+        self.clusters: List[Dict[str, Any]] = list(clusters or [])
+
+    @classmethod
+    def load(cls, path: str) -> "ClusterTaxonomy":
+        """Load the taxonomy; a missing or unreadable file starts empty."""
+        if not os.path.exists(path):
+            return cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as exc:
+            print(f"⚠️ 聚类主题库无法读取，重新开始: {path}: {exc}")
+            return cls(path)
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != TAXONOMY_VERSION
+            or data.get("dimensions") != HASH_DIMENSIONS
+        ):
+            print(f"⚠️ 聚类主题库版本不兼容，重新开始: {path}")
+            return cls(path)
+        clusters = [
+            cluster
+            for cluster in data.get("clusters", [])
+            if isinstance(cluster, dict)
+            and isinstance(cluster.get("name"), str)
+            and cluster["name"].strip()
+        ]
+        return cls(path, clusters)
+
+    def save(self) -> bool:
+        """Atomically persist the taxonomy."""
+        payload = {
+            "version": TAXONOMY_VERSION,
+            "dimensions": HASH_DIMENSIONS,
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+            "clusters": self.clusters,
+        }
+        return save_json(self.path, payload, indent=2, ensure_ascii=False)
+
+    def names(self) -> List[str]:
+        return [cluster["name"] for cluster in self.clusters]
+
+    def _find(self, name: str) -> Optional[Dict[str, Any]]:
+        for cluster in self.clusters:
+            if cluster["name"] == name:
+                return cluster
+        return None
+
+    @staticmethod
+    def _dense_centroid(cluster: Dict[str, Any]):
+        import numpy as np
+
+        vector = np.zeros(HASH_DIMENSIONS)
+        for bucket, weight in zip(
+            cluster.get("buckets") or [], cluster.get("weights") or []
+        ):
+            if 0 <= bucket < HASH_DIMENSIONS:
+                vector[bucket] = weight
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def centroid_matrix(self):
+        """Dense ``(n_clusters x HASH_DIMENSIONS)`` matrix of unit centroids."""
+        import numpy as np
+
+        if not self.clusters:
+            return np.zeros((0, HASH_DIMENSIONS))
+        return np.vstack([self._dense_centroid(cluster) for cluster in self.clusters])
+
+    def assign(self, vectors, min_similarity: float) -> List[Optional[str]]:
+        """Return the closest known cluster per row, or None below the threshold."""
+        import numpy as np
+
+        if not self.clusters or len(vectors) == 0:
+            return [None] * len(vectors)
+        similarities = vectors @ self.centroid_matrix().T
+        best = np.argmax(similarities, axis=1)
+        names = self.names()
+        return [
+            names[cluster] if similarities[row, cluster] >= min_similarity else None
+            for row, cluster in enumerate(best.tolist())
+        ]
+
+    def update(self, name: str, member_vectors) -> None:
+        """Fold member vectors into a cluster centroid, creating it if new."""
+        import numpy as np
+
+        count = len(member_vectors)
+        if count == 0:
+            return
+        cluster = self._find(name)
+        total = np.asarray(member_vectors).sum(axis=0)
+        if cluster is None:
+            cluster = {"name": name, "count": 0}
+            self.clusters.append(cluster)
+            centroid = total / count
+        else:
+            previous = cluster.get("count", 0)
+            centroid = (self._dense_centroid(cluster) * previous + total) / (
+                previous + count
+            )
+
+        top = np.argsort(-np.abs(centroid), kind="stable")[:CENTROID_MAX_TERMS]
+        top = np.sort(top[centroid[top] != 0])
+        weights = centroid[top]
+        norm = np.linalg.norm(weights) or 1.0
+        cluster["buckets"] = [int(bucket) for bucket in top]
+        cluster["weights"] = [round(float(w), 6) for w in weights / norm]
+        cluster["count"] = cluster.get("count", 0) + count
+        cluster["updated_at"] = datetime.now().isoformat(timespec="seconds")
@@ -212,6 +212,9 @@ REVIEWGROUNDER_MAX_RELATED_PAPERS = _get_env_int(
 REVIEWGROUNDER_ENABLE_WEB_FALLBACK = _get_env_bool(
     "REVIEWGROUNDER_ENABLE_WEB_FALLBACK", True
 )
+REVIEWGROUNDER_SEARCH_CACHE_TTL_HOURS = _get_env_float(
+    "REVIEWGROUNDER_SEARCH_CACHE_TTL_HOURS", 168.0, minimum=0.0
+)
 REVIEWGROUNDER_REVIEW_FORMAT = _get_env_str(
     "REVIEWGROUNDER_REVIEW_FORMAT", "ai_researcher"
 )
@@ -253,6 +256,23 @@ ARXIV_PAPER_DIR = "arxiv_paper"
 DOMAIN_PAPER_DIR = "domain_paper"
 SUMMARY_DIR = "summary"
 WEBPAGES_DIR = "webpages"
+# 网页资源模式：inline 把样式、脚本与首屏数据全部内联进 index.html；
+# split 只输出小型 HTML 外壳，样式/脚本写成内容哈希命名的静态资源，首屏数据写成单独 JSON。
+WEBPAGE_ASSET_MODE = _get_env_str("WEBPAGE_ASSET_MODE", "inline").strip().lower()
+# 发布时为 index.html 与 data/*.json 预生成 .gz（及安装 brotli 时的 .br）压缩副本，仅在内容变化时重新压缩
+WEBPAGE_PRECOMPRESS = _get_env_bool("WEBPAGE_PRECOMPRESS", True)
+# 额外发布按 ISO 周合并的 data/bundle-YYYY-Www.json，页面一次请求即可取回同一周的多天数据
+WEBPAGE_DATE_BUNDLES = _get_env_bool("WEBPAGE_DATE_BUNDLES", False)
+# serve 生产模式：多线程 + HTTP/1.1 长连接，大文件用 sendfile 零拷贝发送
+SERVE_PRODUCTION = _get_env_bool("SERVE_PRODUCTION", False)
+# 用户状态（已读/删除）先写内存，后台合并写盘：距上次写盘超过该秒数，
+# 或累计未写盘的修改达到该条数时写入；服务器退出前会再写一次
+USER_STATE_FLUSH_INTERVAL = _get_env_float(
+    "USER_STATE_FLUSH_INTERVAL", 2.0, minimum=0.1
+)
+USER_STATE_FLUSH_MAX_PENDING = _get_env_int(
+    "USER_STATE_FLUSH_MAX_PENDING", 50, minimum=1
+)
 
 # 时间划分配置
 DATE_FORMAT = "%Y-%m-%d"  # 日期格式
@@ -263,6 +283,20 @@ CACHE_DIR = "cache"
 ENABLE_CACHE = _get_env_bool("ENABLE_CACHE", True)  # 是否启用缓存机制
 CACHE_EXPIRY_DAYS = _get_env_int("CACHE_EXPIRY_DAYS", 30, minimum=1)  # 缓存过期天数
 
+# 跨日聚类主题库：保存各主题名称与向量质心，新论文先按相似度归入已有主题，
+# 只有剩余论文才交给聚类引擎，保证不同日期的聚类标签可比。
+CLUSTER_TAXONOMY_ENABLED = _get_env_bool("CLUSTER_TAXONOMY_ENABLED", True)
+CLUSTER_TAXONOMY_FILE = _get_env_str(
+    "CLUSTER_TAXONOMY_FILE", os.path.join(CACHE_DIR, "cluster_taxonomy.json")
+)
+CLUSTER_TAXONOMY_MIN_SIMILARITY = _get_env_float(
+    "CLUSTER_TAXONOMY_MIN_SIMILARITY", 0.2, minimum=0.0
+)
+# 聚类结果缓存：同一论文集合重跑时直接复用；新增论文不超过该比例时只为新论文分配主题。
+CLUSTER_CACHE_INCREMENTAL_MAX_RATIO = _get_env_float(
+    "CLUSTER_CACHE_INCREMENTAL_MAX_RATIO", 0.2, minimum=0.0
+)
+
 # 爬取配置
 MAX_PAPERS_PER_CATEGORY = _get_env_int(
     "MAX_PAPERS_PER_CATEGORY", 5000, minimum=1
@@ -278,6 +312,20 @@ MAX_WORKERS = _get_env_int(
 )  # 并发线程数，100 RPM 限额下安全运行
 FILTER_MAX_WORKERS = _get_env_int("FILTER_MAX_WORKERS", min(MAX_WORKERS, 5), minimum=1)
 SUMMARY_MAX_WORKERS = _get_env_int("SUMMARY_MAX_WORKERS", 5, minimum=1)
+# 聚类阶段按批并发调用 LLM；结果按批次偏移量拼装，输出与串行一致。
+CLUSTER_MAX_WORKERS = _get_env_int("CLUSTER_MAX_WORKERS", 4, minimum=1)
+# 聚类引擎：llm（默认）为 LLM 分批划分；local 为本地 TF-IDF k-means 分组、LLM 只负责命名；
+# auto 在安装 NumPy 时使用 local，否则回退 llm。local/auto 需显式开启。
+CLUSTER_ENGINE = _get_env_str("CLUSTER_ENGINE", "llm").strip().lower()
+# 全文预提取阶段是 CPU 密集型（Docling 转换 PDF），使用独立的进程池并发。
+EXTRACT_MAX_WORKERS = _get_env_int(
+    "EXTRACT_MAX_WORKERS", min(os.cpu_count() or 1, 4), minimum=1
+)
+# 预提取与总结并行时，总结 worker 等待单篇全文进入缓存的最长秒数；
+# 超时后回退为总结阶段自行提取。
+SUMMARY_PREFETCH_WAIT_SECONDS = _get_env_int(
+    "SUMMARY_PREFETCH_WAIT_SECONDS", 1800, minimum=0
+)
 
 # 论文筛选Prompt模板
 PAPER_FILTER_PROMPT = """你是一位顶尖的人工智能研究员，正在为一项关于 "LLM智能体及其演化"（LLM-based Agents and their Evolution） 的研究课题筛选前沿论文。请你严格但不要过窄地判断这篇论文是否符合我的研究范围。
@@ -0,0 +1,52 @@
+"""Weekly range bundles of published date files.
+
+With ``WEBPAGE_DATE_BUNDLES`` enabled, ``data/bundle-YYYY-Www.json`` holds
+every published date of one ISO week as ``{"dates": {date: payload}}``, so
+the page can fetch several days with one request.  Bundles are assembled by
+concatenating the already-encoded date files, so no payload is serialized
+again and each embedded payload is identical to its date file.
+
+Only weeks with at least :data:`MIN_BUNDLE_DATES` published dates get a
+bundle; a lone date is always fetched from its own file.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import re
+from typing import Dict, Iterable, List
+
+BUNDLE_RE = re.compile(r"bundle-(\d{4}-W\d{2})\.json")
+MIN_BUNDLE_DATES = 2
+
+
+def bundle_week(date: str) -> str:
+    """ISO week of a ``YYYY-MM-DD`` date, e.g. ``2026-W22``."""
+    year, week, _ = dt.date.fromisoformat(date).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def bundle_filename(week: str) -> str:
+    return f"bundle-{week}.json"
+
+
+def plan_date_bundles(all_dates: Iterable[str]) -> Dict[str, List[str]]:
+    """Map each bundled week to its dates, newest first."""
+    dates_by_week: Dict[str, List[str]] = {}
+    for date in sorted(all_dates, reverse=True):
+        dates_by_week.setdefault(bundle_week(date), []).append(date)
+    return {
+        week: dates
+        for week, dates in dates_by_week.items()
+        if len(dates) >= MIN_BUNDLE_DATES
+    }
+
+
+def encode_date_bundle(contents: Dict[str, bytes]) -> bytes:
+    """Join encoded date payloads into one bundle without re-serializing them."""
+    members = b",".join(
+        json.dumps(date).encode("utf-8") + b":" + contents[date]
+        for date in sorted(contents, reverse=True)
+    )
+    return b'{"dates":{' + members + b"}}"
@@ -7,12 +7,18 @@ import json
 import os
 import shutil
 import tempfile
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.utils.logger import get_logger
 
 logger = get_logger("io")
 
+# 进程内阶段交接：启用后，阶段最终输出的论文列表留在内存里，
+# 下一阶段按文件大小与 mtime 校验后直接取用，不再重新解析 JSON
+_stage_handoff: Optional[Dict[str, Tuple[int, int, Any]]] = None
+_stage_handoff_lock = threading.Lock()
+
 
 def load_json(filepath: str, default: Optional[Any] = None) -> Optional[Any]:
     """
@@ -101,6 +107,60 @@ def save_json(
         return False
 
 
+def enable_stage_handoff() -> None:
+    """Keep stage outputs passed to :func:`remember_stage_output` in memory."""
+    global _stage_handoff
+    with _stage_handoff_lock:
+        if _stage_handoff is None:
+            _stage_handoff = {}
+
+
+def disable_stage_handoff() -> None:
+    """Stop handing off stage outputs and drop the ones still held."""
+    global _stage_handoff
+    with _stage_handoff_lock:
+        _stage_handoff = None
+
+
+def _file_signature(filepath: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def remember_stage_output(filepath: str, data: Any) -> None:
+    """Hand a just-saved stage output to the next stage, if handoff is enabled.
+
+    The caller must not modify ``data`` afterwards.
+    """
+    signature = _file_signature(filepath)
+    with _stage_handoff_lock:
+        if _stage_handoff is None or signature is None:
+            return
+        _stage_handoff[os.path.abspath(filepath)] = (*signature, data)
+
+
+def load_stage_input(filepath: str, consume: bool = True) -> Any:
+    """Load a stage input JSON file, preferring data handed off in memory.
+
+    The handed-off object is only used while the file still has the size and
+    mtime it had when it was saved.  ``consume`` drops it so a later reader
+    gets a fresh copy from disk; pass False for read-only peeks.  Errors
+    propagate like ``json.load``.
+    """
+    key = os.path.abspath(filepath)
+    with _stage_handoff_lock:
+        entry = (_stage_handoff or {}).get(key)
+        if entry is not None and consume:
+            del _stage_handoff[key]
+    if entry is not None and entry[:2] == _file_signature(filepath):
+        return entry[2]
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def save_text(filepath: str, content: str) -> bool:
     """Atomically save plain text content."""
     try:
@@ -136,6 +196,40 @@ def save_text(filepath: str, content: str) -> bool:
         return False
 
 
+def save_bytes(filepath: str, content: bytes) -> bool:
+    """Atomically save already-serialized bytes."""
+    try:
+        dir_path = os.path.dirname(filepath)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        target_dir = dir_path or "."
+        if not _check_disk_space(target_dir):
+            logger.error(f"磁盘空间不足，无法保存文件: {filepath}")
+            return False
+
+        fd, temp_path = tempfile.mkstemp(
+            prefix=f".{os.path.basename(filepath)}.",
+            suffix=".tmp",
+            dir=target_dir,
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, filepath)
+        except Exception:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        return True
+    except OSError as e:
+        logger.error(f"保存文件失败 {filepath}: {e}")
+        return False
+
+
 def load_papers(filepath: str) -> List[Dict[str, Any]]:
     """
     加载论文列表
@@ -14,8 +14,7 @@ warnings.filterwarnings(
     category=Warning,
 )
 
-import requests
-from typing import List, Optional
+from typing import List, Optional, Tuple, Type
 
 logger = logging.getLogger(__name__)
 PROXY_ENV_VARS = (
@@ -26,11 +25,6 @@ PROXY_ENV_VARS = (
     "all_proxy",
     "ALL_PROXY",
 )
-DIRECT_RETRY_EXCEPTIONS = (
-    requests.exceptions.ProxyError,
-    requests.exceptions.ConnectionError,
-    requests.exceptions.ConnectTimeout,
-)
 
 try:
     from src.utils.config import WEBHOOK_URL
@@ -42,7 +36,20 @@ def _has_proxy_env() -> bool:
     return any(os.environ.get(name) for name in PROXY_ENV_VARS)
 
 
+def _direct_retry_exceptions() -> Tuple[Type[Exception], ...]:
+    import requests
+
+    return (
+        requests.exceptions.ProxyError,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.ConnectTimeout,
+    )
+
+
 def _post_notification(url: str, message: str, *, trust_env: bool) -> None:
+    # requests 只在真正发送通知时导入，避免拖慢 pipeline 等模块的启动
+    import requests
+
     session = requests.Session()
     session.trust_env = trust_env
     try:
@@ -62,7 +69,7 @@ def send_notification(message: str, webhook_url: Optional[str] = None) -> bool:
         _post_notification(url, message, trust_env=True)
         logger.info("Webhook notification sent successfully")
         return True
-    except DIRECT_RETRY_EXCEPTIONS as exc:
+    except _direct_retry_exceptions() as exc:
         if _has_proxy_env():
             logger.warning(
                 "Webhook notification failed via proxy/env; retrying direct: %s", exc
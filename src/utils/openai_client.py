@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 import os
-from typing import Any
+import threading
+import time
+from typing import Any, Iterator, Optional
 
 from openai import DefaultHttpxClient, OpenAI
 
+from src.utils.stage_metrics import record_llm_request
+
+# 进程内流水线各阶段共用的 HTTP 连接池；None 表示每个客户端自建
+_shared_http_client: Optional[DefaultHttpxClient] = None
+_shared_http_client_lock = threading.Lock()
+
 
 def _env_bool(name: str, default: bool) -> bool:
     value = os.getenv(name)
@@ -46,6 +54,112 @@ def openai_trust_env() -> bool:
     return _env_bool("PAPERTOOLS_OPENAI_TRUST_ENV", False)
 
 
+def enable_shared_http_client() -> None:
+    """Make clients created from now on share one HTTP connection pool."""
+    global _shared_http_client
+    with _shared_http_client_lock:
+        if _shared_http_client is None:
+            _shared_http_client = DefaultHttpxClient(trust_env=openai_trust_env())
+
+
+def close_shared_http_client() -> None:
+    """Close the shared pool; later clients get their own again."""
+    global _shared_http_client
+    with _shared_http_client_lock:
+        http_client, _shared_http_client = _shared_http_client, None
+    if http_client is not None:
+        http_client.close()
+
+
+def _usage_tokens(usage: Any) -> tuple:
+    if usage is None:
+        return None, None
+    return getattr(usage, "prompt_tokens", None), getattr(
+        usage, "completion_tokens", None
+    )
+
+
+class _MeteredStream:
+    """Streaming response that records its request once fully consumed or closed.
+
+    Latency covers the whole stream; tokens come from the final ``usage``
+    chunk when the provider sends one.
+    """
+
+    def __init__(self, stream: Any, provider: str, started: float):
+        self._stream = stream
+        self._provider = provider
+        self._started = started
+        self._recorded = False
+
+    def _record(self, usage: Any, error: bool) -> None:
+        if not self._recorded:
+            self._recorded = True
+            record_llm_request(
+                self._provider,
+                time.monotonic() - self._started,
+                *_usage_tokens(usage),
+                error=error,
+            )
+
+    def __iter__(self) -> Iterator[Any]:
+        usage = None
+        error = False
+        try:
+            for chunk in self._stream:
+                usage = getattr(chunk, "usage", None) or usage
+                yield chunk
+        except Exception:
+            error = True
+            raise
+        finally:
+            self._record(usage, error)
+
+    def close(self) -> None:
+        self._record(None, False)
+        close = getattr(self._stream, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "_MeteredStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+def meter_chat_completions(client: Any) -> Any:
+    """Record every ``client.chat.completions.create`` call in the stage metrics."""
+    try:
+        completions = client.chat.completions
+        create = completions.create
+        provider = str(getattr(client.base_url, "host", "") or client.base_url)
+    except AttributeError:
+        return client
+
+    def metered_create(*args: Any, **kwargs: Any) -> Any:
+        started = time.monotonic()
+        try:
+            response = create(*args, **kwargs)
+        except Exception:
+            record_llm_request(provider, time.monotonic() - started, error=True)
+            raise
+        if kwargs.get("stream"):
+            return _MeteredStream(response, provider, started)
+        record_llm_request(
+            provider,
+            time.monotonic() - started,
+            *_usage_tokens(getattr(response, "usage", None)),
+        )
+        return response
+
+    completions.create = metered_create
+    return client
+
+
 def create_openai_client(**kwargs: Any) -> OpenAI:
     """Create an OpenAI client with deterministic timeout/retry defaults.
 
@@ -62,5 +176,10 @@ def create_openai_client(**kwargs: Any) -> OpenAI:
     kwargs.setdefault(
         "max_retries", _env_int("PAPERTOOLS_OPENAI_SDK_MAX_RETRIES", 2, minimum=0)
     )
-    kwargs.setdefault("http_client", DefaultHttpxClient(trust_env=openai_trust_env()))
-    return OpenAI(**kwargs)
+    if "http_client" not in kwargs:
+        with _shared_http_client_lock:
+            shared = _shared_http_client
+        kwargs["http_client"] = shared or DefaultHttpxClient(
+            trust_env=openai_trust_env()
+        )
+    return meter_chat_completions(OpenAI(**kwargs))
@@ -0,0 +1,173 @@
+"""Precompressed ``.br`` / ``.gz`` siblings for published files.
+
+Published JSON and HTML are compressed once at build time and stored next to
+the original (``2026-06-01.json.gz``), so a server can answer with
+``Content-Encoding`` instead of compressing on every request.  gzip uses the
+standard library; Brotli is written only when the ``brotli`` package is
+installed (``papertools[compress]``).
+
+A sibling is only trusted while it is at least as new as its original; a file
+edited after the build is served uncompressed until it is compressed again.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import tempfile
+from importlib import util as importlib_util
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+# 按优先级排列：浏览器同时接受时优先 Brotli
+ENCODING_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+PathLike = Union[str, Path]
+
+
+def brotli_available() -> bool:
+    """Return whether the optional ``brotli`` package is importable."""
+    try:
+        return importlib_util.find_spec("brotli") is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def available_encodings() -> List[str]:
+    """Encodings that can be produced in this environment, preferred first."""
+    return [
+        encoding
+        for encoding, _ in ENCODING_SUFFIXES
+        if encoding != "br" or brotli_available()
+    ]
+
+
+def variant_path(path: PathLike, encoding: str) -> Path:
+    suffix = dict(ENCODING_SUFFIXES)[encoding]
+    return Path(f"{path}{suffix}")
+
+
+def compress_bytes(data: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        # mtime=0 让相同内容得到相同字节，便于比对与缓存
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == "br":
+        import brotli
+
+        return brotli.compress(data, quality=11)
+    raise ValueError(f"unsupported encoding: {encoding}")
+
+
+def decompress_bytes(data: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "br":
+        import brotli
+
+        return brotli.decompress(data)
+    raise ValueError(f"unsupported encoding: {encoding}")
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent)
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def remove_precompressed(path: PathLike) -> None:
+    """Delete every compressed sibling of ``path``."""
+    for encoding, _ in ENCODING_SUFFIXES:
+        try:
+            variant_path(path, encoding).unlink()
+        except FileNotFoundError:
+            pass
+
+
+def write_precompressed(path: PathLike, data: Optional[bytes] = None) -> List[str]:
+    """(Re)write the compressed siblings of a freshly written file.
+
+    Siblings for encodings unavailable here are removed, since they would
+    describe the previous content.  Returns the encodings written.
+    """
+    if data is None:
+        data = Path(path).read_bytes()
+    remove_precompressed(path)
+    written = []
+    for encoding in available_encodings():
+        _write_bytes_atomic(
+            variant_path(path, encoding), compress_bytes(data, encoding)
+        )
+        written.append(encoding)
+    return written
+
+
+def ensure_precompressed(path: PathLike) -> List[str]:
+    """Fill in missing or outdated siblings of an unchanged file."""
+    data = None
+    written = []
+    for encoding in available_encodings():
+        if is_fresh_variant(path, variant_path(path, encoding)):
+            continue
+        if data is None:
+            data = Path(path).read_bytes()
+        _write_bytes_atomic(
+            variant_path(path, encoding), compress_bytes(data, encoding)
+        )
+        written.append(encoding)
+    return written
+
+
+def is_fresh_variant(path: PathLike, variant: PathLike) -> bool:
+    """A sibling is usable when it is a regular file no older than ``path``."""
+    try:
+        original = os.stat(path)
+        compressed = os.lstat(variant)
+    except OSError:
+        return False
+    if not os.path.isfile(variant) or os.path.islink(variant):
+        return False
+    return compressed.st_mtime_ns >= original.st_mtime_ns
+
+
+def accepted_encodings(accept_encoding: str) -> List[str]:
+    """Parse an ``Accept-Encoding`` header into encodings with a non-zero q."""
+    accepted = []
+    for part in (accept_encoding or "").split(","):
+        fields = [field.strip() for field in part.split(";")]
+        coding = fields[0].lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in fields[1:]:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.append(coding)
+    return accepted
+
+
+def select_precompressed(
+    path: PathLike, accept_encoding: str
+) -> Optional[Tuple[Path, str]]:
+    """Return ``(variant, encoding)`` to serve for ``path``, or None."""
+    accepted = accepted_encodings(accept_encoding)
+    for encoding, _ in ENCODING_SUFFIXES:
+        if encoding not in accepted and "*" not in accepted:
+            continue
+        variant = variant_path(path, encoding)
+        if is_fresh_variant(path, variant):
+            return variant, encoding
+    return None
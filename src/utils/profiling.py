@@ -0,0 +1,188 @@
+"""Opt-in cProfile profiling of pipeline stages.
+
+With ``PAPERTOOLS_PROFILE=1`` (or ``pipeline.py --profile``) every stage
+``main()`` decorated with :func:`profiled` runs under :mod:`cProfile` and
+writes ``logs/profiles/<date>/<stage>_<time>_<pid>.pstats`` when it returns,
+whether the stage runs as a child process or inside the pipeline process.
+cProfile only sees the thread that enabled it, so threads started while the
+stage runs (the per-paper ``ThreadPoolExecutor`` workers) get a profiler of
+their own and are merged into the same file.
+The pipeline exports the processed date in ``PAPERTOOLS_PROFILE_DATE`` so all
+stages of one run land in the same directory.
+
+:func:`summarize_profiles` merges the files of each stage and returns its hot
+spots; ``papertools profile report`` prints them.  The files are ordinary
+pstats dumps and also open in snakeviz or ``python -m pstats``.
+"""
+
+from __future__ import annotations
+
+import functools
+import glob
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+PROFILE_ENV = "PAPERTOOLS_PROFILE"
+PROFILE_DATE_ENV = "PAPERTOOLS_PROFILE_DATE"
+PROFILE_DIR_ENV = "PAPERTOOLS_PROFILE_DIR"
+DEFAULT_PROFILE_DIR = os.path.join("logs", "profiles")
+# papertools profile report --sort 的取值 -> 统计列
+PROFILE_SORT_KEYS = {"cumulative": "cumtime", "tottime": "tottime", "ncalls": "ncalls"}
+
+
+def profiling_enabled() -> bool:
+    value = os.getenv(PROFILE_ENV, "")
+    return value.strip().lower() in ("1", "true", "yes", "on", "cprofile")
+
+
+def profile_dir() -> str:
+    return os.getenv(PROFILE_DIR_ENV) or DEFAULT_PROFILE_DIR
+
+
+def profile_path(stage: str, date: Optional[str] = None) -> str:
+    """Where the profile of one stage run is written."""
+    date = date or os.getenv(PROFILE_DATE_ENV) or datetime.now().strftime("%Y-%m-%d")
+    filename = f"{stage}_{datetime.now().strftime('%H%M%S%f')}_{os.getpid()}.pstats"
+    return os.path.join(profile_dir(), date, filename)
+
+
+class _ThreadProfilers:
+    """Give every thread started while installed its own profiler."""
+
+    def __init__(self) -> None:
+        self.profilers: List[Any] = []
+        self._lock = threading.Lock()
+        self._previous: Any = None
+
+    def _start(self, frame: Any, event: str, arg: Any) -> None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            # 替换掉本钩子，成为该线程的 profile 函数
+            profiler.enable()
+        except ValueError:
+            # 新版 Python 的 cProfile 基于 sys.monitoring，主线程的剖析器已覆盖所有线程
+            sys.setprofile(None)
+            return
+        with self._lock:
+            self.profilers.append(profiler)
+
+    def install(self) -> None:
+        self._previous = threading.getprofile()
+        threading.setprofile(self._start)
+
+    def uninstall(self) -> List[Any]:
+        threading.setprofile(self._previous)
+        with self._lock:
+            profilers, self.profilers = self.profilers, []
+        return profilers
+
+
+def _dump_merged(path: str, profilers: List[Any]) -> None:
+    import pstats
+
+    stats = None
+    for profiler in profilers:
+        profiler.disable()
+        try:
+            if stats is None:
+                stats = pstats.Stats(profiler)
+            else:
+                stats.add(profiler)
+        except TypeError:
+            # 没有记录到任何调用的线程
+            continue
+    if stats is not None:
+        stats.dump_stats(path)
+
+
+def profiled(stage: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Run the decorated stage entry point under cProfile when profiling is on."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not profiling_enabled():
+                return func(*args, **kwargs)
+            import cProfile
+
+            profiler = cProfile.Profile()
+            thread_profilers = _ThreadProfilers()
+            started = time.monotonic()
+            thread_profilers.install()
+            try:
+                return profiler.runcall(func, *args, **kwargs)
+            finally:
+                profilers = [profiler, *thread_profilers.uninstall()]
+                # 阶段失败或超时也保存：慢的往往正是这些运行
+                path = profile_path(stage)
+                try:
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    _dump_merged(path, profilers)
+                    print(
+                        f"🔬 {stage} 性能剖析 ({time.monotonic() - started:.1f}s): {path}"
+                    )
+                except OSError as exc:
+                    print(f"⚠️ 保存性能剖析失败({path}): {exc}")
+
+        return wrapper
+
+    return decorator
+
+
+def find_profiles(
+    directory: Optional[str] = None,
+    date: Optional[str] = None,
+    stage: Optional[str] = None,
+) -> Dict[str, List[str]]:
+    """Profile files grouped by stage, optionally for one date or stage."""
+    pattern = os.path.join(
+        directory or profile_dir(), date or "*", f"{stage or '*'}_*.pstats"
+    )
+    grouped: Dict[str, List[str]] = {}
+    for path in sorted(glob.glob(pattern)):
+        name = os.path.basename(path)[: -len(".pstats")]
+        # <stage>_<HHMMSSffffff>_<pid>；阶段名本身可能含下划线
+        grouped.setdefault(name.rsplit("_", 2)[0], []).append(path)
+    return grouped
+
+
+def _function_label(func: tuple) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name
+    if os.path.isabs(filename):
+        filename = os.path.relpath(filename)
+    return f"{filename}:{line}({name})"
+
+
+def summarize_profiles(
+    paths: List[str], sort: str = "cumulative", top: int = 15
+) -> Dict[str, Any]:
+    """Merge profile files and return total time plus the ``top`` hot spots."""
+    if sort not in PROFILE_SORT_KEYS:
+        raise ValueError(f"unsupported sort key: {sort}")
+    import pstats
+
+    stats = pstats.Stats(*paths)
+    rows = []
+    for func, (_cc, ncalls, tottime, cumtime, _callers) in stats.stats.items():
+        rows.append(
+            {
+                "function": _function_label(func),
+                "ncalls": ncalls,
+                "tottime": round(tottime, 3),
+                "cumtime": round(cumtime, 3),
+            }
+        )
+    rows.sort(key=lambda row: row[PROFILE_SORT_KEYS[sort]], reverse=True)
+    return {
+        "runs": len(paths),
+        "total_seconds": round(stats.total_tt, 3),
+        "hot_spots": rows[:top],
+    }
@@ -4,28 +4,75 @@ from __future__ import annotations
 
 import hashlib
 import json
+from dataclasses import dataclass
 from typing import Any
 
 
-def build_published_data_version(
+def encode_published_payload(payload: Any) -> bytes:
+    """Return the canonical serialization of one published JSON payload."""
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    ).encode("utf-8")
+
+
+def published_payload_digest(payload: Any) -> str:
+    """Return the canonical SHA-256 digest of one published JSON payload."""
+    return hashlib.sha256(encode_published_payload(payload)).hexdigest()
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """A payload serialized once; ``content`` is both the file bytes and the digest input.
+
+    Published date files are written as their canonical serialization, so the
+    digest of a file's bytes equals :func:`published_payload_digest` of its
+    parsed content.
+    """
+
+    data: Any
+    content: bytes
+    digest: str
+
+    @classmethod
+    def from_data(cls, data: Any) -> "EncodedPayload":
+        content = encode_published_payload(data)
+        return cls(data, content, hashlib.sha256(content).hexdigest())
+
+
+def build_published_data_version_from_digests(
     index_data: dict[str, Any],
-    date_payloads_by_date: dict[str, Any],
+    digests_by_date: dict[str, str],
 ) -> str:
-    """Return a stable token for the exact JSON payloads the entrypoint can load."""
+    """Return the data version from per-date payload digests.
+
+    Incremental builds keep the digest of every unchanged date in their build
+    manifest, so the version can be computed without re-reading those files.
+    """
     dates = index_data.get("dates")
-    ordered_dates = dates if isinstance(dates, list) else sorted(date_payloads_by_date)
+    ordered_dates = dates if isinstance(dates, list) else sorted(digests_by_date)
     payload = {
         "index": index_data,
         "dates": {
-            date: date_payloads_by_date.get(date)
+            date: digests_by_date.get(date)
             for date in ordered_dates
             if isinstance(date, str)
         },
     }
-    encoded = json.dumps(
-        payload,
-        ensure_ascii=False,
-        sort_keys=True,
-        default=str,
-    ).encode("utf-8")
-    return hashlib.sha256(encoded).hexdigest()[:12]
+    return published_payload_digest(payload)[:12]
+
+
+def build_published_data_version(
+    index_data: dict[str, Any],
+    date_payloads_by_date: dict[str, Any],
+) -> str:
+    """Return a stable token for the exact JSON payloads the entrypoint can load."""
+    return build_published_data_version_from_digests(
+        index_data,
+        {
+            date: published_payload_digest(payload)
+            for date, payload in date_payloads_by_date.items()
+        },
+    )
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
+# index.html 把全部嵌入数据写成一个 JSON 对象，夹在这两个注释标记之间，
+# 发布校验器据此直接截取并解析，无需扫描整页。
+PAGE_DATA_BEGIN = "/*@papertools-page-data*/"
+PAGE_DATA_END = "/*@papertools-page-data-end*/"
 
 EMBEDDED_PAPER_FIELDS = (
     "title",
@@ -73,3 +78,26 @@ def project_embedded_clusters(date_payload: dict[str, Any]) -> list[dict[str, An
             }
         )
     return projected_clusters
+
+
+def extract_page_data(html: str) -> tuple[dict[str, Any] | None, str | None]:
+    """Return the marked page-data object of an entrypoint.
+
+    ``(None, None)`` means the page has no marked span (older pages); a
+    present but unreadable span yields ``(None, error)``.
+    """
+    start = html.find(PAGE_DATA_BEGIN)
+    if start == -1:
+        return None, None
+    value_start = start + len(PAGE_DATA_BEGIN)
+    # 数据里的字符串不可能越过真正的结束标记，取最后一个即可
+    end = html.rfind(PAGE_DATA_END, value_start)
+    if end == -1:
+        return None, "unterminated page data span"
+    try:
+        data = json.loads(html[value_start:end])
+    except json.JSONDecodeError as exc:
+        return None, f"page data is not valid JSON: {exc}"
+    if not isinstance(data, dict):
+        return None, "page data must be an object"
+    return data, None
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import os
 import random
+import sys
 import time
 import warnings
 from functools import wraps
@@ -17,21 +18,6 @@ warnings.filterwarnings(
 )
 
 import requests
-from openai import OpenAIError
-
-try:  # openai>=1.x typed exceptions
-    from openai import (
-        APIConnectionError,
-        APIStatusError,
-        APITimeoutError,
-        InternalServerError,
-        RateLimitError,
-    )
-except Exception:  # pragma: no cover - compatibility with older openai packages
-    APIConnectionError = APITimeoutError = RateLimitError = InternalServerError = (
-        OpenAIError  # type: ignore
-    )
-    APIStatusError = OpenAIError  # type: ignore
 
 logger = logging.getLogger(__name__)
 F = TypeVar("F", bound=Callable)
@@ -41,10 +27,13 @@ RETRYABLE_EXCEPTIONS: Tuple[Type[Exception], ...] = (
     requests.exceptions.Timeout,
     ConnectionError,
     TimeoutError,
-    APIConnectionError,
-    APITimeoutError,
-    RateLimitError,
-    InternalServerError,
+)
+# openai 的异常类型；只有 openai 已被导入时才可能抛出，因此这里不主动导入它
+OPENAI_RETRYABLE_EXCEPTION_NAMES = (
+    "APIConnectionError",
+    "APITimeoutError",
+    "RateLimitError",
+    "InternalServerError",
 )
 
 RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 520, 522, 524, 529}
@@ -83,6 +72,19 @@ def _status_code(exc: Exception) -> Optional[int]:
     return None
 
 
+def _openai_exception_types(*names: str) -> Tuple[Type[Exception], ...]:
+    openai = sys.modules.get("openai")
+    if openai is None:
+        return ()
+    # 旧版 openai 没有细分的异常类型，回退到 OpenAIError
+    fallback = getattr(openai, "OpenAIError", None)
+    return tuple(
+        exc_type
+        for exc_type in (getattr(openai, name, fallback) for name in names)
+        if isinstance(exc_type, type)
+    )
+
+
 def is_retryable(exc: Exception) -> bool:
     """Determine if an exception is retryable."""
     status_code = _status_code(exc)
@@ -95,9 +97,11 @@ def is_retryable(exc: Exception) -> bool:
         return False
     if isinstance(exc, RETRYABLE_EXCEPTIONS):
         return True
-    if isinstance(exc, APIStatusError):
+    if isinstance(exc, _openai_exception_types(*OPENAI_RETRYABLE_EXCEPTION_NAMES)):
+        return True
+    if isinstance(exc, _openai_exception_types("APIStatusError")):
         return status_code in RETRYABLE_STATUS_CODES
-    if isinstance(exc, OpenAIError):
+    if isinstance(exc, _openai_exception_types("OpenAIError")):
         message = str(exc).lower()
         if any(
             code in message
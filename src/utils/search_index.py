@@ -0,0 +1,197 @@
+"""Prebuilt full-text search index for the published webpage.
+
+The index is split into one shard per month (``data/search-YYYY-MM.json``)
+mapping terms to the papers of that month.  ``data/search-index.json`` is the
+term dictionary: for every month it holds a small Bloom filter of the month's
+terms, so the page only fetches the shards that can contain every term of a
+query instead of downloading all date files.
+
+Text is tokenized into lowercase Latin/digit words plus CJK character
+bigrams.  The page re-implements :func:`tokenize_search_text` and
+:func:`term_hashes` in JavaScript; the stopword list and Bloom parameters are
+shipped in the dictionary so both sides always agree.
+"""
+
+from __future__ import annotations
+
+import base64
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.utils.published_data_version import published_payload_digest
+
+SEARCH_INDEX_VERSION = 1
+SEARCH_INDEX_FILENAME = "search-index.json"
+SEARCH_SHARD_RE = re.compile(r"search-(\d{4}-\d{2})\.json")
+BLOOM_BITS_PER_TERM = 6
+BLOOM_HASHES = 3
+MIN_LATIN_TERM_LENGTH = 2
+PAPER_SEARCH_FIELDS = ("title", "authors", "summary", "summary_translation")
+
+# 只去掉几乎每篇论文都有的英文虚词，避免倒排表被它们撑大
+SEARCH_STOPWORDS = (
+    "a an and are as at be by for from in is it its of on or that the this to "
+    "we with our"
+).split()
+
+_TERM_RE = re.compile(r"[a-z0-9]+|[\u3400-\u9fff\uf900-\ufaff]+")
+_STOPWORD_SET = frozenset(SEARCH_STOPWORDS)
+
+
+def search_shard_filename(month: str) -> str:
+    return f"search-{month}.json"
+
+
+def tokenize_search_text(text: Any) -> List[str]:
+    """Lowercase words and CJK bigrams of ``text`` (a lone CJK char is kept)."""
+    terms: List[str] = []
+    for run in _TERM_RE.findall(str(text or "").lower()):
+        if run[0] <= "z":
+            if len(run) >= MIN_LATIN_TERM_LENGTH and run not in _STOPWORD_SET:
+                terms.append(run)
+        elif len(run) == 1:
+            terms.append(run)
+        else:
+            terms.extend(run[i : i + 2] for i in range(len(run) - 1))
+    return terms
+
+
+def _fnv1a(data: bytes, basis: int) -> int:
+    value = basis
+    for byte in data:
+        value = ((value ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return value
+
+
+def term_hashes(term: str, bits: int, hashes: int = BLOOM_HASHES) -> List[int]:
+    """Bloom filter bit positions of a term."""
+    data = term.encode("utf-8")
+    first = _fnv1a(data, 0x811C9DC5)
+    second = _fnv1a(data, 0x050C5D1F) | 1
+    return [((first + i * second) & 0xFFFFFFFF) % bits for i in range(hashes)]
+
+
+def build_bloom_filter(terms: Iterable[str]) -> Dict[str, Any]:
+    """Return ``{"bits", "bloom"}`` with the filter base64-encoded."""
+    unique_terms = set(terms)
+    # 按字节对齐；约 6% 的误判只会多下载一个分片
+    bits = max(64, -(-len(unique_terms) * BLOOM_BITS_PER_TERM // 8) * 8)
+    buffer = bytearray(bits // 8)
+    for term in unique_terms:
+        for position in term_hashes(term, bits):
+            buffer[position >> 3] |= 1 << (position & 7)
+    return {"bits": bits, "bloom": base64.b64encode(bytes(buffer)).decode("ascii")}
+
+
+def bloom_might_contain(entry: Dict[str, Any], term: str) -> bool:
+    buffer = base64.b64decode(entry["bloom"])
+    return all(
+        buffer[position >> 3] & (1 << (position & 7))
+        for position in term_hashes(term, entry["bits"])
+    )
+
+
+def paper_search_terms(paper: Dict[str, Any], cluster_name: str = "") -> List[str]:
+    """Terms of every searchable field of a published paper."""
+    terms = tokenize_search_text(cluster_name or paper.get("cluster", ""))
+    for field in PAPER_SEARCH_FIELDS:
+        terms.extend(tokenize_search_text(paper.get(field, "")))
+    return terms
+
+
+def build_month_shard(
+    month: str, payloads_by_date: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Inverted index of every paper published on the given dates of a month."""
+    docs: List[List[str]] = []
+    postings: Dict[str, List[int]] = {}
+    for date in sorted(payloads_by_date, reverse=True):
+        for cluster in payloads_by_date[date].get("clusters", []) or []:
+            for paper in cluster.get("papers", []) or []:
+                arxiv_id = str(paper.get("arxiv_id") or "")
+                if not arxiv_id:
+                    continue
+                doc = len(docs)
+                docs.append([arxiv_id, date])
+                for term in set(paper_search_terms(paper, cluster.get("name", ""))):
+                    postings.setdefault(term, []).append(doc)
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "month": month,
+        "docs": docs,
+        "postings": {term: postings[term] for term in sorted(postings)},
+    }
+
+
+def month_entry(shard: Dict[str, Any], dates: List[str]) -> Dict[str, Any]:
+    """Dictionary entry describing one month shard."""
+    entry = {
+        "month": shard["month"],
+        "file": search_shard_filename(shard["month"]),
+        "digest": published_payload_digest(shard)[:12],
+        "dates": dates,
+        "docs": len(shard["docs"]),
+        "terms": len(shard["postings"]),
+    }
+    entry.update(build_bloom_filter(shard["postings"]))
+    return entry
+
+
+def build_search_files(
+    all_dates: List[str],
+    date_payloads: Dict[str, Dict[str, Any]],
+    previous_index: Optional[Dict[str, Any]],
+    load_payload: Callable[[str], Dict[str, Any]],
+    shard_exists: Callable[[str], bool] = lambda _name: True,
+) -> Dict[str, Any]:
+    """Return the search files to (re)write, keyed by data file name.
+
+    Only months containing a changed date, or whose set of dates changed,
+    get a new shard; other months keep their previous entry and file.  The
+    dictionary is always rewritten.
+    """
+    dates_by_month: Dict[str, List[str]] = {}
+    for date in sorted(all_dates, reverse=True):
+        dates_by_month.setdefault(date[:7], []).append(date)
+
+    previous_entries: Dict[str, Dict[str, Any]] = {}
+    if (
+        isinstance(previous_index, dict)
+        and previous_index.get("version") == SEARCH_INDEX_VERSION
+        and previous_index.get("min_latin_length") == MIN_LATIN_TERM_LENGTH
+        and previous_index.get("stopwords") == SEARCH_STOPWORDS
+        and previous_index.get("bloom_hashes") == BLOOM_HASHES
+    ):
+        previous_entries = {
+            entry.get("month"): entry
+            for entry in previous_index.get("months", [])
+            if isinstance(entry, dict)
+        }
+
+    files: Dict[str, Any] = {}
+    entries = []
+    for month, dates in dates_by_month.items():
+        previous = previous_entries.get(month)
+        if (
+            previous is not None
+            and previous.get("dates") == dates
+            and not any(date in date_payloads for date in dates)
+            and shard_exists(previous.get("file", ""))
+        ):
+            entries.append(previous)
+            continue
+        shard = build_month_shard(
+            month,
+            {date: date_payloads.get(date) or load_payload(date) for date in dates},
+        )
+        files[search_shard_filename(month)] = shard
+        entries.append(month_entry(shard, dates))
+
+    files[SEARCH_INDEX_FILENAME] = {
+        "version": SEARCH_INDEX_VERSION,
+        "min_latin_length": MIN_LATIN_TERM_LENGTH,
+        "stopwords": SEARCH_STOPWORDS,
+        "bloom_hashes": BLOOM_HASHES,
+        "months": entries,
+    }
+    return files
@@ -0,0 +1,192 @@
+"""Persistent arXiv id -> crawl metadata index.
+
+Crawl outputs in ``arxiv_paper/`` are indexed into a small SQLite database
+(``.source_index.sqlite3`` next to them) keyed by arXiv id, so backfilling
+metadata is a keyed lookup of exactly the ids needed instead of parsing every
+crawl file.  The crawler upserts each file it saves; readers call
+:meth:`ArxivSourceIndex.sync_directory` first, which only re-reads crawl files
+whose size or mtime changed since they were last indexed.
+
+Rows are never deleted when a crawl file disappears: crawl metadata does not
+go stale, and keeping it only widens what can be backfilled.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+SOURCE_INDEX_FILENAME = ".source_index.sqlite3"
+SCHEMA_VERSION = 1
+LOOKUP_BATCH_SIZE = 500
+
+
+def source_index_path(directory: str) -> str:
+    """Return the index location for a crawl output directory."""
+    return os.path.join(directory, SOURCE_INDEX_FILENAME)
+
+
+class ArxivSourceIndex:
+    """SQLite-backed ``arxiv_id -> paper`` mapping for one crawl directory."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._reset_schema()
+
+    def _reset_schema(self) -> None:
+        with self._conn:
+            self._conn.execute("DROP TABLE IF EXISTS papers")
+            self._conn.execute("DROP TABLE IF EXISTS source_files")
+            self._conn.execute(
+                "CREATE TABLE papers ("
+                "arxiv_id TEXT PRIMARY KEY, metadata TEXT NOT NULL, "
+                "source_file TEXT NOT NULL, updated_at TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE source_files ("
+                "path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+                "mtime_ns INTEGER NOT NULL)"
+            )
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ArxivSourceIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    def upsert_file(
+        self, json_file: str, papers: Optional[List[Dict[str, Any]]] = None
+    ) -> int:
+        """Index one crawl file; ``papers`` skips re-reading it. Returns rows written."""
+        if papers is None:
+            with open(json_file, "r", encoding="utf-8") as f:
+                papers = json.load(f)
+        if not isinstance(papers, list):
+            papers = []
+
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = []
+        for paper in papers:
+            if not isinstance(paper, dict):
+                continue
+            arxiv_id = (paper.get("arxiv_id") or "").strip()
+            if arxiv_id:
+                rows.append(
+                    (arxiv_id, json.dumps(paper, ensure_ascii=False), json_file, now)
+                )
+
+        stat = os.stat(json_file)
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO papers "
+                "(arxiv_id, metadata, source_file, updated_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO source_files (path, size, mtime_ns) "
+                "VALUES (?, ?, ?)",
+                (json_file, stat.st_size, stat.st_mtime_ns),
+            )
+        return len(rows)
+
+    def sync_directory(self, directory: str) -> int:
+        """Index crawl files added or changed since the last sync; return their count."""
+        known = {
+            path: (size, mtime_ns)
+            for path, size, mtime_ns in self._conn.execute(
+                "SELECT path, size, mtime_ns FROM source_files"
+            )
+        }
+        current = []
+        for json_file in Path(directory).glob("*.json"):
+            try:
+                stat = json_file.stat()
+            except OSError:
+                continue
+            current.append((stat.st_mtime_ns, str(json_file), stat.st_size))
+
+        synced = 0
+        # 旧文件先入库，同一论文以最新爬取的元数据为准
+        for mtime_ns, json_file, size in sorted(current):
+            if known.get(json_file) == (size, mtime_ns):
+                continue
+            try:
+                self.upsert_file(json_file)
+            except (OSError, ValueError) as exc:
+                print(f"⚠️ 源数据索引跳过无法读取的文件 {json_file}: {exc}")
+                continue
+            synced += 1
+
+        vanished = set(known) - {json_file for _, json_file, _ in current}
+        if vanished:
+            with self._conn:
+                self._conn.executemany(
+                    "DELETE FROM source_files WHERE path = ?",
+                    [(path,) for path in vanished],
+                )
+        return synced
+
+    def lookup(self, arxiv_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Return indexed metadata for the requested ids that are present."""
+        wanted = sorted({aid.strip() for aid in arxiv_ids if aid and aid.strip()})
+        found: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(wanted), LOOKUP_BATCH_SIZE):
+            batch = wanted[start : start + LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" for _ in batch)
+            for arxiv_id, metadata in self._conn.execute(
+                f"SELECT arxiv_id, metadata FROM papers WHERE arxiv_id IN ({placeholders})",
+                batch,
+            ):
+                try:
+                    found[arxiv_id] = json.loads(metadata)
+                except ValueError:
+                    continue
+        return found
+
+
+def update_source_index(
+    directory: str, json_file: str, papers: List[Dict[str, Any]]
+) -> bool:
+    """Upsert a freshly saved crawl file; failures only cost a later re-sync."""
+    try:
+        with ArxivSourceIndex(source_index_path(directory)) as source_index:
+            source_index.upsert_file(json_file, papers)
+        return True
+    except (sqlite3.Error, OSError) as exc:
+        print(f"⚠️ 更新源数据索引失败 {json_file}: {exc}")
+        return False
+
+
+def open_source_index(directory: str) -> Optional[ArxivSourceIndex]:
+    """Open and sync the index of a crawl directory, or None if unavailable."""
+    if not os.path.isdir(directory):
+        return None
+    try:
+        source_index = ArxivSourceIndex(source_index_path(directory))
+    except (sqlite3.Error, OSError) as exc:
+        print(f"⚠️ 打开源数据索引失败 {directory}: {exc}")
+        return None
+    try:
+        source_index.sync_directory(directory)
+    except sqlite3.Error as exc:
+        print(f"⚠️ 同步源数据索引失败 {directory}: {exc}")
+        source_index.close()
+        return None
+    return source_index
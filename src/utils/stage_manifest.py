@@ -0,0 +1,127 @@
+"""Sidecar manifests describing pipeline stage outputs.
+
+Every stage that saves a paper list (crawl, filter, cluster, summary) writes
+``<dir>/.meta/<file>.meta.json`` right after the atomic save::
+
+    {"schema_version": 1, "count": 214, "sha256": "...", "size": 1843221,
+     "mtime_ns": ..., "date_range": {"start": "2026-06-01", "end": "2026-06-01"}}
+
+The pipeline reads record counts from the manifest instead of parsing the
+whole output.  A manifest is only trusted while ``size`` and ``mtime_ns``
+still match the file, so an output rewritten by anything else falls back to
+a full parse.  Manifests live in a hidden ``.meta`` directory so the
+``*.json`` scans of the stage directories never pick them up.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from src.utils.io import save_json
+
+MANIFEST_SCHEMA_VERSION = 1
+MANIFEST_DIRNAME = ".meta"
+MANIFEST_SUFFIX = ".meta.json"
+PAPER_DATE_FIELDS = ("source_date", "date")
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+
+def manifest_path(filepath: str) -> str:
+    directory, filename = os.path.split(filepath)
+    return os.path.join(directory, MANIFEST_DIRNAME, filename + MANIFEST_SUFFIX)
+
+
+def count_records(data: Any) -> Optional[int]:
+    """Papers in a list-shaped stage file or in generated page data."""
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict):
+        papers = data.get("papers")
+        if isinstance(papers, list):
+            return len(papers)
+        clusters = data.get("clusters")
+        if isinstance(clusters, list):
+            return sum(
+                len(cluster.get("papers", []))
+                for cluster in clusters
+                if isinstance(cluster, dict)
+            )
+    return None
+
+
+def paper_date_range(data: Any) -> Optional[Dict[str, str]]:
+    """Earliest and latest paper date of a list-shaped stage file."""
+    dates = []
+    for paper in data if isinstance(data, list) else []:
+        if not isinstance(paper, dict):
+            continue
+        for field in PAPER_DATE_FIELDS:
+            match = _DATE_RE.match(str(paper.get(field) or ""))
+            if match:
+                dates.append(match.group(0))
+                break
+    if not dates:
+        return None
+    return {"start": min(dates), "end": max(dates)}
+
+
+def _file_sha256(filepath: str) -> str:
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_stage_manifest(filepath: str, data: Any) -> bool:
+    """Describe a stage output that was just saved from ``data``.
+
+    A failed manifest write only costs later readers a full parse, so it is
+    reported and otherwise ignored.
+    """
+    try:
+        stat = os.stat(filepath)
+        manifest = {
+            "schema_version": MANIFEST_SCHEMA_VERSION,
+            "count": count_records(data),
+            "sha256": _file_sha256(filepath),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "date_range": paper_date_range(data),
+            "written_at": datetime.now().isoformat(timespec="seconds"),
+        }
+    except OSError as exc:
+        print(f"⚠️ 生成阶段清单失败({filepath}): {exc}")
+        return False
+    return save_json(manifest_path(filepath), manifest)
+
+
+def read_stage_manifest(filepath: Optional[str]) -> Optional[Dict[str, Any]]:
+    """The manifest of ``filepath`` if it still describes the file, else None."""
+    if not filepath:
+        return None
+    try:
+        with open(manifest_path(filepath), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("schema_version") != MANIFEST_SCHEMA_VERSION
+    ):
+        return None
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    if manifest.get("size") != stat.st_size or manifest.get("mtime_ns") != (
+        stat.st_mtime_ns
+    ):
+        return None
+    return manifest
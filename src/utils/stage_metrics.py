@@ -0,0 +1,431 @@
+"""Per-stage timing and resource metrics for pipeline runs.
+
+Every process keeps a :data:`RECORDER` of the LLM requests it made (per
+provider host: count, errors, latencies, prompt/completion tokens) and of its
+cache lookups (per cache kind: hits and misses).  The pipeline wraps each
+step in a :class:`StageMetrics` scope that measures wall time, CPU time of the
+pipeline and its children, peak RSS and bytes read/written, and collects the
+counters of that step:
+
+- stages run in process are measured as the difference of the pipeline's own
+  recorder before and after the step;
+- stage subprocesses find the step's report file in
+  ``PAPERTOOLS_STAGE_METRICS_FILE`` and append their counters to it when they
+  exit; the reports are merged when the run's metrics are built.
+
+:meth:`StageMetrics.report` returns the ``metrics`` section of the pipeline
+status file, and :func:`append_metrics_record` keeps the rolling
+``logs/metrics.jsonl`` history.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows has no getrusage
+    resource = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None
+
+STAGE_METRICS_FILE_ENV = "PAPERTOOLS_STAGE_METRICS_FILE"
+# 写报告文件的是阶段子进程；流水线进程自己（进程内运行阶段时）不写
+STAGE_METRICS_OWNER_ENV = "PAPERTOOLS_STAGE_METRICS_OWNER"
+# 各次流水线运行的阶段子进程报告目录，运行结束时删除
+DEFAULT_REPORT_ROOT = os.path.join("logs", "stage_metrics")
+
+Counters = Dict[str, Dict[str, Dict[str, Any]]]
+
+
+class MetricsRecorder:
+    """Thread-safe LLM request and cache lookup counters of this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._llm: Dict[str, Dict[str, Any]] = {}
+        self._cache: Dict[str, Dict[str, int]] = {}
+
+    def record_llm_request(
+        self,
+        provider: str,
+        latency: float,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        error: bool = False,
+    ) -> None:
+        with self._lock:
+            entry = self._llm.setdefault(provider, _empty_llm_entry())
+            entry["requests"] += 1
+            entry["errors"] += int(bool(error))
+            entry["prompt_tokens"] += int(prompt_tokens or 0)
+            entry["completion_tokens"] += int(completion_tokens or 0)
+            entry["latencies"].append(round(max(latency, 0.0), 3))
+
+    def record_cache(self, kind: str, hit: bool) -> None:
+        with self._lock:
+            entry = self._cache.setdefault(kind, {"hits": 0, "misses": 0})
+            entry["hits" if hit else "misses"] += 1
+
+    def snapshot(self) -> Counters:
+        """Copy of the counters accumulated so far."""
+        with self._lock:
+            return {
+                "llm": {
+                    provider: {**entry, "latencies": list(entry["latencies"])}
+                    for provider, entry in self._llm.items()
+                },
+                "cache": {kind: dict(entry) for kind, entry in self._cache.items()},
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._llm.clear()
+            self._cache.clear()
+
+
+RECORDER = MetricsRecorder()
+
+
+def record_llm_request(
+    provider: str,
+    latency: float,
+    prompt_tokens: Optional[int] = None,
+    completion_tokens: Optional[int] = None,
+    error: bool = False,
+) -> None:
+    """Count one chat completion request of this process."""
+    RECORDER.record_llm_request(
+        provider, latency, prompt_tokens, completion_tokens, error
+    )
+
+
+def record_cache(kind: str, hit: bool) -> None:
+    """Count one cache lookup of this process."""
+    RECORDER.record_cache(kind, hit)
+
+
+def _empty_llm_entry() -> Dict[str, Any]:
+    return {
+        "requests": 0,
+        "errors": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "latencies": [],
+    }
+
+
+def diff_counters(before: Counters, after: Counters) -> Counters:
+    """Counters accumulated between two snapshots of the same recorder."""
+    llm = {}
+    for provider, entry in after.get("llm", {}).items():
+        base = before.get("llm", {}).get(provider, _empty_llm_entry())
+        if entry["requests"] == base["requests"]:
+            continue
+        llm[provider] = {
+            key: entry[key] - base[key]
+            for key in ("requests", "errors", "prompt_tokens", "completion_tokens")
+        }
+        llm[provider]["latencies"] = entry["latencies"][len(base["latencies"]) :]
+    cache = {}
+    for kind, entry in after.get("cache", {}).items():
+        base = before.get("cache", {}).get(kind, {"hits": 0, "misses": 0})
+        hits = entry["hits"] - base["hits"]
+        misses = entry["misses"] - base["misses"]
+        if hits or misses:
+            cache[kind] = {"hits": hits, "misses": misses}
+    return {"llm": llm, "cache": cache}
+
+
+def merge_counters(target: Counters, other: Counters) -> Counters:
+    """Add ``other`` into ``target`` in place and return it."""
+    for provider, entry in (other.get("llm") or {}).items():
+        merged = target.setdefault("llm", {}).setdefault(provider, _empty_llm_entry())
+        for key in ("requests", "errors", "prompt_tokens", "completion_tokens"):
+            merged[key] += int(entry.get(key) or 0)
+        merged["latencies"].extend(entry.get("latencies") or [])
+    for kind, entry in (other.get("cache") or {}).items():
+        merged = target.setdefault("cache", {}).setdefault(
+            kind, {"hits": 0, "misses": 0}
+        )
+        merged["hits"] += int(entry.get("hits") or 0)
+        merged["misses"] += int(entry.get("misses") or 0)
+    return target
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize_counters(counters: Counters) -> Dict[str, Any]:
+    """Status-file form of counters: latency percentiles and hit ratios."""
+    llm = {}
+    for provider, entry in sorted((counters.get("llm") or {}).items()):
+        latencies = entry.get("latencies") or []
+        summary = {
+            "requests": entry["requests"],
+            "errors": entry["errors"],
+            "prompt_tokens": entry["prompt_tokens"],
+            "completion_tokens": entry["completion_tokens"],
+        }
+        if latencies:
+            summary.update(
+                {
+                    "latency_avg_seconds": round(sum(latencies) / len(latencies), 3),
+                    "latency_p50_seconds": _percentile(latencies, 0.5),
+                    "latency_p95_seconds": _percentile(latencies, 0.95),
+                    "latency_max_seconds": max(latencies),
+                }
+            )
+        llm[provider] = summary
+    cache = {}
+    for kind, entry in sorted((counters.get("cache") or {}).items()):
+        lookups = entry["hits"] + entry["misses"]
+        cache[kind] = {
+            "hits": entry["hits"],
+            "misses": entry["misses"],
+            "hit_ratio": round(entry["hits"] / lookups, 3) if lookups else None,
+        }
+    return {"llm": llm, "cache": cache}
+
+
+def process_io_bytes() -> Dict[str, int]:
+    """Bytes this process has read and written so far."""
+    try:
+        with open("/proc/self/io", "r", encoding="ascii") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+        return {
+            "read_bytes": int(fields["rchar"]),
+            "write_bytes": int(fields["wchar"]),
+        }
+    except (OSError, KeyError, ValueError):
+        pass
+    if resource is None:
+        return {"read_bytes": 0, "write_bytes": 0}
+    # 没有 /proc 时只能拿到块设备读写次数，按 512 字节估算
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return {"read_bytes": usage.ru_inblock * 512, "write_bytes": usage.ru_oublock * 512}
+
+
+def _rss_kb(value: int) -> int:
+    # macOS 的 ru_maxrss 单位是字节，Linux 是 KB
+    return value // 1024 if sys.platform == "darwin" else value
+
+
+def resource_sample() -> Dict[str, float]:
+    """Clocks, CPU times, RSS high-water marks and I/O counters right now."""
+    sample: Dict[str, float] = {
+        "wall": time.monotonic(),
+        "cpu": time.process_time(),
+        "children_cpu": 0.0,
+        "peak_rss_kb": 0,
+        "children_peak_rss_kb": 0,
+    }
+    if resource is not None:
+        own = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        sample["children_cpu"] = children.ru_utime + children.ru_stime
+        sample["peak_rss_kb"] = _rss_kb(own.ru_maxrss)
+        sample["children_peak_rss_kb"] = _rss_kb(children.ru_maxrss)
+    sample.update(process_io_bytes())
+    return sample
+
+
+def _write_exit_report() -> None:
+    path = os.getenv(STAGE_METRICS_FILE_ENV)
+    if not path or os.getenv(STAGE_METRICS_OWNER_ENV) == str(os.getpid()):
+        return
+    record = {"pid": os.getpid(), **RECORDER.snapshot(), "io": process_io_bytes()}
+    try:
+        # 一行一个进程；追加写入，同一步骤的多个子进程互不覆盖
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError:
+        pass
+
+
+atexit.register(_write_exit_report)
+
+
+def read_stage_reports(path: str) -> List[Dict[str, Any]]:
+    """Reports appended by the stage subprocesses of one step."""
+    reports = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    report = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(report, dict):
+                    reports.append(report)
+    except OSError:
+        pass
+    return reports
+
+
+class StageMetrics:
+    """Measures the steps of one pipeline run."""
+
+    def __init__(self, report_dir: Optional[str] = None):
+        self.report_dir = report_dir or os.path.join(
+            DEFAULT_REPORT_ROOT, f"{os.getpid()}_{int(time.time())}"
+        )
+        self.stages: List[Dict[str, Any]] = []
+        self._open: Optional[Dict[str, Any]] = None
+
+    def start(self, step: int, name: str) -> None:
+        """Begin measuring a step; a step still open is closed as unfinished."""
+        self.finish("unfinished")
+        report_file = os.path.join(self.report_dir, f"step{step}.jsonl")
+        try:
+            os.makedirs(self.report_dir, exist_ok=True)
+            os.environ[STAGE_METRICS_FILE_ENV] = report_file
+            os.environ[STAGE_METRICS_OWNER_ENV] = str(os.getpid())
+        except OSError:
+            report_file = None
+        record = {"step": step, "name": name, "status": "running", "substeps": []}
+        self.stages.append(record)
+        self._open = {
+            "record": record,
+            "start": resource_sample(),
+            "counters": RECORDER.snapshot(),
+            "report_file": report_file,
+        }
+
+    def set_papers(self, count: Optional[int]) -> None:
+        """Number of papers the current (or last) step processed."""
+        if count is not None and self.stages:
+            self.stages[-1]["papers"] = count
+
+    def finish(self, status: str) -> None:
+        """Close the open step, if any."""
+        if self._open is None:
+            return
+        scope, self._open = self._open, None
+        start, end = scope["start"], resource_sample()
+        record = scope["record"]
+        record["status"] = status
+        record["wall_seconds"] = round(end["wall"] - start["wall"], 3)
+        record["cpu_seconds"] = round(
+            end["cpu"] - start["cpu"] + end["children_cpu"] - start["children_cpu"], 3
+        )
+        record["peak_rss_mb"] = round(end["peak_rss_kb"] / 1024, 1)
+        # 子进程峰值是所有已结束子进程的最大值，只有本步骤把它推高时才属于本步骤
+        if end["children_peak_rss_kb"] > start["children_peak_rss_kb"]:
+            record["child_peak_rss_mb"] = round(end["children_peak_rss_kb"] / 1024, 1)
+        record["read_bytes"] = end["read_bytes"] - start["read_bytes"]
+        record["write_bytes"] = end["write_bytes"] - start["write_bytes"]
+        record["_counters"] = diff_counters(scope["counters"], RECORDER.snapshot())
+        record["_report_file"] = scope["report_file"]
+        os.environ.pop(STAGE_METRICS_FILE_ENV, None)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Time a sub-step of the current (or last) step."""
+        start = resource_sample()
+        try:
+            yield
+        finally:
+            end = resource_sample()
+            if self.stages:
+                self.stages[-1]["substeps"].append(
+                    {
+                        "name": name,
+                        "wall_seconds": round(end["wall"] - start["wall"], 3),
+                        "cpu_seconds": round(
+                            end["cpu"]
+                            - start["cpu"]
+                            + end["children_cpu"]
+                            - start["children_cpu"],
+                            3,
+                        ),
+                    }
+                )
+
+    def report(self) -> Dict[str, Any]:
+        """Close the run and return its ``metrics`` status section.
+
+        Reads and removes the subprocess reports, so call it once, after
+        every stage subprocess has exited.
+        """
+        self.finish("unfinished")
+        os.environ.pop(STAGE_METRICS_OWNER_ENV, None)
+        totals: Counters = {"llm": {}, "cache": {}}
+        stages = []
+        for record in self.stages:
+            stage = {k: v for k, v in record.items() if not k.startswith("_")}
+            counters = merge_counters(
+                {"llm": {}, "cache": {}}, record.get("_counters") or {}
+            )
+            report_file = record.get("_report_file")
+            for child in read_stage_reports(report_file) if report_file else []:
+                merge_counters(counters, child)
+                io = child.get("io") or {}
+                stage["read_bytes"] = stage.get("read_bytes", 0) + int(
+                    io.get("read_bytes") or 0
+                )
+                stage["write_bytes"] = stage.get("write_bytes", 0) + int(
+                    io.get("write_bytes") or 0
+                )
+            merge_counters(totals, counters)
+            stage.update(summarize_counters(counters))
+            papers, wall = stage.get("papers"), stage.get("wall_seconds")
+            if papers and wall:
+                stage["papers_per_second"] = round(papers / wall, 3)
+            if not stage["substeps"]:
+                del stage["substeps"]
+            stages.append(stage)
+        shutil.rmtree(self.report_dir, ignore_errors=True)
+        return {
+            "stages": stages,
+            "totals": {
+                "wall_seconds": round(
+                    sum(stage.get("wall_seconds", 0) for stage in stages), 3
+                ),
+                "cpu_seconds": round(
+                    sum(stage.get("cpu_seconds", 0) for stage in stages), 3
+                ),
+                **summarize_counters(totals),
+            },
+        }
+
+
+def append_metrics_record(path: str, record: Dict[str, Any], max_records: int) -> bool:
+    """Append one run to the rolling JSONL history, keeping the newest runs.
+
+    Concurrent pipelines (the two lanes of a backlog run) share the history,
+    so the append and the trim run under an exclusive lock on ``<path>.lock``.
+    """
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(f"{path}.lock", "a", encoding="utf-8") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n")
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+            if len(lines) > max_records:
+                temp_path = f"{path}.{os.getpid()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    f.writelines(lines[-max_records:])
+                os.replace(temp_path, path)
+        return True
+    except OSError as exc:
+        print(f"⚠️ 写入指标历史失败({path}): {exc}")
+        return False
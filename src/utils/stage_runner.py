@@ -0,0 +1,186 @@
+"""Run pipeline stage scripts as functions inside the pipeline process.
+
+By default every pipeline stage is a child ``python src/core/<stage>.py``
+process, which re-imports openai, bs4 and the extraction stack, rebuilds its
+clients and re-parses the previous stage's JSON output.  With
+``PAPERTOOLS_PIPELINE_RUNNER=inprocess`` the same command line is instead
+handed to the stage module's ``main()`` in a worker thread of the pipeline
+process:
+
+- modules stay imported between stages and OpenAI clients share one HTTP
+  connection pool (:func:`src.utils.openai_client.enable_shared_http_client`);
+- each stage's final paper list is handed to the next stage in memory
+  (:func:`src.utils.io.remember_stage_output`) instead of being parsed again;
+- a watchdog keeps the stage timeout: when a stage overruns, a
+  :class:`StageTimeout` is raised inside its thread, and a stage that still
+  does not stop is abandoned and the runner falls back to subprocesses.
+
+Only commands that run a known stage script with the pipeline's own
+environment are run in process; anything else (env overrides that differ
+from the parent, unknown scripts) still goes through a subprocess.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import traceback
+from typing import Any, Dict, List, Mapping, Optional
+
+from src.utils.io import disable_stage_handoff, enable_stage_handoff
+
+# 脚本路径 -> 模块名；只有这些阶段脚本可以在进程内运行
+STAGE_MODULES = {
+    "src/core/crawl_arxiv.py": "src.core.crawl_arxiv",
+    "src/core/paper_filter.py": "src.core.paper_filter",
+    "src/core/cluster_papers.py": "src.core.cluster_papers",
+    "src/core/generate_summary.py": "src.core.generate_summary",
+    "src/core/generate_unified_index.py": "src.core.generate_unified_index",
+}
+RUNNER_MODES = ("subprocess", "inprocess")
+TIMEOUT_GRACE_SECONDS = 10.0
+TIMEOUT_RETURN_CODE = 124
+
+
+# 当前线程正在运行的进程内阶段（由 run() 在阶段线程中设置）
+_HOSTED = threading.local()
+
+
+class StageTimeout(BaseException):
+    """Raised inside a stage thread by the watchdog.
+
+    A BaseException so the stages' ``except Exception`` handlers let it through.
+    """
+
+
+def stage_module_name(cmd: List[str]) -> Optional[str]:
+    """Module of a ``[python, script, ...]`` stage command, or None."""
+    if len(cmd) < 2 or cmd[0] != sys.executable:
+        return None
+    return STAGE_MODULES.get(cmd[1].replace(os.sep, "/"))
+
+
+def exit_code(code: Any) -> int:
+    """Translate a ``main()`` return value or ``SystemExit.code`` to an exit code."""
+    if code is None:
+        return 0
+    if isinstance(code, bool):
+        return int(code)
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def exit_leaving_stuck_threads(code: int) -> int:
+    """End a stage whose worker threads are stuck (e.g. timed-out LLM calls).
+
+    Run as a script, the process exits at once with ``os._exit`` so the
+    interpreter does not wait for those threads at shutdown.  Hosted by
+    :class:`InProcessStageRunner`, ``os._exit`` would take the whole pipeline
+    down, so the stage is recorded on the runner and ``code`` is returned;
+    the pipeline exits hard only after it has finished.
+    """
+    runner = getattr(_HOSTED, "runner", None)
+    if runner is None:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+    runner.lingering.append(_HOSTED.module)
+    return code
+
+
+def _interrupt_thread(thread: threading.Thread) -> None:
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(thread.ident), ctypes.py_object(StageTimeout)
+    )
+
+
+class InProcessStageRunner:
+    """Runs stage commands as ``module.main()`` calls, one at a time."""
+
+    def __init__(self, grace_seconds: float = TIMEOUT_GRACE_SECONDS):
+        self.grace_seconds = grace_seconds
+        self.abandoned: List[str] = []
+        # 已结束、但留下仍在运行的工作线程的阶段；流水线退出时同样不能等待它们
+        self.lingering: List[str] = []
+        self._lock = threading.Lock()
+        self._active = False
+
+    def can_run(self, cmd: List[str], env: Optional[Mapping[str, str]]) -> bool:
+        """Whether ``cmd`` can run in process with the same effect as a child.
+
+        Stage modules read their configuration when imported, so a child
+        environment that differs from this process cannot be honoured here.
+        """
+        if self.abandoned or stage_module_name(cmd) is None:
+            return False
+        return env is None or dict(env) == dict(os.environ)
+
+    def _activate(self) -> None:
+        if not self._active:
+            # openai 只在真正进程内运行阶段时才导入，子进程模式的流水线不付这笔开销
+            from src.utils.openai_client import enable_shared_http_client
+
+            enable_stage_handoff()
+            enable_shared_http_client()
+            self._active = True
+
+    def run(self, cmd: List[str], timeout: Optional[float] = None) -> int:
+        """Run a stage command; raises ``subprocess.TimeoutExpired`` on overrun."""
+        module_name = stage_module_name(cmd)
+        if module_name is None:
+            raise ValueError(f"not an in-process stage command: {cmd[:2]}")
+        with self._lock:
+            self._activate()
+            module = importlib.import_module(module_name)
+            result: Dict[str, int] = {}
+
+            def target() -> None:
+                _HOSTED.runner = self
+                _HOSTED.module = module_name
+                try:
+                    result["rc"] = exit_code(module.main())
+                except SystemExit as exc:
+                    result["rc"] = exit_code(exc.code)
+                except StageTimeout:
+                    result["rc"] = TIMEOUT_RETURN_CODE
+                except BaseException:
+                    traceback.print_exc()
+                    result["rc"] = 1
+                finally:
+                    _HOSTED.runner = None
+
+            saved_argv = sys.argv
+            sys.argv = list(cmd[1:])
+            thread = threading.Thread(
+                target=target, name=f"stage-{module_name.rsplit('.', 1)[-1]}"
+            )
+            thread.daemon = True
+            try:
+                thread.start()
+                thread.join(timeout)
+                if thread.is_alive():
+                    _interrupt_thread(thread)
+                    thread.join(self.grace_seconds)
+                    if thread.is_alive():
+                        # 线程无法强制结束：后续阶段改回子进程，退出时不再等它
+                        self.abandoned.append(module_name)
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+            finally:
+                sys.argv = saved_argv
+            return result.get("rc", 1)
+
+    def close(self) -> None:
+        """Drop handed-off papers and the shared HTTP connection pool."""
+        with self._lock:
+            if self._active:
+                from src.utils.openai_client import close_shared_http_client
+
+                disable_stage_handoff()
+                close_shared_http_client()
+                self._active = False
@@ -0,0 +1,255 @@
+"""Local, deterministic text clustering for paper titles and abstracts.
+
+Papers are embedded as hashed bag-of-words TF-IDF vectors (unigrams plus
+adjacent bigrams) and grouped with spherical k-means on CPU.  Hashing uses a
+stable CRC32 bucket so vectors from different runs live in the same space,
+and k-means is seeded by farthest-point traversal, so the same input always
+produces the same groups.  Requires NumPy (``papertools[cluster-local]``).
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import zlib
+from collections import Counter
+from importlib import util as importlib_util
+from typing import Dict, List, Sequence, Tuple
+
+HASH_DIMENSIONS = 1 << 14
+TITLE_WEIGHT = 2
+MIN_CLUSTERS = 3
+MAX_CLUSTERS = 8
+KMEANS_MAX_ITERATIONS = 50
+
+# Tokens rendered upper-case in offline keyword names.
+ACRONYMS = frozenset(
+    "llm llms vlm vlms mllm mllms rag rl rlhf gui api apis cot nlp qa mcp".split()
+)
+
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9]*(?:-[a-z0-9]+)*")
+
+STOPWORDS = frozenset(
+    """
+    a about above across after again against all also among an and any are as at
+    based be been being between both but by can could do does done during each
+    either et for from further has have having here how however if in into is it
+    its itself may more most much must new no nor not novel of on only or other
+    our ours over own paper per propose proposed proposes present presents same
+    several should show shows shown significant significantly so some such than
+    that the their them then there these they this those through thus to toward
+    towards under until up upon us use used uses using via was we were what when
+    where whether which while who whose why will with within without work would
+    yet approach approaches method methods result results study studies task
+    tasks framework frameworks existing across achieve achieves demonstrate
+    demonstrates experiments extensive performance problem problems introduce
+    introduces well including however moreover furthermore first one two three
+    """.split()
+)
+
+
+def local_clustering_available() -> bool:
+    """Return whether NumPy is importable for the local clustering engine."""
+    try:
+        return importlib_util.find_spec("numpy") is not None
+    except (ImportError, ModuleNotFoundError, ValueError):
+        return False
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stopwords and very short tokens removed."""
+    return [
+        token
+        for token in _TOKEN_RE.findall((text or "").lower())
+        if len(token) > 2 and token not in STOPWORDS
+    ]
+
+
+def paper_terms(paper: Dict) -> List[str]:
+    """Return unigram and adjacent-bigram terms for a paper, title weighted."""
+    title_tokens = tokenize(paper.get("title", ""))
+    abstract = paper.get("summary", "") or paper.get("abstract", "") or ""
+    abstract_tokens = tokenize(abstract)
+
+    terms: List[str] = []
+    for tokens, weight in ((title_tokens, TITLE_WEIGHT), (abstract_tokens, 1)):
+        bigrams = [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        terms.extend((tokens + bigrams) * weight)
+    return terms
+
+
+def term_bucket(term: str) -> int:
+    """Stable hash bucket for a term (independent of PYTHONHASHSEED)."""
+    return zlib.crc32(term.encode("utf-8")) % HASH_DIMENSIONS
+
+
+def document_frequencies(term_lists: Sequence[List[str]]) -> Counter:
+    """Count in how many documents each term appears."""
+    df: Counter = Counter()
+    for terms in term_lists:
+        df.update(set(terms))
+    return df
+
+
+def vectorize(term_lists: Sequence[List[str]], df: Counter, n_docs: int):
+    """Build an L2-normalised hashed TF-IDF matrix (n_docs x HASH_DIMENSIONS)."""
+    import numpy as np
+
+    matrix = np.zeros((len(term_lists), HASH_DIMENSIONS), dtype=np.float64)
+    for row, terms in enumerate(term_lists):
+        for term, count in Counter(terms).items():
+            idf = math.log((1 + n_docs) / (1 + df.get(term, 0))) + 1.0
+            matrix[row, term_bucket(term)] += (1.0 + math.log(count)) * idf
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def paper_vectors(papers: Sequence[Dict]):
+    """Vectorize papers using document frequencies from the same set."""
+    term_lists = [paper_terms(paper) for paper in papers]
+    df = document_frequencies(term_lists)
+    return vectorize(term_lists, df, len(papers))
+
+
+def choose_cluster_count(n_docs: int) -> int:
+    """Pick k from the corpus size: about sqrt(n/2), clamped to [3, 8]."""
+    if n_docs <= 0:
+        return 0
+    k = int(round(math.sqrt(n_docs / 2)))
+    return max(1, min(n_docs, max(MIN_CLUSTERS, min(MAX_CLUSTERS, k))))
+
+
+def _normalize_rows(matrix):
+    import numpy as np
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _farthest_point_seeds(vectors, k: int) -> List[int]:
+    """Deterministic seeding: start near the corpus mean, then farthest-first."""
+    import numpy as np
+
+    mean = vectors.mean(axis=0)
+    seeds = [int(np.argmax(vectors @ mean))]
+    closest = vectors @ vectors[seeds[0]]
+    while len(seeds) < k:
+        candidate = int(np.argmin(closest))
+        if candidate in seeds:
+            break
+        seeds.append(candidate)
+        closest = np.maximum(closest, vectors @ vectors[candidate])
+    return seeds
+
+
+def spherical_kmeans(vectors, k: int) -> Tuple[List[int], object]:
+    """Cluster unit vectors by cosine similarity.
+
+    Returns ``(labels, centroids)`` with labels renumbered by first occurrence so
+    group ids follow input order.
+    """
+    import numpy as np
+
+    n_docs = vectors.shape[0]
+    if n_docs == 0 or k <= 0:
+        return [], np.zeros((0, vectors.shape[1] if vectors.ndim == 2 else 0))
+    seeds = _farthest_point_seeds(vectors, min(k, n_docs))
+    centroids = vectors[seeds].copy()
+    labels = np.zeros(n_docs, dtype=int)
+
+    for iteration in range(KMEANS_MAX_ITERATIONS):
+        new_labels = np.argmax(vectors @ centroids.T, axis=1)
+        if iteration and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        for cluster_id in range(centroids.shape[0]):
+            members = vectors[labels == cluster_id]
+            if len(members):
+                centroids[cluster_id] = members.sum(axis=0)
+        centroids = _normalize_rows(centroids)
+
+    remap: Dict[int, int] = {}
+    for label in labels.tolist():
+        remap.setdefault(label, len(remap))
+    ordered = [remap[label] for label in labels.tolist()]
+    ordered_centroids = np.zeros((len(remap), vectors.shape[1]))
+    for old, new in remap.items():
+        ordered_centroids[new] = centroids[old]
+    return ordered, ordered_centroids
+
+
+def nearest_groups(vectors, groups: Sequence[Sequence[int]], rows: Sequence[int]):
+    """Return, for each row, the index of the group with the closest centroid."""
+    import numpy as np
+
+    if not groups or not rows:
+        return []
+    centroids = _normalize_rows(
+        np.vstack([vectors[list(members)].sum(axis=0) for members in groups])
+    )
+    similarities = vectors[list(rows)] @ centroids.T
+    return [int(best) for best in np.argmax(similarities, axis=1)]
+
+
+def group_keywords(
+    term_lists: Sequence[List[str]],
+    indices: Sequence[int],
+    df: Counter,
+    n_docs: int,
+    limit: int = 5,
+) -> List[str]:
+    """Return the most distinctive terms of a group, preferring bigrams."""
+    counts: Counter = Counter()
+    doc_counts: Counter = Counter()
+    for index in indices:
+        counts.update(term_lists[index])
+        doc_counts.update(set(term_lists[index]))
+    scored = []
+    for term, count in counts.items():
+        # Skip terms carried by a single paper of a multi-paper group.
+        if doc_counts[term] < 2 and len(indices) > 1:
+            continue
+        idf = math.log((1 + n_docs) / (1 + df.get(term, 0))) + 1.0
+        bonus = 1.5 if " " in term else 1.0
+        scored.append((-(count * idf * bonus), term))
+    scored.sort()
+
+    keywords: List[str] = []
+    covered = set()
+    for _, term in scored:
+        words = set(term.split())
+        if words <= covered:
+            continue
+        keywords.append(term)
+        covered |= words
+        if len(keywords) >= limit:
+            break
+    return keywords
+
+
+def keyword_cluster_name(keywords: Sequence[str]) -> str:
+    """Readable offline name from group keywords, e.g. ``Tool Use & Planning``."""
+    if not keywords:
+        return "Other"
+    words = [
+        " ".join(
+            part.upper() if part in ACRONYMS else part.capitalize()
+            for part in keyword.split()
+        )
+        for keyword in keywords[:2]
+    ]
+    return " & ".join(words)
+
+
+def representative_indices(vectors, indices: Sequence[int], centroid, limit: int):
+    """Indices of the group members closest to the centroid, best first."""
+    import numpy as np
+
+    if not indices:
+        return []
+    members = np.asarray(list(indices))
+    scores = vectors[members] @ centroid
+    order = np.argsort(-scores, kind="stable")[:limit]
+    return [int(members[i]) for i in order]
@@ -0,0 +1,160 @@
+"""Process-wide cache of per-date user state with write-behind persistence.
+
+The local server keeps every ``<date>/.user_state.json`` it has touched in
+memory.  Reads are answered from memory and writes only update memory; a
+background thread writes changed files when ``flush_interval`` seconds have
+passed or ``max_pending`` changes have accumulated, so rapid clicking costs
+one atomic write per date instead of one per click.  :meth:`close` writes
+everything that is still pending and is called on shutdown.
+
+The store assumes it is the only writer of the state files while the server
+runs.  A failed write keeps the state pending and is retried on the next
+flush.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from src.utils.config import (
+    USER_STATE_FLUSH_INTERVAL,
+    USER_STATE_FLUSH_MAX_PENDING,
+)
+from src.utils.io import save_json
+
+State = Dict[str, Any]
+
+
+class UserStateStore:
+    """In-memory ``state file path -> state`` map with coalesced writes."""
+
+    def __init__(
+        self,
+        normalize: Callable[[Any], State],
+        *,
+        flush_interval: float = USER_STATE_FLUSH_INTERVAL,
+        max_pending: int = USER_STATE_FLUSH_MAX_PENDING,
+    ):
+        self.normalize = normalize
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._states: Dict[str, State] = {}
+        self._versions: Dict[str, int] = {}
+        self._flushed: Dict[str, int] = {}
+        self._path_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pending = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def _path_lock(self, path: str) -> threading.Lock:
+        with self._lock:
+            return self._path_locks.setdefault(path, threading.Lock())
+
+    def _ensure_loaded(self, path: str) -> None:
+        """Read a state file into memory; the caller holds its path lock."""
+        if path in self._states:
+            return
+        state: Any = None
+        try:
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+        except (OSError, ValueError):
+            state = None
+        self._states[path] = self.normalize(state)
+        with self._lock:
+            self._versions.setdefault(path, 0)
+            self._flushed.setdefault(path, 0)
+
+    def get(self, path: str) -> State:
+        """Return a copy of the state stored at ``path``."""
+        path = os.path.abspath(path)
+        with self._path_lock(path):
+            self._ensure_loaded(path)
+            return copy.deepcopy(self._states[path])
+
+    def update(self, path: str, mutate: Callable[[State], None]) -> State:
+        """Apply ``mutate`` to the state at ``path``; returns the new state.
+
+        The change is visible to readers immediately and written to disk by
+        a later flush.
+        """
+        path = os.path.abspath(path)
+        with self._path_lock(path):
+            self._ensure_loaded(path)
+            state = copy.deepcopy(self._states[path])
+            mutate(state)
+            state = self.normalize(state)
+            if state == self._states[path]:
+                return copy.deepcopy(state)
+            self._states[path] = state
+            with self._lock:
+                self._versions[path] += 1
+                self._pending += 1
+                wake = self._pending >= self.max_pending
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="user-state-flush", daemon=True
+                    )
+                    self._thread.start()
+        if wake:
+            self._wake.set()
+        return copy.deepcopy(state)
+
+    def pending_paths(self) -> List[str]:
+        """State files changed since they were last written."""
+        with self._lock:
+            return sorted(
+                path
+                for path, version in self._versions.items()
+                if version != self._flushed.get(path)
+            )
+
+    def flush(self) -> bool:
+        """Write every changed state file; False if any write failed."""
+        with self._flush_lock:
+            with self._lock:
+                self._pending = 0
+            ok = True
+            for path in self.pending_paths():
+                with self._path_lock(path):
+                    snapshot = copy.deepcopy(self._states[path])
+                    with self._lock:
+                        version = self._versions[path]
+                try:
+                    saved = save_json(path, snapshot, indent=2)
+                except Exception as exc:
+                    print(f"❌ 保存状态失败({path}): {exc}")
+                    saved = False
+                if not saved:
+                    ok = False
+                    continue
+                with self._lock:
+                    self._flushed[path] = max(self._flushed.get(path, 0), version)
+            return ok
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self) -> bool:
+        """Stop the background writer and write everything still pending."""
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            self._stopping = True
+            self._wake.set()
+            thread.join()
+            with self._lock:
+                self._thread = None
+            self._stopping = False
+        return self.flush()
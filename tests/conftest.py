@@ -0,0 +1,12 @@
+import pytest
+
+from src.utils import stage_metrics
+
+
+@pytest.fixture(autouse=True)
+def isolate_pipeline_metrics(tmp_path, monkeypatch):
+    """Keep pipeline runs in tests from writing metrics under the repo's logs/."""
+    monkeypatch.setenv("PAPERTOOLS_PIPELINE_METRICS_FILE", "off")
+    monkeypatch.setattr(
+        stage_metrics, "DEFAULT_REPORT_ROOT", str(tmp_path / "stage_metrics")
+    )
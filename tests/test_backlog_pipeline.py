@@ -0,0 +1,126 @@
+"""Tests for the pipelined multi-date backlog runner."""
+
+from __future__ import annotations
+
+import sys
+import threading
+
+from src.core import backlog_pipeline
+
+
+def test_run_backlog_prepares_next_date_during_summary() -> None:
+    events = []
+    next_prepared = threading.Event()
+
+    def run_phase(date, phase, phase_args):
+        events.append((phase, date, "start"))
+        if phase == "prepare" and date == "2026-06-02":
+            next_prepared.set()
+        if phase == "publish" and date == "2026-06-01":
+            # 第一天的总结只有在第二天准备完成后才结束，否则测试会超时失败
+            assert next_prepared.wait(5)
+        events.append((phase, date, "end"))
+        return 0, {"status": "ok"}
+
+    results = backlog_pipeline.run_backlog(
+        ["2026-06-01", "2026-06-02"], run_phase, lookahead=1
+    )
+
+    assert [r["status"] for r in results.values()] == ["ok", "ok"]
+    publish_order = [date for phase, date, step in events if phase == "publish"]
+    assert publish_order == ["2026-06-01", "2026-06-01", "2026-06-02", "2026-06-02"]
+    assert events.index(("prepare", "2026-06-02", "end")) < events.index(
+        ("publish", "2026-06-01", "end")
+    )
+
+
+def test_run_backlog_does_not_publish_skipped_or_failed_dates() -> None:
+    published = []
+    prepare_outcomes = {
+        "2026-06-01": (0, {"status": "skipped_no_selected_papers"}),
+        "2026-06-02": (1, {"status": "failed", "reason": "筛选失败"}),
+        "2026-06-03": (0, {"status": "ok", "stopped_after": "extract"}),
+    }
+
+    def run_phase(date, phase, phase_args):
+        if phase == "prepare":
+            assert phase_args == backlog_pipeline.PREPARE_ARGS
+            return prepare_outcomes[date]
+        assert phase_args == backlog_pipeline.PUBLISH_ARGS
+        published.append(date)
+        return 0, {"status": "partial"}
+
+    results = backlog_pipeline.run_backlog(list(prepare_outcomes), run_phase)
+
+    assert published == ["2026-06-03"]
+    assert results["2026-06-01"]["status"] == "skipped_no_selected_papers"
+    assert results["2026-06-02"] == {
+        "status": "failed",
+        "phase": "prepare",
+        "exit_code": 1,
+        "reason": "筛选失败",
+    }
+    assert results["2026-06-03"]["status"] == "partial"
+
+
+def test_run_backlog_continues_after_prepare_error() -> None:
+    def run_phase(date, phase, phase_args):
+        if date == "2026-06-01":
+            raise OSError("disk full")
+        return 0, {"status": "ok"}
+
+    results = backlog_pipeline.run_backlog(["2026-06-01", "2026-06-02"], run_phase)
+
+    assert results["2026-06-01"]["status"] == "failed"
+    assert results["2026-06-01"]["reason"] == "disk full"
+    assert results["2026-06-02"]["status"] == "ok"
+
+
+def test_run_backlog_continues_after_publish_error() -> None:
+    def run_phase(date, phase, phase_args):
+        if phase == "publish" and date == "2026-06-01":
+            raise OSError("disk full")
+        return 0, {"status": "ok"}
+
+    results = backlog_pipeline.run_backlog(
+        ["2026-06-01", "2026-06-02", "2026-06-03"], run_phase
+    )
+
+    assert results["2026-06-01"] == {
+        "status": "failed",
+        "phase": "publish",
+        "exit_code": 1,
+        "reason": "disk full",
+    }
+    assert results["2026-06-02"]["status"] == "ok"
+    assert results["2026-06-03"]["status"] == "ok"
+
+
+def test_phase_result_treats_nonzero_exit_without_status_as_failure() -> None:
+    assert backlog_pipeline.phase_result("publish", 124, {})["status"] == "failed"
+    assert backlog_pipeline.phase_result("publish", 0, {})["status"] == "missing"
+
+
+def test_main_skips_when_publish_lock_is_held(tmp_path, monkeypatch, capsys) -> None:
+    lock_file = tmp_path / "publish.lock"
+    monkeypatch.setenv("PAPERTOOLS_PUBLISH_LOCK_FILE", str(lock_file))
+    monkeypatch.setattr(sys, "argv", ["backlog_pipeline.py", "--dates", "2026-06-01"])
+    monkeypatch.setattr(
+        backlog_pipeline,
+        "run_backlog",
+        lambda *_args, **_kwargs: (_ for _ in ()).throw(AssertionError("ran")),
+    )
+
+    held = backlog_pipeline.acquire_publish_lock(str(lock_file))
+    try:
+        assert backlog_pipeline.main() == 0
+    finally:
+        held.close()
+
+    assert "跳过本次处理" in capsys.readouterr().out
+
+
+def test_main_rejects_invalid_dates(monkeypatch) -> None:
+    monkeypatch.setattr(sys, "argv", ["backlog_pipeline.py", "--dates", "2026-13-01"])
+
+    assert backlog_pipeline.main() == 2
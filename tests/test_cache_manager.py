@@ -8,6 +8,7 @@ import os
 import time
 from pathlib import Path
 
+from src.utils import cache_manager as cache_manager_module
 from src.utils.cache_manager import CacheManager
 
 
@@ -417,3 +418,81 @@ def test_cache_stats_reports_counts(tmp_path) -> None:
     assert stats["webpages"] == 1
     assert stats["crawl"] == 1
     assert stats["total"] == 5
+
+
+def test_cluster_cache_roundtrip_and_config_lookup(tmp_path) -> None:
+    """Cluster assignments are cached by fingerprint and listed by config."""
+
+    manager = CacheManager(cache_dir=str(tmp_path / "cache"))
+    config = {"engine": "llm", "models": ["m"], "prompt_version": "1"}
+
+    manager.set_cluster_cache(
+        "fp-1", config, ["2601.00001"], {"2601.00001": "Agents"}, {"Agent": "Agents"}
+    )
+
+    cached = manager.get_cluster_cache("fp-1")
+    assert cached["assignments"] == {"2601.00001": "Agents"}
+    assert cached["name_mapping"] == {"Agent": "Agents"}
+    assert manager.get_cluster_cache("fp-2") is None
+    assert [entry["fingerprint"] for entry in manager.find_cluster_caches(config)] == [
+        "fp-1"
+    ]
+    assert manager.find_cluster_caches({**config, "prompt_version": "2"}) == []
+    assert manager.get_cache_stats()["clusters"] == 1
+
+
+def test_cluster_cache_lookup_reads_only_the_newest_entries(
+    tmp_path, monkeypatch
+) -> None:
+    """Incremental lookups do not load every cluster cache on disk."""
+
+    monkeypatch.setattr(cache_manager_module, "CLUSTER_CACHE_SCAN_LIMIT", 2)
+    manager = CacheManager(cache_dir=str(tmp_path / "cache"))
+    config = {"engine": "llm", "models": ["m"], "prompt_version": "1"}
+    now = time.time()
+    for age, fingerprint in enumerate(["fp-new", "fp-mid", "fp-old"]):
+        arxiv_id = f"2601.0000{age}"
+        manager.set_cluster_cache(fingerprint, config, [arxiv_id], {arxiv_id: "Agents"})
+        cache_file = manager._get_cache_file(
+            "clusters", manager._generate_key(fingerprint)
+        )
+        os.utime(cache_file, (now - age * 60, now - age * 60))
+
+    assert [entry["fingerprint"] for entry in manager.find_cluster_caches(config)] == [
+        "fp-new",
+        "fp-mid",
+    ]
+
+
+def test_cluster_cache_rejects_incomplete_assignments(tmp_path) -> None:
+    """Entries that do not assign every paper are never written."""
+
+    manager = CacheManager(cache_dir=str(tmp_path / "cache"))
+
+    manager.set_cluster_cache(
+        "fp", {}, ["2601.00001", "2601.00002"], {"2601.00001": "A"}
+    )
+
+    assert manager.get_cluster_cache("fp") is None
+
+
+def test_search_cache_roundtrip_honors_its_own_ttl(tmp_path) -> None:
+    """Search responses are keyed by endpoint and params and expire by TTL."""
+
+    manager = CacheManager(cache_dir=str(tmp_path / "cache"))
+    endpoint = "https://api.openalex.org/works"
+    params = {"search": "agent memory", "per-page": 5}
+    manager.set_search_cache(endpoint, params, {"results": [{"id": "W1"}]})
+
+    assert manager.get_search_cache(endpoint, params, 3600) == {
+        "results": [{"id": "W1"}]
+    }
+    assert manager.get_search_cache(endpoint, {**params, "per-page": 6}, 3600) is None
+    assert manager.get_search_cache(endpoint, params, 0) is None
+
+    (cache_file,) = (tmp_path / "cache" / "search").glob("*.json")
+    old_timestamp = time.time() - 7200
+    os.utime(cache_file, (old_timestamp, old_timestamp))
+
+    assert manager.get_search_cache(endpoint, params, 3600) is None
+    assert manager.get_cache_stats()["search"] == 1
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.core import cluster_papers as cluster_module
+from src.utils import text_clustering
+from src.utils.cluster_taxonomy import ClusterTaxonomy
+
+
+MEMORY_PAPERS = [
+    {
+        "title": f"Long-term memory retrieval for conversational agents {i}",
+        "summary": "Episodic memory store with retrieval and memory consolidation.",
+    }
+    for i in range(3)
+]
+TOOL_PAPERS = [
+    {
+        "title": f"Tool calling benchmark for API agents {i}",
+        "summary": "Evaluating tool calling accuracy across API schemas and tool chains.",
+    }
+    for i in range(3)
+]
+
+
+def _seeded_taxonomy(path):
+    taxonomy = ClusterTaxonomy(str(path))
+    taxonomy.update("Agent Memory", text_clustering.paper_vectors(MEMORY_PAPERS))
+    return taxonomy
+
+
+def test_taxonomy_round_trips_sparse_centroids(tmp_path):
+    path = tmp_path / "cluster_taxonomy.json"
+    taxonomy = _seeded_taxonomy(path)
+
+    assert taxonomy.save()
+    stored = json.loads(path.read_text(encoding="utf-8"))
+    assert stored["clusters"][0]["name"] == "Agent Memory"
+    assert stored["clusters"][0]["count"] == 3
+    assert len(stored["clusters"][0]["buckets"]) <= 512
+
+    loaded = ClusterTaxonomy.load(str(path))
+    vectors = text_clustering.paper_vectors(MEMORY_PAPERS + TOOL_PAPERS)
+    assert loaded.assign(vectors, 0.3) == ["Agent Memory"] * 3 + [None] * 3
+
+
+def test_taxonomy_load_starts_empty_on_incompatible_file(tmp_path):
+    path = tmp_path / "cluster_taxonomy.json"
+    path.write_text(json.dumps({"version": 0, "clusters": []}), encoding="utf-8")
+
+    assert ClusterTaxonomy.load(str(path)).clusters == []
+
+
+def test_cluster_papers_sends_only_leftovers_to_the_llm(tmp_path, monkeypatch):
+    prompts = []
+
+    def fake_call(_client, _model, prompt, _temperature):
+        prompts.append(prompt)
+        return '{"names": {"0": "Tool Use", "1": "Tool Use", "2": "Tool Use"}}'
+
+    monkeypatch.setattr(cluster_module, "call_llm_for_clustering", fake_call)
+    taxonomy = _seeded_taxonomy(tmp_path / "cluster_taxonomy.json")
+
+    clustered = cluster_module.cluster_papers(
+        MEMORY_PAPERS + TOOL_PAPERS,
+        client=object(),
+        model="test-model",
+        temperature=0.1,
+        engine="local",
+        taxonomy=taxonomy,
+    )
+
+    assert [paper["cluster"] for paper in clustered] == (
+        ["Agent Memory"] * 3 + ["Tool Use"] * 3
+    )
+    assert len(prompts) == 1
+    assert "- Agent Memory" in prompts[0]
+    assert "Long-term memory" not in prompts[0]
+    assert taxonomy.names() == ["Agent Memory", "Tool Use"]
+    assert [cluster["count"] for cluster in taxonomy.clusters] == [6, 3]
+
+
+def test_llm_engine_offers_known_names_for_leftovers(tmp_path, monkeypatch):
+    prompts = []
+
+    def fake_call(_client, _model, prompt, _temperature):
+        prompts.append(prompt)
+        return '{"clusters": [{"name": "Agent Memory", "paper_indices": [0, 1, 2]}]}'
+
+    monkeypatch.setattr(cluster_module, "call_llm_for_clustering", fake_call)
+    taxonomy = _seeded_taxonomy(tmp_path / "cluster_taxonomy.json")
+
+    clustered = cluster_module.cluster_papers(
+        MEMORY_PAPERS + TOOL_PAPERS,
+        client=object(),
+        model="test-model",
+        temperature=0.1,
+        engine="llm",
+        taxonomy=taxonomy,
+    )
+
+    assert len(prompts) == 1
+    assert "reuse that name exactly:\n- Agent Memory" in prompts[0]
+    assert "Long-term memory" not in prompts[0]
+    assert [paper["cluster"] for paper in clustered] == ["Agent Memory"] * 6
+    assert taxonomy.names() == ["Agent Memory"]
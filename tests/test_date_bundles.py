@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+
+from src.utils.date_bundles import (
+    bundle_filename,
+    bundle_week,
+    encode_date_bundle,
+    plan_date_bundles,
+)
+from src.utils.published_data_version import encode_published_payload
+
+
+def test_plan_date_bundles_groups_iso_weeks_with_several_dates():
+    plan = plan_date_bundles(
+        ["2026-05-11", "2026-05-17", "2026-05-18", "2026-05-12", "2026-01-01"]
+    )
+
+    assert bundle_week("2026-05-17") == "2026-W20"
+    assert bundle_week("2026-05-18") == "2026-W21"
+    assert bundle_week("2021-01-01") == "2020-W53"
+    assert plan == {"2026-W20": ["2026-05-17", "2026-05-12", "2026-05-11"]}
+    assert bundle_filename("2026-W20") == "bundle-2026-W20.json"
+
+
+def test_encode_date_bundle_embeds_encoded_payloads_verbatim():
+    payloads = {
+        "2026-05-11": {"date": "2026-05-11", "title": "规划"},
+        "2026-05-12": {"date": "2026-05-12", "clusters": []},
+    }
+    content = encode_date_bundle(
+        {date: encode_published_payload(data) for date, data in payloads.items()}
+    )
+
+    assert json.loads(content) == {"dates": payloads}
+    assert encode_published_payload(payloads["2026-05-11"]) in content
+    assert list(json.loads(content)["dates"]) == ["2026-05-12", "2026-05-11"]
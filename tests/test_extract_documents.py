@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import extract_documents as extract_module
+from src.core import generate_summary as summary_module
+
+
+VALID_CONTENT = "Introduction\n" + ("agent planning memory tool use " * 80)
+
+
+class FakeExtractor:
+    def __init__(self, cached=None, extracted=None):
+        self.cached = dict(cached or {})
+        self.extracted = dict(extracted or {})
+        self.extract_calls = []
+
+    def get_cached_result(self, link):
+        content = self.cached.get(link)
+        if content is None:
+            return None
+        return SimpleNamespace(content=content, provider="cache")
+
+    def extract(self, link):
+        self.extract_calls.append(link)
+        content = self.extracted.get(link)
+        if content is None:
+            raise RuntimeError(f"cannot extract {link}")
+        self.cached[link] = content
+        return SimpleNamespace(content=content, provider="fake")
+
+
+def test_collect_paper_links_dedupes_and_skips_missing_links():
+    papers = [
+        {"link": "/arxiv/2606.00001"},
+        {"link": ""},
+        {"title": "no link"},
+        {"link": "/arxiv/2606.00001"},
+        {"link": "/arxiv/2606.00002"},
+    ]
+
+    assert extract_module.collect_paper_links(papers) == [
+        "/arxiv/2606.00001",
+        "/arxiv/2606.00002",
+    ]
+
+
+def test_resolve_extract_input_file_prefers_clustered_output(tmp_path):
+    filtered = tmp_path / "filtered_papers_2026-06-01.json"
+    clustered = tmp_path / "clustered_papers_2026-06-01.json"
+    filtered.write_text("[]", encoding="utf-8")
+
+    assert extract_module.resolve_extract_input_file(
+        None, "2026-06-01", str(tmp_path)
+    ) == str(filtered)
+
+    clustered.write_text("[]", encoding="utf-8")
+    assert extract_module.resolve_extract_input_file(
+        None, "2026-06-01", str(tmp_path)
+    ) == str(clustered)
+    assert (
+        extract_module.resolve_extract_input_file(None, "2026-06-02", str(tmp_path))
+        is None
+    )
+
+
+def test_prefetch_documents_records_progress_per_paper(tmp_path, monkeypatch):
+    extractor = FakeExtractor(
+        cached={"/arxiv/a": VALID_CONTENT},
+        extracted={"/arxiv/b": VALID_CONTENT},
+    )
+    monkeypatch.setattr(extract_module, "_WORKER_EXTRACTOR", extractor)
+    monkeypatch.setattr(extract_module, "SUMMARY_EXTRACTION_MAX_ATTEMPTS", 1)
+    progress_file = tmp_path / "extract_progress.json"
+
+    progress = extract_module.prefetch_documents(
+        ["/arxiv/a", "/arxiv/b", "/arxiv/c"],
+        max_workers=1,
+        progress_file=str(progress_file),
+        input_file="clustered_papers_2026-06-01.json",
+    )
+
+    assert progress["status"] == "failed"
+    assert progress["cached"] == 1
+    assert progress["extracted"] == 1
+    assert progress["completed"] == ["/arxiv/a", "/arxiv/b"]
+    assert list(progress["failed"]) == ["/arxiv/c"]
+    assert extractor.extract_calls == ["/arxiv/b", "/arxiv/c"]
+
+    persisted = json.loads(progress_file.read_text(encoding="utf-8"))
+    assert persisted["status"] == "failed"
+    assert persisted["total"] == 3
+    assert persisted["pid"] > 0
+    assert isinstance(persisted["heartbeat_at"], float)
+
+
+def test_prefetch_documents_refreshes_heartbeat_during_slow_extraction(
+    tmp_path, monkeypatch
+):
+    progress_file = tmp_path / "extract_progress.json"
+
+    class SlowExtractor(FakeExtractor):
+        def extract(self, link):
+            first = json.loads(progress_file.read_text(encoding="utf-8"))
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                current = json.loads(progress_file.read_text(encoding="utf-8"))
+                if current["heartbeat_at"] > first["heartbeat_at"]:
+                    return SimpleNamespace(content=VALID_CONTENT, provider="fake")
+                time.sleep(0.01)
+            raise RuntimeError("heartbeat was not refreshed")
+
+    monkeypatch.setattr(extract_module, "_WORKER_EXTRACTOR", SlowExtractor())
+    monkeypatch.setattr(extract_module, "SUMMARY_EXTRACTION_MAX_ATTEMPTS", 1)
+    monkeypatch.setattr(extract_module, "EXTRACTION_HEARTBEAT_SECONDS", 0.02)
+
+    progress = extract_module.prefetch_documents(
+        ["/arxiv/a"], max_workers=1, progress_file=str(progress_file)
+    )
+
+    assert progress["status"] == "ok"
+
+
+def _dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_extraction_progress_is_stale_for_dead_pid_or_old_heartbeat():
+    now = time.time()
+    alive = {"status": "running", "pid": os.getpid(), "heartbeat_at": now}
+
+    assert not extract_module.extraction_progress_is_stale(alive)
+    assert extract_module.extraction_progress_is_stale({**alive, "pid": _dead_pid()})
+    assert extract_module.extraction_progress_is_stale(
+        {**alive, "heartbeat_at": now - 600}
+    )
+    # 已结束的进度和旧格式（无 pid/心跳）的进度都不算失联
+    assert not extract_module.extraction_progress_is_stale(
+        {"status": "ok", "pid": _dead_pid(), "heartbeat_at": now - 600}
+    )
+    assert not extract_module.extraction_progress_is_stale({"status": "running"})
+
+
+def test_wait_for_prefetched_content_returns_cached_content(tmp_path):
+    progress_file = tmp_path / "extract_progress.json"
+    progress_file.write_text(json.dumps({"status": "running"}), encoding="utf-8")
+    extractor = FakeExtractor(cached={"/arxiv/a": VALID_CONTENT})
+
+    content = summary_module.wait_for_prefetched_content(
+        extractor, "/arxiv/a", str(progress_file), timeout_seconds=1, poll_interval=0
+    )
+
+    assert content == VALID_CONTENT
+
+
+def test_wait_for_prefetched_content_stops_when_extract_stage_gives_up(tmp_path):
+    progress_file = tmp_path / "extract_progress.json"
+    progress_file.write_text(
+        json.dumps({"status": "running", "failed": {"/arxiv/a": "boom"}}),
+        encoding="utf-8",
+    )
+
+    content = summary_module.wait_for_prefetched_content(
+        FakeExtractor(), "/arxiv/a", str(progress_file), timeout_seconds=60
+    )
+
+    assert content is None
+
+
+def test_wait_for_prefetched_content_is_disabled_without_progress_file():
+    extractor = FakeExtractor(cached={"/arxiv/a": VALID_CONTENT})
+
+    assert (
+        summary_module.wait_for_prefetched_content(extractor, "/arxiv/a", None) is None
+    )
+
+
+def test_wait_for_prefetched_content_respects_summary_budget(tmp_path, monkeypatch):
+    progress_file = tmp_path / "extract_progress.json"
+    progress_file.write_text(json.dumps({"status": "running"}), encoding="utf-8")
+    monkeypatch.setattr(summary_module, "summary_budget_exceeded", lambda: True)
+
+    with pytest.raises(summary_module.SummaryBudgetExceeded):
+        summary_module.wait_for_prefetched_content(
+            FakeExtractor(), "/arxiv/a", str(progress_file), timeout_seconds=60
+        )
+
+
+def test_wait_for_prefetched_content_stops_when_extract_process_died(tmp_path):
+    progress_file = tmp_path / "extract_progress.json"
+    progress_file.write_text(
+        json.dumps(
+            {"status": "running", "pid": _dead_pid(), "heartbeat_at": time.time()}
+        ),
+        encoding="utf-8",
+    )
+
+    started = time.monotonic()
+    content = summary_module.wait_for_prefetched_content(
+        FakeExtractor(), "/arxiv/a", str(progress_file), timeout_seconds=60
+    )
+
+    assert content is None
+    assert time.monotonic() - started < 5
@@ -0,0 +1,75 @@
+"""Import-time regression checks based on ``python -X importtime``.
+
+Every stage runs in its own process, so anything a module imports at top
+level is paid again on each ``papertools`` command and each stage.  These
+tests import the entry points in a fresh interpreter and check which heavy
+packages end up in the import tree and how long the import takes.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# 包名 -> 只有真正用到它的模块才应该在顶层导入
+HEAVY_PACKAGES = ("openai", "requests", "bs4", "tqdm")
+# 累计导入耗时上限（秒）；远高于实测值，只拦截把重依赖拖回顶层的改动
+IMPORT_BUDGET_SECONDS = 1.0
+
+
+def import_times(module: str) -> Dict[str, float]:
+    """Cumulative import time in seconds of every module ``module`` pulls in."""
+    env = dict(os.environ)
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if cumulative_us.strip().isdigit():
+            times[name.strip()] = int(cumulative_us) / 1_000_000
+    return times
+
+
+@pytest.mark.parametrize(
+    ("module", "allowed"),
+    [
+        ("papertools", ()),
+        ("src.core.pipeline", ()),
+        ("src.core.backlog_pipeline", ()),
+        ("src.core.serve_webpages", ()),
+        ("src.utils.retry", ("requests",)),
+        ("src.core.crawl_arxiv", ("requests", "bs4", "tqdm")),
+    ],
+)
+def test_entry_points_do_not_import_unused_heavy_packages(module, allowed) -> None:
+    times = import_times(module)
+
+    unexpected = [
+        package
+        for package in HEAVY_PACKAGES
+        if package in times and package not in allowed
+    ]
+    assert unexpected == [], f"{module} imports {unexpected} at module level"
+
+
+@pytest.mark.parametrize("module", ["papertools", "src.core.pipeline"])
+def test_cli_entry_points_import_within_budget(module) -> None:
+    times = import_times(module)
+
+    assert times[module] < IMPORT_BUDGET_SECONDS
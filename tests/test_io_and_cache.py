@@ -6,7 +6,14 @@ from types import SimpleNamespace
 from unittest.mock import patch
 
 from src.utils.cache_manager import CacheManager
-from src.utils.io import save_json, save_text
+from src.utils.io import (
+    disable_stage_handoff,
+    enable_stage_handoff,
+    load_stage_input,
+    remember_stage_output,
+    save_json,
+    save_text,
+)
 
 
 class IoAndCacheTests(unittest.TestCase):
@@ -60,6 +67,31 @@ class IoAndCacheTests(unittest.TestCase):
 
             self.assertFalse(target.exists())
 
+    def test_stage_handoff_reuses_saved_papers_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "papers.json"
+            papers = [{"arxiv_id": "2601.00001"}]
+            save_json(str(target), papers)
+            remember_stage_output(str(target), papers)
+            self.assertEqual(load_stage_input(str(target)), papers)
+            self.assertIsNot(load_stage_input(str(target)), papers)
+
+            enable_stage_handoff()
+            try:
+                remember_stage_output(str(target), papers)
+                self.assertIs(load_stage_input(str(target), consume=False), papers)
+                self.assertIs(load_stage_input(str(target)), papers)
+                self.assertIsNot(load_stage_input(str(target)), papers)
+
+                remember_stage_output(str(target), papers)
+                target.write_text('[{"arxiv_id": "2601.00002", "x": 1}]')
+                self.assertEqual(
+                    load_stage_input(str(target)),
+                    [{"arxiv_id": "2601.00002", "x": 1}],
+                )
+            finally:
+                disable_stage_handoff()
+
     def test_cache_manager_persists_summary_cache(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = CacheManager(cache_dir=tmpdir)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 from types import SimpleNamespace
-import builtins
+import importlib.util
 
 import pytest
 
@@ -105,15 +105,15 @@ def test_main_returns_serve_exit_code(monkeypatch):
 
 
 def test_missing_dependencies_do_not_auto_install_by_default(monkeypatch):
-    real_import = builtins.__import__
+    real_find_spec = importlib.util.find_spec
     install_calls = []
 
-    def fake_import(name, *args, **kwargs):
+    def fake_find_spec(name, *args, **kwargs):
         if name == "openai":
-            raise ImportError("missing openai")
-        return real_import(name, *args, **kwargs)
+            return None
+        return real_find_spec(name, *args, **kwargs)
 
-    monkeypatch.setattr(builtins, "__import__", fake_import)
+    monkeypatch.setattr(importlib.util, "find_spec", fake_find_spec)
     monkeypatch.setattr(
         papertools.subprocess,
         "check_call",
@@ -125,15 +125,15 @@ def test_missing_dependencies_do_not_auto_install_by_default(monkeypatch):
 
 
 def test_missing_dependencies_install_only_when_explicitly_requested(monkeypatch):
-    real_import = builtins.__import__
+    real_find_spec = importlib.util.find_spec
     install_calls = []
 
-    def fake_import(name, *args, **kwargs):
+    def fake_find_spec(name, *args, **kwargs):
         if name == "openai":
-            raise ImportError("missing openai")
-        return real_import(name, *args, **kwargs)
+            return None
+        return real_find_spec(name, *args, **kwargs)
 
-    monkeypatch.setattr(builtins, "__import__", fake_import)
+    monkeypatch.setattr(importlib.util, "find_spec", fake_find_spec)
     monkeypatch.setattr(
         papertools.subprocess,
         "check_call",
@@ -175,3 +175,112 @@ def test_check_python_version_accepts_declared_floor(monkeypatch):
     monkeypatch.setattr(papertools.sys, "version_info", (3, 10, 0))
 
     papertools.check_python_version()
+
+
+def test_extract_command_runs_extract_stage(monkeypatch):
+    calls = []
+
+    def fake_run(cmd):
+        calls.append(cmd)
+        return SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr(
+        sys, "argv", ["papertools.py", "extract", "--date", "2026-06-01"]
+    )
+    monkeypatch.setattr(papertools, "check_python_version", lambda: None)
+    monkeypatch.setattr(papertools.subprocess, "run", fake_run)
+
+    assert papertools.main() == 0
+    assert calls == [
+        [sys.executable, "src/core/extract_documents.py", "--date", "2026-06-01"]
+    ]
+
+
+def test_run_dates_uses_backlog_pipeline(monkeypatch):
+    calls = []
+
+    def fake_run(cmd):
+        calls.append(cmd)
+        return SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["papertools.py", "run", "--dates", "2026-06-01", "2026-06-02"],
+    )
+    monkeypatch.setattr(papertools, "check_python_version", lambda: None)
+    monkeypatch.setattr(papertools, "check_and_install_dependencies", lambda: True)
+    monkeypatch.setattr(papertools, "check_config", lambda: True)
+    monkeypatch.setattr(papertools.subprocess, "run", fake_run)
+
+    assert papertools.main() == 0
+    assert calls[0][:5] == [
+        sys.executable,
+        "src/core/backlog_pipeline.py",
+        "--dates",
+        "2026-06-01",
+        "2026-06-02",
+    ]
+    assert "--max-papers-total" in calls[0]
+
+
+def test_profile_report_prints_hot_spots_per_stage(tmp_path, monkeypatch, capsys):
+    from src.utils.profiling import PROFILE_DIR_ENV, PROFILE_ENV, profiled
+
+    monkeypatch.setenv(PROFILE_ENV, "1")
+    monkeypatch.setenv(PROFILE_DIR_ENV, str(tmp_path))
+    profiled("cluster_papers")(lambda: sorted(range(1000)))()
+    monkeypatch.setattr(
+        sys, "argv", ["papertools.py", "profile", "report", "--top", "5"]
+    )
+    monkeypatch.setattr(papertools, "check_python_version", lambda: None)
+
+    assert papertools.main() == 0
+    assert "cluster_papers: 1 次运行" in capsys.readouterr().out
+
+
+def test_profile_report_fails_without_profiles(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["papertools.py", "profile", "report", "--dir", str(tmp_path)],
+    )
+    monkeypatch.setattr(papertools, "check_python_version", lambda: None)
+
+    assert papertools.main() == 1
+
+
+def _run_dates_cli(monkeypatch, *extra):
+    calls = []
+
+    def fake_run(cmd):
+        calls.append(cmd)
+        return SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr(
+        sys, "argv", ["papertools.py", "run", "--dates", "2026-06-01", *extra]
+    )
+    monkeypatch.setattr(papertools, "check_python_version", lambda: None)
+    monkeypatch.setattr(papertools, "check_and_install_dependencies", lambda: True)
+    monkeypatch.setattr(papertools, "check_config", lambda: True)
+    monkeypatch.setattr(papertools.subprocess, "run", fake_run)
+    return papertools.main(), calls
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [("--start-from", "summary"), ("--skip-summary",), ("--skip-unified",)],
+)
+def test_run_dates_rejects_stage_selection_flags(monkeypatch, extra):
+    returncode, calls = _run_dates_cli(monkeypatch, *extra)
+
+    assert returncode == 2
+    assert calls == []
+
+
+def test_run_dates_forwards_prepare_skip_flags(monkeypatch):
+    returncode, calls = _run_dates_cli(monkeypatch, "--skip-crawl", "--skip-extract")
+
+    assert returncode == 0
+    assert "--skip-crawl" in calls[0]
+    assert "--skip-extract" in calls[0]
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import json
 import os
 import subprocess
+import sys
 import time
+import types
 
 import pytest
 
 from src.core import cluster_papers as cluster_module
+from src.core import paper_filter as filter_module
 from src.core import pipeline as pipeline_module
 from src.core.generate_summary import has_non_empty_text
 from src.core.generate_unified_index import backfill_paper_metadata
@@ -19,6 +23,8 @@ from src.core.pipeline import (
     select_cluster_output_file,
     validate_webpages_for_publication,
 )
+from src.utils import stage_runner as stage_runner_module
+from src.utils.cache_manager import CacheManager
 
 
 def _write_json(path) -> None:
@@ -319,6 +325,106 @@ def test_cluster_model_fallback_skips_invalid_model(monkeypatch) -> None:
     assert "bad-model" in cluster_module._DISABLED_CLUSTER_MODELS
 
 
+def test_cluster_papers_runs_batches_concurrently_in_offset_order(
+    monkeypatch,
+) -> None:
+    def fake_call(_client, _model, prompt, _temperature):
+        # The first batch finishes last so completion order differs from offset order.
+        if "Paper 0" in prompt:
+            time.sleep(0.05)
+            name = "First"
+        elif "Paper 2" in prompt:
+            name = "Second"
+        else:
+            name = "Third"
+        return '{"clusters": [{"name": "%s", "paper_indices": [0, 1]}]}' % name
+
+    monkeypatch.setattr(cluster_module, "BATCH_SIZE", 2)
+    monkeypatch.setattr(cluster_module, "call_llm_for_clustering", fake_call)
+    papers = [{"title": f"Paper {i}", "summary": "Abstract"} for i in range(5)]
+
+    clustered = cluster_module.cluster_papers(
+        papers,
+        client=None,
+        model="test-model",
+        temperature=0.1,
+        max_workers=3,
+        engine="llm",
+    )
+
+    assert [paper["cluster"] for paper in clustered] == [
+        "First",
+        "First",
+        "Second",
+        "Second",
+        "Third",
+    ]
+
+
+def test_cluster_papers_fails_closed_when_any_batch_fails(monkeypatch) -> None:
+    def fake_call(_client, _model, prompt, _temperature):
+        if "Paper 2" in prompt:
+            raise RuntimeError("upstream timeout")
+        return '{"clusters": [{"name": "Agents", "paper_indices": [0, 1]}]}'
+
+    monkeypatch.setattr(cluster_module, "BATCH_SIZE", 2)
+    monkeypatch.setattr(cluster_module, "call_llm_for_clustering", fake_call)
+    papers = [{"title": f"Paper {i}", "summary": "Abstract"} for i in range(4)]
+
+    with pytest.raises(RuntimeError, match="clustering batch failed"):
+        cluster_module.cluster_papers(
+            papers,
+            client=None,
+            model="test-model",
+            temperature=0.1,
+            max_workers=2,
+            engine="llm",
+        )
+
+
+def test_cluster_papers_reuses_cached_assignments(tmp_path, monkeypatch) -> None:
+    prompts = []
+
+    def fake_call(_client, _model, prompt, _temperature):
+        prompts.append(prompt)
+        indices = list(range(prompt.count("\n[") + 1))
+        return '{"clusters": [{"name": "Agents", "paper_indices": %s}]}' % indices
+
+    monkeypatch.setattr(cluster_module, "call_llm_for_clustering", fake_call)
+    monkeypatch.setattr(cluster_module, "local_clustering_available", lambda: False)
+    cache_manager = CacheManager(cache_dir=str(tmp_path / "cache"))
+    papers = [
+        {"arxiv_id": f"2606.0000{i}", "title": f"Paper {i}", "summary": "Abstract"}
+        for i in range(5)
+    ]
+
+    def run(paper_list):
+        return cluster_module.cluster_papers(
+            paper_list,
+            client=None,
+            model="test-model",
+            temperature=0.1,
+            engine="llm",
+            cache_manager=cache_manager,
+        )
+
+    run(papers)
+    assert len(prompts) == 1
+
+    rerun = run(papers)
+    assert len(prompts) == 1
+    assert {paper["cluster"] for paper in rerun} == {"Agents"}
+
+    added = papers + [
+        {"arxiv_id": "2606.00009", "title": "Paper 9", "summary": "Abstract"}
+    ]
+    incremental = run(added)
+    assert len(prompts) == 2
+    assert "Paper 9" in prompts[1]
+    assert "Paper 0" not in prompts[1]
+    assert incremental[-1]["cluster"] == "Agents"
+
+
 def test_validate_webpages_for_publication_blocks_missing_validator(
     tmp_path, monkeypatch
 ) -> None:
@@ -395,6 +501,46 @@ def test_pipeline_status_write_failure_preserves_nonzero_exit(
     assert exit_code == 2
 
 
+def test_pipeline_rejects_stop_after_before_start_from(tmp_path, monkeypatch) -> None:
+    status_file = tmp_path / "status.json"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "pipeline.py",
+            "--start-from",
+            "summary",
+            "--stop-after",
+            "filter",
+            "--status-file",
+            str(status_file),
+        ],
+    )
+
+    assert pipeline_module.main() == 2
+    assert "--stop-after filter" in status_file.read_text(encoding="utf-8")
+
+
+def test_pipeline_records_metrics_in_status_and_history(tmp_path, monkeypatch) -> None:
+    status_file = tmp_path / "status.json"
+    history = tmp_path / "metrics.jsonl"
+    monkeypatch.setenv("PAPERTOOLS_PIPELINE_METRICS_FILE", str(history))
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["pipeline.py", "--max-workers", "0", "--status-file", str(status_file)],
+    )
+
+    assert pipeline_module.main() == 2
+
+    status = json.loads(status_file.read_text(encoding="utf-8"))
+    assert status["metrics"]["stages"] == []
+    (line,) = history.read_text(encoding="utf-8").splitlines()
+    record = json.loads(line)
+    assert record["status"] == "failed"
+    assert record["metrics"] == status["metrics"]
+
+
 def test_pipeline_stage_timeout_default_and_disable(monkeypatch) -> None:
     monkeypatch.delenv("PAPERTOOLS_PIPELINE_STAGE_TIMEOUT_SECONDS", raising=False)
     assert pipeline_module.pipeline_stage_timeout_seconds() == 21600.0
@@ -495,6 +641,162 @@ def test_run_command_timeout_is_stage_failure(monkeypatch, capsys) -> None:
     assert "超时" in capsys.readouterr().out
 
 
+def _fake_stage(monkeypatch, main):
+    module = types.ModuleType("fake_pipeline_stage")
+    module.main = main
+    monkeypatch.setitem(sys.modules, "fake_pipeline_stage", module)
+    monkeypatch.setitem(
+        stage_runner_module.STAGE_MODULES, "src/core/fake_stage.py", module.__name__
+    )
+    return [sys.executable, "src/core/fake_stage.py", "--flag", "value"]
+
+
+def test_in_process_runner_calls_stage_main_with_argv(monkeypatch) -> None:
+    seen = []
+
+    def main():
+        seen.append(list(sys.argv))
+        raise SystemExit(3)
+
+    cmd = _fake_stage(monkeypatch, main)
+    runner = stage_runner_module.InProcessStageRunner()
+
+    assert runner.can_run(cmd, None)
+    assert runner.run(cmd, timeout=5) == 3
+    assert seen == [["src/core/fake_stage.py", "--flag", "value"]]
+    assert sys.argv[1:2] != ["--flag"]
+    runner.close()
+
+
+def test_in_process_runner_refuses_differing_env_and_unknown_scripts(
+    monkeypatch,
+) -> None:
+    cmd = _fake_stage(monkeypatch, lambda: 0)
+    runner = stage_runner_module.InProcessStageRunner()
+
+    assert runner.can_run(cmd, dict(os.environ))
+    assert not runner.can_run(cmd, {**os.environ, "OPENAI_API_KEY": "other-key"})
+    assert not runner.can_run([sys.executable, "src/core/other.py"], None)
+    assert not runner.can_run(["python3", "src/core/fake_stage.py"], None)
+
+
+def test_in_process_runner_watchdog_interrupts_overrunning_stage(monkeypatch) -> None:
+    finished = []
+
+    def main():
+        try:
+            while True:
+                time.sleep(0.01)
+        finally:
+            finished.append(True)
+
+    cmd = _fake_stage(monkeypatch, main)
+    runner = stage_runner_module.InProcessStageRunner(grace_seconds=5)
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        runner.run(cmd, timeout=0.1)
+    assert finished == [True]
+    assert runner.abandoned == []
+    assert runner.can_run(cmd, None)
+
+
+def test_run_command_rc_uses_in_process_runner_when_enabled(monkeypatch) -> None:
+    def fake_run(*_args, **_kwargs):
+        raise AssertionError("subprocess should not run")
+
+    cmd = _fake_stage(monkeypatch, lambda: 3)
+    monkeypatch.setenv("PAPERTOOLS_PIPELINE_RUNNER", "inprocess")
+    monkeypatch.setattr(pipeline_module.subprocess, "run", fake_run)
+
+    try:
+        assert pipeline_module.run_command_rc(cmd, "fake stage") == 3
+        assert not pipeline_module.run_command(cmd, "fake stage")
+    finally:
+        pipeline_module.STAGE_RUNNER.close()
+
+
+def test_run_command_falls_back_to_subprocess_for_env_overrides(monkeypatch) -> None:
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0)
+
+    cmd = _fake_stage(monkeypatch, lambda: 1)
+    monkeypatch.setenv("PAPERTOOLS_PIPELINE_RUNNER", "inprocess")
+    monkeypatch.setattr(pipeline_module.subprocess, "run", fake_run)
+
+    env = pipeline_module.build_subprocess_env({"OPENAI_API_KEY": "stage-only-key"})
+    assert pipeline_module.run_command(cmd, "fake stage", env=env)
+    assert calls == [cmd]
+
+
+def _default_pipeline_args(**overrides):
+    """The client settings ``pipeline.py`` parses when no flag is given."""
+    values = {
+        "api_key": pipeline_module.API_KEY,
+        "base_url": pipeline_module.BASE_URL,
+        "summary_api_key": pipeline_module.SUMMARY_API_KEY,
+        "summary_base_url": pipeline_module.SUMMARY_BASE_URL,
+        "summary_sjtu_api_key": pipeline_module.SUMMARY_SJTU_API_KEY,
+        "summary_sjtu_base_url": pipeline_module.SUMMARY_SJTU_BASE_URL,
+        "summary_prism_api_key": pipeline_module.SUMMARY_PRISM_API_KEY,
+        "summary_prism_base_url": pipeline_module.SUMMARY_PRISM_BASE_URL,
+    }
+    values.update(overrides)
+    return types.SimpleNamespace(**values)
+
+
+def test_llm_stages_with_default_config_run_in_process(monkeypatch) -> None:
+    monkeypatch.setenv("PAPERTOOLS_PIPELINE_RUNNER", "inprocess")
+    args = _default_pipeline_args()
+    stages = [
+        ("src/core/paper_filter.py", pipeline_module.filter_stage_env(args)),
+        ("src/core/cluster_papers.py", pipeline_module.cluster_stage_env()),
+        ("src/core/generate_summary.py", pipeline_module.summary_stage_env(args)),
+    ]
+
+    for script, env in stages:
+        cmd = [sys.executable, script, "--output-dir", "domain_paper"]
+        assert pipeline_module.runs_in_process(cmd, env), script
+
+    explicit = pipeline_module.filter_stage_env(
+        _default_pipeline_args(api_key="explicit-stage-key")
+    )
+    cmd = [sys.executable, "src/core/paper_filter.py"]
+    assert explicit["OPENAI_API_KEY"] == "explicit-stage-key"
+    assert not pipeline_module.runs_in_process(cmd, explicit)
+
+
+def test_summary_stage_env_passes_prism_settings_to_reviewgrounder(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(pipeline_module, "REVIEWGROUNDER_ENABLED", True)
+    monkeypatch.setitem(
+        pipeline_module.STAGE_CONFIG_ENV,
+        "REVIEWGROUNDER_BASE_URL",
+        "https://api.openai.com/v1",
+    )
+    monkeypatch.delenv("REVIEWGROUNDER_BASE_URL", raising=False)
+    args = _default_pipeline_args(summary_prism_base_url="https://prism.example/v1")
+
+    env = pipeline_module.summary_stage_env(args)
+    assert env["REVIEWGROUNDER_BASE_URL"] == "https://prism.example/v1"
+
+    monkeypatch.setenv("REVIEWGROUNDER_BASE_URL", "https://api.openai.com/v1")
+    env = pipeline_module.summary_stage_env(args)
+    assert env["REVIEWGROUNDER_BASE_URL"] == "https://api.openai.com/v1"
+
+
+def test_pipeline_stage_runner_defaults_to_subprocess(monkeypatch, capsys) -> None:
+    monkeypatch.delenv("PAPERTOOLS_PIPELINE_RUNNER", raising=False)
+    assert pipeline_module.pipeline_stage_runner() == "subprocess"
+
+    monkeypatch.setenv("PAPERTOOLS_PIPELINE_RUNNER", "threads")
+    assert pipeline_module.pipeline_stage_runner() == "subprocess"
+    assert "PAPERTOOLS_PIPELINE_RUNNER" in capsys.readouterr().out
+
+
 def test_run_interactive_command_uses_check_without_stage_timeout(monkeypatch) -> None:
     calls = []
     monkeypatch.setenv("PAPERTOOLS_PIPELINE_STAGE_TIMEOUT_SECONDS", "3")
@@ -570,3 +872,69 @@ def test_validate_webpages_for_publication_runs_release_validator(
             None,
         )
     ]
+
+
+def test_remove_extract_progress_files_keeps_other_live_runs(tmp_path):
+    own = tmp_path / "extract_progress_2026-06-01_100.json"
+    other_lane = tmp_path / "extract_progress_2026-06-02_100.json"
+    leftover = tmp_path / "extract_progress_2026-05-01_100.json"
+    for path in (own, other_lane, leftover):
+        path.write_text("{}", encoding="utf-8")
+    old = time.time() - pipeline_module.EXTRACT_PROGRESS_MAX_AGE_SECONDS - 60
+    os.utime(leftover, (old, old))
+
+    pipeline_module.remove_extract_progress_files(str(own), logs_dir=str(tmp_path))
+
+    assert not own.exists()
+    assert not leftover.exists()
+    # 并行的另一条流水线可能仍在读取自己的进度文件
+    assert other_lane.exists()
+
+
+def test_in_process_filter_with_timeouts_returns_instead_of_exiting(
+    tmp_path, monkeypatch
+) -> None:
+    def timed_out(title, summary):
+        raise filter_module.OpenAIError("Request timed out.")
+
+    def no_hard_exit(code):
+        raise AssertionError(f"os._exit({code}) would kill the pipeline process")
+
+    monkeypatch.setattr(filter_module, "evaluate_topic_heuristic", timed_out)
+    monkeypatch.setattr(filter_module, "ENABLE_CACHE", False)
+    monkeypatch.setattr(filter_module, "REQUEST_DELAY", 0)
+    monkeypatch.setattr(stage_runner_module.os, "_exit", no_hard_exit)
+    input_file = tmp_path / "papers_2026-06-01.json"
+    input_file.write_text(
+        json.dumps(
+            [
+                {
+                    "arxiv_id": "2606.00001",
+                    "title": "LLM agents that time out",
+                    "summary": "An LLM agent paper.",
+                }
+            ]
+        ),
+        encoding="utf-8",
+    )
+    status_file = tmp_path / "filter_status.json"
+    cmd = [
+        sys.executable,
+        "src/core/paper_filter.py",
+        "--input-file",
+        str(input_file),
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--api-key",
+        "test-key",
+        "--max-workers",
+        "1",
+        "--status-file",
+        str(status_file),
+    ]
+    runner = stage_runner_module.InProcessStageRunner()
+
+    assert runner.run(cmd, timeout=60) == 1
+    assert runner.lingering == ["src.core.paper_filter"]
+    assert json.loads(status_file.read_text(encoding="utf-8"))["timed_out_count"] == 1
+    runner.close()
@@ -0,0 +1,74 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils import profiling
+from src.utils.profiling import find_profiles, profiled, summarize_profiles
+
+
+def _busy_stage() -> int:
+    return sum(i * i for i in range(20000))
+
+
+def test_profiled_stage_is_untouched_when_profiling_is_off(tmp_path, monkeypatch):
+    monkeypatch.delenv(profiling.PROFILE_ENV, raising=False)
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV, str(tmp_path))
+
+    assert profiled("paper_filter")(_busy_stage)() == _busy_stage()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profiled_stage_writes_pstats_per_date(tmp_path, monkeypatch):
+    monkeypatch.setenv(profiling.PROFILE_ENV, "1")
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV, str(tmp_path))
+    monkeypatch.setenv(profiling.PROFILE_DATE_ENV, "2026-06-01")
+
+    main = profiled("generate_summary")(_busy_stage)
+    main()
+    main()
+
+    grouped = find_profiles(str(tmp_path), date="2026-06-01")
+    assert list(grouped) == ["generate_summary"]
+    assert len(grouped["generate_summary"]) == 2
+    assert all(
+        path.startswith(str(tmp_path / "2026-06-01"))
+        for path in grouped["generate_summary"]
+    )
+
+
+def test_summarize_profiles_merges_runs_and_ranks_hot_spots(tmp_path, monkeypatch):
+    monkeypatch.setenv(profiling.PROFILE_ENV, "1")
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV, str(tmp_path))
+    main = profiled("paper_filter")(_busy_stage)
+    main()
+    main()
+    (paths,) = find_profiles(str(tmp_path), stage="paper_filter").values()
+
+    summary = summarize_profiles(paths, sort="cumulative", top=3)
+
+    assert summary["runs"] == 2
+    assert len(summary["hot_spots"]) == 3
+    assert "_busy_stage" in summary["hot_spots"][0]["function"]
+    cumtimes = [row["cumtime"] for row in summary["hot_spots"]]
+    assert cumtimes == sorted(cumtimes, reverse=True)
+
+
+def _pooled_work(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def _threaded_stage() -> int:
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return sum(executor.map(_pooled_work, [20000, 20000, 20000]))
+
+
+def test_profiled_stage_includes_thread_pool_workers(tmp_path, monkeypatch):
+    monkeypatch.setenv(profiling.PROFILE_ENV, "1")
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV, str(tmp_path))
+
+    profiled("paper_filter")(_threaded_stage)()
+    (paths,) = find_profiles(str(tmp_path), stage="paper_filter").values()
+
+    summary = summarize_profiles(paths, sort="cumulative", top=200)
+    pooled = [row for row in summary["hot_spots"] if "_pooled_work" in row["function"]]
+    assert pooled and pooled[0]["ncalls"] == 3
+    assert threading.getprofile() is None
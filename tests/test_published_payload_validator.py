@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import datetime as dt
+import gzip
 import json
 from pathlib import Path
 
+import scripts.validate_published_payloads as validator
 from scripts.validate_published_payloads import (
+    VALIDATION_LEDGER_NAME,
     validate_html_page,
     validate_webpages_data,
 )
 from src.utils.published_data_version import build_published_data_version
-from src.utils.published_webpage_data import project_embedded_clusters
+from src.utils.published_webpage_data import (
+    PAGE_DATA_BEGIN,
+    PAGE_DATA_END,
+    project_embedded_clusters,
+)
 
 
 def _complete_paper() -> dict:
@@ -371,6 +378,136 @@ def test_validate_webpages_data_rejects_stale_initial_embedded_data(tmp_path):
     )
 
 
+def _write_marked_index_html(webpages: Path, **overrides: object) -> None:
+    index_payload = json.loads(
+        (webpages / "data" / "index.json").read_text(encoding="utf-8")
+    )
+    date_payload = json.loads(
+        (webpages / "data" / "2026-05-12.json").read_text(encoding="utf-8")
+    )
+    page_data = {
+        "allPapers": {"2026-05-12": project_embedded_clusters(date_payload)},
+        "allPaperTags": {"2026-05-12": date_payload["tags"]},
+        "availableDates": ["2026-05-12"],
+        "loadedDates": ["2026-05-12"],
+        "loadMoreDays": 7,
+        "dataVersion": build_published_data_version(
+            index_payload, {"2026-05-12": date_payload}
+        ),
+        "firstScreenDataUrl": "",
+        "dailyOverviewsRaw": {"2026-05-12": date_payload["overview"]},
+        **overrides,
+    }
+    (webpages / "index.html").write_text(
+        f"""<!doctype html>
+<html>
+<body>
+<script>
+const PAGE_DATA = {PAGE_DATA_BEGIN}{json.dumps(page_data, ensure_ascii=False)}{PAGE_DATA_END};
+const availableDates = PAGE_DATA.availableDates;
+fetch(`data/${{availableDates[0]}}.json`);
+</script>
+</body>
+</html>""",
+        encoding="utf-8",
+    )
+
+
+def test_validate_webpages_data_reads_marked_page_data(tmp_path):
+    webpages = _write_valid_webpages(tmp_path)
+    _write_marked_index_html(webpages)
+
+    assert validate_webpages_data(webpages) == []
+
+    _write_marked_index_html(
+        webpages, availableDates=["2026-05-11"], dataVersion="000000000000"
+    )
+    errors = validate_webpages_data(webpages)
+
+    assert any("availableDates manifest must match" in error for error in errors)
+    assert any("DATA_VERSION mismatch" in error for error in errors)
+
+    html = (webpages / "index.html").read_text(encoding="utf-8")
+    (webpages / "index.html").write_text(
+        html.replace('"allPapers": {', '"allPapers": {,'), encoding="utf-8"
+    )
+    errors = validate_webpages_data(webpages)
+
+    assert any("page data is not valid JSON" in error for error in errors)
+
+
+def _count_payload_checks(monkeypatch) -> list[str]:
+    checked: list[str] = []
+    validate_payload = validator.validate_date_data_payload
+
+    def counting_validate(date_data, *, expected_date):
+        checked.append(expected_date)
+        return validate_payload(date_data, expected_date=expected_date)
+
+    monkeypatch.setattr(validator, "validate_date_data_payload", counting_validate)
+    return checked
+
+
+def test_validate_webpages_data_skips_checks_recorded_in_ledger(tmp_path, monkeypatch):
+    webpages = _write_valid_webpages(tmp_path)
+    assert validate_webpages_data(webpages) == []
+    assert (webpages / VALIDATION_LEDGER_NAME).is_file()
+    checked = _count_payload_checks(monkeypatch)
+
+    assert validate_webpages_data(webpages) == []
+    assert checked == []
+    assert validate_webpages_data(webpages, use_ledger=False) == []
+    assert checked == ["2026-05-12"]
+
+    date_file = webpages / "data" / "2026-05-12.json"
+    payload = json.loads(date_file.read_text(encoding="utf-8"))
+    payload["clusters"][0]["papers"][0]["methodology"] = ""
+    _write_json(date_file, payload)
+    errors = validate_webpages_data(webpages)
+
+    assert any("missing methodology" in error for error in errors)
+    assert checked == ["2026-05-12", "2026-05-12"]
+
+
+def test_validate_webpages_data_ledger_is_not_written_on_failure(tmp_path):
+    webpages = _write_valid_webpages(tmp_path)
+    _write_index_html(webpages, data_version="000000000000")
+
+    assert validate_webpages_data(webpages) != []
+    assert not (webpages / VALIDATION_LEDGER_NAME).exists()
+
+
+def test_validate_webpages_data_parallel_matches_serial(tmp_path, monkeypatch):
+    webpages = _write_valid_webpages(tmp_path)
+    date_file = webpages / "data" / "2026-05-12.json"
+    payload = json.loads(date_file.read_text(encoding="utf-8"))
+    payload["clusters"][0]["papers"][0]["methodology"] = ""
+    _write_json(date_file, payload)
+    monkeypatch.setattr(validator, "PARALLEL_MIN_DATE_FILES", 1)
+
+    serial = validate_webpages_data(webpages, jobs=1, use_ledger=False)
+    parallel = validate_webpages_data(webpages, jobs=2, use_ledger=False)
+
+    assert any("missing methodology" in error for error in serial)
+    assert parallel == serial
+
+
+def test_validate_webpages_data_pool_does_not_fork(tmp_path, monkeypatch):
+    webpages = _write_valid_webpages(tmp_path)
+    monkeypatch.setattr(validator, "PARALLEL_MIN_DATE_FILES", 1)
+    start_methods = []
+
+    class RecordingPool:
+        def __init__(self, max_workers, mp_context):
+            start_methods.append(mp_context.get_start_method())
+            raise OSError("no pool in this test")
+
+    monkeypatch.setattr(validator, "ProcessPoolExecutor", RecordingPool)
+
+    assert validate_webpages_data(webpages, jobs=2, use_ledger=False) == []
+    assert start_methods and start_methods[0] in ("forkserver", "spawn")
+
+
 def test_validate_webpages_data_rejects_missing_index_date_file(tmp_path):
     webpages = _write_valid_webpages(tmp_path)
     (webpages / "data" / "2026-05-12.json").unlink()
@@ -465,6 +602,25 @@ def test_validate_webpages_data_rejects_unexpected_json_payload(tmp_path):
     assert any("unexpected JSON file" in error for error in errors)
 
 
+def test_validate_webpages_data_checks_precompressed_variants(tmp_path):
+    webpages = _write_valid_webpages(tmp_path)
+    data_dir = webpages / "data"
+    index_bytes = (data_dir / "index.json").read_bytes()
+    (data_dir / "index.json.gz").write_bytes(gzip.compress(index_bytes))
+    (webpages / "index.html.gz").write_bytes(
+        gzip.compress((webpages / "index.html").read_bytes())
+    )
+
+    assert validate_webpages_data(webpages) == []
+
+    (data_dir / "index.json.gz").write_bytes(gzip.compress(index_bytes + b" "))
+    (data_dir / "2026-05-11.json.gz").write_bytes(gzip.compress(b"{}"))
+    errors = validate_webpages_data(webpages)
+
+    assert any("compressed variant does not match index.json" in e for e in errors)
+    assert any("compressed variant without original file" in e for e in errors)
+
+
 def test_validate_webpages_data_rejects_unexpected_data_directory_entries(tmp_path):
     webpages = _write_valid_webpages(tmp_path)
     data_dir = webpages / "data"
@@ -1,11 +1,17 @@
 import json
+import threading
+import time
 
+from src.core import reviewgrounder_adapter
 from src.core.reviewgrounder_adapter import (
+    FallbackPaperSearchAPI,
     OpenAlexSearchAPI,
+    PrefetchedPaperSearchAPI,
     _promote_initial_review_on_refiner_failure,
     build_reviewgrounder_cache_payload,
     reviewgrounder_markdown_from_result,
 )
+from src.utils.cache_manager import CacheManager
 
 
 def test_reviewgrounder_markdown_prefers_refined_review():
@@ -107,3 +113,181 @@ def test_openalex_normalization_reconstructs_abstract():
     assert normalized["authors"] == ["Ada Lovelace"]
     assert normalized["venue"] == "TestConf"
     assert normalized["search_source"] == "openalex"
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._data
+
+
+class _FakeSession:
+    def __init__(self, data):
+        self.data = data
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append((url, params))
+        return _FakeResponse(self.data)
+
+
+def _openalex_api(tmp_path, session, cache_ttl_hours=1.0):
+    return OpenAlexSearchAPI(
+        session=session,
+        cache=CacheManager(cache_dir=str(tmp_path / "cache")),
+        cache_ttl_hours=cache_ttl_hours,
+    )
+
+
+def test_openalex_search_is_answered_from_cache_on_repeat(tmp_path):
+    session = _FakeSession(
+        {"results": [{"id": "https://openalex.org/W1", "display_name": "Cached"}]}
+    )
+    api = _openalex_api(tmp_path, session)
+
+    first = api.search_by_query("agent memory", limit=3)
+    second = _openalex_api(tmp_path, session).search_by_query("agent memory", limit=3)
+
+    assert [paper["title"] for paper in first] == ["Cached"]
+    assert second == first
+    assert len(session.calls) == 1
+
+    uncached = _openalex_api(tmp_path, session, cache_ttl_hours=0)
+    uncached.search_by_query("agent memory", limit=3)
+    assert len(session.calls) == 2
+
+
+def test_fallback_search_uses_openalex_when_primary_fails(tmp_path):
+    session = _FakeSession(
+        {"results": [{"id": "https://openalex.org/W2", "display_name": "Fallback"}]}
+    )
+
+    class FailingPrimary:
+        def search_by_query(self, query, limit=50, **kwargs):
+            raise RuntimeError("rate limited")
+
+        def get_paper(self, paper_id, **kwargs):
+            raise AssertionError("OpenAlex IDs must not reach the primary API")
+
+    api = FallbackPaperSearchAPI(FailingPrimary(), _openalex_api(tmp_path, session))
+
+    papers = api.search_by_query("grounded review", limit=2)
+
+    assert [paper["title"] for paper in papers] == ["Fallback"]
+    assert api.last_source == "openalex"
+
+    session.data = {"id": "https://openalex.org/W2", "display_name": "Fallback"}
+    paper = api.get_paper("https://openalex.org/W2")
+    assert paper["title"] == "Fallback"
+    assert api.last_source == "openalex"
+
+
+def test_fallback_search_prefers_primary_and_skips_openalex(tmp_path, monkeypatch):
+    monkeypatch.setattr(reviewgrounder_adapter, "_HEDGE_DELAY_SECONDS", 0.05)
+    session = _FakeSession(
+        {"results": [{"id": "https://openalex.org/W3", "display_name": "Hedge"}]}
+    )
+
+    class SemanticScholarPrimary:
+        def search_by_query(self, query, limit=50, **kwargs):
+            return [{"title": "Primary"}]
+
+    api = FallbackPaperSearchAPI(
+        SemanticScholarPrimary(), _openalex_api(tmp_path, session)
+    )
+
+    papers = api.search_by_query("grounded review", limit=2)
+    time.sleep(0.2)
+
+    assert papers == [{"title": "Primary", "search_source": "semantic_scholar"}]
+    # 主检索及时返回时不发出 OpenAlex 请求
+    assert session.calls == []
+
+
+def test_fallback_search_hedges_slow_primary_with_openalex(tmp_path, monkeypatch):
+    monkeypatch.setattr(reviewgrounder_adapter, "_HEDGE_DELAY_SECONDS", 0.05)
+    session = _FakeSession(
+        {"results": [{"id": "https://openalex.org/W4", "display_name": "Hedge"}]}
+    )
+    hedge_started = threading.Event()
+    original_get = session.get
+
+    def get(url, params=None, timeout=None):
+        hedge_started.set()
+        return original_get(url, params=params, timeout=timeout)
+
+    session.get = get
+
+    class SlowFailingPrimary:
+        def search_by_query(self, query, limit=50, **kwargs):
+            # 主检索在对冲请求发出之后才失败
+            assert hedge_started.wait(5)
+            raise RuntimeError("rate limited")
+
+    api = FallbackPaperSearchAPI(SlowFailingPrimary(), _openalex_api(tmp_path, session))
+
+    papers = api.search_by_query("grounded review", limit=2)
+
+    assert [paper["title"] for paper in papers] == ["Hedge"]
+    assert api.last_source == "openalex"
+    assert len(session.calls) == 1
+
+
+def test_fallback_search_many_runs_queries_concurrently(tmp_path):
+    barrier = threading.Barrier(3, timeout=5)
+
+    class SemanticScholarPrimary:
+        def search_by_query(self, query, limit=50, **kwargs):
+            # 三个查询必须同时在途才能越过屏障
+            barrier.wait()
+            return [{"title": f"{query}:{limit}"}]
+
+    session = _FakeSession({"results": []})
+    api = FallbackPaperSearchAPI(
+        SemanticScholarPrimary(), _openalex_api(tmp_path, session)
+    )
+
+    results = api.search_many(["a", "b", "c"], limit=4)
+
+    assert [[paper["title"] for paper in papers] for papers in results] == [
+        ["a:4"],
+        ["b:4"],
+        ["c:4"],
+    ]
+    assert session.calls == []
+
+
+def test_prefetched_search_serves_keyword_searches_from_batch():
+    class RecordingSearch:
+        def __init__(self):
+            self.batches = []
+            self.queries = []
+            self.last_source = "openalex"
+
+        def search_many(self, queries, limit=50):
+            self.batches.append((list(queries), limit))
+            return [[{"title": f"{query}-{i}"} for i in range(3)] for query in queries]
+
+        def search_by_query(self, query, limit=50, **kwargs):
+            self.queries.append((query, limit))
+            return [{"title": f"live-{query}"}]
+
+    inner = RecordingSearch()
+    api = PrefetchedPaperSearchAPI(inner)
+
+    api.prefetch(["agents", "memory", "agents", ""])
+
+    assert inner.batches == [(["agents", "memory"], 50)]
+    assert [paper["title"] for paper in api.search_by_query("memory", limit=2)] == [
+        "memory-0",
+        "memory-1",
+    ]
+    assert api.search_by_query("planning", limit=2) == [{"title": "live-planning"}]
+    assert api.search_by_query("agents", limit=80) == [{"title": "live-agents"}]
+    assert inner.queries == [("planning", 2), ("agents", 80)]
+    assert api.last_source == "openalex"
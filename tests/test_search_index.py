@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from src.utils import search_index
+from src.utils.search_index import (
+    SEARCH_INDEX_FILENAME,
+    bloom_might_contain,
+    build_month_shard,
+    build_search_files,
+    month_entry,
+    tokenize_search_text,
+)
+
+
+def _payload(date: str, *papers: dict) -> dict:
+    return {
+        "date": date,
+        "clusters": [{"name": "Agent Planning", "papers": list(papers)}],
+    }
+
+
+def test_tokenize_search_text_splits_words_and_cjk_bigrams():
+    assert tokenize_search_text("The LLM-based 智能体规划 for GUI 书") == [
+        "llm",
+        "based",
+        "智能",
+        "能体",
+        "体规",
+        "规划",
+        "gui",
+        "书",
+    ]
+
+
+def test_month_shard_indexes_every_searchable_field():
+    shard = build_month_shard(
+        "2026-05",
+        {
+            "2026-05-02": _payload(
+                "2026-05-02",
+                {
+                    "arxiv_id": "2605.00002",
+                    "title": "Tool Use",
+                    "authors": "Ada Lovelace",
+                },
+            ),
+            "2026-05-01": _payload(
+                "2026-05-01",
+                {"arxiv_id": "2605.00001", "summary_translation": "多智能体协作"},
+            ),
+        },
+    )
+
+    assert shard["docs"] == [["2605.00002", "2026-05-02"], ["2605.00001", "2026-05-01"]]
+    assert shard["postings"]["lovelace"] == [0]
+    assert shard["postings"]["planning"] == [0, 1]
+    assert shard["postings"]["协作"] == [1]
+
+    entry = month_entry(shard, ["2026-05-02", "2026-05-01"])
+    assert all(bloom_might_contain(entry, term) for term in shard["postings"])
+
+
+def test_build_search_files_rebuilds_only_touched_months():
+    loads = []
+    payloads = {
+        "2026-05-01": _payload("2026-05-01", {"arxiv_id": "2605.00001", "title": "A"}),
+        "2026-04-30": _payload("2026-04-30", {"arxiv_id": "2604.00001", "title": "B"}),
+    }
+
+    def load_payload(date):
+        loads.append(date)
+        return payloads[date]
+
+    dates = ["2026-05-01", "2026-04-30"]
+    first = build_search_files(dates, payloads, None, load_payload)
+    assert sorted(first) == [
+        "search-2026-04.json",
+        "search-2026-05.json",
+        SEARCH_INDEX_FILENAME,
+    ]
+
+    changed = {
+        "2026-05-02": _payload("2026-05-02", {"arxiv_id": "2605.00002", "title": "C"})
+    }
+    second = build_search_files(
+        ["2026-05-02", *dates], changed, first[SEARCH_INDEX_FILENAME], load_payload
+    )
+
+    assert sorted(second) == ["search-2026-05.json", SEARCH_INDEX_FILENAME]
+    assert loads == ["2026-05-01"]
+    assert [entry["month"] for entry in second[SEARCH_INDEX_FILENAME]["months"]] == [
+        "2026-05",
+        "2026-04",
+    ]
+
+
+def test_build_search_files_ignores_dictionary_with_other_tokenizer(monkeypatch):
+    payloads = {"2026-05-01": _payload("2026-05-01", {"arxiv_id": "2605.00001"})}
+    first = build_search_files(["2026-05-01"], payloads, None, payloads.get)
+    monkeypatch.setattr(search_index, "SEARCH_STOPWORDS", ["the"])
+
+    second = build_search_files(
+        ["2026-05-01"], {}, first[SEARCH_INDEX_FILENAME], payloads.get
+    )
+
+    assert "search-2026-05.json" in second
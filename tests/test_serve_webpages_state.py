@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import gzip
 import io
 import json
 import http.server
+import os
 
 import pytest
 
 from src.core import serve_webpages
+from src.utils import user_state_store
 
 
 def _handler(request_headers: dict | None = None):
@@ -64,21 +67,58 @@ def test_toggle_read_persists_state_with_atomic_helper(tmp_path, monkeypatch):
     assert handler.status == 200
     assert _response_payload(handler) == {"ok": True}
     state_file = tmp_path / "2026-05-12" / ".user_state.json"
+    assert serve_webpages.USER_STATE_STORE.flush()
     state = json.loads(state_file.read_text(encoding="utf-8"))
     assert state == {"deleted_ids": [], "read_ids": ["2605.00001"]}
 
 
-def test_toggle_read_reports_state_write_failure(tmp_path, monkeypatch):
+def test_state_write_failure_keeps_change_pending(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
-    monkeypatch.setattr(serve_webpages, "save_json", lambda *_args, **_kwargs: False)
-    handler = _handler()
+    monkeypatch.setattr(user_state_store, "save_json", lambda *_args, **_kwargs: False)
+    store = user_state_store.UserStateStore(
+        serve_webpages._normalize_user_state, flush_interval=60
+    )
+    state_file = tmp_path / "2026-05-12" / ".user_state.json"
 
-    handler._handle_toggle_read(
-        {"date": "2026-05-12", "arxiv_id": "2605.00001", "read": True}
+    store.update(str(state_file), lambda state: state["read_ids"].append("2605.1"))
+
+    assert store.flush() is False
+    assert store.pending_paths() == [str(state_file)]
+    assert store.get(str(state_file))["read_ids"] == ["2605.1"]
+
+    monkeypatch.undo()
+    assert store.close() is True
+    assert store.pending_paths() == []
+    assert json.loads(state_file.read_text(encoding="utf-8"))["read_ids"] == ["2605.1"]
+
+
+def test_state_store_coalesces_writes_and_serves_reads_from_memory(
+    tmp_path, monkeypatch
+):
+    writes = []
+    save_json = user_state_store.save_json
+
+    def counting_save_json(path, payload, **kwargs):
+        writes.append(path)
+        return save_json(path, payload, **kwargs)
+
+    monkeypatch.setattr(user_state_store, "save_json", counting_save_json)
+    store = user_state_store.UserStateStore(
+        serve_webpages._normalize_user_state, flush_interval=60, max_pending=1000
     )
+    state_file = str(tmp_path / "2026-05-12" / ".user_state.json")
+
+    for index in range(20):
+        store.update(
+            state_file, lambda state, index=index: state["read_ids"].append(str(index))
+        )
+    assert writes == []
+    assert len(store.get(state_file)["read_ids"]) == 20
 
-    assert handler.status == 500
-    assert _response_payload(handler) == {"error": "failed to persist user state"}
+    store.close()
+    assert writes == [state_file]
+    assert store.close() is True
+    assert writes == [state_file]
 
 
 def test_delete_refuses_sibling_prefix_directory(tmp_path, monkeypatch):
@@ -238,3 +278,228 @@ def test_post_accepts_valid_json_object(tmp_path, monkeypatch):
 
     assert handler.status == 200
     assert _response_payload(handler) == {"ok": True}
+
+
+def test_send_head_serves_fresh_precompressed_variant(tmp_path):
+    page = tmp_path / "index.json"
+    page.write_text('{"dates": []}', encoding="utf-8")
+    (tmp_path / "index.json.gz").write_bytes(gzip.compress(page.read_bytes()))
+    handler = _handler({"Accept-Encoding": "br;q=0, gzip"})
+    handler.path = "/index.json"
+    handler.translate_path = lambda _path: str(page)
+
+    body = handler.send_head()
+    try:
+        assert gzip.decompress(body.read()) == page.read_bytes()
+    finally:
+        body.close()
+
+    headers = _sent_headers(handler)
+    assert handler.status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["Content-Type"] == "application/json"
+    assert handler._vary_accept_encoding
+
+
+def test_precompressed_variant_older_than_original_is_ignored(tmp_path):
+    page = tmp_path / "index.json"
+    variant = tmp_path / "index.json.gz"
+    variant.write_bytes(gzip.compress(b"{}"))
+    page.write_text('{"dates": []}', encoding="utf-8")
+    os.utime(variant, ns=(0, 0))
+
+    assert serve_webpages.select_precompressed(str(page), "gzip") is None
+
+
+def test_send_head_answers_matching_etag_with_not_modified(tmp_path):
+    page = tmp_path / "index.json"
+    page.write_text('{"dates": []}', encoding="utf-8")
+    (tmp_path / "index.json.gz").write_bytes(gzip.compress(page.read_bytes()))
+    handler = _handler({"Accept-Encoding": "gzip"})
+    handler.path = "/data/index.json"
+    handler.translate_path = lambda _path: str(page)
+
+    handler.send_head().close()
+    gzip_etag = handler._response_etag
+    assert gzip_etag.startswith('"') and gzip_etag.endswith('-gzip"')
+
+    handler = _handler({"Accept-Encoding": "identity", "If-None-Match": gzip_etag})
+    handler.path = "/data/index.json"
+    handler.translate_path = lambda _path: str(page)
+    body = handler.send_head()
+    try:
+        assert handler.status == 200
+        assert handler._response_etag not in (None, gzip_etag)
+    finally:
+        body.close()
+
+    handler = _handler(
+        {"Accept-Encoding": "gzip", "If-None-Match": f'"other", W/{gzip_etag}'}
+    )
+    handler.path = "/data/index.json"
+    handler.translate_path = lambda _path: str(page)
+
+    assert handler.send_head() is None
+    assert handler.status == 304
+    assert handler._response_etag == gzip_etag
+
+
+def test_production_server_keeps_connections_alive_and_threads(tmp_path, monkeypatch):
+    import http.client
+    import socket
+    import threading
+
+    large = b"x" * (serve_webpages.SENDFILE_MIN_BYTES * 2)
+    (tmp_path / "large.json").write_bytes(large)
+    monkeypatch.chdir(tmp_path)
+    server = serve_webpages.create_server("127.0.0.1", 0, production=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    # A client that connects but never sends a request must not block others.
+    stalled = socket.create_connection(("127.0.0.1", port))
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        connection.request("GET", "/large.json")
+        response = connection.getresponse()
+        assert response.status == 200
+        assert response.read() == large
+        etag = response.getheader("ETag")
+        kept_alive_socket = connection.sock
+        assert response.getheader("Cache-Control") == "no-cache"
+
+        connection.request("GET", "/large.json", headers={"If-None-Match": etag})
+        response = connection.getresponse()
+        assert response.status == 304
+        assert response.read() == b""
+        assert connection.sock is kept_alive_socket
+
+        connection.request("POST", "/api/unknown", body=b"{}")
+        response = connection.getresponse()
+        assert response.status == 404
+        assert json.loads(response.read()) == {"error": "not found"}
+        connection.close()
+    finally:
+        stalled.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_state_store_flushes_after_max_pending_changes(tmp_path):
+    import threading
+    import time
+
+    store = user_state_store.UserStateStore(
+        serve_webpages._normalize_user_state, flush_interval=60, max_pending=8
+    )
+    state_file = tmp_path / "2026-05-12" / ".user_state.json"
+
+    def add_ids(worker: int) -> None:
+        for index in range(8):
+            store.update(
+                str(state_file),
+                lambda state, value=f"{worker}.{index}": state["read_ids"].append(
+                    value
+                ),
+            )
+
+    threads = [threading.Thread(target=add_ids, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    deadline = time.monotonic() + 5
+    while store.pending_paths() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert store.pending_paths() == []
+    saved = json.loads(state_file.read_text(encoding="utf-8"))
+    assert len(saved["read_ids"]) == 32
+    store.close()
+
+
+def _get(handler, path: str) -> None:
+    handler.path = path
+    handler._handle_get_state()
+
+
+def test_get_state_returns_many_dates_or_a_range(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    handler = _handler()
+    handler._handle_toggle_read(
+        {"date": "2026-05-12", "arxiv_id": "2605.00001", "read": True}
+    )
+
+    handler = _handler()
+    _get(handler, "/api/state?dates=2026-05-12,2026-05-11")
+    assert handler.status == 200
+    assert _response_payload(handler) == {
+        "states": {
+            "2026-05-12": {"deleted_ids": [], "read_ids": ["2605.00001"]},
+            "2026-05-11": {"deleted_ids": [], "read_ids": []},
+        }
+    }
+
+    handler = _handler()
+    _get(handler, "/api/state?from=2026-05-10&to=2026-05-12")
+    states = _response_payload(handler)["states"]
+    assert list(states) == ["2026-05-10", "2026-05-11", "2026-05-12"]
+    assert states["2026-05-12"]["read_ids"] == ["2605.00001"]
+
+    for query in (
+        "dates=2026-05-12,../outside",
+        "from=2026-05-12&to=2026-05-10",
+        "from=2024-01-01&to=2026-05-12",
+        "to=2026-05-12",
+    ):
+        handler = _handler()
+        _get(handler, f"/api/state?{query}")
+        assert handler.status == 400, query
+
+
+def test_state_batch_applies_operations_per_date(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    handler = _handler()
+
+    handler._handle_state_batch(
+        {
+            "ops": [
+                {"date": "2026-05-12", "arxiv_id": "2605.00001", "action": "read"},
+                {"date": "2026-05-12", "arxiv_id": "2605.00002", "action": "read"},
+                {"date": "2026-05-11", "arxiv_id": "2605.00003", "action": "read"},
+                {"date": "2026-05-12", "arxiv_id": "2605.00001", "action": "delete"},
+                {"date": "2026-05-11", "arxiv_id": "2605.00003", "action": "unread"},
+            ]
+        }
+    )
+
+    assert handler.status == 200
+    assert _response_payload(handler) == {
+        "ok": True,
+        "states": {
+            "2026-05-12": {"deleted_ids": ["2605.00001"], "read_ids": ["2605.00002"]},
+            "2026-05-11": {"deleted_ids": [], "read_ids": []},
+        },
+    }
+
+
+def test_state_batch_rejects_invalid_operations_without_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    for payload in (
+        {"ops": []},
+        {"ops": "read"},
+        {
+            "ops": [
+                {"date": "2026-05-12", "arxiv_id": "2605.00001", "action": "read"},
+                {"date": "2026-05-12", "arxiv_id": "2605.00002", "action": "star"},
+            ]
+        },
+        {"ops": [{"date": "../x", "arxiv_id": "2605.00001", "action": "read"}]},
+    ):
+        handler = _handler()
+        handler._handle_state_batch(payload)
+        assert handler.status == 400, payload
+
+    handler = _handler()
+    _get(handler, "/api/state?date=2026-05-12")
+    assert _response_payload(handler) == {"deleted_ids": [], "read_ids": []}
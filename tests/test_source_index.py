@@ -0,0 +1,106 @@
+import json
+import os
+
+from src.core import crawl_arxiv, generate_unified_index
+from src.core.paper_filter import supplement_source_paper_index
+from src.utils.source_index import (
+    ArxivSourceIndex,
+    open_source_index,
+    source_index_path,
+)
+
+
+def _write_crawl_file(path, papers, mtime_ns=None):
+    path.write_text(json.dumps(papers), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_source_index_syncs_only_changed_files_and_prefers_newest(tmp_path):
+    older = tmp_path / "cs.AI_paper_2026-05-10.json"
+    newer = tmp_path / "cs.AI_paper_2026-05-11.json"
+    _write_crawl_file(
+        older,
+        [{"arxiv_id": "2605.00001", "authors": "Old Author"}],
+        mtime_ns=1_000_000_000,
+    )
+    _write_crawl_file(
+        newer,
+        [
+            {"arxiv_id": "2605.00001", "authors": "New Author"},
+            {"arxiv_id": "2605.00002", "authors": "Other"},
+        ],
+        mtime_ns=2_000_000_000,
+    )
+
+    with ArxivSourceIndex(source_index_path(str(tmp_path))) as source_index:
+        assert source_index.sync_directory(str(tmp_path)) == 2
+        assert source_index.sync_directory(str(tmp_path)) == 0
+        found = source_index.lookup(["2605.00001", "2605.99999", ""])
+
+    assert found == {"2605.00001": {"arxiv_id": "2605.00001", "authors": "New Author"}}
+
+
+def test_crawler_save_updates_source_index(tmp_path):
+    papers = {"2605.00003": {"arxiv_id": "2605.00003", "title": "Saved"}}
+
+    output = crawl_arxiv.save_papers(
+        papers, ["cs.AI"], str(tmp_path), "2026-05-12", "2026-05-12"
+    )
+
+    with ArxivSourceIndex(source_index_path(str(tmp_path))) as source_index:
+        assert source_index.lookup(["2605.00003"])["2605.00003"]["title"] == "Saved"
+        # 已由爬虫入库的文件在读取端同步时无需再次解析
+        assert source_index.sync_directory(str(tmp_path)) == 0
+    assert os.path.exists(output)
+
+
+def test_unified_index_backfills_from_source_index(tmp_path, monkeypatch):
+    arxiv_dir = tmp_path / "arxiv_paper"
+    arxiv_dir.mkdir()
+    _write_crawl_file(
+        arxiv_dir / "cs.AI_paper_2026-05-11.json",
+        [{"arxiv_id": "2605.00004", "authors": "Ada Lovelace", "category": "cs.AI"}],
+    )
+    monkeypatch.setattr(generate_unified_index, "ARXIV_PAPER_DIR", str(arxiv_dir))
+    monkeypatch.setattr(
+        generate_unified_index,
+        "build_arxiv_source_index",
+        lambda: (_ for _ in ()).throw(AssertionError("must use the source index")),
+    )
+    monkeypatch.setattr(generate_unified_index, "WEBPAGES_DIR", str(tmp_path / "w"))
+    candidate = tmp_path / "clustered_papers_2026-05-11.json"
+    candidate.write_text(
+        json.dumps([{"arxiv_id": "2605.00004", "title": "T", "authors": ""}]),
+        encoding="utf-8",
+    )
+    seen = {}
+
+    def capture_backfill(papers, source_by_id):
+        seen.update(source_by_id)
+        return papers
+
+    monkeypatch.setattr(
+        generate_unified_index, "backfill_paper_metadata", capture_backfill
+    )
+    generate_unified_index.load_paper_data(candidate_files=[candidate])
+
+    assert seen["2605.00004"]["authors"] == "Ada Lovelace"
+
+
+def test_paper_filter_supplements_missing_ids_from_source_index(tmp_path):
+    _write_crawl_file(
+        tmp_path / "cs.AI_paper_2026-05-10.json",
+        [{"arxiv_id": "2605.00005", "authors": "Indexed"}],
+    )
+    source_by_id = {"2605.00006": {"arxiv_id": "2605.00006"}}
+
+    added = supplement_source_paper_index(
+        source_by_id,
+        [{"arxiv_id": "2605.00005"}, {"arxiv_id": "2605.00006"}],
+        str(tmp_path),
+    )
+
+    assert added == 1
+    assert source_by_id["2605.00005"]["authors"] == "Indexed"
+    assert open_source_index(str(tmp_path / "missing")) is None
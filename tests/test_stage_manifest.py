@@ -0,0 +1,68 @@
+import json
+import os
+
+from src.core import pipeline as pipeline_module
+from src.utils.io import save_json
+from src.utils.stage_manifest import (
+    manifest_path,
+    read_stage_manifest,
+    write_stage_manifest,
+)
+
+PAPERS = [
+    {"title": "A", "date": "2026-06-01"},
+    {"title": "B", "source_date": "2026-05-30", "date": "Fri, 29 May 2026"},
+    {"title": "C"},
+]
+
+
+def _save_stage_output(path, data):
+    assert save_json(str(path), data)
+    assert write_stage_manifest(str(path), data)
+
+
+def test_manifest_describes_saved_output(tmp_path) -> None:
+    output = tmp_path / "filtered_papers_2026-06-01.json"
+    _save_stage_output(output, PAPERS)
+
+    manifest = read_stage_manifest(str(output))
+
+    assert manifest_path(str(output)) == str(
+        tmp_path / ".meta" / "filtered_papers_2026-06-01.json.meta.json"
+    )
+    assert manifest["count"] == 3
+    assert manifest["size"] == output.stat().st_size
+    assert manifest["date_range"] == {"start": "2026-05-30", "end": "2026-06-01"}
+    assert len(manifest["sha256"]) == 64
+
+
+def test_manifest_is_ignored_once_output_changes(tmp_path) -> None:
+    output = tmp_path / "clustered_papers_2026-06-01.json"
+    _save_stage_output(output, PAPERS)
+
+    output.write_text(json.dumps(PAPERS[:1]), encoding="utf-8")
+
+    assert read_stage_manifest(str(output)) is None
+    assert pipeline_module.count_paper_records(str(output)) == 1
+
+
+def test_pipeline_counts_records_from_manifest_without_parsing(tmp_path) -> None:
+    output = tmp_path / "cs.AI_paper_2026-06-01.json"
+    _save_stage_output(output, PAPERS)
+    sidecar = manifest_path(str(output))
+    with open(sidecar, encoding="utf-8") as f:
+        manifest = json.load(f)
+    # 清单里的数字与文件内容不同，证明计数只读了清单
+    manifest["count"] = 42
+    assert save_json(sidecar, manifest)
+
+    assert pipeline_module.count_paper_records(str(output)) == 42
+
+
+def test_manifests_are_not_picked_up_as_stage_outputs(tmp_path) -> None:
+    output = tmp_path / "filtered_papers_2026-06-01.json"
+    _save_stage_output(output, PAPERS)
+    os.utime(manifest_path(str(output)), (2_000_000_000, 2_000_000_000))
+
+    assert pipeline_module.find_latest_file(str(tmp_path)) == str(output)
+    assert pipeline_module.find_file_by_date(str(tmp_path), "2026-06-01") == str(output)
@@ -0,0 +1,211 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.utils import stage_metrics
+from src.utils.cache_manager import CacheManager
+from src.utils.openai_client import meter_chat_completions
+from src.utils.stage_metrics import (
+    STAGE_METRICS_FILE_ENV,
+    STAGE_METRICS_OWNER_ENV,
+    MetricsRecorder,
+    StageMetrics,
+    append_metrics_record,
+    diff_counters,
+    summarize_counters,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_diff_counters_only_keeps_activity_between_snapshots() -> None:
+    recorder = MetricsRecorder()
+    recorder.record_llm_request("api.a", 1.0, 10, 5)
+    recorder.record_cache("papers", True)
+    before = recorder.snapshot()
+    recorder.record_llm_request("api.a", 3.0, 20, 7)
+    recorder.record_llm_request("api.b", 2.0, error=True)
+    recorder.record_cache("papers", False)
+
+    delta = diff_counters(before, recorder.snapshot())
+
+    assert delta["llm"]["api.a"] == {
+        "requests": 1,
+        "errors": 0,
+        "prompt_tokens": 20,
+        "completion_tokens": 7,
+        "latencies": [3.0],
+    }
+    assert delta["llm"]["api.b"]["errors"] == 1
+    assert delta["cache"] == {"papers": {"hits": 0, "misses": 1}}
+
+
+def test_summarize_counters_reports_latency_percentiles_and_hit_ratio() -> None:
+    summary = summarize_counters(
+        {
+            "llm": {
+                "api.a": {
+                    "requests": 4,
+                    "errors": 0,
+                    "prompt_tokens": 40,
+                    "completion_tokens": 8,
+                    "latencies": [1.0, 2.0, 3.0, 10.0],
+                }
+            },
+            "cache": {"summaries": {"hits": 3, "misses": 1}},
+        }
+    )
+
+    assert summary["llm"]["api.a"]["latency_avg_seconds"] == 4.0
+    assert summary["llm"]["api.a"]["latency_p50_seconds"] == 3.0
+    assert summary["llm"]["api.a"]["latency_max_seconds"] == 10.0
+    assert summary["cache"]["summaries"]["hit_ratio"] == 0.75
+
+
+def test_stage_metrics_merges_in_process_and_subprocess_counters(
+    tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(stage_metrics, "RECORDER", MetricsRecorder())
+    metrics = StageMetrics(report_dir=str(tmp_path / "reports"))
+
+    metrics.start(2, "筛选相关论文")
+    metrics.set_papers(50)
+    report_file = os.environ[STAGE_METRICS_FILE_ENV]
+    assert os.environ[STAGE_METRICS_OWNER_ENV] == str(os.getpid())
+    stage_metrics.record_llm_request("api.a", 0.5, 100, 10)
+    with metrics.measure("校验"):
+        pass
+    Path(report_file).write_text(
+        json.dumps(
+            {
+                "llm": {
+                    "api.a": {
+                        "requests": 2,
+                        "errors": 1,
+                        "prompt_tokens": 30,
+                        "completion_tokens": 3,
+                        "latencies": [1.5, 2.5],
+                    }
+                },
+                "cache": {"papers": {"hits": 1, "misses": 1}},
+                "io": {"read_bytes": 1000, "write_bytes": 10},
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    metrics.finish("ok")
+    metrics.start(3, "论文聚类")
+
+    report = metrics.report()
+
+    first, second = report["stages"]
+    assert first["status"] == "ok"
+    assert first["papers"] == 50
+    assert first["papers_per_second"] > 0
+    assert first["llm"]["api.a"]["requests"] == 3
+    assert first["llm"]["api.a"]["prompt_tokens"] == 130
+    assert first["cache"]["papers"]["hit_ratio"] == 0.5
+    assert first["read_bytes"] >= 1000
+    assert first["substeps"][0]["name"] == "校验"
+    assert second["status"] == "unfinished"
+    assert report["totals"]["llm"]["api.a"]["errors"] == 1
+    assert STAGE_METRICS_FILE_ENV not in os.environ
+    assert STAGE_METRICS_OWNER_ENV not in os.environ
+    assert not (tmp_path / "reports").exists()
+
+
+def test_stage_subprocess_appends_its_counters_on_exit(tmp_path) -> None:
+    report_file = tmp_path / "step1.jsonl"
+    env = dict(os.environ)
+    env[STAGE_METRICS_FILE_ENV] = str(report_file)
+    env[STAGE_METRICS_OWNER_ENV] = "1"
+    code = (
+        "from src.utils.stage_metrics import record_cache\n"
+        "record_cache('crawl', True)\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, env=env, check=True)
+
+    (report,) = stage_metrics.read_stage_reports(str(report_file))
+    assert report["cache"] == {"crawl": {"hits": 1, "misses": 0}}
+    assert report["io"]["read_bytes"] >= 0
+
+
+def test_cache_lookups_are_counted(tmp_path, monkeypatch) -> None:
+    recorder = MetricsRecorder()
+    monkeypatch.setattr(stage_metrics, "RECORDER", recorder)
+    cache = CacheManager(cache_dir=str(tmp_path))
+    cache.enabled = True
+    cache.set_crawl_cache("cs.AI", "2026-06-01", [{"title": "A"}])
+
+    assert cache.get_crawl_cache("cs.AI", "2026-06-01") == [{"title": "A"}]
+    assert cache.get_crawl_cache("cs.AI", "2026-06-02") is None
+
+    assert recorder.snapshot()["cache"] == {"crawl": {"hits": 1, "misses": 1}}
+
+
+def test_chat_completions_are_metered_for_plain_and_streaming_calls(
+    monkeypatch,
+) -> None:
+    recorder = MetricsRecorder()
+    monkeypatch.setattr(stage_metrics, "RECORDER", recorder)
+    usage = SimpleNamespace(prompt_tokens=12, completion_tokens=4)
+
+    def create(**kwargs):
+        if kwargs.get("stream"):
+            return iter([SimpleNamespace(usage=None), SimpleNamespace(usage=usage)])
+        return SimpleNamespace(usage=usage)
+
+    client = SimpleNamespace(
+        base_url=SimpleNamespace(host="api.example.test"),
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create)),
+    )
+    meter_chat_completions(client)
+
+    client.chat.completions.create(model="m")
+    assert len(list(client.chat.completions.create(model="m", stream=True))) == 2
+
+    entry = recorder.snapshot()["llm"]["api.example.test"]
+    assert entry["requests"] == 2
+    assert entry["prompt_tokens"] == 24
+    assert entry["completion_tokens"] == 8
+
+
+def test_metrics_history_keeps_only_newest_records(tmp_path) -> None:
+    history = tmp_path / "logs" / "metrics.jsonl"
+
+    for run in range(5):
+        assert append_metrics_record(str(history), {"run": run}, max_records=3)
+
+    lines = history.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["run"] for line in lines] == [2, 3, 4]
+
+
+def test_concurrent_metrics_appends_do_not_lose_records(tmp_path) -> None:
+    history = tmp_path / "metrics.jsonl"
+    code = (
+        "import sys\n"
+        "from src.utils.stage_metrics import append_metrics_record\n"
+        "for run in range(300):\n"
+        "    append_metrics_record(sys.argv[1], {'lane': sys.argv[2], 'run': run}, 50)\n"
+    )
+    lanes = [
+        subprocess.Popen(
+            [sys.executable, "-c", code, str(history), lane], cwd=PROJECT_ROOT
+        )
+        for lane in ("prepare", "publish")
+    ]
+    assert [lane.wait() for lane in lanes] == [0, 0]
+
+    records = [json.loads(line) for line in history.read_text().splitlines()]
+    assert len(records) == 50
+    assert records[-1]["run"] == 299
+    # 各条流水线留下的记录是一段连续的最新运行，中间没有被覆盖丢失的记录
+    # （先跑完的一条可能已被完全挤出历史）
+    for lane in ("prepare", "publish"):
+        runs = [r["run"] for r in records if r["lane"] == lane]
+        assert runs == list(range(300 - len(runs), 300))
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.core import cluster_papers as cluster_module
+from src.utils import text_clustering
+
+
+MEMORY_PAPERS = [
+    {
+        "title": f"Long-term memory retrieval for conversational agents {i}",
+        "summary": "Episodic memory store with retrieval and memory consolidation.",
+    }
+    for i in range(4)
+]
+TOOL_PAPERS = [
+    {
+        "title": f"Tool calling benchmark for API agents {i}",
+        "summary": "Evaluating tool calling accuracy across API schemas and tool chains.",
+    }
+    for i in range(4)
+]
+GAME_PAPERS = [
+    {
+        "title": f"Multi-agent negotiation games {i}",
+        "summary": "Negotiation strategies and game theoretic bargaining among agents.",
+    }
+    for i in range(4)
+]
+
+
+def _interleaved_papers():
+    papers = []
+    for group in zip(MEMORY_PAPERS, TOOL_PAPERS, GAME_PAPERS):
+        papers.extend(group)
+    return papers
+
+
+def test_spherical_kmeans_groups_topics_deterministically():
+    papers = _interleaved_papers()
+    terms = [text_clustering.paper_terms(paper) for paper in papers]
+    df = text_clustering.document_frequencies(terms)
+    vectors = text_clustering.vectorize(terms, df, len(papers))
+
+    labels, centroids = text_clustering.spherical_kmeans(vectors, 3)
+    again, _ = text_clustering.spherical_kmeans(vectors, 3)
+
+    assert labels == again
+    assert labels == [0, 1, 2] * 4
+    assert centroids.shape == (3, text_clustering.HASH_DIMENSIONS)
+
+
+def test_keyword_cluster_name_prefers_distinctive_terms():
+    papers = MEMORY_PAPERS + TOOL_PAPERS
+    terms = [text_clustering.paper_terms(paper) for paper in papers]
+    df = text_clustering.document_frequencies(terms)
+
+    keywords = text_clustering.group_keywords(terms, range(4, 8), df, len(papers))
+
+    assert "tool calling" in keywords
+    assert text_clustering.keyword_cluster_name(["tool calling", "api"]) == (
+        "Tool Calling & API"
+    )
+    assert text_clustering.keyword_cluster_name([]) == "Other"
+
+
+def test_local_engine_only_asks_llm_to_name_groups(monkeypatch):
+    prompts = []
+
+    def fake_call(_client, _model, prompt, _temperature):
+        prompts.append(prompt)
+        return '{"names": {"0": "Agent Memory", "1": "Tool Use", "2": "Negotiation"}}'
+
+    monkeypatch.setattr(cluster_module, "call_llm_for_clustering", fake_call)
+
+    clustered = cluster_module.cluster_papers(
+        _interleaved_papers(),
+        client=object(),
+        model="test-model",
+        temperature=0.1,
+        engine="local",
+    )
+
+    assert len(prompts) == 1
+    assert "[0] keywords:" in prompts[0]
+    assert [paper["cluster"] for paper in clustered[:3]] == [
+        "Agent Memory",
+        "Tool Use",
+        "Negotiation",
+    ]
+
+
+def test_local_engine_falls_back_to_keyword_names_offline(monkeypatch):
+    def fail_call(*_args, **_kwargs):
+        raise AssertionError("LLM must not be called without a client")
+
+    monkeypatch.setattr(cluster_module, "call_llm_for_clustering", fail_call)
+
+    clustered = cluster_module.cluster_papers(
+        _interleaved_papers(),
+        client=None,
+        model="test-model",
+        temperature=0.1,
+        engine="local",
+    )
+
+    names = {paper["cluster"] for paper in clustered}
+    assert len(names) == 3
+    assert "Other" not in names
+
+
+def test_auto_engine_uses_llm_without_numpy(monkeypatch):
+    monkeypatch.setattr(cluster_module, "local_clustering_available", lambda: False)
+
+    assert cluster_module.resolve_cluster_engine("auto") == "llm"
+    with pytest.raises(RuntimeError, match="requires numpy"):
+        cluster_module.resolve_cluster_engine("local")
+    with pytest.raises(ValueError, match="unknown cluster engine"):
+        cluster_module.resolve_cluster_engine("bogus")
+
+
+def test_default_engine_is_llm_even_with_numpy(monkeypatch):
+    import importlib
+
+    import src.utils.config as config
+
+    # 空值视为未设置，且不会被 .env 覆盖
+    monkeypatch.setenv("CLUSTER_ENGINE", "")
+    try:
+        default_engine = importlib.reload(config).CLUSTER_ENGINE
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config)
+    monkeypatch.setattr(cluster_module, "local_clustering_available", lambda: True)
+    monkeypatch.setattr(cluster_module, "CLUSTER_ENGINE", default_engine)
+
+    assert default_engine == "llm"
+    assert cluster_module.resolve_cluster_engine() == "llm"
+    # local 只在显式选择 auto/local 时启用
+    assert cluster_module.resolve_cluster_engine("auto") == "local"
@@ -1,9 +1,11 @@
+import gzip
+import hashlib
 import json
 
 import pytest
 
 from scripts.validate_published_payloads import validate_webpages_data
-from src.core import generate_unified_index
+from src.core import generate_unified_index, serve_webpages
 
 
 def _publishable_paper(arxiv_id: str, title: str) -> dict:
@@ -125,6 +127,38 @@ def test_unified_index_html_uses_safe_render_helpers(tmp_path, monkeypatch):
     assert "formatAuthorsWithAffiliations(paper.authors, paper.affiliations)" in html
 
 
+def test_unified_index_renders_date_sections_incrementally(tmp_path, monkeypatch):
+    paper = _publishable_paper("2605.00004", "Virtualized Paper")
+    monkeypatch.setattr(
+        generate_unified_index,
+        "load_paper_data",
+        lambda replace_dates=None: {"2026-05-31": [paper]},
+    )
+    monkeypatch.setattr(
+        generate_unified_index,
+        "load_daily_overviews",
+        lambda: {"2026-05-31": "今日速览 2026-05-31。"},
+    )
+    monkeypatch.setattr(
+        generate_unified_index, "WEBPAGES_DIR", str(tmp_path / "webpages")
+    )
+
+    html = generate_unified_index.generate_complete_html()
+
+    assert "new IntersectionObserver(" in html
+    assert "state.signature !== signature" in html
+    assert "mainContent.innerHTML" not in html
+    assert "Object.keys(paperDataMap).forEach(k => delete paperDataMap[k])" not in html
+    # User state is fetched for all loaded dates in chunks the server accepts
+    # and mutations are batched.
+    assert "api/state?dates=${chunk.join(',')}" in html
+    assert (
+        f"const STATE_FETCH_MAX_DATES = {serve_webpages.MAX_STATE_BATCH_DATES};" in html
+    )
+    assert "fetch('api/state/batch'" in html
+    assert "fetch(`api/state?date=" not in html
+
+
 def test_generated_unified_index_embedded_data_passes_publish_validator(
     tmp_path, monkeypatch
 ):
@@ -158,6 +192,54 @@ def test_generated_unified_index_embedded_data_passes_publish_validator(
     assert validate_webpages_data(webpages_dir) == []
 
 
+def test_generated_search_index_covers_published_papers(tmp_path, monkeypatch):
+    webpages_dir = tmp_path / "webpages"
+    data_dir = webpages_dir / "data"
+    papers = {
+        "2026-05-31": [_publishable_paper("2605.00005", "Planning Agents")],
+        "2026-04-30": [_publishable_paper("2604.00005", "Tool Use")],
+    }
+    monkeypatch.setattr(
+        generate_unified_index,
+        "load_paper_data",
+        lambda replace_dates=None: dict(papers),
+    )
+    monkeypatch.setattr(
+        generate_unified_index,
+        "load_daily_overviews",
+        lambda: {date: f"今日速览 {date}。" for date in papers},
+    )
+    monkeypatch.setattr(generate_unified_index, "WEBPAGES_DIR", str(webpages_dir))
+
+    html = generate_unified_index.generate_complete_html()
+    (webpages_dir / "index.html").write_text(html, encoding="utf-8")
+
+    search_index = json.loads((data_dir / "search-index.json").read_text("utf-8"))
+    assert [entry["file"] for entry in search_index["months"]] == [
+        "search-2026-05.json",
+        "search-2026-04.json",
+    ]
+    shard = json.loads((data_dir / "search-2026-05.json").read_text("utf-8"))
+    assert shard["docs"] == [["2605.00005", "2026-05-31"]]
+    assert shard["postings"]["planning"] == [0]
+    assert validate_webpages_data(webpages_dir) == []
+
+    shard["docs"] = []
+    (data_dir / "search-2026-05.json").write_text(json.dumps(shard), "utf-8")
+    errors = validate_webpages_data(webpages_dir)
+    assert any("search shard digest does not match" in e for e in errors)
+
+    del papers["2026-04-30"]
+    generate_unified_index.remove_build_manifest(
+        str(generate_unified_index.build_manifest_path())
+    )
+    html = generate_unified_index.generate_complete_html()
+    (webpages_dir / "index.html").write_text(html, encoding="utf-8")
+
+    assert not (data_dir / "search-2026-04.json").exists()
+    assert validate_webpages_data(webpages_dir) == []
+
+
 def test_unified_index_candidate_fails_closed_when_quality_gate_unavailable(
     monkeypatch, capsys
 ):
@@ -243,18 +325,15 @@ def test_unified_index_save_date_data_stages_before_visible_write(
     index_file.write_text('{"dates": ["2026-05-11"]}', encoding="utf-8")
     paper = _publishable_paper("2605.00005", "Daily Paper")
 
-    def fail_staged_date_write(filepath, data, indent=2, ensure_ascii=False):
+    original_save_bytes = generate_unified_index.save_bytes
+
+    def fail_staged_date_write(filepath, content):
         if filepath.endswith("2026-05-12.json"):
             return False
-        return generate_unified_index._atomic_save_json(
-            filepath,
-            data,
-            indent=indent,
-            ensure_ascii=ensure_ascii,
-        )
+        return original_save_bytes(filepath, content)
 
     monkeypatch.setattr(generate_unified_index, "WEBPAGES_DIR", str(webpages_dir))
-    monkeypatch.setattr(generate_unified_index, "save_json", fail_staged_date_write)
+    monkeypatch.setattr(generate_unified_index, "save_bytes", fail_staged_date_write)
 
     with pytest.raises(OSError, match="暂存数据文件失败"):
         generate_unified_index.save_date_data_files(
@@ -279,23 +358,20 @@ def test_unified_index_save_date_data_rolls_back_commit_failure(tmp_path, monkey
     index_file = data_dir / "index.json"
     index_file.write_text('{"dates": ["2026-05-12", "2026-05-11"]}', encoding="utf-8")
     paper = _publishable_paper("2605.00005", "Daily Paper")
-    original_replace = generate_unified_index.os.replace
+    original_rename = generate_unified_index.os.rename
 
-    def fail_index_commit(src, dst):
-        src_path = str(src)
-        dst_path = generate_unified_index.Path(dst)
+    def fail_generation_swap(src, dst):
         if (
-            ".publish-stage-" in src_path
-            and dst_path.parent == data_dir
-            and dst_path.name == "index.json"
+            generate_unified_index.DATA_GENERATION_PREFIX in str(src)
+            and generate_unified_index.Path(dst) == data_dir
         ):
-            raise OSError("index replace failed")
-        return original_replace(src, dst)
+            raise OSError("generation swap failed")
+        return original_rename(src, dst)
 
     monkeypatch.setattr(generate_unified_index, "WEBPAGES_DIR", str(webpages_dir))
-    monkeypatch.setattr(generate_unified_index.os, "replace", fail_index_commit)
+    monkeypatch.setattr(generate_unified_index.os, "rename", fail_generation_swap)
 
-    with pytest.raises(OSError, match="index replace failed"):
+    with pytest.raises(OSError, match="generation swap failed"):
         generate_unified_index.save_date_data_files(
             {"2026-05-12": [paper]},
             {"2026-05-12": "今日速览 2026-05-12。"},
@@ -308,7 +384,69 @@ def test_unified_index_save_date_data_rolls_back_commit_failure(tmp_path, monkey
     assert index_file.read_text(encoding="utf-8") == (
         '{"dates": ["2026-05-12", "2026-05-11"]}'
     )
-    assert list(data_dir.glob(".publish-stage-*")) == []
+    assert list(webpages_dir.glob(".data-generation-*")) == []
+
+
+def test_unified_index_save_date_data_hardlinks_unchanged_files(tmp_path, monkeypatch):
+    webpages_dir = tmp_path / "webpages"
+    data_dir = webpages_dir / "data"
+    data_dir.mkdir(parents=True)
+    kept_file = data_dir / "2026-05-11.json"
+    kept_file.write_text('{"date": "2026-05-11"}', encoding="utf-8")
+    stale_file = data_dir / "2026-05-10.json"
+    stale_file.write_text('{"date": "2026-05-10"}', encoding="utf-8")
+    kept_inode = kept_file.stat().st_ino
+    monkeypatch.setattr(generate_unified_index, "WEBPAGES_DIR", str(webpages_dir))
+
+    generate_unified_index.write_date_data_files(
+        {"2026-05-12": {"date": "2026-05-12"}}, ["2026-05-12", "2026-05-11"]
+    )
+
+    assert (data_dir / "2026-05-11.json").stat().st_ino == kept_inode
+    assert (data_dir / "2026-05-12.json").exists()
+    assert not (data_dir / "2026-05-10.json").exists()
+    assert json.loads((data_dir / "index.json").read_text(encoding="utf-8"))[
+        "dates"
+    ] == ["2026-05-12", "2026-05-11"]
+
+    assert generate_unified_index.rollback_data_generation(data_dir)
+    assert (data_dir / "2026-05-10.json").exists()
+    assert not (data_dir / "2026-05-12.json").exists()
+
+
+def test_unified_index_precompresses_only_rewritten_data_files(tmp_path, monkeypatch):
+    webpages_dir = tmp_path / "webpages"
+    data_dir = webpages_dir / "data"
+    monkeypatch.setattr(generate_unified_index, "WEBPAGES_DIR", str(webpages_dir))
+    monkeypatch.setattr(generate_unified_index, "WEBPAGE_PRECOMPRESS", True)
+
+    generate_unified_index.write_date_data_files(
+        {
+            "2026-05-12": {"date": "2026-05-12", "v": 1},
+            "2026-05-11": {"date": "2026-05-11"},
+        },
+        ["2026-05-12", "2026-05-11"],
+    )
+    for name in ("2026-05-12.json", "2026-05-11.json", "index.json"):
+        compressed = (data_dir / f"{name}.gz").read_bytes()
+        assert gzip.decompress(compressed) == (data_dir / name).read_bytes()
+    kept_inode = (data_dir / "2026-05-11.json.gz").stat().st_ino
+
+    generate_unified_index.write_date_data_files(
+        {"2026-05-12": {"date": "2026-05-12", "v": 2}}, ["2026-05-12", "2026-05-11"]
+    )
+
+    assert (data_dir / "2026-05-11.json.gz").stat().st_ino == kept_inode
+    assert (
+        json.loads(gzip.decompress((data_dir / "2026-05-12.json.gz").read_bytes()))["v"]
+        == 2
+    )
+
+    generate_unified_index.write_date_data_files(
+        {"2026-05-12": {"date": "2026-05-12", "v": 3}}, ["2026-05-12"]
+    )
+
+    assert not (data_dir / "2026-05-11.json.gz").exists()
 
 
 def test_unified_index_save_date_data_rejects_empty_publish_set(tmp_path, monkeypatch):
@@ -420,12 +558,8 @@ def test_unified_index_main_restores_existing_data_dir_when_validator_fails(
     )
 
     def generate_candidate(replace_dates=None):
-        (data_dir / "index.json").write_text(
-            '{"dates": ["2026-05-12"]}', encoding="utf-8"
-        )
-        (data_dir / "2026-05-11.json").unlink()
-        (data_dir / "2026-05-12.json").write_text(
-            '{"date": "2026-05-12"}', encoding="utf-8"
+        generate_unified_index.write_date_data_files(
+            {"2026-05-12": {"date": "2026-05-12"}}, ["2026-05-12"]
         )
         return "<!doctype html><html>invalid</html>"
 
@@ -452,3 +586,275 @@ def test_unified_index_main_restores_existing_data_dir_when_validator_fails(
         encoding="utf-8"
     ) == '{"date": "2026-05-11"}'
     assert not (data_dir / "2026-05-12.json").exists()
+
+
+def _write_incremental_inputs(tmp_path, monkeypatch):
+    summary_dir = tmp_path / "summary"
+    domain_dir = tmp_path / "domain_paper"
+    webpages_dir = tmp_path / "webpages"
+    arxiv_dir = tmp_path / "arxiv_paper"
+    for path in (summary_dir, domain_dir, webpages_dir, arxiv_dir):
+        path.mkdir(parents=True)
+
+    for date, arxiv_id in (("2026-05-11", "2605.00011"), ("2026-05-12", "2605.00012")):
+        (summary_dir / f"clustered_papers_{date}_with_summary2.json").write_text(
+            json.dumps([_publishable_paper(arxiv_id, f"Paper {date}")]),
+            encoding="utf-8",
+        )
+        (summary_dir / f"daily_overview_{date}.md").write_text(
+            f"今日速览 {date}。", encoding="utf-8"
+        )
+
+    monkeypatch.setattr(generate_unified_index, "SUMMARY_DIR", str(summary_dir))
+    monkeypatch.setattr(generate_unified_index, "DOMAIN_PAPER_DIR", str(domain_dir))
+    monkeypatch.setattr(generate_unified_index, "WEBPAGES_DIR", str(webpages_dir))
+    monkeypatch.setattr(generate_unified_index, "ARXIV_PAPER_DIR", str(arxiv_dir))
+    return summary_dir, webpages_dir
+
+
+def _build(webpages_dir):
+    html = generate_unified_index.generate_complete_html()
+    (webpages_dir / "index.html").write_text(html, encoding="utf-8")
+    return html
+
+
+def test_incremental_build_leaves_unchanged_date_files_untouched(tmp_path, monkeypatch):
+    _summary_dir, webpages_dir = _write_incremental_inputs(tmp_path, monkeypatch)
+    data_dir = webpages_dir / "data"
+
+    first_html = _build(webpages_dir)
+    first_stats = {
+        date: (data_dir / f"{date}.json").stat().st_mtime_ns
+        for date in ("2026-05-11", "2026-05-12")
+    }
+    assert (webpages_dir / generate_unified_index.BUILD_MANIFEST_NAME).exists()
+
+    monkeypatch.setattr(
+        generate_unified_index,
+        "load_paper_data",
+        lambda **kwargs: pytest.fail("clean build must not re-derive dates"),
+    )
+    second_html = _build(webpages_dir)
+
+    assert second_html == first_html
+    for date, mtime_ns in first_stats.items():
+        assert (data_dir / f"{date}.json").stat().st_mtime_ns == mtime_ns
+    assert validate_webpages_data(webpages_dir) == []
+
+
+def test_incremental_build_rewrites_only_changed_dates(tmp_path, monkeypatch):
+    summary_dir, webpages_dir = _write_incremental_inputs(tmp_path, monkeypatch)
+    data_dir = webpages_dir / "data"
+    _build(webpages_dir)
+    untouched_mtime = (data_dir / "2026-05-11.json").stat().st_mtime_ns
+
+    changed = _publishable_paper("2605.00012", "Paper 2026-05-12 revised")
+    (summary_dir / "clustered_papers_2026-05-12_with_summary2.json").write_text(
+        json.dumps([changed]),
+        encoding="utf-8",
+    )
+    _build(webpages_dir)
+
+    assert (data_dir / "2026-05-11.json").stat().st_mtime_ns == untouched_mtime
+    rewritten = json.loads((data_dir / "2026-05-12.json").read_text(encoding="utf-8"))
+    assert rewritten["clusters"][0]["papers"][0]["title"] == changed["title"]
+    assert validate_webpages_data(webpages_dir) == []
+
+
+def test_incremental_build_rebuilds_externally_modified_date_file(
+    tmp_path, monkeypatch
+):
+    _summary_dir, webpages_dir = _write_incremental_inputs(tmp_path, monkeypatch)
+    date_file = webpages_dir / "data" / "2026-05-11.json"
+    _build(webpages_dir)
+    expected = date_file.read_text(encoding="utf-8")
+
+    date_file.write_text('{"date": "2026-05-11"}', encoding="utf-8")
+    _build(webpages_dir)
+
+    assert date_file.read_text(encoding="utf-8") == expected
+    assert validate_webpages_data(webpages_dir) == []
+
+
+def test_date_files_are_their_canonical_encoding(tmp_path, monkeypatch):
+    _summary_dir, webpages_dir = _write_incremental_inputs(tmp_path, monkeypatch)
+    encode_calls = []
+    original_from_data = generate_unified_index.EncodedPayload.from_data.__func__
+
+    def counting_from_data(cls, data):
+        encode_calls.append(data.get("date"))
+        return original_from_data(cls, data)
+
+    monkeypatch.setattr(
+        generate_unified_index.EncodedPayload,
+        "from_data",
+        classmethod(counting_from_data),
+    )
+    _build(webpages_dir)
+
+    assert sorted(encode_calls) == ["2026-05-11", "2026-05-12"]
+    manifest = json.loads(
+        (webpages_dir / generate_unified_index.BUILD_MANIFEST_NAME).read_text(
+            encoding="utf-8"
+        )
+    )
+    for date, entry in manifest["dates"].items():
+        content = (webpages_dir / "data" / f"{date}.json").read_bytes()
+        assert hashlib.sha256(content).hexdigest() == entry["digest"]
+    assert validate_webpages_data(webpages_dir) == []
+
+
+def test_weekly_date_bundles_follow_changed_dates(tmp_path, monkeypatch):
+    summary_dir, webpages_dir = _write_incremental_inputs(tmp_path, monkeypatch)
+    data_dir = webpages_dir / "data"
+    bundle_file = data_dir / "bundle-2026-W20.json"
+    monkeypatch.setattr(generate_unified_index, "WEBPAGE_DATE_BUNDLES", True)
+
+    html = _build(webpages_dir)
+
+    def bundled_dates():
+        return json.loads(bundle_file.read_text(encoding="utf-8"))["dates"]
+
+    assert '"2026-W20": ["2026-05-12", "2026-05-11"]' in html
+    for date, payload in bundled_dates().items():
+        assert payload == json.loads(
+            (data_dir / f"{date}.json").read_text(encoding="utf-8")
+        )
+    assert validate_webpages_data(webpages_dir) == []
+
+    changed = _publishable_paper("2605.00012", "Paper 2026-05-12 revised")
+    (summary_dir / "clustered_papers_2026-05-12_with_summary2.json").write_text(
+        json.dumps([changed]), encoding="utf-8"
+    )
+    _build(webpages_dir)
+
+    papers = bundled_dates()["2026-05-12"]["clusters"][0]["papers"]
+    assert papers[0]["title"] == changed["title"]
+    assert validate_webpages_data(webpages_dir) == []
+
+    bundle_file.write_text(
+        json.dumps({"dates": {"2026-05-12": {}, "2026-05-11": {}}}), encoding="utf-8"
+    )
+    assert any(
+        "differs from its date file" in error
+        for error in validate_webpages_data(webpages_dir)
+    )
+
+    monkeypatch.setattr(generate_unified_index, "WEBPAGE_DATE_BUNDLES", False)
+    _build(webpages_dir)
+
+    assert not bundle_file.exists()
+    assert validate_webpages_data(webpages_dir) == []
+
+
+def test_unified_index_main_discards_previous_generation_after_success(
+    tmp_path, monkeypatch
+):
+    webpages_dir = tmp_path / "webpages"
+    data_dir = webpages_dir / "data"
+    data_dir.mkdir(parents=True)
+    (data_dir / "2026-05-11.json").write_text(
+        '{"date": "2026-05-11"}', encoding="utf-8"
+    )
+
+    def generate_candidate(replace_dates=None):
+        generate_unified_index.write_date_data_files(
+            {"2026-05-12": {"date": "2026-05-12"}}, ["2026-05-12"]
+        )
+        return "<!doctype html><html></html>"
+
+    monkeypatch.setattr(
+        generate_unified_index.sys, "argv", ["generate_unified_index.py"]
+    )
+    monkeypatch.setattr(generate_unified_index, "WEBPAGES_DIR", str(webpages_dir))
+    monkeypatch.setattr(
+        generate_unified_index, "generate_complete_html", generate_candidate
+    )
+    monkeypatch.setattr(
+        generate_unified_index,
+        "validate_generated_webpages_for_publication",
+        lambda: None,
+    )
+
+    assert generate_unified_index.main() == 0
+    assert (data_dir / "2026-05-12.json").exists()
+    assert not (data_dir / "2026-05-11.json").exists()
+    assert not (webpages_dir / generate_unified_index.PREVIOUS_DATA_GENERATION).exists()
+
+
+def test_split_asset_mode_writes_hashed_assets_and_first_screen_chunk(
+    tmp_path, monkeypatch
+):
+    webpages_dir = tmp_path / "webpages"
+    paper = _publishable_paper("2605.00007", "Split Paper")
+    monkeypatch.setattr(
+        generate_unified_index,
+        "load_paper_data",
+        lambda replace_dates=None: {"2026-05-31": [paper]},
+    )
+    monkeypatch.setattr(
+        generate_unified_index,
+        "load_daily_overviews",
+        lambda: {"2026-05-31": "今日速览 2026-05-31。"},
+    )
+    monkeypatch.setattr(generate_unified_index, "WEBPAGES_DIR", str(webpages_dir))
+    monkeypatch.setattr(generate_unified_index, "WEBPAGE_ASSET_MODE", "split")
+
+    html = generate_unified_index.generate_complete_html()
+    (webpages_dir / "index.html").write_text(html, encoding="utf-8")
+
+    assets = sorted(
+        path.name
+        for path in (webpages_dir / "assets").iterdir()
+        if path.suffix not in {".gz", ".br"}
+    )
+    assert [name.split(".")[0] for name in assets] == ["app", "app", "first-screen"]
+    assert "Split Paper" not in html
+    assert "async function loadFirstScreenData" not in html
+    chunk_name = next(name for name in assets if name.startswith("first-screen"))
+    chunk = json.loads((webpages_dir / "assets" / chunk_name).read_text("utf-8"))
+    assert chunk["paperDateIndex"] == {"2605.00007": "2026-05-31"}
+    assert validate_webpages_data(webpages_dir) == []
+
+    chunk["allPapers"] = {}
+    (webpages_dir / "assets" / chunk_name).write_text(
+        json.dumps(chunk), encoding="utf-8"
+    )
+    errors = validate_webpages_data(webpages_dir)
+    assert any("allPapers embedded dates must match loadedDates" in e for e in errors)
+
+    js_name = next(name for name in assets if name.endswith(".js"))
+    (webpages_dir / "assets" / js_name).unlink()
+    errors = validate_webpages_data(webpages_dir)
+    assert any(f"missing static asset assets/{js_name}" in e for e in errors)
+
+
+def test_incremental_build_rebuilds_everything_after_generator_change(
+    tmp_path, monkeypatch
+):
+    _summary_dir, webpages_dir = _write_incremental_inputs(tmp_path, monkeypatch)
+    _build(webpages_dir)
+    full_loads = []
+    original_load_paper_data = generate_unified_index.load_paper_data
+
+    def recording_load_paper_data(**kwargs):
+        full_loads.append(kwargs.get("only_dates"))
+        return original_load_paper_data(**kwargs)
+
+    monkeypatch.setattr(
+        generate_unified_index, "load_paper_data", recording_load_paper_data
+    )
+    monkeypatch.setattr(
+        generate_unified_index, "payload_generator_digest", lambda: "upgraded"
+    )
+    _build(webpages_dir)
+
+    # 输入未变，但生成代码变了：所有日期重新派生
+    assert full_loads == [None]
+    manifest = json.loads(
+        (webpages_dir / generate_unified_index.BUILD_MANIFEST_NAME).read_text(
+            encoding="utf-8"
+        )
+    )
+    assert manifest["generator"] == "upgraded"
+    assert validate_webpages_data(webpages_dir) == []